@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# Benchmark of the windowed CAM analytics against a loop over the CAM
+# objects of the window, for windows of increasing size:
+#
+#   python benchmarks/analytics.py --rate 2000 --window 1 --window 10
+#
+# Requires numpy: pip install -e .[analytics]
+# ---------------------------------------------------------------------
+import argparse
+import math
+import random
+import sys
+import time
+
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from cohda_driver.analytics import CamBuffer
+from cohda_driver.corpus import MessageCorpus
+from cohda_driver.etsi_message_type import EtsiMessageType
+from cohda_driver.etsi_messages import CAM
+from cohda_driver.geofence import EARTH_RADIUS, POSITION_UNITS_PER_DEGREE
+
+ORIGIN = (49.0, 8.4)
+# Half edge length of the area the stations are spread over in position units (0.1 microdegrees).
+AREA = 5000
+
+
+def python_cell_statistics(cams: List[CAM], cell_size: float) -> Dict[Tuple[int, int], Dict]:
+    """
+    Reference implementation looping over the CAM objects, as done before the analytics module.
+    """
+    meters_per_degree = math.radians(1) * EARTH_RADIUS
+    cos_latitude = math.cos(math.radians(ORIGIN[0]))
+    cells: Dict[Tuple[int, int], Dict] = defaultdict(
+        lambda: {"samples": 0, "stations": set(), "speeds": [], "headings": [0] * 8}
+    )
+    for cam in cams:
+        parameters = cam.cam.cam_parameters
+        position = parameters.basic_container.reference_position
+        high_frequency = parameters.high_frequency_container.basic_vehicle_container_high_frequency
+        north = (position.latitude / POSITION_UNITS_PER_DEGREE - ORIGIN[0]) * meters_per_degree
+        east = (
+            (position.longitude / POSITION_UNITS_PER_DEGREE - ORIGIN[1])
+            * meters_per_degree
+            * cos_latitude
+        )
+        cell = cells[(math.floor(north / cell_size), math.floor(east / cell_size))]
+        cell["samples"] += 1
+        cell["stations"].add(cam.header.station_id)
+        if high_frequency.speed.speed_value != 16383:
+            cell["speeds"].append(high_frequency.speed.speed_value / 100)
+        if high_frequency.heading.heading_value != 3601:
+            cell["headings"][int(high_frequency.heading.heading_value / 450) % 8] += 1
+    return cells
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the windowed CAM analytics.")
+    parser.add_argument("--rate", type=float, default=2000.0, help="CAMs per second.")
+    parser.add_argument(
+        "--window", type=float, action="append", help="Window in seconds. Can be repeated."
+    )
+    parser.add_argument("--stations", type=int, default=500, help="Number of stations.")
+    parser.add_argument("--cell-size", type=float, default=50.0, help="Cell size in meters.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing runs, the best is kept.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the message corpus.")
+    args = parser.parse_args()
+    windows = args.window or [1.0, 10.0, 60.0]
+
+    corpus = MessageCorpus(seed=args.seed)
+    rng = random.Random(args.seed)
+    templates = []
+    for payload in corpus.payloads(EtsiMessageType.CAM, 1000):
+        cam = corpus.decoder.decode(payload)
+        position = cam.cam.cam_parameters.basic_container.reference_position
+        position.latitude = round(ORIGIN[0] * POSITION_UNITS_PER_DEGREE) + rng.randint(-AREA, AREA)
+        position.longitude = round(ORIGIN[1] * POSITION_UNITS_PER_DEGREE) + rng.randint(-AREA, AREA)
+        cam.header.station_id = rng.randrange(args.stations)
+        templates.append(cam)
+
+    count = int(max(windows) * args.rate)
+    buffer = CamBuffer(capacity=count, origin=ORIGIN)
+    cams = [templates[i % len(templates)] for i in range(count)]
+    start = time.perf_counter()
+    for i, cam in enumerate(cams):
+        buffer.add(cam, i / args.rate)
+    add_time = (time.perf_counter() - start) / count
+    print(f"add: {add_time * 1e6:.2f} us per CAM")
+
+    end = count / args.rate
+    for window in windows:
+        selected = cams[count - int(window * args.rate) :]
+        vectorized = python = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            buffer.cell_statistics(window, args.cell_size, now=end)
+            vectorized = min(vectorized, time.perf_counter() - start)
+            start = time.perf_counter()
+            python_cell_statistics(selected, args.cell_size)
+            python = min(python, time.perf_counter() - start)
+        print(
+            f"{window:6.1f} s window, {len(selected):7d} CAMs: "
+            f"vectorized {vectorized * 1e3:8.2f} ms, Python loop {python * 1e3:8.2f} ms"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# Import time check of the package modules. Every module is imported in
+# fresh interpreters with `python -X importtime`, and the best time is
+# compared with its budget:
+#
+#   python benchmarks/import_time.py
+#
+# Exits with 1 if a module exceeds its budget or loads a module that
+# should only be imported on first use.
+# ---------------------------------------------------------------------
+import argparse
+import subprocess
+import sys
+
+from typing import List, Tuple
+
+# Budgets of the cumulative import time in milliseconds. Most of the time of btp_request is
+# spent in dataclasses_struct.
+BUDGETS_MS = {
+    "cohda_driver.btp_request": 120,
+    "cohda_driver.etsi_messages": 10,
+    "cohda_driver.its_time": 50,
+    "cohda_driver.driver": 150,
+}
+# Modules loaded on first use only, e.g. when the first EtsiDecoder is created.
+DEFERRED_MODULES = [
+    "asn1tools",
+    "colorlog",
+    "concurrent.futures.process",
+    "http.server",
+]
+
+
+def import_time(module: str) -> Tuple[float, List[Tuple[float, str]]]:
+    """
+    Import a module in a fresh interpreter.
+
+    Returns
+    -------
+    Tuple[float, List[Tuple[float, str]]]
+        Cumulative import time in milliseconds and the self time in milliseconds of every
+        imported module.
+    """
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    total = 0.0
+    self_times = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            # Header line.
+            continue
+        self_times.append((int(self_us) / 1000, name.strip()))
+        # Top level entries of the package, which include everything imported by them.
+        if name.startswith(" cohda_driver"):
+            total += int(cumulative_us) / 1000
+    return total, self_times
+
+
+def loaded_modules(module: str) -> List[str]:
+    """
+    Deferred modules that are loaded by importing a module.
+    """
+    code = f"import sys, {module}; print(' '.join(sys.modules))"
+    modules = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.split()
+    return [name for name in DEFERRED_MODULES if name in modules]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check the import times of the package.")
+    parser.add_argument("--repeat", type=int, default=5, help="Imports per module.")
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="Factor of the budgets, for slow machines."
+    )
+    parser.add_argument("--top", type=int, default=5, help="Slowest imports shown per module.")
+    args = parser.parse_args()
+
+    failures = 0
+    for module, budget in BUDGETS_MS.items():
+        best = float("inf")
+        slowest: List[Tuple[float, str]] = []
+        for _ in range(args.repeat):
+            total, self_times = import_time(module)
+            if total < best:
+                best = total
+                slowest = sorted(self_times, reverse=True)[: args.top]
+        budget *= args.scale
+        status = "ok"
+        if best > budget:
+            failures += 1
+            status = "OVER BUDGET"
+        print(f"{module:<28} {best:7.1f} ms  (budget {budget:5.0f} ms)  {status}")
+        if best > budget:
+            for milliseconds, name in slowest:
+                print(f"    {milliseconds:7.1f} ms  {name}")
+        deferred = loaded_modules(module)
+        if deferred:
+            failures += 1
+            print(f"    loads deferred modules: {', '.join(deferred)}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# Benchmark of the stages of the receive and send path on a synthetic,
+# reproducible message corpus. Writes the results as JSON and compares
+# them with the results of another commit:
+#
+#   python benchmarks/pipeline.py --output before.json
+#   python benchmarks/pipeline.py --output after.json --baseline before.json
+#
+# Exits with 1 if a stage got slower than the baseline by more than the
+# tolerance.
+# ---------------------------------------------------------------------
+import argparse
+import gc
+import json
+import platform
+import subprocess
+import sys
+import time
+
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+import asn1tools
+
+from cohda_driver import uper_codecs
+from cohda_driver.btp_request import create_btp_request_packet
+from cohda_driver.corpus import MessageCorpus
+from cohda_driver.decoder import EtsiDecoder
+from cohda_driver.etsi_message_type import EtsiMessageType
+
+# Message types and corpus arguments of the benchmarked variants.
+VARIANTS = [
+    (EtsiMessageType.CAM, {"road_side_unit": False}),
+    (EtsiMessageType.CAM, {"road_side_unit": True}),
+    (EtsiMessageType.CPM, {"objects": 0}),
+    (EtsiMessageType.CPM, {"objects": 8}),
+    (EtsiMessageType.CPM, {"objects": 32}),
+    (EtsiMessageType.MAPEM, {"lanes": 4, "nodes": 4}),
+    (EtsiMessageType.MAPEM, {"lanes": 16, "nodes": 16}),
+    (EtsiMessageType.SPATEM, {"intersections": 1}),
+    (EtsiMessageType.SPATEM, {"intersections": 8}),
+]
+# Message classes with a to_dict method. CPM.to_dict is not usable yet and MAPEM and SPATEM have
+# none. Its output is not timed with encoding, as it contains both alternatives of the high
+# frequency container CHOICE.
+TO_DICT_TYPES = {EtsiMessageType.CAM}
+
+
+def measure(function: Callable, inputs: Sequence, repeat: int) -> float:
+    """
+    Best time per input in microseconds, with the garbage collector disabled as in timeit.
+    """
+    best = float("inf")
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for item in inputs:
+                function(item)
+            best = min(best, time.perf_counter() - start)
+    finally:
+        if enabled:
+            gc.enable()
+    return best / len(inputs) * 1e6
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=Path(__file__).parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def benchmark_variant(
+    corpus: MessageCorpus,
+    message_type: EtsiMessageType,
+    arguments: Dict,
+    count: int,
+    repeat: int,
+) -> List[Dict]:
+    """
+    Time every stage on `count` messages of one variant.
+    """
+    decoder = corpus.decoder
+    spec_name, type_name, message_class = EtsiDecoder.MESSAGE_SPECS[message_type]
+    specification = decoder.specs[spec_name]
+    generate = getattr(corpus, message_type.name.lower())
+    values = [generate(**arguments) for _ in range(count)]
+    payloads = [corpus.encode(message_type, value) for value in values]
+    decoded = [specification.decode(type_name, data) for data in payloads]
+    messages = [message_class.from_dict(value) for value in decoded]
+
+    def dispatch(data: bytes):
+        header = decoder.decode_header(data)
+        decoder.is_decodable(EtsiMessageType(header.message_id), header.protocol_version)
+
+    stages = {
+        "header_dispatch": (dispatch, payloads),
+        "asn1tools_decode": (lambda data: specification.decode(type_name, data), payloads),
+        "from_dict": (message_class.from_dict, decoded),
+        "decode": (decoder.decode, payloads),
+        "encode": (lambda value: specification.encode(type_name, value), values),
+        "btp_request": (lambda data: create_btp_request_packet(message_type, data), payloads),
+    }
+    if type_name in uper_codecs.DECODERS:
+        stages["generated_decode"] = (uper_codecs.DECODERS[type_name], payloads)
+    if message_type in TO_DICT_TYPES:
+        stages["to_dict"] = (lambda message: message.to_dict(), messages)
+
+    variant = ",".join(f"{key}={value}" for key, value in arguments.items())
+    size = sum(len(data) for data in payloads) / len(payloads)
+    results = []
+    for stage, (function, inputs) in stages.items():
+        microseconds = measure(function, inputs, repeat)
+        results.append(
+            {
+                "message": message_type.name,
+                "variant": variant,
+                "stage": stage,
+                "bytes": round(size, 1),
+                "us_per_message": round(microseconds, 3),
+                "messages_per_second": round(1e6 / microseconds),
+            }
+        )
+    return results
+
+
+def compare(results: List[Dict], baseline: Dict, tolerance: float) -> int:
+    """
+    Print the change of every stage relative to the baseline. Returns the number of
+    regressions.
+    """
+    reference = {
+        (entry["message"], entry["variant"], entry["stage"]): entry["us_per_message"]
+        for entry in baseline["results"]
+    }
+    regressions = 0
+    for entry in results:
+        before = reference.get((entry["message"], entry["variant"], entry["stage"]))
+        if before is None:
+            continue
+        change = entry["us_per_message"] / before - 1
+        marker = ""
+        if change > tolerance:
+            regressions += 1
+            marker = "  REGRESSION"
+        print(
+            f"{entry['message']:<7} {entry['variant']:<20} {entry['stage']:<17} "
+            f"{before:10.2f} -> {entry['us_per_message']:10.2f} us  {change:+7.1%}{marker}",
+            file=sys.stderr,
+        )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the decode and encode stages.")
+    parser.add_argument("--count", type=int, default=200, help="Messages per variant.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing runs, the best is kept.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the message corpus.")
+    parser.add_argument("--output", type=Path, help="JSON file, stdout if not given.")
+    parser.add_argument("--baseline", type=Path, help="JSON results to compare with.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Relative slowdown of a stage reported as regression.",
+    )
+    args = parser.parse_args()
+
+    corpus = MessageCorpus(seed=args.seed)
+    results = []
+    for message_type, arguments in VARIANTS:
+        results += benchmark_variant(corpus, message_type, arguments, args.count, args.repeat)
+    report = {
+        "environment": {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "asn1tools": asn1tools.__version__,
+        },
+        "config": {"count": args.count, "repeat": args.repeat, "seed": args.seed},
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output is None:
+        print(text)
+    else:
+        args.output.write_text(text + "\n")
+
+    if args.baseline is None:
+        return 0
+    return 1 if compare(results, json.loads(args.baseline.read_text()), args.tolerance) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# Soak test of the driver with synthetic traffic from the device
+# emulator. Samples the resident memory, the per type throughput and,
+# with --tracemalloc, the largest allocation growths at intervals:
+#
+#   python benchmarks/soak.py --duration 3600 --rate CAM=2000 --rate CPM=200
+#   python benchmarks/soak.py --duration 600 --rate CAM=50 --tracemalloc
+#
+# Exits with 1 if the memory grew or the throughput dropped after the
+# warm-up by more than the thresholds.
+# ---------------------------------------------------------------------
+import argparse
+import json
+import os
+import resource
+import sys
+import time
+import tracemalloc
+
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from cohda_driver.corpus import MessageCorpus
+from cohda_driver.driver import CohdaDriver
+from cohda_driver.emulator import CohdaEmulator, parse_rate
+from cohda_driver.etsi_message_type import EtsiMessageType
+from cohda_driver.logger import logger, setup_logger
+from cohda_driver.metrics import STATION_TIMEOUT
+
+# Frames of the allocation tracebacks, to group allocations by their caller in the driver rather
+# than by the line in the standard library. Every frame adds to the tracing overhead.
+TRACEBACK_FRAMES = 3
+
+
+def rss_bytes() -> int:
+    """
+    Current resident set size of the process. Falls back to the peak where /proc is missing.
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Kilobytes on Linux, bytes on macOS.
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def top_allocations(baseline: tracemalloc.Snapshot, top: int) -> List[Dict]:
+    """
+    Allocations that grew most since the baseline snapshot.
+    """
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        [tracemalloc.Filter(False, tracemalloc.__file__)]
+    )
+    return [
+        {
+            # Most recent call first.
+            "traceback": [str(frame) for frame in reversed(stat.traceback)],
+            "size_diff": stat.size_diff,
+            "count_diff": stat.count_diff,
+            "size": stat.size,
+        }
+        for stat in snapshot.compare_to(baseline, "traceback")[:top]
+    ]
+
+
+def evaluate(
+    samples: List[Dict],
+    max_rss_growth: float,
+    max_throughput_drop: float,
+) -> List[str]:
+    """
+    Compare the samples after the warm-up with the first one. Returns the failed checks.
+    """
+    measured = [sample for sample in samples if not sample["warmup"]]
+    if len(measured) < 2:
+        return ["Too few samples after the warm-up, increase the duration."]
+    failures = []
+    first, last = measured[0], measured[-1]
+    rss_growth = (last["rss_bytes"] - first["rss_bytes"]) / 2**20
+    if rss_growth > max_rss_growth:
+        failures.append(f"RSS grew by {rss_growth:.1f} MiB (limit {max_rss_growth} MiB).")
+    # Throughput relative to the sent rate, so scheduling jitter of the emulator is not reported.
+    for name in first["received_per_second"]:
+        ratios = [
+            sample["received_per_second"][name] / sample["sent_per_second"][name]
+            for sample in measured
+            if sample["sent_per_second"].get(name)
+        ]
+        if not ratios:
+            continue
+        # Mean of the first and the last quarter of the samples.
+        quarter = max(1, len(ratios) // 4)
+        before = sum(ratios[:quarter]) / quarter
+        after = sum(ratios[-quarter:]) / quarter
+        drop = 1 - after / before if before else 0.0
+        if drop > max_throughput_drop:
+            failures.append(
+                f"{name} throughput dropped by {drop:.1%} (limit {max_throughput_drop:.0%})."
+            )
+    return failures
+
+
+def soak(
+    driver: CohdaDriver,
+    emulator: CohdaEmulator,
+    duration: float,
+    interval: float,
+    warmup: float,
+    top: int,
+    trace: bool,
+) -> List[Dict]:
+    """
+    Run the driver with emulated traffic and sample the process every `interval` seconds.
+    """
+    if trace:
+        tracemalloc.start(TRACEBACK_FRAMES)
+    baseline: Optional[tracemalloc.Snapshot] = None
+    tracker = emulator.tracker
+    samples = []
+    driver.start_loop()
+    emulator.start()
+    start = time.monotonic()
+    last_time = start
+    last_sent: Dict[EtsiMessageType, int] = {}
+    last_received: Dict[EtsiMessageType, int] = {}
+    try:
+        while last_time - start < duration:
+            time.sleep(max(0.0, min(interval, start + duration - last_time)))
+            now = time.monotonic()
+            elapsed = now - last_time
+            sent = dict(tracker.sent)
+            received = dict(tracker.received)
+            sample = {
+                "time": round(now - start, 3),
+                "warmup": now - start <= warmup,
+                "rss_bytes": rss_bytes(),
+                "sent_per_second": {
+                    t.name: (sent.get(t, 0) - last_sent.get(t, 0)) / elapsed
+                    for t in emulator.rates
+                },
+                "received_per_second": {
+                    t.name: (received.get(t, 0) - last_received.get(t, 0)) / elapsed
+                    for t in emulator.rates
+                },
+                "in_flight": tracker.in_flight,
+            }
+            if trace:
+                current, peak = tracemalloc.get_traced_memory()
+                sample["traced_bytes"] = current
+                sample["traced_peak_bytes"] = peak
+                if baseline is None and not sample["warmup"]:
+                    baseline = tracemalloc.take_snapshot().filter_traces(
+                        [tracemalloc.Filter(False, tracemalloc.__file__)]
+                    )
+                elif baseline is not None:
+                    sample["top_allocations"] = top_allocations(baseline, top)
+            rates = ", ".join(
+                f"{name} {rate:.0f}/s" for name, rate in sample["received_per_second"].items()
+            )
+            logger.info(
+                f"{sample['time']:.0f} s: RSS {sample['rss_bytes'] / 2**20:.1f} MiB, "
+                f"received {rates}"
+            )
+            samples.append(sample)
+            last_time, last_sent, last_received = now, sent, received
+    finally:
+        emulator.stop()
+        driver.stop_loop()
+        if trace:
+            tracemalloc.stop()
+    return samples
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Soak test the driver with emulated traffic.")
+    parser.add_argument(
+        "--rate",
+        type=parse_rate,
+        action="append",
+        help="Packets per second of a message type, e.g. CAM=1000. Can be repeated.",
+    )
+    parser.add_argument("--duration", type=float, default=600.0, help="Seconds to run.")
+    parser.add_argument("--interval", type=float, default=10.0, help="Seconds between samples.")
+    parser.add_argument(
+        "--warmup",
+        type=float,
+        # Per station state of the metrics grows until the first stations time out.
+        default=STATION_TIMEOUT + 30,
+        help="Seconds before the first measured sample, while caches and buffers fill up.",
+    )
+    parser.add_argument(
+        "--max-rss-growth", type=float, default=20.0, help="Allowed RSS growth in MiB."
+    )
+    parser.add_argument(
+        "--max-throughput-drop",
+        type=float,
+        default=0.05,
+        help="Allowed relative drop of the received share of the sent messages.",
+    )
+    parser.add_argument("--top", type=int, default=10, help="Allocation growths per sample.")
+    parser.add_argument(
+        "--tracemalloc",
+        dest="trace",
+        action="store_true",
+        help="Report the allocations that grew most. Slows the driver down about tenfold, so use "
+        "low rates to locate the growth found by a run without tracing.",
+    )
+    parser.add_argument("--ind-port", type=int, default=5000, help="Indication port.")
+    parser.add_argument("--req-port", type=int, default=5001, help="Request port.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the message corpus.")
+    parser.add_argument("--output", type=Path, help="JSON file, stdout if not given.")
+    args = parser.parse_args()
+    setup_logger()
+
+    rates = dict(args.rate or [(EtsiMessageType.CAM, 1000.0), (EtsiMessageType.CPM, 100.0)])
+    corpus = MessageCorpus(seed=args.seed)
+    emulator = CohdaEmulator(
+        rates, "127.0.0.1", args.ind_port, "127.0.0.1", args.req_port, corpus=corpus
+    )
+    driver = CohdaDriver(
+        "127.0.0.1",
+        "127.0.0.1",
+        args.ind_port,
+        args.req_port,
+        enable_metrics=True,
+        decoder=corpus.decoder,
+    )
+    emulator.attach(driver)
+    try:
+        samples = soak(
+            driver, emulator, args.duration, args.interval, args.warmup, args.top, args.trace
+        )
+    finally:
+        emulator.close()
+        driver.sock.close()
+    failures = evaluate(samples, args.max_rss_growth, args.max_throughput_drop)
+    report = {
+        "config": {
+            "rates": {t.name: rate for t, rate in rates.items()},
+            "duration": args.duration,
+            "interval": args.interval,
+            "warmup": args.warmup,
+            "max_rss_growth": args.max_rss_growth,
+            "max_throughput_drop": args.max_throughput_drop,
+            "tracemalloc": args.trace,
+        },
+        "samples": samples,
+        "emulator": emulator.report(),
+        "driver": driver.stats(),
+        "failures": failures,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output is None:
+        print(text)
+    else:
+        args.output.write_text(text + "\n")
+    for failure in failures:
+        logger.error(failure)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
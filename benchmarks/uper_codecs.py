@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# Throughput comparison of the generated UPER decoders against asn1tools
+# and from_dict, on random valid messages:
+#
+#   python benchmarks/uper_codecs.py --count 2000
+#
+# The conformance of the generated codecs is tested by
+# tests/test_uper_codecs.py.
+# ---------------------------------------------------------------------
+import argparse
+import random
+import sys
+import time
+
+from cohda_driver import uper_codecs
+from cohda_driver.codegen import GENERATED_MESSAGES, GeneratedMessage
+from cohda_driver.corpus import random_value
+from cohda_driver.decoder import EtsiDecoder
+
+
+def measure(function, payloads, repeat: int) -> float:
+    """
+    Best time per payload in microseconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for data in payloads:
+            function(data)
+        best = min(best, time.perf_counter() - start)
+    return best / len(payloads) * 1e6
+
+
+def compare_throughput(
+    decoder: EtsiDecoder, message: GeneratedMessage, count: int, rng: random.Random
+):
+    specification = decoder.specifications[EtsiDecoder.DECODABLE_PROTOCOL_VERSION]
+    root = specification.types[message.type_name]._type
+    message_class = getattr(
+        __import__(f"cohda_driver.etsi_messages.{message.module}", fromlist=["_"]),
+        message.message_class,
+    )
+    payloads = []
+    while len(payloads) < count:
+        value = random_value(root, rng, complete=True)
+        data = bytes(specification.encode(message.type_name, value))
+        try:
+            message_class.from_dict(specification.decode(message.type_name, data))
+        except (KeyError, IndexError, TypeError):
+            continue
+        payloads.append(data)
+    decode = getattr(uper_codecs, f"decode_{message.name}")
+    results = {
+        "asn1tools + from_dict": measure(
+            lambda data: message_class.from_dict(specification.decode(message.type_name, data)),
+            payloads,
+            3,
+        ),
+        "generated": measure(decode, payloads, 3),
+    }
+    size = sum(len(data) for data in payloads) / len(payloads)
+    print(f"{message.type_name} decoding ({size:.0f} bytes on average):")
+    for name, microseconds in results.items():
+        print(f"  {name:<22} {microseconds:8.1f} us/msg  {1e6 / microseconds:10.0f} msg/s")
+    speedup = results["asn1tools + from_dict"] / results["generated"]
+    print(f"  speedup {speedup:.1f}x")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=1000, help="Random messages per type.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    decoder = EtsiDecoder()
+    for message in GENERATED_MESSAGES:
+        compare_throughput(decoder, message, args.count, rng)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
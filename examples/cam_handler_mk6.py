@@ -15,9 +15,11 @@ import time
 from cohda_driver.etsi_messages.cam import CAM
 from cohda_driver.etsi_message_type import EtsiMessageType
 from cohda_driver.driver import CohdaDriver
+from cohda_driver.logger import setup_logger
 
 
 def main() -> None:
+    setup_logger()
     driver = CohdaDriver("localhost", "127.0.0.1", 5000, 5001)
 
     driver.setup_callback(callback=cam_callback, etsi_msg_type=EtsiMessageType.CAM)
@@ -17,8 +17,10 @@ from cohda_driver.etsi_messages.cpm import CPM
 from cohda_driver.etsi_message_type import EtsiMessageType
 
 from cohda_driver.driver import CohdaDriver
+from cohda_driver.logger import setup_logger
 
 def main() -> None:
+	setup_logger()
 	driver = CohdaDriver("141.21.47.177","141.21.45.111", 4400, 4401)
 
 	driver.setup_callback(callback=cpm_callback, etsi_msg_type=EtsiMessageType.CPM)
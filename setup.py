@@ -20,5 +20,11 @@ setup(
             "pytest>=8.2.2",
             "pylint>=2.3.1",
         ],
+        "export": [
+            "pyarrow>=12.0.0",
+        ],
+        "analytics": [
+            "numpy>=1.20",
+        ],
     },
 )
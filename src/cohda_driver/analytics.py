@@ -0,0 +1,551 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# This module implements traffic analytics over sliding time windows of
+# received CAMs. The kinematics of the CAMs are buffered in preallocated
+# NumPy ring arrays and aggregated per geographic cell or MAPEM approach
+# with vectorized operations.
+#
+# Requires the optional numpy dependency: pip install -e .[analytics]
+# ---------------------------------------------------------------------
+import math
+import threading
+import time
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from cohda_driver.etsi_messages.cam import CAM, ROAD_SIDE_UNIT
+from cohda_driver.etsi_messages.mapem import MAPEM
+from cohda_driver.geofence import EARTH_RADIUS, POSITION_UNITS_PER_DEGREE
+from cohda_driver.partial_decoder import LATITUDE_UNAVAILABLE, LONGITUDE_UNAVAILABLE
+
+# Values of the CAM data elements meaning unavailable.
+HEADING_UNAVAILABLE = 3601
+SPEED_UNAVAILABLE = 16383
+ACCELERATION_UNAVAILABLE = 161
+# Units of the CAM data elements: 0.1 degree, 0.01 m/s and 0.1 m/s^2.
+HEADING_UNITS_PER_DEGREE = 10
+SPEED_UNITS_PER_METER_PER_SECOND = 100
+ACCELERATION_UNITS_PER_METER_PER_SECOND_SQUARED = 10
+
+# Lane width in meters for MAPEMs without a lane width.
+DEFAULT_LANE_WIDTH = 3.5
+# Positions matched to the lanes of a MAPEM at once, which bounds the memory of the distance
+# matrix of the positions and the lane segments.
+APPROACH_CHUNK_SIZE = 4096
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError(
+            "The analytics require numpy. Install it with 'pip install .[analytics]'."
+        )
+
+
+def _local_coordinates(
+    latitudes: "np.ndarray",
+    longitudes: "np.ndarray",
+    origin: Tuple[float, float],
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    East and north coordinates in meters of positions in degrees around an origin, with the same
+    equirectangular approximation as Geofence.
+    """
+    meters_per_degree = math.radians(1) * EARTH_RADIUS
+    east = (longitudes - origin[1]) * (meters_per_degree * math.cos(math.radians(origin[0])))
+    north = (latitudes - origin[0]) * meters_per_degree
+    return east, north
+
+
+@dataclass
+class CamWindow:
+    """
+    Kinematics of the CAMs of a time window in columns, oldest first. Unavailable values are NaN.
+
+    Attributes
+    ----------
+    time : np.ndarray
+        Unix time the CAMs were added to the buffer.
+    station_id : np.ndarray
+        Station ID of the senders.
+    latitude, longitude : np.ndarray
+        Reference position in degrees.
+    speed : np.ndarray
+        Speed in m/s.
+    heading : np.ndarray
+        Heading in degrees clockwise from north.
+    acceleration : np.ndarray
+        Longitudinal acceleration in m/s^2.
+    """
+
+    time: "np.ndarray"
+    station_id: "np.ndarray"
+    latitude: "np.ndarray"
+    longitude: "np.ndarray"
+    speed: "np.ndarray"
+    heading: "np.ndarray"
+    acceleration: "np.ndarray"
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+
+@dataclass
+class WindowStatistics:
+    """
+    Traffic statistics of a time window per group, i.e. per geographic cell or approach. Only
+    groups with CAMs in the window are included.
+
+    Attributes
+    ----------
+    keys : np.ndarray
+        Group of every row, shape (groups, 2). Cells are given by their north and east index,
+        approaches by the intersection ID and the ingress approach ID.
+    samples : np.ndarray
+        Number of CAMs.
+    stations : np.ndarray
+        Number of distinct stations, the traffic density of the group.
+    mean_speed : np.ndarray
+        Mean speed of the CAMs in m/s, NaN if none had a speed.
+    mean_acceleration : np.ndarray
+        Mean longitudinal acceleration of the CAMs in m/s^2, NaN if none had an acceleration.
+    heading_histogram : np.ndarray
+        Number of CAMs per heading sector, shape (groups, sectors). The first sector starts at
+        north, the sectors follow clockwise.
+    """
+
+    keys: "np.ndarray"
+    samples: "np.ndarray"
+    stations: "np.ndarray"
+    mean_speed: "np.ndarray"
+    mean_acceleration: "np.ndarray"
+    heading_histogram: "np.ndarray"
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def rows(self) -> List[Dict]:
+        """
+        Statistics as one dictionary per group, e.g. for JSON output.
+        """
+        return [
+            {
+                "key": tuple(int(value) for value in self.keys[i]),
+                "samples": int(self.samples[i]),
+                "stations": int(self.stations[i]),
+                "mean_speed": float(self.mean_speed[i]),
+                "mean_acceleration": float(self.mean_acceleration[i]),
+                "heading_histogram": self.heading_histogram[i].tolist(),
+            }
+            for i in range(len(self.keys))
+        ]
+
+
+def aggregate(
+    window: CamWindow,
+    keys: "np.ndarray",
+    heading_sectors: int = 8,
+) -> WindowStatistics:
+    """
+    Aggregate the CAMs of a window per group.
+
+    Parameters
+    ----------
+    window : CamWindow
+        CAMs to aggregate.
+    keys : np.ndarray
+        Group of every CAM, shape (len(window), 2), with parts in the range of 32 bit integers.
+    heading_sectors : int
+        Number of sectors of the heading histogram.
+
+    Returns
+    -------
+    WindowStatistics
+        Statistics of the groups.
+    """
+    _require_numpy()
+    # Both parts of a key as one 64 bit integer, as unique of rows is much slower.
+    keys = keys.reshape(-1, 2).astype(np.int64)
+    codes, groups = np.unique(keys[:, 0] << 32 | (keys[:, 1] & 0xFFFFFFFF), return_inverse=True)
+    groups = groups.reshape(-1)
+    count = len(codes)
+    low = (codes & 0xFFFFFFFF).astype(np.uint32).view(np.int32)
+    group_keys = np.stack([codes >> 32, low.astype(np.int64)], axis=1)
+    samples = np.bincount(groups, minlength=count)
+    # Distinct stations from the distinct pairs of group and station.
+    pairs = np.unique(groups.astype(np.int64) << 32 | window.station_id.astype(np.int64))
+    stations = np.bincount(pairs >> 32, minlength=count)
+
+    def mean(values: "np.ndarray") -> "np.ndarray":
+        valid = ~np.isnan(values)
+        sums = np.bincount(groups[valid], weights=values[valid], minlength=count)
+        counts = np.bincount(groups[valid], minlength=count)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return sums / counts
+
+    valid = ~np.isnan(window.heading)
+    sectors = (window.heading[valid] * (heading_sectors / 360)).astype(np.int64) % heading_sectors
+    heading_histogram = np.bincount(
+        groups[valid] * heading_sectors + sectors, minlength=count * heading_sectors
+    ).reshape(count, heading_sectors)
+    return WindowStatistics(
+        keys=group_keys,
+        samples=samples,
+        stations=stations,
+        mean_speed=mean(window.speed),
+        mean_acceleration=mean(window.acceleration),
+        heading_histogram=heading_histogram,
+    )
+
+
+class ApproachMap:
+    """
+    Lanes of the intersections of a MAPEM, to match positions to ingress approaches.
+
+    A position belongs to the approach of the nearest lane if it is closer to the lane center
+    line than the lane width. Positions nearest to lanes without an ingress approach, e.g.
+    egress lanes, belong to no approach.
+    """
+
+    def __init__(self, mapem: MAPEM, max_distance: Optional[float] = None):
+        """
+        Initialize the map.
+
+        Parameters
+        ----------
+        mapem : MAPEM
+            Decoded MAPEM.
+        max_distance : Optional[float]
+            Maximum distance in meters of a position to the center line of its lane. Defaults to
+            the lane width of the intersection.
+        """
+        _require_numpy()
+        intersections = mapem.mapData.intersectionGeometryList
+        if not intersections:
+            raise ValueError("The MAPEM contains no intersection.")
+        first = intersections[0].refPoint
+        self.origin = (first.latitude, first.longitude)
+        starts, ends, keys, distances = [], [], [], []
+        for intersection in intersections:
+            east, north = _local_coordinates(
+                np.array([intersection.refPoint.latitude]),
+                np.array([intersection.refPoint.longitude]),
+                self.origin,
+            )
+            lane_width = intersection.laneWidth / 100 or DEFAULT_LANE_WIDTH
+            for lane in intersection.genericLaneListSet:
+                nodes = lane.mapemNodeList.mapemNodeList
+                if not nodes:
+                    continue
+                # The first node is an offset from the reference point, the others from their
+                # previous node.
+                offsets = np.cumsum([(node.offset_x, node.offset_y) for node in nodes], axis=0)
+                points = offsets + (east[0], north[0])
+                if len(points) == 1:
+                    points = np.vstack([points, points])
+                starts.append(points[:-1])
+                ends.append(points[1:])
+                segments = len(points) - 1
+                keys += [(intersection.intersectionReferenceId, lane.ingressApproach)] * segments
+                distances += [lane_width if max_distance is None else max_distance] * segments
+        if not keys:
+            raise ValueError("The MAPEM contains no lane with nodes.")
+        self._starts = np.vstack(starts)
+        self._directions = np.vstack(ends) - self._starts
+        self._lengths = np.einsum("ij,ij->i", self._directions, self._directions)
+        self._keys = np.array(keys, dtype=np.int64)
+        self._max_distances = np.array(distances)
+
+    def match(
+        self, latitudes: "np.ndarray", longitudes: "np.ndarray"
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Match positions to approaches.
+
+        Parameters
+        ----------
+        latitudes, longitudes : np.ndarray
+            Positions in degrees.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Intersection ID and ingress approach ID of every position, shape (positions, 2), and
+            whether the position belongs to an approach.
+        """
+        east, north = _local_coordinates(latitudes, longitudes, self.origin)
+        points = np.stack([east, north], axis=1)
+        nearest = np.empty(len(points), dtype=np.int64)
+        distances = np.empty(len(points))
+        for start in range(0, len(points), APPROACH_CHUNK_SIZE):
+            chunk = points[start : start + APPROACH_CHUNK_SIZE]
+            # Offsets of every position to every segment start, shape (positions, segments, 2).
+            offsets = chunk[:, None, :] - self._starts[None, :, :]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                along = np.einsum("psk,sk->ps", offsets, self._directions) / self._lengths
+            along = np.clip(np.nan_to_num(along), 0, 1)
+            closest = offsets - along[:, :, None] * self._directions[None, :, :]
+            squared = np.einsum("psk,psk->ps", closest, closest)
+            index = np.argmin(squared, axis=1)
+            nearest[start : start + len(chunk)] = index
+            distances[start : start + len(chunk)] = np.sqrt(squared[np.arange(len(chunk)), index])
+        keys = self._keys[nearest]
+        matched = (distances <= self._max_distances[nearest]) & (keys[:, 1] != 0)
+        return keys, matched
+
+
+class CamBuffer:
+    """
+    Ring buffer of the kinematics of received CAMs in preallocated NumPy arrays.
+
+    Adding a CAM writes one row, and the oldest rows are overwritten once the buffer is full.
+    Windows are located by binary search on the add times, so aggregations cost time
+    proportional to the number of CAMs in the window, not to the capacity. CAMs of road side
+    units and without a position are not buffered.
+
+    The buffer is meant to be fed from a CAM subscription:
+
+    ```
+    buffer = CamBuffer()
+    driver.subscribe(EtsiMessageType.CAM, buffer.add)
+    statistics = buffer.cell_statistics(10.0, cell_size=50.0)
+    ```
+
+    All methods may be called from any thread.
+    """
+
+    def __init__(self, capacity: int = 65536, origin: Optional[Tuple[float, float]] = None):
+        """
+        Initialize the buffer.
+
+        Parameters
+        ----------
+        capacity : int
+            Number of CAMs kept. Size it for the longest window at the peak CAM rate.
+        origin : Optional[Tuple[float, float]]
+            Latitude and longitude in degrees of the origin of the geographic cells. Defaults to
+            the position of the first buffered CAM.
+        """
+        _require_numpy()
+        if capacity < 1:
+            raise ValueError("The capacity must be at least 1.")
+        self.capacity = capacity
+        self.origin = origin
+        # Values in the units of the CAM data elements.
+        self._time = np.zeros(capacity, dtype=np.float64)
+        self._station_id = np.zeros(capacity, dtype=np.uint32)
+        self._latitude = np.zeros(capacity, dtype=np.int32)
+        self._longitude = np.zeros(capacity, dtype=np.int32)
+        self._speed = np.zeros(capacity, dtype=np.uint16)
+        self._heading = np.zeros(capacity, dtype=np.uint16)
+        self._acceleration = np.zeros(capacity, dtype=np.int16)
+        self._next = 0
+        self._count = 0
+        self._last_time = -math.inf
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, cam: CAM, timestamp: Optional[float] = None) -> bool:
+        """
+        Add the kinematics of a CAM.
+
+        Parameters
+        ----------
+        cam : CAM
+            Decoded CAM.
+        timestamp : Optional[float]
+            Receive time as Unix time. Defaults to now. Timestamps before the latest added one
+            are replaced by it, so the buffer stays sorted by time.
+
+        Returns
+        -------
+        bool
+            Whether the CAM was buffered.
+        """
+        parameters = cam.cam.cam_parameters
+        basic_container = parameters.basic_container
+        position = basic_container.reference_position
+        if (
+            basic_container.station_type == ROAD_SIDE_UNIT
+            or position.latitude == LATITUDE_UNAVAILABLE
+            or position.longitude == LONGITUDE_UNAVAILABLE
+        ):
+            return False
+        high_frequency = parameters.high_frequency_container.basic_vehicle_container_high_frequency
+        if timestamp is None:
+            timestamp = time.time()
+        with self._lock:
+            if timestamp < self._last_time:
+                timestamp = self._last_time
+            self._last_time = timestamp
+            if self.origin is None:
+                self.origin = (
+                    position.latitude / POSITION_UNITS_PER_DEGREE,
+                    position.longitude / POSITION_UNITS_PER_DEGREE,
+                )
+            index = self._next
+            self._time[index] = timestamp
+            self._station_id[index] = cam.header.station_id
+            self._latitude[index] = position.latitude
+            self._longitude[index] = position.longitude
+            self._speed[index] = high_frequency.speed.speed_value
+            self._heading[index] = high_frequency.heading.heading_value
+            self._acceleration[index] = (
+                high_frequency.longitudinal_acceleration.longitudinal_acceleration_value
+            )
+            self._next = (index + 1) % self.capacity
+            self._count = min(self._count + 1, self.capacity)
+        return True
+
+    def window(self, duration: float, now: Optional[float] = None) -> CamWindow:
+        """
+        Get the CAMs added in the last `duration` seconds.
+
+        Parameters
+        ----------
+        duration : float
+            Length of the window in seconds.
+        now : Optional[float]
+            End of the window as Unix time. Defaults to now.
+
+        Returns
+        -------
+        CamWindow
+            Copy of the CAMs of the window with values in SI units.
+        """
+        if now is None:
+            now = time.time()
+        start_time = now - duration
+        with self._lock:
+            # The rows in the order they were added, as at most two contiguous slices.
+            first = (self._next - self._count) % self.capacity
+            if first + self._count <= self.capacity:
+                segments = [slice(first, first + self._count)]
+            else:
+                segments = [slice(first, self.capacity), slice(0, self._next)]
+            selected = []
+            for segment in segments:
+                times = self._time[segment]
+                begin = np.searchsorted(times, start_time, side="left")
+                end = np.searchsorted(times, now, side="right")
+                if begin < end:
+                    selected.append(slice(segment.start + begin, segment.start + end))
+            columns = [
+                np.concatenate([column[segment] for segment in selected])
+                if selected
+                else column[:0].copy()
+                for column in (
+                    self._time,
+                    self._station_id,
+                    self._latitude,
+                    self._longitude,
+                    self._speed,
+                    self._heading,
+                    self._acceleration,
+                )
+            ]
+        time_column, station_id, latitude, longitude, speed, heading, acceleration = columns
+        return CamWindow(
+            time=time_column,
+            station_id=station_id,
+            latitude=latitude / POSITION_UNITS_PER_DEGREE,
+            longitude=longitude / POSITION_UNITS_PER_DEGREE,
+            speed=np.where(
+                speed == SPEED_UNAVAILABLE, np.nan, speed / SPEED_UNITS_PER_METER_PER_SECOND
+            ),
+            heading=np.where(
+                heading >= HEADING_UNAVAILABLE, np.nan, heading / HEADING_UNITS_PER_DEGREE
+            ),
+            acceleration=np.where(
+                acceleration == ACCELERATION_UNAVAILABLE,
+                np.nan,
+                acceleration / ACCELERATION_UNITS_PER_METER_PER_SECOND_SQUARED,
+            ),
+        )
+
+    def cell_statistics(
+        self,
+        duration: float,
+        cell_size: float = 50.0,
+        heading_sectors: int = 8,
+        now: Optional[float] = None,
+    ) -> WindowStatistics:
+        """
+        Traffic statistics of the last `duration` seconds per square geographic cell.
+
+        Parameters
+        ----------
+        duration : float
+            Length of the window in seconds.
+        cell_size : float
+            Edge length of the cells in meters. Cells are aligned to the origin of the buffer.
+        heading_sectors : int
+            Number of sectors of the heading histogram.
+        now : Optional[float]
+            End of the window as Unix time. Defaults to now.
+
+        Returns
+        -------
+        WindowStatistics
+            Statistics per cell, keyed by the north and east index of the cell.
+        """
+        window = self.window(duration, now)
+        if self.origin is None:
+            return aggregate(window, np.empty((0, 2), dtype=np.int64), heading_sectors)
+        east, north = _local_coordinates(window.latitude, window.longitude, self.origin)
+        keys = np.stack(
+            [np.floor(north / cell_size), np.floor(east / cell_size)], axis=1
+        ).astype(np.int64)
+        return aggregate(window, keys, heading_sectors)
+
+    def approach_statistics(
+        self,
+        duration: float,
+        approaches: ApproachMap,
+        heading_sectors: int = 8,
+        now: Optional[float] = None,
+    ) -> WindowStatistics:
+        """
+        Traffic statistics of the last `duration` seconds per ingress approach of a MAPEM.
+
+        Parameters
+        ----------
+        duration : float
+            Length of the window in seconds.
+        approaches : ApproachMap
+            Lanes of the MAPEM. CAMs outside of the ingress lanes are not included.
+        heading_sectors : int
+            Number of sectors of the heading histogram.
+        now : Optional[float]
+            End of the window as Unix time. Defaults to now.
+
+        Returns
+        -------
+        WindowStatistics
+            Statistics per approach, keyed by the intersection ID and the approach ID.
+        """
+        window = self.window(duration, now)
+        keys, matched = approaches.match(window.latitude, window.longitude)
+        window = CamWindow(
+            **{name: column[matched] for name, column in vars(window).items()}
+        )
+        return aggregate(window, keys[matched], heading_sectors)
+
+    def clear(self):
+        with self._lock:
+            self._next = 0
+            self._count = 0
+            self._last_time = -math.inf
@@ -0,0 +1,375 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# This module implements an indexed, append-only archive of raw UPER
+# encoded ETSI messages with memory-mapped random access.
+#
+# An archive is a directory of segments. Every segment consists of a data
+# file with the concatenated payloads and an index file with one fixed-size
+# entry (timestamp, stationID, messageType, offset, ...) per payload.
+# ---------------------------------------------------------------------
+import mmap
+import struct
+import time
+
+from pathlib import Path
+from typing import BinaryIO, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from cohda_driver.decoder import EtsiDecoder, EtsiMessageClasses
+from cohda_driver.etsi_message_type import EtsiMessageType
+from cohda_driver.etsi_messages import ItsPduHeader
+from cohda_driver.logger import logger
+
+# timestamp_ns, station_id, message_type, protocol_version, reserved, offset, length
+INDEX_ENTRY_STRUCT = struct.Struct(">QIBBHQI")
+INDEX_ENTRY_SIZE = INDEX_ENTRY_STRUCT.size
+
+SEGMENT_DATA_SUFFIX = ".dat"
+SEGMENT_INDEX_SUFFIX = ".idx"
+
+
+class ArchiveRecord(NamedTuple):
+    # Receive timestamp in nanoseconds since the epoch.
+    timestamp_ns: int
+    station_id: int
+    message_type: int
+    protocol_version: int
+    # UPER encoded ETSI message. This is a view into the memory-mapped segment and is only valid
+    # until the reader is closed.
+    payload: memoryview
+
+
+def _segment_path(directory: Path, number: int, suffix: str) -> Path:
+    return directory / f"segment-{number:06d}{suffix}"
+
+
+def _segment_numbers(directory: Path) -> List[int]:
+    return sorted(
+        int(path.stem.split("-")[1]) for path in directory.glob(f"segment-*{SEGMENT_INDEX_SUFFIX}")
+    )
+
+
+def _last_timestamp_ns(directory: Path, segment_numbers: List[int]) -> int:
+    """
+    Timestamp of the last complete index entry of an archive, or 0 if it is empty.
+    """
+    for number in reversed(segment_numbers):
+        index_path = _segment_path(directory, number, SEGMENT_INDEX_SUFFIX)
+        entry_count = index_path.stat().st_size // INDEX_ENTRY_SIZE
+        if entry_count > 0:
+            with open(index_path, "rb") as index_file:
+                index_file.seek((entry_count - 1) * INDEX_ENTRY_SIZE)
+                return INDEX_ENTRY_STRUCT.unpack(index_file.read(INDEX_ENTRY_SIZE))[0]
+    return 0
+
+
+class MessageArchiveWriter:
+    """
+    Append raw ETSI messages to an archive.
+
+    A new segment is started whenever the data file of the current segment exceeds the
+    configured size, and whenever an existing archive is opened again.
+    """
+
+    def __init__(self, directory: Union[str, Path], segment_size: int = 256 * 1024 * 1024):
+        """
+        Initialize the writer.
+
+        Parameters
+        ----------
+        directory : Union[str, pathlib.Path]
+            Archive directory. It is created if it does not exist.
+        segment_size : int
+            Maximum size of a segment data file in bytes.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_size = segment_size
+        self.message_count = 0
+
+        segment_numbers = _segment_numbers(self.directory)
+        self._segment_number = segment_numbers[-1] + 1 if segment_numbers else 0
+        self._data_file: Optional[BinaryIO] = None
+        self._index_file: Optional[BinaryIO] = None
+        self._offset = 0
+        # Continue after the last archived message, so that timestamps also do not decrease
+        # across the segments of an archive that is opened again.
+        self._last_timestamp_ns = _last_timestamp_ns(self.directory, segment_numbers)
+        self._open_segment()
+
+    def _open_segment(self):
+        self._close_segment()
+        data_path = _segment_path(self.directory, self._segment_number, SEGMENT_DATA_SUFFIX)
+        logger.debug(f"Starting archive segment {data_path}.")
+        self._data_file = open(data_path, "ab")
+        self._index_file = open(
+            _segment_path(self.directory, self._segment_number, SEGMENT_INDEX_SUFFIX), "ab"
+        )
+        self._offset = 0
+        self._segment_number += 1
+
+    def _close_segment(self):
+        if self._data_file is not None:
+            self._data_file.close()
+            self._index_file.close()
+            self._data_file = None
+            self._index_file = None
+
+    def write(
+        self,
+        payload: bytes,
+        its_pdu_header: Optional[ItsPduHeader] = None,
+        timestamp_ns: Optional[int] = None,
+    ):
+        """
+        Append a message to the archive.
+
+        Parameters
+        ----------
+        payload : bytes
+            UPER encoded ETSI message, starting with the ItsPduHeader.
+        its_pdu_header : Optional[ItsPduHeader]
+            Header of the message. It is read from the payload if None.
+        timestamp_ns : Optional[int]
+            Receive timestamp in nanoseconds since the epoch. Defaults to `time.time_ns()`.
+            Timestamps must not decrease within an archive, so an earlier timestamp (e.g. after
+            a clock step) is raised to the last written one.
+        """
+        if its_pdu_header is None:
+            its_pdu_header = ItsPduHeader.from_bytes(payload)
+        if timestamp_ns is None:
+            timestamp_ns = time.time_ns()
+        timestamp_ns = max(timestamp_ns, self._last_timestamp_ns)
+        self._last_timestamp_ns = timestamp_ns
+
+        if self._offset > 0 and self._offset + len(payload) > self.segment_size:
+            self._open_segment()
+        self._data_file.write(payload)
+        self._index_file.write(
+            INDEX_ENTRY_STRUCT.pack(
+                timestamp_ns,
+                its_pdu_header.station_id,
+                its_pdu_header.message_id,
+                its_pdu_header.protocol_version,
+                0,
+                self._offset,
+                len(payload),
+            )
+        )
+        self._offset += len(payload)
+        self.message_count += 1
+
+    def flush(self):
+        """
+        Flush the current segment, making all written messages visible to readers.
+        """
+        self._data_file.flush()
+        self._index_file.flush()
+
+    def close(self):
+        self._close_segment()
+        logger.info(f"Archived {self.message_count} messages to {self.directory}.")
+
+    def __enter__(self) -> "MessageArchiveWriter":
+        return self
+
+    def __exit__(self, *_exc_info):
+        self.close()
+
+
+class _Segment:
+    def __init__(self, data_path: Path, index_path: Path):
+        # Only complete index entries whose payload has been written are used.
+        index_size = index_path.stat().st_size // INDEX_ENTRY_SIZE * INDEX_ENTRY_SIZE
+        self.entry_count = index_size // INDEX_ENTRY_SIZE
+        self._files = []
+        self._index = self._map(index_path, index_size)
+        self._data = self._map(data_path, data_path.stat().st_size)
+        while self.entry_count > 0:
+            entry = self.entry(self.entry_count - 1)
+            if entry[5] + entry[6] <= len(self._data):
+                break
+            self.entry_count -= 1
+
+    def _map(self, path: Path, size: int) -> memoryview:
+        if size == 0:
+            return memoryview(b"")
+        file = open(path, "rb")
+        self._files.append(file)
+        mapped = mmap.mmap(file.fileno(), size, access=mmap.ACCESS_READ)
+        self._files.append(mapped)
+        return memoryview(mapped)
+
+    def entry(self, position: int) -> Tuple[int, int, int, int, int, int, int]:
+        return INDEX_ENTRY_STRUCT.unpack_from(self._index, position * INDEX_ENTRY_SIZE)
+
+    def timestamp(self, position: int) -> int:
+        return struct.unpack_from(">Q", self._index, position * INDEX_ENTRY_SIZE)[0]
+
+    def lower_bound(self, timestamp_ns: int) -> int:
+        low, high = 0, self.entry_count
+        while low < high:
+            middle = (low + high) // 2
+            if self.timestamp(middle) < timestamp_ns:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def payload(self, offset: int, length: int) -> memoryview:
+        return self._data[offset : offset + length]
+
+    def close(self):
+        self._index.release()
+        self._data.release()
+        for file in reversed(self._files):
+            try:
+                file.close()
+            except BufferError:
+                # Payloads of returned records are still referenced. The mapping is closed when
+                # they are garbage collected.
+                pass
+
+
+class MessageArchiveReader:
+    """
+    Query an archive written by MessageArchiveWriter.
+
+    Segments are memory-mapped, and the time range of a query is located by a binary search in
+    the index, so a query only touches the index entries within its time range and the payloads
+    of the matching messages.
+    """
+
+    def __init__(self, directory: Union[str, Path], decoder: Optional[EtsiDecoder] = None):
+        """
+        Initialize the reader.
+
+        Parameters
+        ----------
+        directory : Union[str, pathlib.Path]
+            Archive directory.
+        decoder : Optional[EtsiDecoder]
+            Decoder used by `query_messages`. A new decoder is created on first use if None.
+        """
+        self.directory = Path(directory)
+        if not self.directory.is_dir():
+            raise FileNotFoundError(f"Archive {self.directory} does not exist.")
+        self._decoder = decoder
+        self._segments: List[_Segment] = []
+        for number in _segment_numbers(self.directory):
+            segment = _Segment(
+                _segment_path(self.directory, number, SEGMENT_DATA_SUFFIX),
+                _segment_path(self.directory, number, SEGMENT_INDEX_SUFFIX),
+            )
+            if segment.entry_count > 0:
+                self._segments.append(segment)
+            else:
+                segment.close()
+
+    def __len__(self) -> int:
+        return sum(segment.entry_count for segment in self._segments)
+
+    def query(
+        self,
+        start_ns: Optional[int] = None,
+        end_ns: Optional[int] = None,
+        station_id: Optional[int] = None,
+        message_type: Optional[EtsiMessageType] = None,
+    ) -> Iterator[ArchiveRecord]:
+        """
+        Get the raw messages matching all given criteria.
+
+        Parameters
+        ----------
+        start_ns : Optional[int]
+            Inclusive start of the time range in nanoseconds since the epoch.
+        end_ns : Optional[int]
+            Exclusive end of the time range in nanoseconds since the epoch.
+        station_id : Optional[int]
+            Station ID of the sender.
+        message_type : Optional[EtsiMessageType]
+            Type of the messages.
+
+        Returns
+        -------
+        Iterator[ArchiveRecord]
+            Matching messages in the order they were archived.
+        """
+        message_id = None if message_type is None else message_type.value
+        for segment in self._segments:
+            # Segments may overlap in time, e.g. in archives combined from the segments of
+            # several archives, so the later segments are still checked.
+            if end_ns is not None and segment.timestamp(0) >= end_ns:
+                continue
+            if start_ns is not None and segment.timestamp(segment.entry_count - 1) < start_ns:
+                continue
+
+            position = 0 if start_ns is None else segment.lower_bound(start_ns)
+            for position in range(position, segment.entry_count):
+                (
+                    timestamp_ns,
+                    entry_station_id,
+                    entry_message_id,
+                    protocol_version,
+                    _,
+                    offset,
+                    length,
+                ) = segment.entry(position)
+                if end_ns is not None and timestamp_ns >= end_ns:
+                    break
+                if station_id is not None and entry_station_id != station_id:
+                    continue
+                if message_id is not None and entry_message_id != message_id:
+                    continue
+                yield ArchiveRecord(
+                    timestamp_ns,
+                    entry_station_id,
+                    entry_message_id,
+                    protocol_version,
+                    segment.payload(offset, length),
+                )
+
+    def query_messages(
+        self,
+        start_ns: Optional[int] = None,
+        end_ns: Optional[int] = None,
+        station_id: Optional[int] = None,
+        message_type: Optional[EtsiMessageType] = None,
+    ) -> Iterator[Tuple[int, EtsiMessageClasses]]:
+        """
+        Get the decoded messages matching all given criteria.
+
+        The parameters are the same as for `query`. Messages are only decoded when the iterator
+        reaches them, and messages that cannot be decoded are skipped.
+
+        Returns
+        -------
+        Iterator[Tuple[int, EtsiMessageClasses]]
+            Timestamp in nanoseconds since the epoch and the decoded message.
+        """
+        if self._decoder is None:
+            self._decoder = EtsiDecoder()
+        for record in self.query(start_ns, end_ns, station_id, message_type):
+            try:
+                etsi_msg = self._decoder.decode(bytes(record.payload))
+            except Exception as e:
+                logger.debug("Error decoding archived message at %d: %s", record.timestamp_ns, e)
+                continue
+            if etsi_msg is not None:
+                yield record.timestamp_ns, etsi_msg
+
+    def close(self):
+        for segment in self._segments:
+            segment.close()
+        self._segments = []
+
+    def __enter__(self) -> "MessageArchiveReader":
+        return self
+
+    def __exit__(self, *_exc_info):
+        self.close()
@@ -13,6 +13,10 @@ import dataclasses_struct as ds
 
 from typing_extensions import Annotated
 
+from .btp_request import btp_ports, gn_packet_transports, gn_traffic_classes
+from .common_header import CommonHeader
+from .etsi_message_type import EtsiMessageType
+
 
 @ds.dataclass(endian=ds.BIG_ENDIAN)
 class BtpDataIndication:
@@ -47,3 +51,22 @@ class BtpDataIndication:
 
 
 BTP_DATA_INDICATION_SIZE = ds.get_struct_size(BtpDataIndication)
+
+
+def create_btp_indication_packet(message_type: EtsiMessageType, data: bytes) -> bytes:
+    """
+    Create the datagram a Cohda device sends to the indication port for a received message.
+    Used to emulate a device, see `cohda_driver.emulator`.
+    """
+    common_header = CommonHeader()
+    # 1 = BTP Data Indication
+    common_header.message_id = 1
+    common_header.length = BTP_DATA_INDICATION_SIZE + len(data)
+
+    btp_header = BtpDataIndication()
+    btp_header.gn_packet_transport = gn_packet_transports[message_type]
+    btp_header.gn_traffic_class = gn_traffic_classes[message_type]
+    btp_header.btp_destination_port = btp_ports[message_type]
+    btp_header.data_length = len(data)
+
+    return common_header.pack() + btp_header.pack() + data
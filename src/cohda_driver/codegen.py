@@ -0,0 +1,1562 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# This module implements the generator of the specialized UPER codecs in
+# uper_codecs.py. It walks the type trees compiled by asn1tools from the
+# bundled ASN.1 specifications and emits straight-line Python code for
+# them. Regenerate the codecs after changing the specifications or the
+# bindings below:
+#
+#   python -m cohda_driver.codegen
+# ---------------------------------------------------------------------
+import argparse
+import builtins
+import importlib
+import keyword
+import re
+import sys
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from asn1tools.codecs import per, uper
+
+from cohda_driver.decoder import EtsiDecoder, compile_modules, specification_digest
+
+OUTPUT_PATH = Path(__file__).parent / "uper_codecs.py"
+
+# Placeholder of a decoded value in a binding, relative to the bound path, e.g. "$speed.speedValue".
+PLACEHOLDER = re.compile(r"\$([A-Za-z_][\w-]*(?:\.[A-Za-z_][\w-]*)*)")
+# Clamp of a placeholder, dropped if the ASN.1 constraints already guarantee the range.
+CLAMP = re.compile(r"clamp\(\$([\w.-]+), (-?\d+), (-?\d+)\)")
+# Names in a binding that may refer to the module of the ETSI message classes.
+NAME = re.compile(r"(?<![\w.$'])([A-Za-z_]\w*)(?!\s*=[^=])")
+
+# Names that generated local variables must not shadow.
+RESERVED_NAMES = set(keyword.kwlist) | set(dir(builtins)) | {"v", "r", "e", "m", "value", "outer"}
+
+
+class GeneratedMessage(NamedTuple):
+    """
+    Message for which codecs are generated.
+
+    Decoded values are mapped to the ETSI message classes by bindings. A binding is a Python
+    expression that builds the value of a path in the ASN.1 type tree, e.g.
+    "cam.camParameters" or "cpm.cpmParameters.perceivedObjectContainer.*" for the elements of a
+    SEQUENCE OF. Its placeholders "$member.submember" are replaced by the decoded values below
+    the path. Unbound values referenced by a binding are decoded as by asn1tools, and members
+    that no binding references are skipped without building any values.
+    """
+
+    # Suffix of the generated functions.
+    name: str
+    # Name of the ASN.1 type in the specification of the decodable protocol version.
+    type_name: str
+    # Module in cohda_driver.etsi_messages and ETSI message class built by the root binding.
+    module: str
+    message_class: str
+    bindings: Dict[str, str]
+    # Values of bound paths and referenced members that are absent in a message. Defaults to
+    # the ASN.1 DEFAULT of a member, or None.
+    defaults: Dict[str, str]
+
+
+CAM_HIGH_FREQUENCY = "cam.camParameters.highFrequencyContainer"
+CAM_BASIC_VEHICLE = f"{CAM_HIGH_FREQUENCY}.basicVehicleContainerHighFrequency"
+CAM_RSU = f"{CAM_HIGH_FREQUENCY}.rsuContainerHighFrequency"
+CAM_ZONE = f"{CAM_RSU}.protectedCommunicationZonesRSU.*"
+
+# Mirrors CAM.from_dict.
+CAM_MESSAGE = GeneratedMessage(
+    name="cam",
+    type_name="CAM",
+    module="cam",
+    message_class="CAM",
+    bindings={
+        "": "CAM(header=$header, cam=$cam)",
+        "header": (
+            "ItsPduHeader(protocol_version=$protocolVersion, message_id=$messageId,"
+            " station_id=$stationId)"
+        ),
+        "cam": (
+            "CoopAwareness(generation_delta_time=clamp($generationDeltaTime, 0, 65535),"
+            " cam_parameters=$camParameters)"
+        ),
+        "cam.camParameters": (
+            "CamParameters(basic_container=$basicContainer,"
+            " high_frequency_container=$highFrequencyContainer)"
+        ),
+        "cam.camParameters.basicContainer": (
+            "BasicContainer(station_type=clamp($stationType, 0, 255),"
+            " reference_position=ReferencePosition("
+            "latitude=clamp($referencePosition.latitude, -900000000, 900000001),"
+            " longitude=clamp($referencePosition.longitude, -1800000000, 1800000001),"
+            " position_confidence_ellipse=PosConfidenceEllipse("
+            "semi_major_confidence=clamp("
+            "$referencePosition.positionConfidenceEllipse.semiMajorConfidence, 0, 4095),"
+            " semi_minor_confidence=clamp("
+            "$referencePosition.positionConfidenceEllipse.semiMinorConfidence, 0, 4095),"
+            " semi_major_orientation=clamp("
+            "$referencePosition.positionConfidenceEllipse.semiMajorOrientation, 0, 3601)),"
+            " altitude=Altitude("
+            "altitude_value=clamp($referencePosition.altitude.altitudeValue, -100000, 800001),"
+            " altitude_confidence=clamp("
+            "$referencePosition.altitude.altitudeConfidence, 0, 15))))"
+        ),
+        CAM_HIGH_FREQUENCY: (
+            "HighFrequencyContainer("
+            "basic_vehicle_container_high_frequency=$basicVehicleContainerHighFrequency,"
+            " rsu_container_high_frequency=$rsuContainerHighFrequency)"
+        ),
+        CAM_BASIC_VEHICLE: (
+            "BasicVehicleContainerHighFrequency("
+            "heading=Heading(heading_value=clamp($heading.headingValue, 0, 3601),"
+            " heading_confidence=clamp($heading.headingConfidence, 0, 127)),"
+            " speed=Speed(speed_value=clamp($speed.speedValue, 0, 16382),"
+            " speed_confidence=clamp($speed.speedConfidence, 0, 127)),"
+            " drive_direction=clamp($driveDirection, 0, 2),"
+            " vehicle_length=VehicleLength("
+            "vehicle_length_value=clamp($vehicleLength.vehicleLengthValue, 1, 1023),"
+            " vehicle_length_confidence_indication=clamp("
+            "$vehicleLength.vehicleLengthConfidenceIndication, 0, 4)),"
+            " vehicle_width=clamp($vehicleWidth, 1, 62),"
+            " longitudinal_acceleration=LongitudinalAcceleration("
+            "longitudinal_acceleration_value=clamp("
+            "$longitudinalAcceleration.longitudinalAccelerationValue, -160, 160),"
+            " longitudinal_acceleration_confidence=clamp("
+            "$longitudinalAcceleration.longitudinalAccelerationConfidence, 0, 102)),"
+            " curvature=Curvature(curvature_value=clamp($curvature.curvatureValue, -1023, 1023),"
+            " curvature_confidence=clamp($curvature.curvatureConfidence, 0, 7)),"
+            " curvature_calculation_mode=clamp($curvatureCalculationMode, 0, 2),"
+            " yaw_rate=YawRate(yaw_rate_value=clamp($yawRate.yawRateValue, -32766, 32767),"
+            " yaw_rate_confidence=clamp($yawRate.yawRateConfidence, 0, 8)))"
+        ),
+        CAM_RSU: (
+            "RSUContainerHighFrequency("
+            "protected_communication_zones_rsu=$protectedCommunicationZonesRSU)"
+        ),
+        CAM_ZONE: (
+            "ProtectedCommunicationZone("
+            "protected_zone_type=clamp($protectedZoneType, 0, 1),"
+            " expiry_time=clamp($expiryTime, 0, 4398046511103),"
+            " protected_zone_latitude=clamp($protectedZoneLatitude, -900000000, 900000001),"
+            " protected_zone_longitude=clamp($protectedZoneLongitude, -1800000000, 1800000001),"
+            " protected_zone_radius=clamp($protectedZoneRadius, 1, 255),"
+            " protected_zone_id=clamp($protectedZoneId, 0, 134217727))"
+        ),
+    },
+    defaults={
+        CAM_BASIC_VEHICLE: "BasicVehicleContainerHighFrequency.from_dict({})",
+        CAM_RSU: "RSUContainerHighFrequency.from_dict({})",
+        f"{CAM_RSU}.protectedCommunicationZonesRSU": "[]",
+        f"{CAM_ZONE}.expiryTime": "0",
+        f"{CAM_ZONE}.protectedZoneRadius": "1",
+        f"{CAM_ZONE}.protectedZoneId": "0",
+    },
+)
+
+CPM_PARAMETERS = "cpm.cpmParameters"
+CPM_OBJECT = f"{CPM_PARAMETERS}.perceivedObjectContainer.*"
+
+# Mirrors CPM.from_dict. Optional members that CPM.from_dict requires are filled with the
+# defaults of the classes instead of failing the whole message.
+CPM_MESSAGE = GeneratedMessage(
+    name="cpm",
+    type_name="CPM",
+    module="cpm",
+    message_class="CPM",
+    bindings={
+        "": (
+            "CPM(header=$header, generationDeltaTime=$cpm.generationDeltaTime,"
+            " cpmParameters=$cpm.cpmParameters)"
+        ),
+        "header": (
+            "ItsPduHeader(protocol_version=$protocolVersion, message_id=$messageID,"
+            " station_id=$stationID)"
+        ),
+        CPM_PARAMETERS: (
+            "CpmParameters(numberOfPerceivedObjects=$numberOfPerceivedObjects,"
+            " cpmPerceivedObjectContainer=$perceivedObjectContainer,"
+            " managementContainer=ManagementContainer("
+            "referencePosition=$managementContainer.referencePosition))"
+        ),
+        f"{CPM_PARAMETERS}.managementContainer.referencePosition": (
+            "ReferencePosition(latitude=$latitude * 1e-7, longitude=$longitude * 1e-7,"
+            " positionConfidenceEllipse=PositionConfidenceEllipse("
+            "semiMajorConfidence=$positionConfidenceEllipse.semiMajorConfidence,"
+            " semiMinorConfidence=$positionConfidenceEllipse.semiMinorConfidence,"
+            " semiMajorOrientation=$positionConfidenceEllipse.semiMajorOrientation),"
+            " altitude=Altitude(altitudeValue=$altitude.altitudeValue,"
+            " altitudeConfidence=$altitude.altitudeConfidence))"
+        ),
+        CPM_OBJECT: (
+            "CpmPerceivedObject(objectId=$objectID, time_of_measurement=$timeOfMeasurement,"
+            " xDistance=XDistance(value=$xDistance.value / 100,"
+            " confidence=$xDistance.confidence),"
+            " yDistance=YDistance(value=$yDistance.value / 100,"
+            " confidence=$yDistance.confidence),"
+            " xSpeed=XSpeed(value=$xSpeed.value / 100, confidence=$xSpeed.confidence),"
+            " ySpeed=YSpeed(value=$ySpeed.value / 100, confidence=$ySpeed.confidence),"
+            " dimensionPlanar1=$planarObjectDimension1,"
+            " dimensionPlanar2=$planarObjectDimension2,"
+            " classification=Classification("
+            "confidence=$classification[0]['confidence'],"
+            " classificationType=$classification[0]['class'][1]['type'])"
+            " if $classification is not None else Classification(),"
+            " matchedPosition=$matchedPosition)"
+        ),
+        f"{CPM_OBJECT}.planarObjectDimension1": (
+            "DimensionPlanar(value=$value / 100, confidence=$confidence)"
+        ),
+        f"{CPM_OBJECT}.planarObjectDimension2": (
+            "DimensionPlanar(value=$value / 100, confidence=$confidence)"
+        ),
+        f"{CPM_OBJECT}.matchedPosition": (
+            "MatchedPosition(laneId=$laneID,"
+            " longitudinalLanePositionValue="
+            "$longitudinalLanePosition.longitudinalLanePositionValue,"
+            " longitudinalLanePositionConfidenceValue="
+            "$longitudinalLanePosition.longitudinalLanePositionConfidence)"
+        ),
+    },
+    defaults={
+        f"{CPM_PARAMETERS}.perceivedObjectContainer": "[]",
+        f"{CPM_OBJECT}.planarObjectDimension1": "DimensionPlanar()",
+        f"{CPM_OBJECT}.planarObjectDimension2": "DimensionPlanar()",
+        f"{CPM_OBJECT}.matchedPosition.laneID": "0",
+        f"{CPM_OBJECT}.matchedPosition.longitudinalLanePosition.longitudinalLanePositionValue": (
+            "0.0"
+        ),
+        (
+            f"{CPM_OBJECT}.matchedPosition.longitudinalLanePosition"
+            ".longitudinalLanePositionConfidence"
+        ): "0",
+    },
+)
+
+GENERATED_MESSAGES = [CAM_MESSAGE, CPM_MESSAGE]
+
+HEADER = '''\
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\\file
+#
+# \\date    2026-10-19
+#
+# This module implements specialized UPER codecs for the ETSI messages.
+#
+# GENERATED by cohda_driver.codegen from the bundled ASN.1 specifications.
+# Do not edit; run `python -m cohda_driver.codegen` instead.
+#
+# The decoders read the message as one integer and track the number of
+# remaining bits r. Values are read with (v >> (r - offset)) & mask.
+# ---------------------------------------------------------------------
+# pylint: skip-file
+'''
+
+RUNTIME = '''
+
+class UperDecodeError(ValueError):
+    pass
+
+
+class UperEncodeError(ValueError):
+    pass
+
+
+def _read_length(v, r):
+    length = (v >> (r - 8)) & 0xFF
+    if length < 0x80:
+        return length, r - 8
+    if length & 0xC0 == 0x80:
+        return ((length & 0x7F) << 8) | ((v >> (r - 16)) & 0xFF), r - 16
+    raise UperDecodeError("Fragmented length determinants are not supported.")
+
+
+def _read_unconstrained(v, r):
+    length, r = _read_length(v, r)
+    bits = 8 * length
+    value = (v >> (r - bits)) & ((1 << bits) - 1)
+    if value >> (bits - 1):
+        value -= 1 << bits
+    return value, r - bits
+
+
+def _read_normally_small(v, r):
+    if not (v >> (r - 1)) & 1:
+        return (v >> (r - 7)) & 0x3F, r - 7
+    length, r = _read_length(v, r - 1)
+    bits = 8 * length
+    return (v >> (r - bits)) & ((1 << bits) - 1), r - bits
+
+
+def _read_normally_small_length(v, r):
+    if not (v >> (r - 1)) & 1:
+        return ((v >> (r - 7)) & 0x3F) + 1, r - 7
+    if not (v >> (r - 2)) & 1:
+        return (v >> (r - 9)) & 0x7F, r - 9
+    raise UperDecodeError("Normally small lengths above 127 are not supported.")
+
+
+def _read_bytes(v, r, length):
+    bits = 8 * length
+    return ((v >> (r - bits)) & ((1 << bits) - 1)).to_bytes(length, "big"), r - bits
+
+
+def _read_bits(v, r, bits):
+    padding = -bits % 8
+    value = ((v >> (r - bits)) & ((1 << bits) - 1)) << padding
+    return (value.to_bytes((bits + padding) // 8, "big"), bits), r - bits
+
+
+def _skip_additions(v, r):
+    count, r = _read_normally_small_length(v, r)
+    present = (v >> (r - count)) & ((1 << count) - 1)
+    r -= count
+    while present:
+        if present & 1:
+            length, r = _read_length(v, r)
+            r -= 8 * length
+        present >>= 1
+    return r
+
+
+def _skip_choice_addition(v, r):
+    _, r = _read_normally_small(v, r)
+    length, r = _read_length(v, r)
+    return r - 8 * length
+
+
+def _write_length(e, m, length):
+    if length < 0x80:
+        return (e << 8) | length, m + 8
+    if length < 0x4000:
+        return (e << 16) | 0x8000 | length, m + 16
+    raise UperEncodeError("Fragmented length determinants are not supported.")
+
+
+def _write_unconstrained(e, m, value):
+    bits = value.bit_length()
+    if value < 0:
+        length = (bits + 7) // 8
+        value += 1 << (8 * length)
+        if not value & (1 << (8 * length - 1)):
+            value |= 0xFF << (8 * length)
+            length += 1
+    elif value > 0:
+        length = (bits + 7) // 8
+        if bits == 8 * length:
+            length += 1
+    else:
+        length = 1
+    e, m = _write_length(e, m, length)
+    return (e << (8 * length)) | value, m + 8 * length
+
+
+def _write_normally_small(e, m, value):
+    if value < 64:
+        return (e << 7) | value, m + 7
+    length = (value.bit_length() + 7) // 8
+    e, m = _write_length((e << 1) | 1, m + 1, length)
+    return (e << (8 * length)) | value, m + 8 * length
+
+
+def _write_normally_small_length(e, m, value):
+    if value <= 64:
+        return (e << 7) | (value - 1), m + 7
+    if value <= 127:
+        return (e << 9) | 0x100 | value, m + 9
+    raise UperEncodeError("Normally small lengths above 127 are not supported.")
+
+
+def _write_bytes(e, m, data):
+    return (e << (8 * len(data))) | int.from_bytes(data, "big"), m + 8 * len(data)
+
+
+def _write_bits(e, m, data, bits):
+    if not bits:
+        return e, m
+    value = int.from_bytes(data, "big") >> (8 * len(data) - bits)
+    return (e << bits) | value, m + bits
+
+
+def _write_open_type(e, m, addition, bits):
+    padding = -bits % 8
+    e, m = _write_length(e, m, (bits + padding) // 8)
+    return (e << (bits + padding)) | (addition << padding), m + bits + padding
+
+
+def _rstrip_bits(data, bits, minimum):
+    value = int.from_bytes(data, "big") >> (8 * len(data) - bits) if bits else 0
+    while bits and not value & 1:
+        value >>= 1
+        bits -= 1
+    if minimum is not None and bits < minimum:
+        value <<= minimum - bits
+        bits = minimum
+    padding = -bits % 8
+    return (value << padding).to_bytes((bits + padding) // 8, "big"), bits
+
+
+def _out_of_data(error):
+    if isinstance(error, UperDecodeError):
+        return error
+    return UperDecodeError(f"Out of data or invalid message: {error}")
+'''
+
+
+def _mask(bits: int) -> str:
+    return hex((1 << bits) - 1)
+
+
+def _identifier(name: str) -> str:
+    identifier = re.sub(r"\W", "_", name)
+    if not identifier or identifier[0].isdigit():
+        identifier = "_" + identifier
+    return identifier
+
+
+def _bits(count: int) -> int:
+    # Number of bits of a constrained whole number with the given number of values.
+    return max(count - 1, 0).bit_length()
+
+
+def _members(node: per.Type) -> List[per.Type]:
+    # Root members and extension additions of a SEQUENCE, with addition groups flattened.
+    members = list(node.root_members)
+    for addition in node.additions or []:
+        if isinstance(addition, per.AdditionGroup):
+            members.extend(addition.root_members)
+        else:
+            members.append(addition)
+    return members
+
+
+def _child(node: per.Type, name: str) -> per.Type:
+    if name == "*" and isinstance(node, uper.SequenceOf):
+        return node.element_type
+    if isinstance(node, uper.Choice):
+        alternatives = list(node.root_index_to_member.values())
+        alternatives += list((node.additions_index_to_member or {}).values())
+        for alternative in alternatives:
+            if alternative.name == name:
+                return alternative
+    elif isinstance(node, per.Sequence):
+        for member in _members(node):
+            if member.name == name:
+                return member
+    raise KeyError(f"No member '{name}' in {node!r}.")
+
+
+def _join(path: str, relative: str) -> str:
+    return f"{path}.{relative}" if path else relative
+
+
+def _fixed_width(node: per.Type) -> Optional[int]:
+    # Number of bits of a type whose encoding does not depend on its value.
+    if isinstance(node, uper.Integer):
+        if node.has_extension_marker or node.number_of_bits is None:
+            return None
+        return node.number_of_bits
+    if isinstance(node, per.Boolean):
+        return 1
+    if isinstance(node, per.Null):
+        return 0
+    if isinstance(node, per.Enumerated):
+        if node.additions_index_to_data is not None:
+            return None
+        return node.root_number_of_bits
+    if isinstance(node, per.Sequence):
+        if node.additions is not None or node.optionals:
+            return None
+        widths = [_fixed_width(member) for member in node.root_members]
+        return None if None in widths else sum(widths)
+    return None
+
+
+class _Writer:
+    """
+    Python source writer that defers the updates of the bit counter.
+
+    Reads and writes of fixed-size fields only add to a pending offset, which is applied to the
+    counter before any control flow, call or return.
+    """
+
+    def __init__(self, counter: str):
+        self.lines: List[str] = []
+        self.level = 1
+        self.offset = 0
+        self.counter = counter
+        self._names: Set[str] = set()
+
+    def line(self, text: str):
+        self.lines.append("    " * self.level + text)
+
+    def local(self, name: str) -> str:
+        base = _identifier(name) or "value"
+        local = base
+        index = 1
+        while local in self._names or local in RESERVED_NAMES:
+            index += 1
+            local = f"{base}_{index}"
+        self._names.add(local)
+        return local
+
+    def flush(self):
+        if self.offset:
+            sign = "-" if self.counter == "r" else "+"
+            self.line(f"{self.counter} {sign}= {self.offset}")
+            self.offset = 0
+
+    def read(self, bits: int) -> str:
+        # Expression of the next bits of the message, as unsigned integer.
+        self.offset += bits
+        return f"(v >> (r - {self.offset})) & {_mask(bits)}"
+
+    def write(self, value: str, bits: int):
+        if bits:
+            self.line(f"e = (e << {bits}) | {value}")
+            self.offset += bits
+
+    @contextmanager
+    def block(self, header: str) -> Iterator[None]:
+        self.flush()
+        self.line(header)
+        self.level += 1
+        length = len(self.lines)
+        yield
+        self.flush()
+        if len(self.lines) == length:
+            self.line("pass")
+        self.level -= 1
+
+
+class _Function(NamedTuple):
+    name: str
+    lines: List[str]
+
+
+class CodecGenerator:
+    """
+    Generator of the specialized codecs of one ASN.1 specification.
+
+    Decode, skip and encode functions are generated once per distinct structure of a
+    constructed type and shared by all members of that structure.
+    """
+
+    def __init__(self):
+        self._signatures: Dict[int, str] = {}
+        self._functions: Dict[Tuple[str, str], _Function] = {}
+        self._function_names: Set[str] = set()
+        self._constants: List[str] = []
+
+    # -------- Structure -------------
+
+    def _signature(self, node: per.Type) -> str:
+        key = id(node)
+        if key not in self._signatures:
+            self._signatures[key] = self._build_signature(node)
+        return self._signatures[key]
+
+    def _build_signature(self, node: per.Type) -> str:
+        kind = type(node).__name__
+        if isinstance(node, per.Sequence):
+            members = ",".join(
+                f"{member.name}:{member.optional}:{member.default!r}:{self._signature(member)}"
+                for member in node.root_members
+            )
+            additions = (
+                "-"
+                if node.additions is None
+                else ",".join(
+                    f"{addition.name}:{self._signature(addition)}" for addition in node.additions
+                )
+            )
+            return f"{kind}({members}|{additions})"
+        if isinstance(node, uper.SequenceOf):
+            return (
+                f"{kind}({node.minimum},{node.maximum},{node.has_extension_marker},"
+                f"{self._signature(node.element_type)})"
+            )
+        if isinstance(node, uper.Choice):
+            alternatives = [
+                f"{alternative.name}:{self._signature(alternative)}"
+                for alternative in node.root_index_to_member.values()
+            ]
+            additions = (
+                "-"
+                if node.additions_index_to_member is None
+                else ",".join(
+                    f"{addition.name}:{self._signature(addition)}"
+                    for addition in node.additions_index_to_member.values()
+                )
+            )
+            return f"{kind}({','.join(alternatives)}|{additions})"
+        if isinstance(node, uper.Integer):
+            return f"{kind}({node.minimum},{node.maximum},{node.has_extension_marker})"
+        if isinstance(node, per.Enumerated):
+            return f"{kind}({node.root_index_to_data},{node.additions_index_to_data})"
+        if isinstance(node, (uper.BitString, uper.OctetString)):
+            named_bits = getattr(node, "has_named_bits", False)
+            return (
+                f"{kind}({node.minimum},{node.maximum},{node.has_extension_marker},"
+                f"{named_bits})"
+            )
+        if isinstance(node, (per.Boolean, per.Null, uper.OpenType)):
+            return kind
+        raise NotImplementedError(f"Unsupported ASN.1 type {node!r}.")
+
+    def _function(self, kind: str, node: per.Type, name: str) -> Tuple[str, bool]:
+        # Name of the function of the given kind for the structure of the node, and whether it
+        # still needs to be generated.
+        key = (kind, self._signature(node))
+        if key in self._functions:
+            return self._functions[key].name, False
+        base = f"_{kind}_{_identifier(node.name or name)}"
+        function_name = base
+        index = 1
+        while function_name in self._function_names:
+            index += 1
+            function_name = f"{base}_{index}"
+        self._function_names.add(function_name)
+        self._functions[key] = _Function(function_name, [])
+        return function_name, True
+
+    def _constant(self, value: str) -> str:
+        name = f"_CONSTANT_{len(self._constants)}"
+        self._constants.append(f"{name} = {value}")
+        return name
+
+    # -------- Decoding to asn1tools values -------------
+
+    def decode_function(self, node: per.Type, name: str = "value") -> str:
+        """
+        Generate the function decoding the node to the value asn1tools would return.
+        """
+        function_name, is_new = self._function("decode", node, name)
+        if is_new:
+            writer = _Writer("r")
+            value = writer.local("result")
+            self._decode_constructed(node, value, writer)
+            writer.flush()
+            writer.line(f"return {value}, r")
+            self._functions[("decode", self._signature(node))].lines.extend(
+                [f"def {function_name}(v, r):"] + writer.lines
+            )
+        return function_name
+
+    def _decode(self, node: per.Type, target: str, writer: _Writer):
+        # Decode the node into the target variable.
+        if isinstance(node, uper.Integer):
+            self._decode_integer(node, target, writer)
+        elif isinstance(node, per.Boolean):
+            writer.line(f"{target} = bool({writer.read(1)})")
+        elif isinstance(node, per.Null):
+            writer.line(f"{target} = None")
+        elif isinstance(node, per.Enumerated):
+            self._decode_enumerated(node, target, writer)
+        elif isinstance(node, uper.BitString):
+            self._decode_bit_string(node, target, writer)
+        elif isinstance(node, uper.OctetString):
+            self._decode_octet_string(node, target, writer)
+        elif isinstance(node, uper.OpenType):
+            writer.flush()
+            writer.line(f"{target}, r = _read_length(v, r)")
+            writer.line(f"{target}, r = _read_bytes(v, r, {target})")
+        else:
+            function_name = self.decode_function(node)
+            writer.flush()
+            writer.line(f"{target}, r = {function_name}(v, r)")
+
+    def _decode_integer(self, node: uper.Integer, target: str, writer: _Writer):
+        if node.number_of_bits is None:
+            writer.flush()
+            writer.line(f"{target}, r = _read_unconstrained(v, r)")
+            return
+        if node.has_extension_marker:
+            extension = writer.local("extension")
+            writer.line(f"{extension} = {writer.read(1)}")
+            with writer.block(f"if {extension}:"):
+                writer.line(f"{target}, r = _read_unconstrained(v, r)")
+            with writer.block("else:"):
+                self._decode_constrained(node, target, writer)
+            return
+        self._decode_constrained(node, target, writer)
+
+    @staticmethod
+    def _decode_constrained(node: uper.Integer, target: str, writer: _Writer):
+        if node.number_of_bits == 0:
+            writer.line(f"{target} = {node.minimum}")
+        elif node.minimum == 0:
+            writer.line(f"{target} = {writer.read(node.number_of_bits)}")
+        else:
+            writer.line(f"{target} = ({writer.read(node.number_of_bits)}) + {node.minimum}")
+
+    def _decode_enumerated(self, node: per.Enumerated, target: str, writer: _Writer):
+        if node.additions_index_to_data is not None:
+            extension = writer.local("extension")
+            writer.line(f"{extension} = {writer.read(1)}")
+            with writer.block(f"if {extension}:"):
+                writer.line(f"{target}, r = _read_normally_small(v, r)")
+                additions = self._constant(repr(node.additions_index_to_data))
+                writer.line(f"{target} = {additions}.get({target})")
+            with writer.block("else:"):
+                self._decode_enumerated_root(node, target, writer)
+            return
+        self._decode_enumerated_root(node, target, writer)
+
+    def _decode_enumerated_root(self, node: per.Enumerated, target: str, writer: _Writer):
+        values = [node.root_index_to_data[index] for index in range(len(node.root_index_to_data))]
+        bits = node.root_number_of_bits
+        index = writer.read(bits) if bits else "0"
+        writer.line(f"{target} = {index}")
+        if len(values) != 1 << bits:
+            with writer.block(f"if {target} >= {len(values)}:"):
+                message = f"Invalid enumeration index {{{target}}}."
+                writer.line(f'raise UperDecodeError(f"{message}")')
+        if values != list(range(len(values))):
+            writer.line(f"{target} = {self._constant(repr(tuple(values)))}[{target}]")
+
+    def _decode_size(self, node: per.Type, target: str, writer: _Writer):
+        # Decode the length of a string or SEQUENCE OF with a size constraint.
+        if node.minimum == node.maximum:
+            writer.line(f"{target} = {node.minimum}")
+        elif node.minimum == 0:
+            writer.line(f"{target} = {writer.read(node.number_of_bits)}")
+        else:
+            writer.line(f"{target} = ({writer.read(node.number_of_bits)}) + {node.minimum}")
+
+    def _decode_bit_string(self, node: uper.BitString, target: str, writer: _Writer):
+        if node.has_extension_marker:
+            extension = writer.local("extension")
+            writer.line(f"{extension} = {writer.read(1)}")
+            with writer.block(f"if {extension}:"):
+                writer.line('raise UperDecodeError("BIT STRING extensions are not supported.")')
+        if node.number_of_bits is None:
+            writer.flush()
+            writer.line(f"{target}, r = _read_length(v, r)")
+            writer.line(f"{target}, r = _read_bits(v, r, {target})")
+            return
+        if node.minimum == node.maximum:
+            writer.flush()
+            writer.line(f"{target}, r = _read_bits(v, r, {node.minimum})")
+            return
+        self._decode_size(node, target, writer)
+        writer.flush()
+        writer.line(f"{target}, r = _read_bits(v, r, {target})")
+
+    def _decode_octet_string(self, node: uper.OctetString, target: str, writer: _Writer):
+        if node.has_extension_marker:
+            extension = writer.local("extension")
+            writer.line(f"{extension} = {writer.read(1)}")
+            with writer.block(f"if {extension}:"):
+                writer.line(f"{target}, r = _read_length(v, r)")
+                writer.line(f"{target}, r = _read_bytes(v, r, {target})")
+            with writer.block("else:"):
+                self._decode_octet_string_root(node, target, writer)
+            return
+        self._decode_octet_string_root(node, target, writer)
+
+    def _decode_octet_string_root(self, node: uper.OctetString, target: str, writer: _Writer):
+        if node.number_of_bits is None:
+            writer.flush()
+            writer.line(f"{target}, r = _read_length(v, r)")
+        else:
+            self._decode_size(node, target, writer)
+            writer.flush()
+        writer.line(f"{target}, r = _read_bytes(v, r, {target})")
+
+    def _decode_length(self, node: uper.SequenceOf, target: str, writer: _Writer):
+        # Decode the number of elements of a SEQUENCE OF.
+        if node.has_extension_marker:
+            extension = writer.local("extension")
+            writer.line(f"{extension} = {writer.read(1)}")
+            with writer.block(f"if {extension}:"):
+                writer.line(f"{target}, r = _read_length(v, r)")
+            with writer.block("else:"):
+                self._decode_length_root(node, target, writer)
+            return
+        self._decode_length_root(node, target, writer)
+
+    def _decode_length_root(self, node: uper.SequenceOf, target: str, writer: _Writer):
+        if node.number_of_bits is None:
+            writer.flush()
+            writer.line(f"{target}, r = _read_length(v, r)")
+        else:
+            self._decode_size(node, target, writer)
+
+    def _decode_constructed(self, node: per.Type, target: str, writer: _Writer):
+        if isinstance(node, per.Sequence):
+            self._decode_sequence(node, target, writer)
+        elif isinstance(node, uper.SequenceOf):
+            count = writer.local("count")
+            self._decode_length(node, count, writer)
+            item = writer.local("item")
+            writer.line(f"{target} = []")
+            with writer.block(f"for _ in range({count}):"):
+                self._decode(node.element_type, item, writer)
+                writer.line(f"{target}.append({item})")
+        elif isinstance(node, uper.Choice):
+            self._decode_choice(node, target, writer)
+        else:
+            self._decode(node, target, writer)
+
+    def _read_presence(self, node: per.Sequence, writer: _Writer) -> Tuple[Optional[str], str]:
+        # Read the extension bit and the presence bits of the optional members.
+        extension = None
+        if node.additions is not None:
+            extension = writer.local("extension")
+            writer.line(f"{extension} = {writer.read(1)}")
+        present = "0"
+        if node.optionals:
+            present = writer.local("present")
+            writer.line(f"{present} = {writer.read(len(node.optionals))}")
+        return extension, present
+
+    @staticmethod
+    def _presence_bit(node: per.Sequence, member: per.Type) -> int:
+        return 1 << (len(node.optionals) - 1 - node.optionals.index(member))
+
+    def _decode_sequence(self, node: per.Sequence, target: str, writer: _Writer):
+        extension, present = self._read_presence(node, writer)
+        mandatory = []
+        optional = []
+        for member in node.root_members:
+            local = writer.local(member.name)
+            if member in node.optionals:
+                optional.append((member, local))
+                with writer.block(f"if {present} & {self._presence_bit(node, member)}:"):
+                    self._decode(member, local, writer)
+            else:
+                mandatory.append((member, local))
+                self._decode(member, local, writer)
+        items = ", ".join(f"{member.name!r}: {local}" for member, local in mandatory)
+        writer.line(f"{target} = {{{items}}}")
+        for member, local in optional:
+            with writer.block(f"if {present} & {self._presence_bit(node, member)}:"):
+                writer.line(f"{target}[{member.name!r}] = {local}")
+            if member.default is not None:
+                with writer.block("else:"):
+                    writer.line(f"{target}[{member.name!r}] = {member.default!r}")
+        if extension is not None:
+            with writer.block(f"if {extension}:"):
+                if node.additions:
+                    self._decode_additions(node, target, writer)
+                else:
+                    writer.line("r = _skip_additions(v, r)")
+
+    def _decode_additions(self, node: per.Sequence, target: str, writer: _Writer):
+        count = writer.local("count")
+        additions = writer.local("additions")
+        end = writer.local("end")
+        writer.line(f"{count}, r = _read_normally_small_length(v, r)")
+        writer.line(f"{additions} = (v >> (r - {count})) & ((1 << {count}) - 1)")
+        writer.line(f"r -= {count}")
+        index = writer.local("index")
+        with writer.block(f"for {index} in range({count}):"):
+            with writer.block(f"if not ({additions} >> ({count} - 1 - {index})) & 1:"):
+                writer.line("continue")
+            writer.line(f"{end}, r = _read_length(v, r)")
+            writer.line(f"{end} = r - 8 * {end}")
+            for addition_index, addition in enumerate(node.additions):
+                keyword = "if" if addition_index == 0 else "elif"
+                with writer.block(f"{keyword} {index} == {addition_index}:"):
+                    local = writer.local(addition.name or "group")
+                    self._decode(addition, local, writer)
+                    if isinstance(addition, per.AdditionGroup):
+                        writer.line(f"{target}.update({local})")
+                    else:
+                        writer.line(f"{target}[{addition.name!r}] = {local}")
+            writer.line(f"r = {end}")
+
+    def _decode_choice(self, node: uper.Choice, target: str, writer: _Writer):
+        if node.additions_index_to_member is not None:
+            extension = writer.local("extension")
+            writer.line(f"{extension} = {writer.read(1)}")
+            with writer.block(f"if {extension}:"):
+                self._decode_choice_addition(node, target, writer)
+            with writer.block("else:"):
+                self._decode_choice_root(node, target, writer)
+            return
+        self._decode_choice_root(node, target, writer)
+
+    def _decode_choice_addition(self, node: uper.Choice, target: str, writer: _Writer):
+        index = writer.local("index")
+        end = writer.local("end")
+        writer.line(f"{index}, r = _read_normally_small(v, r)")
+        writer.line(f"{end}, r = _read_length(v, r)")
+        writer.line(f"{end} = r - 8 * {end}")
+        writer.line(f"{target} = (None, None)")
+        for addition_index, addition in node.additions_index_to_member.items():
+            with writer.block(f"if {index} == {addition_index}:"):
+                local = writer.local(addition.name)
+                self._decode(addition, local, writer)
+                writer.line(f"{target} = ({addition.name!r}, {local})")
+        writer.line(f"r = {end}")
+
+    def _decode_choice_root(self, node: uper.Choice, target: str, writer: _Writer):
+        alternatives = node.root_index_to_member
+        if len(alternatives) == 1:
+            alternative = alternatives[0]
+            local = writer.local(alternative.name)
+            self._decode(alternative, local, writer)
+            writer.line(f"{target} = ({alternative.name!r}, {local})")
+            return
+        index = writer.local("index")
+        writer.line(f"{index} = {writer.read(node.root_number_of_bits)}")
+        for alternative_index, alternative in alternatives.items():
+            keyword = "if" if alternative_index == 0 else "elif"
+            with writer.block(f"{keyword} {index} == {alternative_index}:"):
+                local = writer.local(alternative.name)
+                self._decode(alternative, local, writer)
+                writer.line(f"{target} = ({alternative.name!r}, {local})")
+        with writer.block("else:"):
+            writer.line(f'raise UperDecodeError(f"Invalid choice index {{{index}}}.")')
+
+    # -------- Skipping -------------
+
+    def skip_function(self, node: per.Type, name: str = "value") -> str:
+        """
+        Generate the function advancing past the node without building its value.
+        """
+        function_name, is_new = self._function("skip", node, name)
+        if is_new:
+            writer = _Writer("r")
+            self._skip_constructed(node, writer)
+            writer.flush()
+            writer.line("return r")
+            self._functions[("skip", self._signature(node))].lines.extend(
+                [f"def {function_name}(v, r):"] + writer.lines
+            )
+        return function_name
+
+    def _skip(self, node: per.Type, writer: _Writer):
+        width = _fixed_width(node)
+        if width is not None:
+            writer.offset += width
+        elif isinstance(node, (per.Sequence, uper.SequenceOf, uper.Choice)):
+            function_name = self.skip_function(node)
+            writer.flush()
+            writer.line(f"r = {function_name}(v, r)")
+        else:
+            self._decode(node, writer.local("_"), writer)
+
+    def _skip_constructed(self, node: per.Type, writer: _Writer):
+        if isinstance(node, per.Sequence):
+            extension, present = self._read_presence(node, writer)
+            for member in node.root_members:
+                if member in node.optionals:
+                    with writer.block(f"if {present} & {self._presence_bit(node, member)}:"):
+                        self._skip(member, writer)
+                else:
+                    self._skip(member, writer)
+            if extension is not None:
+                with writer.block(f"if {extension}:"):
+                    writer.line("r = _skip_additions(v, r)")
+        elif isinstance(node, uper.SequenceOf):
+            count = writer.local("count")
+            self._decode_length(node, count, writer)
+            width = _fixed_width(node.element_type)
+            if width is not None:
+                writer.flush()
+                writer.line(f"r -= {width} * {count}")
+            else:
+                with writer.block(f"for _ in range({count}):"):
+                    self._skip(node.element_type, writer)
+        elif isinstance(node, uper.Choice):
+            if node.additions_index_to_member is not None:
+                extension = writer.local("extension")
+                writer.line(f"{extension} = {writer.read(1)}")
+                with writer.block(f"if {extension}:"):
+                    writer.line("r = _skip_choice_addition(v, r)")
+                with writer.block("else:"):
+                    self._skip_choice_root(node, writer)
+            else:
+                self._skip_choice_root(node, writer)
+        else:
+            self._skip(node, writer)
+
+    def _skip_choice_root(self, node: uper.Choice, writer: _Writer):
+        alternatives = node.root_index_to_member
+        if len(alternatives) == 1:
+            self._skip(alternatives[0], writer)
+        else:
+            index = writer.local("index")
+            writer.line(f"{index} = {writer.read(node.root_number_of_bits)}")
+            for alternative_index, alternative in alternatives.items():
+                keyword = "if" if alternative_index == 0 else "elif"
+                with writer.block(f"{keyword} {index} == {alternative_index}:"):
+                    self._skip(alternative, writer)
+            with writer.block("else:"):
+                writer.line(f'raise UperDecodeError(f"Invalid choice index {{{index}}}.")')
+
+    # -------- Encoding from asn1tools values -------------
+
+    def encode_function(self, node: per.Type, name: str = "value") -> str:
+        """
+        Generate the function encoding a value as asn1tools would.
+        """
+        function_name, is_new = self._function("encode", node, name)
+        if is_new:
+            writer = _Writer("m")
+            self._encode_constructed(node, "value", writer)
+            writer.flush()
+            writer.line("return e, m")
+            self._functions[("encode", self._signature(node))].lines.extend(
+                [f"def {function_name}(e, m, value):"] + writer.lines
+            )
+        return function_name
+
+    def _encode(self, node: per.Type, value: str, writer: _Writer):
+        if isinstance(node, uper.Integer):
+            self._encode_integer(node, value, writer)
+        elif isinstance(node, per.Boolean):
+            writer.write(f"(1 if {value} else 0)", 1)
+        elif isinstance(node, per.Null):
+            pass
+        elif isinstance(node, per.Enumerated):
+            self._encode_enumerated(node, value, writer)
+        elif isinstance(node, uper.BitString):
+            self._encode_bit_string(node, value, writer)
+        elif isinstance(node, uper.OctetString):
+            self._encode_octet_string(node, value, writer)
+        elif isinstance(node, uper.OpenType):
+            writer.flush()
+            writer.line(f"e, m = _write_length(e, m, len({value}))")
+            writer.line(f"e, m = _write_bytes(e, m, {value})")
+        else:
+            function_name = self.encode_function(node)
+            writer.flush()
+            writer.line(f"e, m = {function_name}(e, m, {value})")
+
+    def _encode_integer(self, node: uper.Integer, value: str, writer: _Writer):
+        if node.number_of_bits is None:
+            writer.flush()
+            writer.line(f"e, m = _write_unconstrained(e, m, {value})")
+            return
+        check = f"{node.minimum} <= {value} <= {node.maximum}"
+        if node.has_extension_marker:
+            with writer.block(f"if {check}:"):
+                writer.write("0", 1)
+                self._encode_constrained(node, value, writer)
+            with writer.block("else:"):
+                writer.write("1", 1)
+                writer.flush()
+                writer.line(f"e, m = _write_unconstrained(e, m, {value})")
+            return
+        with writer.block(f"if not {check}:"):
+            writer.line(
+                f'raise UperEncodeError(f"{node.name} {{{value}}} not in '
+                f'{node.minimum}..{node.maximum}.")'
+            )
+        self._encode_constrained(node, value, writer)
+
+    @staticmethod
+    def _encode_constrained(node: uper.Integer, value: str, writer: _Writer):
+        if node.minimum == 0:
+            writer.write(value, node.number_of_bits)
+        else:
+            writer.write(f"({value} - {node.minimum})", node.number_of_bits)
+
+    def _encode_enumerated(self, node: per.Enumerated, value: str, writer: _Writer):
+        indexes = self._constant(repr(node.root_data_to_index))
+        if node.additions_index_to_data is not None:
+            additions = self._constant(repr(node.additions_data_to_index))
+            with writer.block(f"if {value} in {indexes}:"):
+                writer.write("0", 1)
+                writer.write(f"{indexes}[{value}]", node.root_number_of_bits)
+            with writer.block("else:"):
+                writer.write("1", 1)
+                writer.flush()
+                writer.line(f"e, m = _write_normally_small(e, m, {additions}[{value}])")
+            return
+        writer.write(f"{indexes}[{value}]", node.root_number_of_bits)
+
+    def _encode_size(self, node: per.Type, size: str, writer: _Writer):
+        if node.number_of_bits is None:
+            writer.flush()
+            writer.line(f"e, m = _write_length(e, m, {size})")
+            return
+        with writer.block(f"if not {node.minimum} <= {size} <= {node.maximum}:"):
+            writer.line(f'raise UperEncodeError(f"{node.name} size {{{size}}} out of range.")')
+        if node.minimum != node.maximum:
+            writer.write(f"({size} - {node.minimum})", node.number_of_bits)
+
+    def _encode_bit_string(self, node: uper.BitString, value: str, writer: _Writer):
+        data = writer.local("data")
+        bits = writer.local("bits")
+        writer.line(f"{data}, {bits} = {value}")
+        if node.has_extension_marker:
+            writer.write("0", 1)
+        if node.has_named_bits:
+            writer.line(f"{data}, {bits} = _rstrip_bits({data}, {bits}, {node.minimum!r})")
+        self._encode_size(node, bits, writer)
+        writer.flush()
+        writer.line(f"e, m = _write_bits(e, m, {data}, {bits})")
+
+    def _encode_octet_string(self, node: uper.OctetString, value: str, writer: _Writer):
+        if node.has_extension_marker:
+            check = f"{node.minimum} <= len({value}) <= {node.maximum}"
+            with writer.block(f"if not {check}:"):
+                writer.write("1", 1)
+                writer.flush()
+                writer.line(f"e, m = _write_length(e, m, len({value}))")
+                writer.line(f"e, m = _write_bytes(e, m, {value})")
+            with writer.block("else:"):
+                writer.write("0", 1)
+                self._encode_octet_string_root(node, value, writer)
+            return
+        self._encode_octet_string_root(node, value, writer)
+
+    def _encode_octet_string_root(self, node: uper.OctetString, value: str, writer: _Writer):
+        self._encode_size(node, f"len({value})", writer)
+        writer.flush()
+        writer.line(f"e, m = _write_bytes(e, m, {value})")
+
+    def _encode_constructed(self, node: per.Type, value: str, writer: _Writer):
+        if isinstance(node, per.Sequence):
+            self._encode_sequence(node, value, writer)
+        elif isinstance(node, uper.SequenceOf):
+            count = writer.local("count")
+            writer.line(f"{count} = len({value})")
+            if node.has_extension_marker:
+                check = f"{node.minimum} <= {count} <= {node.maximum}"
+                with writer.block(f"if {check}:"):
+                    writer.write("0", 1)
+                    self._encode_size(node, count, writer)
+                with writer.block("else:"):
+                    writer.write("1", 1)
+                    writer.flush()
+                    writer.line(f"e, m = _write_length(e, m, {count})")
+            else:
+                self._encode_size(node, count, writer)
+            item = writer.local("item")
+            with writer.block(f"for {item} in {value}:"):
+                self._encode(node.element_type, item, writer)
+        elif isinstance(node, uper.Choice):
+            self._encode_choice(node, value, writer)
+        else:
+            self._encode(node, value, writer)
+
+    def _encode_sequence(self, node: per.Sequence, value: str, writer: _Writer):
+        if node.additions is not None:
+            names = []
+            for addition in node.additions:
+                if isinstance(addition, per.AdditionGroup):
+                    names.extend(member.name for member in addition.root_members)
+                else:
+                    names.append(addition.name)
+            extension = writer.local("extension")
+            if names:
+                condition = " or ".join(f"{name!r} in {value}" for name in names)
+                writer.line(f"{extension} = 1 if {condition} else 0")
+            else:
+                writer.line(f"{extension} = 0")
+            writer.write(extension, 1)
+        for member in node.optionals:
+            writer.write(f"(1 if {self._is_encoded(member, value)} else 0)", 1)
+        for member in node.root_members:
+            if member in node.optionals:
+                with writer.block(f"if {self._is_encoded(member, value)}:"):
+                    self._encode(member, f"{value}[{member.name!r}]", writer)
+            else:
+                local = writer.local(member.name)
+                writer.line(f"{local} = {value}[{member.name!r}]")
+                self._encode(member, local, writer)
+        if node.additions:
+            with writer.block(f"if {extension}:"):
+                self._encode_additions(node, value, writer)
+
+    @staticmethod
+    def _is_encoded(member: per.Type, value: str) -> str:
+        if member.default is None:
+            return f"{member.name!r} in {value}"
+        return f"{value}.get({member.name!r}, {member.default!r}) != {member.default!r}"
+
+    def _encode_additions(self, node: per.Sequence, value: str, writer: _Writer):
+        presence = []
+        for addition in node.additions:
+            if isinstance(addition, per.AdditionGroup):
+                names = [member.name for member in addition.root_members]
+                presence.append(" or ".join(f"{name!r} in {value}" for name in names))
+            else:
+                presence.append(f"{addition.name!r} in {value}")
+        writer.line(f"e, m = _write_normally_small_length(e, m, {len(node.additions)})")
+        for condition in presence:
+            writer.write(f"(1 if {condition} else 0)", 1)
+        writer.flush()
+        for addition, condition in zip(node.additions, presence):
+            with writer.block(f"if {condition}:"):
+                writer.line("outer = e, m")
+                writer.line("e, m = 0, 0")
+                if isinstance(addition, per.AdditionGroup):
+                    self._encode(addition, value, writer)
+                else:
+                    self._encode(addition, f"{value}[{addition.name!r}]", writer)
+                writer.flush()
+                writer.line("e, m = _write_open_type(*outer, e, m)")
+
+    def _encode_choice(self, node: uper.Choice, value: str, writer: _Writer):
+        name = writer.local("name")
+        alternative_value = writer.local("alternative")
+        writer.line(f"{name}, {alternative_value} = {value}")
+        alternatives = node.root_index_to_member
+        extensible = node.additions_index_to_member is not None
+        for index, alternative in alternatives.items():
+            keyword = "if" if index == 0 else "elif"
+            with writer.block(f"{keyword} {name} == {alternative.name!r}:"):
+                if extensible:
+                    writer.write("0", 1)
+                if len(alternatives) > 1:
+                    writer.write(str(index), node.root_number_of_bits)
+                self._encode(alternative, alternative_value, writer)
+        for index, addition in (node.additions_index_to_member or {}).items():
+            with writer.block(f"elif {name} == {addition.name!r}:"):
+                writer.write("1", 1)
+                writer.flush()
+                writer.line(f"e, m = _write_normally_small(e, m, {index})")
+                writer.line("outer = e, m")
+                writer.line("e, m = 0, 0")
+                self._encode(addition, alternative_value, writer)
+                writer.flush()
+                writer.line("e, m = _write_open_type(*outer, e, m)")
+        with writer.block("else:"):
+            writer.line(f'raise UperEncodeError(f"Invalid choice {{{name}!r}}.")')
+
+    # -------- Decoding to ETSI message classes -------------
+
+    def bound_decoder(self, message: GeneratedMessage, root: per.Type) -> List[str]:
+        """
+        Generate the function decoding a message directly to its ETSI message class.
+        """
+        return _BoundDecoder(self, message, root).generate()
+
+    def functions(self) -> List[str]:
+        """
+        Source lines of the constants and functions generated so far.
+        """
+        lines = list(self._constants)
+        for function in self._functions.values():
+            lines += ["", ""] + function.lines
+        return lines
+
+
+class _BoundDecoder:
+    """
+    Generator of the decoder of one message to its ETSI message class, see GeneratedMessage.
+
+    The decoder is inlined into a single function, so every bound or referenced value is a local
+    variable, except for the elements of a SEQUENCE OF, which are decoded in a loop.
+    """
+
+    def __init__(self, generator: CodecGenerator, message: GeneratedMessage, root: per.Type):
+        self._generator = generator
+        self._message = message
+        self._root = root
+        self._module = importlib.import_module(f"cohda_driver.etsi_messages.{message.module}")
+        # Referenced paths and the bindings referencing them.
+        self._referenced: Dict[str, Set[str]] = {}
+        # Paths below which values are referenced.
+        self._interior: Set[str] = set()
+        self._locals: Dict[str, str] = {}
+        self._writer = _Writer("r")
+        self._resolve("", None)
+
+    def _node(self, path: str) -> per.Type:
+        node = self._root
+        for name in path.split(".") if path else []:
+            node = _child(node, name)
+        return node
+
+    def _resolve(self, path: str, binding: Optional[str]):
+        # Mark the path as referenced by the binding and resolve its own binding.
+        node = self._node(path)
+        if path in self._referenced:
+            if binding is not None:
+                self._referenced[path].add(binding)
+            return
+        self._referenced[path] = set() if binding is None else {binding}
+        parts = path.split(".") if path else []
+        for length in range(len(parts)):
+            self._interior.add(".".join(parts[:length]))
+        expression = self._message.bindings.get(path)
+        if expression is not None:
+            self._interior.add(path)
+            for relative in PLACEHOLDER.findall(expression):
+                self._resolve(_join(path, relative), path)
+        elif isinstance(node, uper.SequenceOf) and _join(path, "*") in self._message.bindings:
+            self._interior.add(path)
+            self._resolve(_join(path, "*"), path)
+
+    def _is_relevant(self, path: str) -> bool:
+        return path in self._interior or path in self._referenced
+
+    def _local(self, path: str) -> str:
+        if path not in self._locals:
+            self._locals[path] = self._writer.local(path.split(".")[-1] if path else "message")
+        return self._locals[path]
+
+    def _render(self, path: str) -> str:
+        expression = self._message.bindings[path]
+
+        def drop_clamp(match: re.Match) -> str:
+            node = self._node(_join(path, match.group(1)))
+            minimum, maximum = int(match.group(2)), int(match.group(3))
+            if (
+                isinstance(node, uper.Integer)
+                and not node.has_extension_marker
+                and node.minimum is not None
+                and minimum <= node.minimum
+                and node.maximum <= maximum
+            ):
+                return f"${match.group(1)}"
+            return match.group(0)
+
+        expression = self._qualify(CLAMP.sub(drop_clamp, expression))
+        return PLACEHOLDER.sub(
+            lambda match: self._local(_join(path, match.group(1))), expression
+        )
+
+    def _qualify(self, expression: str) -> str:
+        # Refer to the classes and functions of the ETSI message module by its alias.
+        return NAME.sub(
+            lambda match: (
+                f"_{self._message.module}.{match.group(1)}"
+                if not match.group(1).startswith("_") and hasattr(self._module, match.group(1))
+                else match.group(1)
+            ),
+            expression,
+        )
+
+    def _absent_value(self, path: str, node: per.Type) -> str:
+        if path in self._message.defaults:
+            return self._qualify(self._message.defaults[path])
+        if node.default is not None:
+            return repr(node.default)
+        return "None"
+
+    def _assign_absent(self, path: str):
+        # Assign the values of the referenced paths at or below an absent path whose bindings
+        # are evaluated outside of it.
+        for referenced, bindings in self._referenced.items():
+            if referenced != path and not referenced.startswith(path + "."):
+                continue
+            if "*" in referenced[len(path) :].split("."):
+                continue
+            if all(binding == path or binding.startswith(path + ".") for binding in bindings):
+                if referenced != path:
+                    continue
+            value = self._absent_value(referenced, self._node(referenced))
+            self._writer.line(f"{self._local(referenced)} = {value}")
+
+    def generate(self) -> List[str]:
+        writer = self._writer
+        self._emit(self._root, "")
+        writer.flush()
+        function_name = f"decode_{self._message.name}"
+        return (
+            [
+                f"def {function_name}(data: bytes) -> "
+                f"_{self._message.module}.{self._message.message_class}:",
+                "    r = 8 * len(data)",
+                '    v = int.from_bytes(data, "big")',
+                "    try:",
+            ]
+            + ["    " + line for line in writer.lines]
+            + [
+                "    except ValueError as error:",
+                "        raise _out_of_data(error) from error",
+                "    if r < 0:",
+                '        raise UperDecodeError("Out of data.")',
+                f"    return {self._local('')}",
+            ]
+        )
+
+    def _emit(self, node: per.Type, path: str):
+        writer = self._writer
+        if path not in self._interior:
+            if path in self._referenced:
+                self._generator._decode(node, self._local(path), writer)
+            else:
+                self._generator._skip(node, writer)
+            return
+        if isinstance(node, per.Sequence):
+            self._emit_sequence(node, path)
+        elif isinstance(node, uper.Choice):
+            self._emit_choice(node, path)
+        elif isinstance(node, uper.SequenceOf):
+            count = writer.local("count")
+            self._generator._decode_length(node, count, writer)
+            element = _join(path, "*")
+            items = self._local(path)
+            writer.line(f"{items} = []")
+            with writer.block(f"for _ in range({count}):"):
+                self._emit(node.element_type, element)
+                writer.line(f"{items}.append({self._local(element)})")
+        else:
+            raise NotImplementedError(f"Cannot bind below {node!r} at '{path}'.")
+        if path in self._message.bindings:
+            writer.line(f"{self._local(path)} = {self._render(path)}")
+
+    def _emit_sequence(self, node: per.Sequence, path: str):
+        writer = self._writer
+        for addition in _members(node)[len(node.root_members) :]:
+            if self._is_relevant(_join(path, addition.name)):
+                raise NotImplementedError(f"Cannot bind extension addition '{addition.name}'.")
+        extension, present = self._generator._read_presence(node, writer)
+        for member in node.root_members:
+            member_path = _join(path, member.name)
+            relevant = self._is_relevant(member_path)
+            if member not in node.optionals:
+                self._emit(member, member_path)
+                continue
+            bit = self._generator._presence_bit(node, member)
+            with writer.block(f"if {present} & {bit}:"):
+                self._emit(member, member_path)
+            if relevant:
+                with writer.block("else:"):
+                    self._assign_absent(member_path)
+        if extension is not None:
+            with writer.block(f"if {extension}:"):
+                writer.line("r = _skip_additions(v, r)")
+
+    def _emit_choice(self, node: uper.Choice, path: str):
+        writer = self._writer
+        alternatives = node.root_index_to_member
+        relevant = [
+            alternative
+            for alternative in alternatives.values()
+            if self._is_relevant(_join(path, alternative.name))
+        ]
+
+        def assign_others(chosen: Optional[per.Type]):
+            for alternative in relevant:
+                if alternative is not chosen:
+                    self._assign_absent(_join(path, alternative.name))
+
+        if node.additions_index_to_member is not None:
+            extension = writer.local("extension")
+            writer.line(f"{extension} = {writer.read(1)}")
+            with writer.block(f"if {extension}:"):
+                writer.line("r = _skip_choice_addition(v, r)")
+                assign_others(None)
+            with writer.block("else:"):
+                self._emit_choice_root(node, path, assign_others)
+            return
+        self._emit_choice_root(node, path, assign_others)
+
+    def _emit_choice_root(self, node: uper.Choice, path: str, assign_others):
+        writer = self._writer
+        alternatives = node.root_index_to_member
+        if len(alternatives) == 1:
+            self._emit(alternatives[0], _join(path, alternatives[0].name))
+            return
+        index = writer.local("index")
+        writer.line(f"{index} = {writer.read(node.root_number_of_bits)}")
+        for alternative_index, alternative in alternatives.items():
+            keyword = "if" if alternative_index == 0 else "elif"
+            with writer.block(f"{keyword} {index} == {alternative_index}:"):
+                self._emit(alternative, _join(path, alternative.name))
+                assign_others(alternative)
+        with writer.block("else:"):
+            writer.line(f'raise UperDecodeError(f"Invalid choice index {{{index}}}.")')
+
+
+def _value_functions(
+    generator: CodecGenerator, message: GeneratedMessage, root: per.Type
+) -> List[str]:
+    decode = generator.decode_function(root, message.type_name)
+    encode = generator.encode_function(root, message.type_name)
+    return [
+        f"def decode_{message.name}_value(data: bytes) -> dict:",
+        f'    """Decode a {message.type_name} to the value asn1tools would return."""',
+        "    try:",
+        f'        value, r = {decode}(int.from_bytes(data, "big"), 8 * len(data))',
+        "    except ValueError as error:",
+        "        raise _out_of_data(error) from error",
+        "    if r < 0:",
+        '        raise UperDecodeError("Out of data.")',
+        "    return value",
+        "",
+        "",
+        f"def encode_{message.name}_value(value: dict) -> bytes:",
+        f'    """Encode a {message.type_name} given as asn1tools value."""',
+        "    try:",
+        f"        e, m = {encode}(0, 0, value)",
+        "    except KeyError as error:",
+        '        raise UperEncodeError(f"Missing member {error}.") from error',
+        "    padding = -m % 8",
+        '    return (e << padding).to_bytes((m + padding) // 8, "big")',
+    ]
+
+
+def generate(messages: Optional[List[GeneratedMessage]] = None) -> str:
+    """
+    Generate the source of the codecs module.
+
+    Parameters
+    ----------
+    messages : Optional[List[GeneratedMessage]]
+        Messages to generate codecs for. Defaults to GENERATED_MESSAGES.
+
+    Returns
+    -------
+    str
+        Python source.
+    """
+    if messages is None:
+        messages = GENERATED_MESSAGES
+    generator = CodecGenerator()
+    modules = EtsiDecoder.ASN_MODULES[EtsiDecoder.DECODABLE_PROTOCOL_VERSION]
+    specification = compile_modules(modules)
+    sections = []
+    for message in messages:
+        root = specification.types[message.type_name]._type
+        sections += ["", ""] + _value_functions(generator, message, root)
+        sections += ["", ""] + generator.bound_decoder(message, root)
+
+    lines = [HEADER.rstrip("\n")]
+    for module in sorted({message.module for message in messages}):
+        lines.append(f"from cohda_driver.etsi_messages import {module} as _{module}")
+    lines.append("")
+    lines.append("# Digest of the ASN.1 specification the codecs were generated from.")
+    lines.append(f"SPECIFICATION_DIGEST = {specification_digest(modules)!r}")
+    lines.append(RUNTIME.rstrip("\n"))
+    lines += ["", ""] + generator.functions() + sections
+    lines += ["", "", "# Decoders to the ETSI message classes by ASN.1 type name.", "DECODERS = {"]
+    for message in messages:
+        lines.append(f"    {message.type_name!r}: decode_{message.name},")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate the specialized UPER codecs.")
+    parser.add_argument("--output", type=Path, default=OUTPUT_PATH, help="Generated module.")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only check that the generated module is up to date.",
+    )
+    args = parser.parse_args(argv)
+    source = generate()
+    if args.check:
+        if not args.output.exists() or args.output.read_text() != source:
+            print(f"{args.output} is outdated. Run python -m cohda_driver.codegen.")
+            return 1
+        return 0
+    args.output.write_text(source)
+    print(f"Wrote {args.output}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,262 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# This module implements a generator of synthetic, valid UPER encoded
+# ETSI messages for benchmarks and conformance checks.
+# ---------------------------------------------------------------------
+import random
+import string
+
+from typing import Dict, List, Optional
+
+from asn1tools.codecs import per, uper
+
+from cohda_driver.decoder import EtsiDecoder
+from cohda_driver.etsi_message_type import EtsiMessageType
+from cohda_driver.etsi_messages.cam import ROAD_SIDE_UNIT
+
+# Maximum number of elements of a random SEQUENCE OF and maximum nesting of SEQUENCE OFs with
+# more than their minimum number of elements.
+MAX_ELEMENTS = 4
+MAX_LIST_DEPTH = 2
+# StationType of passenger cars.
+PASSENGER_CAR = 5
+
+
+def random_value(
+    node: per.Type, rng: random.Random, list_depth: int = 0, complete: bool = False
+):
+    """
+    Random valid value of an asn1tools UPER type.
+
+    Parameters
+    ----------
+    node : asn1tools.codecs.per.Type
+        Compiled type, e.g. `specification.types["CAM"]._type`.
+    rng : random.Random
+        Source of randomness.
+    list_depth : int
+        Number of enclosing SEQUENCE OFs.
+    complete : bool
+        Add all OPTIONAL and DEFAULT members of sequences. Half of them are left out otherwise.
+
+    Returns
+    -------
+    Any
+        Value in the form accepted by the asn1tools encoder.
+    """
+    if isinstance(node, uper.Integer):
+        if node.minimum is None:
+            return rng.randint(-(2**40), 2**40)
+        if node.has_extension_marker and rng.random() < 0.05:
+            return node.maximum + rng.randint(1, 1000)
+        return rng.choice([node.minimum, node.maximum, rng.randint(node.minimum, node.maximum)])
+    if isinstance(node, per.Boolean):
+        return rng.random() < 0.5
+    if isinstance(node, per.Null):
+        return None
+    if isinstance(node, per.Enumerated):
+        return rng.choice(list(node.root_index_to_data.values()))
+    if isinstance(node, uper.BitString):
+        minimum = node.minimum or 0
+        maximum = node.maximum if node.maximum is not None else minimum + 64
+        bits = rng.randint(minimum, min(maximum, minimum + 64))
+        data = rng.getrandbits(bits) << (-bits % 8) if bits else 0
+        return (data.to_bytes((bits + 7) // 8, "big"), bits)
+    if isinstance(node, (uper.OctetString, uper.OpenType)):
+        minimum = getattr(node, "minimum", None) or 0
+        maximum = getattr(node, "maximum", None) or minimum + 16
+        return bytes(rng.getrandbits(8) for _ in range(rng.randint(minimum, min(maximum, 32))))
+    if isinstance(node, (uper.IA5String, uper.VisibleString)):
+        minimum = node.minimum or 0
+        maximum = node.maximum if node.maximum is not None else minimum + 16
+        length = rng.randint(minimum, min(maximum, minimum + 16))
+        return "".join(rng.choice(string.ascii_letters + string.digits) for _ in range(length))
+    if isinstance(node, per.Sequence):
+        value = {}
+        for member in node.root_members:
+            optional = member.optional or member.default is not None
+            if optional and not complete and rng.random() < 0.5:
+                continue
+            value[member.name] = random_value(member, rng, list_depth, complete)
+        return value
+    if isinstance(node, uper.SequenceOf):
+        maximum = node.maximum if node.maximum is not None else node.minimum + MAX_ELEMENTS
+        limit = MAX_ELEMENTS if list_depth < MAX_LIST_DEPTH else 0
+        count = rng.randint(node.minimum, max(node.minimum, min(maximum, node.minimum + limit)))
+        return [
+            random_value(node.element_type, rng, list_depth + 1, complete) for _ in range(count)
+        ]
+    if isinstance(node, uper.Choice):
+        alternative = rng.choice(list(node.root_index_to_member.values()))
+        return (alternative.name, random_value(alternative, rng, list_depth, complete))
+    raise NotImplementedError(f"No random values for {node!r}.")
+
+
+def member_type(node: per.Type, path: str) -> per.Type:
+    """
+    Type of a nested member, e.g. `member_type(cam, "cam.camParameters")`. SEQUENCE OF elements
+    are selected with "*".
+    """
+    for name in path.split("."):
+        if name == "*":
+            node = node.element_type
+        elif isinstance(node, uper.Choice):
+            node = next(
+                member for member in node.root_index_to_member.values() if member.name == name
+            )
+        else:
+            node = next(member for member in node.root_members if member.name == name)
+    return node
+
+
+class MessageCorpus:
+    """
+    Generator of synthetic ETSI messages that are valid for the bundled ASN.1 specifications
+    and accepted by the `from_dict` methods of the ETSI message classes.
+
+    The headers carry the protocol version decoded by EtsiDecoder and the message ID of the
+    type, so the messages go through the same path as received ones. Messages are reproducible
+    for a given seed.
+    """
+
+    def __init__(self, seed: int = 0, decoder: Optional[EtsiDecoder] = None):
+        """
+        Initialize the corpus.
+
+        Parameters
+        ----------
+        seed : int
+            Seed of the random values.
+        decoder : Optional[EtsiDecoder]
+            Decoder whose specifications are used. A new decoder is created if None.
+        """
+        self.rng = random.Random(seed)
+        self.decoder = decoder if decoder is not None else EtsiDecoder()
+
+    def root_type(self, message_type: EtsiMessageType) -> per.Type:
+        spec_name, type_name, _ = EtsiDecoder.MESSAGE_SPECS[message_type]
+        return self.decoder.specs[spec_name].types[type_name]._type
+
+    def encode(self, message_type: EtsiMessageType, value: Dict) -> bytes:
+        """
+        UPER encode a value of the given message type.
+        """
+        spec_name, type_name, _ = EtsiDecoder.MESSAGE_SPECS[message_type]
+        return bytes(self.decoder.specs[spec_name].encode(type_name, value))
+
+    def cam(self, road_side_unit: bool = False) -> Dict:
+        """
+        Random CAM with the high frequency container of a vehicle or of a road side unit.
+        """
+        root = self.root_type(EtsiMessageType.CAM)
+        value = self._message(EtsiMessageType.CAM, root)
+        parameters = value["cam"]["camParameters"]
+        if road_side_unit:
+            parameters["basicContainer"]["stationType"] = ROAD_SIDE_UNIT
+            alternative = "rsuContainerHighFrequency"
+        else:
+            parameters["basicContainer"]["stationType"] = PASSENGER_CAR
+            alternative = "basicVehicleContainerHighFrequency"
+        container = member_type(root, f"cam.camParameters.highFrequencyContainer.{alternative}")
+        parameters["highFrequencyContainer"] = (
+            alternative,
+            random_value(container, self.rng, complete=True),
+        )
+        return value
+
+    def cpm(self, objects: int) -> Dict:
+        """
+        Random CPM with the given number of perceived objects (0 to 128).
+        """
+        if not 0 <= objects <= 128:
+            raise ValueError(f"A CPM has 0 to 128 perceived objects, got {objects}.")
+        root = self.root_type(EtsiMessageType.CPM)
+        value = self._message(EtsiMessageType.CPM, root)
+        parameters = value["cpm"]["cpmParameters"]
+        parameters["numberOfPerceivedObjects"] = objects
+        parameters.pop("perceivedObjectContainer", None)
+        if objects:
+            # CPM.from_dict requires the dimensions, classification and matched position.
+            perceived_object = member_type(root, "cpm.cpmParameters.perceivedObjectContainer.*")
+            parameters["perceivedObjectContainer"] = [
+                random_value(perceived_object, self.rng, 1, complete=True) for _ in range(objects)
+            ]
+        return value
+
+    def mapem(self, lanes: int, nodes: int) -> Dict:
+        """
+        Random MAPEM with one intersection of the given number of lanes (1 to 255) with the
+        given number of XY nodes each (2 to 63).
+        """
+        if not 1 <= lanes <= 255 or not 2 <= nodes <= 63:
+            raise ValueError(f"Invalid MAPEM with {lanes} lanes and {nodes} nodes per lane.")
+        root = self.root_type(EtsiMessageType.MAPEM)
+        value = self._message(EtsiMessageType.MAPEM, root)
+        intersection_type = member_type(root, "map.intersections.*")
+        intersection = random_value(intersection_type, self.rng, 1)
+        # MAPEM.from_dict requires the name, region and lane width.
+        for name in ("name", "laneWidth"):
+            intersection.setdefault(
+                name, random_value(member_type(intersection_type, name), self.rng)
+            )
+        intersection["id"].setdefault("region", 0)
+        lane_type = member_type(intersection_type, "laneSet.*")
+        node_type = member_type(lane_type, "nodeList.nodes.*")
+        intersection["laneSet"] = [
+            self._lane(lane_type, node_type, nodes) for _ in range(lanes)
+        ]
+        value["map"]["intersections"] = [intersection]
+        return value
+
+    def spatem(self, intersections: int = 1) -> Dict:
+        """
+        Random SPATEM with the given number of intersections (1 to 32).
+        """
+        if not 1 <= intersections <= 32:
+            raise ValueError(f"A SPATEM has 1 to 32 intersections, got {intersections}.")
+        root = self.root_type(EtsiMessageType.SPATEM)
+        value = self._message(EtsiMessageType.SPATEM, root)
+        intersection = member_type(root, "spat.intersections.*")
+        value["spat"]["intersections"] = [
+            random_value(intersection, self.rng, 1) for _ in range(intersections)
+        ]
+        return value
+
+    def payloads(self, message_type: EtsiMessageType, count: int, **kwargs) -> List[bytes]:
+        """
+        Encoded random messages, e.g. `corpus.payloads(EtsiMessageType.CPM, 100, objects=8)`.
+        The keyword arguments are passed to the method of the message type.
+        """
+        generate = getattr(self, message_type.name.lower())
+        return [self.encode(message_type, generate(**kwargs)) for _ in range(count)]
+
+    def _message(self, message_type: EtsiMessageType, root: per.Type) -> Dict:
+        value = random_value(root, self.rng)
+        header = value["header"]
+        # The CAM, MAPEM and SPATEM specifications spell the ID members differently than CPM.
+        message_id = "messageID" if "messageID" in header else "messageId"
+        header["protocolVersion"] = EtsiDecoder.DECODABLE_PROTOCOL_VERSION
+        header[message_id] = message_type.value
+        return value
+
+    def _lane(self, lane_type: per.Type, node_type: per.Type, nodes: int) -> Dict:
+        lane = random_value(lane_type, self.rng, 2)
+        delta_type = member_type(node_type, "delta")
+        node_list = []
+        for _ in range(nodes):
+            node = random_value(node_type, self.rng, 3)
+            # MAPEM.from_dict reads XY offsets only.
+            alternative = f"node-XY{self.rng.randint(1, 6)}"
+            node["delta"] = (
+                alternative,
+                random_value(member_type(delta_type, alternative), self.rng),
+            )
+            node_list.append(node)
+        lane["nodeList"] = ("nodes", node_list)
+        return lane
@@ -0,0 +1,395 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# This module implements the decoding of UPER encoded ETSI messages.
+# ---------------------------------------------------------------------
+
+# -------- System imports -------------
+import hashlib
+import itertools
+import os
+
+from collections import deque
+from typing import Any, Callable, Union, List, Dict, Optional, Iterable, Iterator
+from pathlib import Path
+
+# -------- Third party imports -------------
+from typing_extensions import TypeAlias
+
+# -------- Local imports -------------
+from cohda_driver.etsi_messages import CAM
+from cohda_driver.etsi_messages import SPATEM
+from cohda_driver.etsi_messages import CPM
+from cohda_driver.etsi_messages import MAPEM
+from cohda_driver.etsi_messages import ItsPduHeader
+from cohda_driver.etsi_message_type import EtsiMessageType
+from cohda_driver.tracing import PacketTrace
+
+from cohda_driver.logger import logger
+
+EtsiMessageClasses: TypeAlias = Union[CAM, SPATEM, CPM, MAPEM]
+
+
+def get_asn_files_from_dir(path: Path) -> List[Path]:
+    """
+    Get ASN.1 files from a directory.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        Path to directory.
+
+    Returns
+    -------
+    List[pathlib.Path]
+        List of ASN.1 files.
+    """
+    return [f for f in path.iterdir() if f.is_file()]
+
+
+def specification_digest(modules: Dict[str, str]) -> str:
+    """
+    Digest of the ASN.1 files of a specification, to detect outdated generated codecs.
+
+    Parameters
+    ----------
+    modules : Dict[str, str]
+        Files of the compiled ASN.1 modules by module name, relative to the ASN.1 directory, e.g.
+        `EtsiDecoder.ASN_MODULES[2]`.
+
+    Returns
+    -------
+    str
+        Hex digest of the module selection and of the names and contents of its files.
+    """
+    digest = hashlib.sha256()
+    digest.update(repr(sorted(modules.items())).encode())
+    for file_name in sorted(set(modules.values())):
+        digest.update(file_name.encode())
+        digest.update((EtsiDecoder.ASN_DIR / file_name).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def compile_modules(modules: Dict[str, str]) -> Any:
+    """
+    Compile a selection of ASN.1 modules into one UPER specification.
+
+    Every file is parsed once, and only the selected modules of it are compiled, so modules that
+    are defined in several files, e.g. different versions of a module with the same name, are
+    taken from the selected file.
+
+    Parameters
+    ----------
+    modules : Dict[str, str]
+        Files of the ASN.1 modules by module name, relative to the ASN.1 directory.
+
+    Returns
+    -------
+    asn1tools.compiler.Specification
+        Compiled specification.
+    """
+    # Imported on first use, as asn1tools takes most of the import time of the package.
+    import asn1tools
+
+    parsed_files: Dict[str, dict] = {}
+    selected = {}
+    for module_name, file_name in modules.items():
+        if file_name not in parsed_files:
+            parsed_files[file_name] = asn1tools.parse_files([str(EtsiDecoder.ASN_DIR / file_name)])
+        selected[module_name] = parsed_files[file_name][module_name]
+    return asn1tools.compile_dict(selected, codec="uper", numeric_enums=True)
+
+
+class EtsiDecoder:
+    """
+    Decoder for UPER encoded ETSI messages, shared by the driver loop and offline tools.
+
+    Class Attributes
+    ---------------
+    ASN_DIR : pathlib.Path
+        Path to the directory containing the ASN.1 specifications.
+    ETSI_MESSAGES : List[str]
+        List of ETSI messages to be loaded for the ASN.1
+        specifications. These should match the folder names in the
+        ASN.1 directory.
+    MESSAGE_SPECS : Dict[EtsiMessageType, Tuple[str, str, type]]
+        Specification folder, ASN.1 type name and ETSI message class
+        for every decodable ETSI message type.
+    PROTOCOL_VERSIONS : List[int]
+        ItsPduHeader protocol versions accepted by the decoder.
+    DECODABLE_PROTOCOL_VERSION : int
+        ItsPduHeader protocol version of the generated codecs and of
+        the specifications of all message types.
+    ASN_MODULES : Dict[int, Dict[str, str]]
+        Files of the ASN.1 modules compiled for every protocol version,
+        by module name. The message types of `MESSAGE_SPECS` that are
+        defined by the modules of a version are decoded in it.
+    """
+
+    ASN_DIR = Path(__file__).parent.parent.parent / "asn1"
+    ETSI_MESSAGES = ["cam", "cpm_tr103562", "mapem", "spatem"]
+    MESSAGE_SPECS = {
+        EtsiMessageType.CAM: ("cam", "CAM", CAM),
+        EtsiMessageType.SPATEM: ("spatem", "SPATEM", SPATEM),
+        EtsiMessageType.CPM: ("cpm_tr103562", "CPM", CPM),
+        EtsiMessageType.MAPEM: ("mapem", "MAPEM", MAPEM),
+    }
+    PROTOCOL_VERSIONS = [1, 2]
+    DECODABLE_PROTOCOL_VERSION = 2
+    ASN_MODULES = {
+        # CAM of EN 302 637-2 v1.4.1.
+        1: {
+            "ITS-Container": "cam/141/ITS-Container (2).asn",
+            "CAM-PDU-Descriptions": "cam/141/CAM-PDU-Descriptions (2).asn",
+        },
+        # The common data dictionary and DSRC modules are shared by CAM, MAPEM and SPATEM, and
+        # the CPM of TR 103 562 imports GenerationDeltaTime from the CAM.
+        2: {
+            "ETSI-ITS-CDD": "cam/ETSI-ITS-CDD.asn",
+            "CAM-PDU-Descriptions": "cam/CAM-PDU-Descriptions.asn",
+            "ETSI-ITS-DSRC": "spatem/DSRC.asn",
+            "ETSI-ITS-DSRC-REGION": "spatem/DSRC-region.asn",
+            "ETSI-ITS-DSRC-AddGrpC": "spatem/DSRC-addgrp-C.asn",
+            "MAPEM-PDU-Descriptions": "mapem/MAPEM-PDU-Descriptions.asn",
+            "SPATEM-PDU-Descriptions": "spatem/SPATEM-PDU-Descriptions.asn",
+            "ITS-Container": "cpm_tr103562/ITS-Container.asn",
+            "DSRC": "cpm_tr103562/ISO-TS-19091-addgrp-C-2018.asn",
+            "REGION": "cpm_tr103562/ISO-TS-19091-addgrp-C-2018.asn",
+            "AddGrpC": "cpm_tr103562/ISO-TS-19091-addgrp-C-2018.asn",
+            "CPM-PDU-Descriptions": "cpm_tr103562/TR103562v211-CPM.asn",
+        },
+    }
+
+    def __init__(self, use_generated_codecs: bool = True):
+        """
+        Initialize the decoder and compile the ASN.1 specifications.
+
+        Parameters
+        ----------
+        use_generated_codecs : bool
+            Decode the message types of `cohda_driver.uper_codecs` with the generated decoders
+            instead of asn1tools and from_dict. Generated decoders whose specification changed
+            since they were generated are not used.
+        """
+        logger.info(f"Loading ASN.1 specifications from {self.ASN_DIR} ...")
+        # One specification per protocol version, with the modules shared by the messages
+        # compiled once.
+        self.specifications: Dict[int, Any] = {}
+        # Compiled ASN.1 types of the decodable message types per protocol version.
+        self._message_types: Dict[int, Dict[EtsiMessageType, Any]] = {}
+        for protocol_version, modules in self.ASN_MODULES.items():
+            logger.debug(f"Compiling the modules of protocol version {protocol_version}.")
+            specification = compile_modules(modules)
+            self.specifications[protocol_version] = specification
+            self._message_types[protocol_version] = {
+                message_type: specification.types[type_name]
+                for message_type, (_, type_name, _) in self.MESSAGE_SPECS.items()
+                if type_name in specification.types
+            }
+        # Specification of every ETSI message by folder name, all of them are defined in the
+        # specification of the decodable protocol version.
+        self.specs = {
+            etsi_message: self.specifications[self.DECODABLE_PROTOCOL_VERSION]
+            for etsi_message in self.ETSI_MESSAGES
+        }
+        self._generated_decoders: Dict[
+            EtsiMessageType, Callable[[bytes], EtsiMessageClasses]
+        ] = {}
+        if use_generated_codecs:
+            self._load_generated_decoders()
+
+    def _load_generated_decoders(self):
+        from cohda_driver import uper_codecs
+
+        # The codecs are generated from the specification of the decodable protocol version, and
+        # every file of it can change the types of a message.
+        outdated = uper_codecs.SPECIFICATION_DIGEST != specification_digest(
+            self.ASN_MODULES[self.DECODABLE_PROTOCOL_VERSION]
+        )
+        for message_type, (_, type_name, _) in self.MESSAGE_SPECS.items():
+            if type_name not in uper_codecs.DECODERS:
+                continue
+            if outdated:
+                logger.warning(
+                    f"Generated {type_name} decoder is outdated, using asn1tools. Regenerate it "
+                    "with 'python -m cohda_driver.codegen'."
+                )
+                continue
+            self._generated_decoders[message_type] = uper_codecs.DECODERS[type_name]
+
+    def decode_header(self, data: bytes) -> ItsPduHeader:
+        """
+        Decode the ItsPduHeader at the start of a UPER encoded ETSI message.
+
+        Parameters
+        ----------
+        data : bytes
+            UPER encoded ETSI message.
+
+        Returns
+        -------
+        ItsPduHeader
+            Decoded header.
+        """
+        # The header is byte-aligned in UPER and read without the ASN.1 decoder.
+        return ItsPduHeader.from_bytes(data)
+
+    def is_decodable(self, message_type: EtsiMessageType, protocol_version: int) -> bool:
+        message_types = self._message_types.get(protocol_version)
+        return message_types is not None and message_type in message_types
+
+    def decode_message(
+        self,
+        message_type: EtsiMessageType,
+        data: bytes,
+        trace: Optional[PacketTrace] = None,
+        protocol_version: int = DECODABLE_PROTOCOL_VERSION,
+    ) -> EtsiMessageClasses:
+        """
+        Decode a UPER encoded ETSI message of a known type.
+
+        Parameters
+        ----------
+        message_type : EtsiMessageType
+            Type of the message, usually taken from its ItsPduHeader.
+        data : bytes
+            UPER encoded ETSI message.
+        trace : Optional[PacketTrace]
+            Trace the decoding stages are marked in.
+        protocol_version : int
+            ItsPduHeader protocol version of the message, see `is_decodable`.
+
+        Returns
+        -------
+        EtsiMessageClasses
+            Decoded ETSI message.
+        """
+        if protocol_version == self.DECODABLE_PROTOCOL_VERSION:
+            generated_decoder = self._generated_decoders.get(message_type)
+            if generated_decoder is not None:
+                etsi_msg = generated_decoder(data)
+                if trace is not None:
+                    trace.mark("decode")
+                return etsi_msg
+        value = self._message_types[protocol_version][message_type].decode(data)
+        if trace is not None:
+            trace.mark("uper_decode")
+        etsi_msg = self.MESSAGE_SPECS[message_type][2].from_dict(value)
+        if trace is not None:
+            trace.mark("from_dict")
+        return etsi_msg
+
+    def decode(self, data: bytes) -> Optional[EtsiMessageClasses]:
+        """
+        Decode a UPER encoded ETSI message of any type.
+
+        Parameters
+        ----------
+        data : bytes
+            UPER encoded ETSI message.
+
+        Returns
+        -------
+        Optional[EtsiMessageClasses]
+            Decoded ETSI message or None if the message type or protocol version is not supported.
+        """
+        its_pdu_header = self.decode_header(data)
+        try:
+            message_type = EtsiMessageType(its_pdu_header.message_id)
+        except ValueError:
+            return None
+        if not self.is_decodable(message_type, its_pdu_header.protocol_version):
+            return None
+        return self.decode_message(
+            message_type, data, protocol_version=its_pdu_header.protocol_version
+        )
+
+
+# Decoder of the current process, created on first use by the decode_many workers.
+_worker_decoder: Optional[EtsiDecoder] = None
+
+
+def _decode_chunk(chunk: List[bytes]) -> List[Optional[EtsiMessageClasses]]:
+    global _worker_decoder
+    if _worker_decoder is None:
+        _worker_decoder = EtsiDecoder()
+    return [_decode_or_none(_worker_decoder, data) for data in chunk]
+
+
+def _decode_or_none(decoder: EtsiDecoder, data: bytes) -> Optional[EtsiMessageClasses]:
+    try:
+        return decoder.decode(data)
+    except Exception as e:
+        logger.debug("Error decoding message: %s", e)
+        return None
+
+
+def decode_many(
+    payloads: Iterable[bytes],
+    workers: Optional[int] = None,
+    chunk_size: int = 256,
+    decoder: Optional[EtsiDecoder] = None,
+) -> Iterator[Optional[EtsiMessageClasses]]:
+    """
+    Decode many UPER encoded ETSI messages, optionally on several processes.
+
+    The payloads are consumed lazily and split into chunks that are decoded by a process pool.
+    Every worker process compiles the ASN.1 specifications once and reuses them for all of its
+    chunks. Only a bounded number of chunks is in flight at any time, so arbitrarily long
+    iterables can be decoded with constant memory.
+
+    Parameters
+    ----------
+    payloads : Iterable[bytes]
+        UPER encoded ETSI messages, starting with the ItsPduHeader.
+    workers : Optional[int]
+        Number of worker processes. Defaults to the number of CPUs. With 1, the payloads are
+        decoded in the calling process.
+    chunk_size : int
+        Number of payloads sent to a worker at once.
+    decoder : Optional[EtsiDecoder]
+        Decoder used when decoding in the calling process. A new decoder is created if None.
+
+    Returns
+    -------
+    Iterator[Optional[EtsiMessageClasses]]
+        Decoded ETSI messages in the order of the payloads. Payloads that cannot be decoded or
+        are of an unsupported type or version yield None.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1:
+        if decoder is None:
+            decoder = EtsiDecoder()
+        for data in payloads:
+            yield _decode_or_none(decoder, data)
+        return
+
+    # Imported on first use, as it imports multiprocessing.
+    from concurrent.futures import ProcessPoolExecutor
+
+    payloads = iter(payloads)
+    executor = ProcessPoolExecutor(max_workers=workers)
+    pending = deque()
+    try:
+        while True:
+            while len(pending) < 2 * workers:
+                chunk = list(itertools.islice(payloads, chunk_size))
+                if not chunk:
+                    break
+                pending.append(executor.submit(_decode_chunk, chunk))
+            if not pending:
+                return
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
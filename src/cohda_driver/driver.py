@@ -13,48 +13,40 @@
 
 # -------- System imports -------------
 import socket
+import struct
+import sys
 import threading
+import time
 
-from typing import Union, List, Dict, Callable
-from pathlib import Path
-
-# -------- Third party imports -------------
-import asn1tools
-
-from typing_extensions import TypeAlias
+from collections import deque
+from typing import Callable, Deque, Dict, Optional, Tuple
 
 # -------- Local imports -------------
 from cohda_driver import btp_request
 from cohda_driver.common_header import COMMON_HEADER_SIZE
 from cohda_driver.btp_indication import BTP_DATA_INDICATION_SIZE
 
-from cohda_driver.etsi_messages import CAM
-from cohda_driver.etsi_messages import SPATEM
-from cohda_driver.etsi_messages import CPM
-from cohda_driver.etsi_messages import MAPEM
-from cohda_driver.etsi_messages import ItsPduHeader
+from cohda_driver.archive import MessageArchiveWriter
+from cohda_driver.decoder import EtsiDecoder, EtsiMessageClasses
 from cohda_driver.etsi_message_type import EtsiMessageType
-
-from cohda_driver.logger import logger
-
-EtsiMessageClasses: TypeAlias = Union[CAM, SPATEM]
-
-
-def get_asn_files_from_dir(path: Path) -> List[Path]:
-    """
-    Get ASN.1 files from a directory.
-
-    Parameters
-    ----------
-    path : pathlib.Path
-        Path to directory.
-
-    Returns
-    -------
-    List[pathlib.Path]
-        List of ASN.1 files.
-    """
-    return [f for f in path.iterdir() if f.is_file()]
+from cohda_driver.etsi_messages.its_pdu_header import ITS_PDU_HEADER_SIZE
+from cohda_driver.ingress import IngressQueue
+from cohda_driver.its_time import generation_time, peek_generation_delta_time
+
+from cohda_driver.logger import WarningAggregator, logger
+from cohda_driver.metrics import DriverMetrics, MetricsServer
+from cohda_driver.recorder import PacketRecorder
+from cohda_driver.shared_ring import SharedRingWriter
+from cohda_driver.subscription import Subscription, SubscriptionRegistry
+from cohda_driver.tracing import INDICATION, REQUEST, PacketTrace, Tracer
+
+# Kernel receive timestamps and receive queue drop counter, see socket(7). Python does not
+# export these Linux constants.
+SO_TIMESTAMPNS = getattr(socket, "SO_TIMESTAMPNS", 35)
+SCM_TIMESTAMPNS = SO_TIMESTAMPNS
+SO_RXQ_OVFL = getattr(socket, "SO_RXQ_OVFL", 40)
+TIMESPEC_STRUCT = struct.Struct("@ll")
+RXQ_OVFL_STRUCT = struct.Struct("@I")
 
 
 class CohdaDriver:
@@ -67,21 +59,24 @@ class CohdaDriver:
         Size of the buffer for receiving data.
     HEADER_SIZE : int
         Size of the full header for an incoming UDP packet.
-    ASN_DIR : pathlib.Path
-        Path to the directory containing the ASN.1 specifications.
-    ETSI_MESSAGES : List[str]
-        List of ETSI messages to be loaded for the ASN.1
-        specifications. These should match the folder names in the
-        ASN.1 directory.
     """
 
     BUFFER_SIZE = 4096
     HEADER_SIZE = COMMON_HEADER_SIZE + BTP_DATA_INDICATION_SIZE
 
-    ASN_DIR = Path(__file__).parent.parent.parent / "asn1"
-    ETSI_MESSAGES = ["cam", "cpm_tr103562", "mapem", "spatem"]
-
-    def __init__(self, host_ip: str, cohda_ip: str, cohda_ind_port: int, cohda_req_port: int):
+    def __init__(
+        self,
+        host_ip: str,
+        cohda_ip: str,
+        cohda_ind_port: int,
+        cohda_req_port: int,
+        enable_metrics: bool = False,
+        kernel_timestamps: bool = True,
+        max_message_age: Optional[float] = None,
+        receive_buffer_size: Optional[int] = None,
+        decoder: Optional[EtsiDecoder] = None,
+        reuse_port: bool = False,
+    ):
         """
         Initialize the Cohda Driver class.
 
@@ -95,25 +90,54 @@ class CohdaDriver:
             Cohda Indication Port for receiving data.
         cohda_req_port : int
             Cohda Request Port for sending data.
+        enable_metrics : bool
+            Collect metrics about the received packets, see `stats`. Disabled by default. On
+            Linux, this also enables the SO_RXQ_OVFL counter of the socket, which reports the
+            datagrams the kernel dropped as `kernel_drops`.
+        kernel_timestamps : bool
+            Use the kernel receive timestamps (SO_TIMESTAMPNS) of the datagrams instead of the
+            time the driver loop reads them. Only supported on Linux.
+        max_message_age : Optional[float]
+            Drop CAMs and CPMs whose generationDeltaTime is older than this many seconds before
+            they are decoded. Disabled if None.
+        receive_buffer_size : Optional[int]
+            Size of the socket receive buffer (SO_RCVBUF) in bytes. Larger buffers absorb longer
+            bursts without kernel drops, which are counted with `enable_metrics`. The system
+            default is used if None. On Linux, the size is capped by net.core.rmem_max.
+        decoder : Optional[EtsiDecoder]
+            Decoder with the compiled ASN.1 specifications. Drivers can share a decoder to
+            compile the specifications only once. A new decoder is created if None.
+        reuse_port : bool
+            Allow several sockets to bind the indication port (SO_REUSEPORT), see
+            `cohda_driver.sharded`. Only supported on Linux and BSD.
         """
         self._cohda_ip = cohda_ip
         self._cohda_req_port = cohda_req_port
-        self._callbacks = {}
+        self._subscriptions = SubscriptionRegistry()
+        # Subscriptions made by setup_callback, which replaces the previous one of a type.
+        self._callback_subscriptions: Dict[EtsiMessageType, Subscription] = {}
+        self._recorder: Optional[PacketRecorder] = None
+        self._archive: Optional[MessageArchiveWriter] = None
+        self._ingress: Optional[IngressQueue] = None
+        # messageIDs of the packets dropped by the ingress queue. The metrics are updated on the
+        # process thread, not on the receive thread that drops them.
+        self._ingress_drops: Deque[int] = deque()
+        self._publisher: Optional[SharedRingWriter] = None
+        self._tracer: Optional[Tracer] = None
+        # Warnings about single packets, which can repeat for every packet of a flood.
+        self._warnings = WarningAggregator(logger)
+        self._metrics: Optional[DriverMetrics] = DriverMetrics() if enable_metrics else None
+        self._metrics_server: Optional[MetricsServer] = None
+        self._max_message_age = max_message_age
         self._is_running = False
         self._run_thread = threading.Thread(target=self._run, daemon=True)
+        self._process_thread = threading.Thread(target=self._process, daemon=True)
 
         # -----------------------------
         # ASN.1 Specification Setup
         # -----------------------------
-        logger.info(f"Loading ASN.1 specifications from {self.ASN_DIR} ...")
-        self._specs: Dict[str, asn1tools.compiler.Specification] = {}
-        for etsi_message in self.ETSI_MESSAGES:
-            logger.debug(f"Adding '{etsi_message}' specification.")
-            self._specs[etsi_message] = asn1tools.compile_files(
-                get_asn_files_from_dir(self.ASN_DIR / etsi_message),
-                codec="uper",
-                numeric_enums=True,
-            )
+        self._decoder = EtsiDecoder() if decoder is None else decoder
+        self._specs = self._decoder.specs
 
         # -----------------------------
         # Socket Setup
@@ -122,8 +146,27 @@ class CohdaDriver:
         logger.info(f"Packets will be sent to {cohda_ip}:{cohda_req_port}.")
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.sock.settimeout(5)
+        if receive_buffer_size is not None:
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, receive_buffer_size)
+        # Linux reports twice the requested size to account for its bookkeeping overhead.
+        logger.info(
+            f"Receive buffer size: {self.sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)}"
+        )
+        if reuse_port:
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
         self.sock.bind((host_ip, cohda_ind_port))
 
+        is_linux = sys.platform.startswith("linux")
+        self._kernel_timestamps = kernel_timestamps and is_linux
+        self._kernel_drop_counter = self._metrics is not None and is_linux
+        self._ancillary_size = 0
+        if self._kernel_timestamps:
+            self.sock.setsockopt(socket.SOL_SOCKET, SO_TIMESTAMPNS, 1)
+            self._ancillary_size += socket.CMSG_SPACE(TIMESPEC_STRUCT.size)
+        if self._kernel_drop_counter:
+            self.sock.setsockopt(socket.SOL_SOCKET, SO_RXQ_OVFL, 1)
+            self._ancillary_size += socket.CMSG_SPACE(RXQ_OVFL_STRUCT.size)
+
         logger.info("Driver initialized.")
 
     def setup_callback(
@@ -132,7 +175,8 @@ class CohdaDriver:
         etsi_msg_type: EtsiMessageType,
     ):
         """
-        Add callback for the given etsi_msg_type.
+        Add callback for the given etsi_msg_type, replacing the callback previously added with
+        this method for the type. See `subscribe` for several subscribers per type.
 
         Parameters
         ----------
@@ -150,17 +194,194 @@ class CohdaDriver:
         etsi_msg_type : EtsiMessageType
             ETSI message type for which the callback should be added.
         """
-        if etsi_msg_type in self._callbacks:
+        previous = self._callback_subscriptions.get(etsi_msg_type)
+        if previous is not None:
             logger.warning(f"Callback for {etsi_msg_type} already exists. Will replace it.")
+            previous.unsubscribe()
         logger.info(f"Adding callback for '{etsi_msg_type}'.")
-        self._callbacks[etsi_msg_type] = callback
+        self._callback_subscriptions[etsi_msg_type] = self._subscriptions.subscribe(
+            etsi_msg_type, callback
+        )
+
+    def subscribe(
+        self,
+        etsi_msg_type: EtsiMessageType,
+        callback: Callable[[EtsiMessageClasses], None],
+        message_filter: Optional[Callable[[EtsiMessageClasses], bool]] = None,
+        payload_filter: Optional[Callable[[bytes], bool]] = None,
+    ) -> Subscription:
+        """
+        Subscribe to the given etsi_msg_type.
+
+        A type can have any number of subscribers. Every message is decoded once and passed to
+        all subscribers in the order they subscribed. An exception raised by a subscriber is
+        logged and does not affect the other subscribers. Subscribing and unsubscribing is
+        allowed from any thread while the driver loop is running. A subscriber that is
+        unsubscribed while a message is dispatched still receives that message.
+
+        Parameters
+        ----------
+        etsi_msg_type : EtsiMessageType
+            ETSI message type to subscribe to.
+        callback : Callable[[EtsiMessageClasses], None]
+            Function called with every decoded message that passes the filter.
+        message_filter : Optional[Callable[[EtsiMessageClasses], bool]]
+            Function called with every decoded message. The callback is only called if it
+            returns True. All messages are passed if None.
+        payload_filter : Optional[Callable[[bytes], bool]]
+            Function called with the UPER encoded message before it is decoded, e.g.
+            `Geofence.accepts_cam`. Messages rejected by the payload filters of all subscribers
+            are not decoded at all.
+
+        Returns
+        -------
+        Subscription
+            Handle to cancel the subscription with `unsubscribe()`.
+        """
+        logger.info(f"Adding subscriber for '{etsi_msg_type}'.")
+        return self._subscriptions.subscribe(
+            etsi_msg_type, callback, message_filter, payload_filter
+        )
+
+    def setup_recorder(self, recorder: Optional[PacketRecorder]):
+        """
+        Record every raw datagram received by the driver loop.
+
+        Parameters
+        ----------
+        recorder : Optional[PacketRecorder]
+            Recorder the datagrams are appended to. None disables recording. The caller remains
+            responsible for closing the recorder.
+        """
+        if recorder is None:
+            logger.info("Disabling packet recording.")
+        else:
+            logger.info(f"Recording packets to {recorder.path}.")
+        self._recorder = recorder
+
+    def setup_archive(self, archive: Optional[MessageArchiveWriter]):
+        """
+        Archive the ETSI message of every processed packet, with the time it was received.
+
+        Parameters
+        ----------
+        archive : Optional[MessageArchiveWriter]
+            Archive the messages are appended to. None disables archiving. The caller remains
+            responsible for closing the archive.
+        """
+        if archive is None:
+            logger.info("Disabling message archive.")
+        else:
+            logger.info(f"Archiving messages to {archive.directory}.")
+        self._archive = archive
+
+    def setup_publisher(self, publisher: Optional[SharedRingWriter]):
+        """
+        Publish the ETSI message of every processed packet to a shared memory ring buffer, from
+        which other local processes can read with SharedRingReader.
+
+        Parameters
+        ----------
+        publisher : Optional[SharedRingWriter]
+            Ring buffer the messages are published to. None disables publishing. The caller
+            remains responsible for closing the ring buffer.
+        """
+        if publisher is None:
+            logger.info("Disabling shared memory publishing.")
+        else:
+            logger.info(f"Publishing messages to shared memory '{publisher.name}'.")
+        self._publisher = publisher
+
+    def setup_tracer(self, tracer: Optional[Tracer]):
+        """
+        Trace the stages of sampled received packets and requests, see `cohda_driver.tracing`.
+
+        Parameters
+        ----------
+        tracer : Optional[Tracer]
+            Tracer deciding which packets are traced and receiving their traces, e.g. a
+            RingBufferTracer. None disables tracing.
+        """
+        if tracer is None:
+            logger.info("Disabling tracing.")
+        else:
+            logger.info(f"Tracing {tracer.sample_rate:.1%} of the packets.")
+        self._tracer = tracer
+
+    def setup_ingress(self, ingress: Optional[IngressQueue]):
+        """
+        Decouple receiving from decoding with a priority-aware ingress queue.
+
+        With an ingress queue, the driver loop receives packets on one thread and decodes them
+        on another. Under overload, the queue drops packets according to its per message type
+        policies, e.g. CAMs before SPATEMs, instead of delaying all packets alike. Must be called
+        before `start_loop`.
+
+        Parameters
+        ----------
+        ingress : Optional[IngressQueue]
+            Queue between the threads. None receives and decodes on a single thread.
+        """
+        if self._is_running:
+            raise RuntimeError("The ingress queue must be set up before starting the loop.")
+        if ingress is None:
+            logger.info("Disabling ingress queue.")
+        else:
+            logger.info(f"Using an ingress queue with capacity {ingress.capacity}.")
+        self._ingress = ingress
+
+    def stats(self) -> Dict:
+        """
+        Get a snapshot of the driver metrics.
+
+        Returns
+        -------
+        Dict
+            JSON serializable snapshot with per message type counters, receive rates, decode
+            latency and callback duration histograms, and drop counters. Empty if the driver was
+            created without `enable_metrics`.
+        """
+        if self._metrics is None:
+            return {}
+        return self._metrics.snapshot()
+
+    def serve_metrics(self, port: int, host: str = "127.0.0.1") -> MetricsServer:
+        """
+        Serve the driver metrics over HTTP until the driver loop is stopped.
+
+        `/metrics` serves the Prometheus text format and `/stats` serves JSON.
+
+        Parameters
+        ----------
+        port : int
+            Port to listen on. 0 selects a free port.
+        host : str
+            Address to listen on. Defaults to localhost only.
+
+        Returns
+        -------
+        MetricsServer
+            The running server.
+        """
+        if self._metrics is None:
+            raise RuntimeError("Metrics are disabled. Create the driver with enable_metrics=True.")
+        if self._metrics_server is None:
+            self._metrics_server = MetricsServer(self.stats, port, host)
+        return self._metrics_server
+
+    @property
+    def has_subscriptions(self) -> bool:
+        """
+        Whether any message type has a subscriber.
+        """
+        return bool(self._subscriptions)
 
     def start_loop(self):
         """
         Start the driver loop.
         """
         logger.info("Starting driver loop.")
-        self._is_running = True
+        self.start_processing()
         self._run_thread.start()
 
     def stop_loop(self):
@@ -170,49 +391,275 @@ class CohdaDriver:
         logger.info("Stopping driver loop.")
         self._is_running = False
         self._run_thread.join()
+        self.stop_processing()
+        if self._metrics_server is not None:
+            self._metrics_server.close()
+            self._metrics_server = None
+
+    def start_processing(self):
+        """
+        Start processing without the receive loop, for drivers whose datagrams are received by
+        another loop and passed to `handle_datagram`, e.g. the devices of a MultiDeviceDriver.
+        Starts the process thread of the ingress queue, if any.
+        """
+        self._is_running = True
+        if self._ingress is not None:
+            self._process_thread.start()
+
+    def stop_processing(self):
+        """
+        Stop the processing started by `start_processing` and log the pending packet warnings.
+        """
+        self._is_running = False
+        if self._process_thread.is_alive():
+            self._process_thread.join()
+        self._count_ingress_drops()
+        self._warnings.flush()
 
     def _run(self):
         """
         Run the driver and receive and process incoming packets.
         """
-        if not self._callbacks:
+        if not self._subscriptions:
             logger.warning("No callbacks added. Will not receive any packets.")
             self._is_running = False
             return
 
         while self._is_running:
             try:
-                data, _ = self.sock.recvfrom(self.BUFFER_SIZE)
+                packet, receive_time = self.receive()
             except socket.timeout:
                 logger.warning("Trying to receive data...")
                 continue
-            data = data[self.HEADER_SIZE :]
+            self.handle_datagram(packet, receive_time)
 
-            its_pdu_header = ItsPduHeader.from_dict(self._specs["cam"].decode("ItsPduHeader", data))
-            protocol_version = its_pdu_header.protocol_version
-            message_type = EtsiMessageType(its_pdu_header.message_id)
-            if protocol_version not in [1, 2]:
-                logger.warning(f"Unsupported protocol version: {protocol_version}")
+    def handle_datagram(self, packet: bytes, receive_time: float):
+        """
+        Record a received datagram and process it, or pass it to the ingress queue.
+
+        This is the step of the driver loop after receiving. Loops receiving from the socket of
+        the driver themselves call it instead of starting the driver loop, see `start_processing`.
+
+        Parameters
+        ----------
+        packet : bytes
+            Raw datagram including the CommonHeader and BtpDataIndication.
+        receive_time : float
+            Unix time the packet was received.
+        """
+        if self._recorder is not None:
+            self._recorder.write(packet, time.monotonic_ns())
+        if self._ingress is None:
+            self.process_packet(packet, receive_time)
+            return
+        dropped = self._ingress.put(packet, receive_time)
+        if dropped and self._metrics is not None:
+            self._ingress_drops.extend(dropped)
+
+    def _process(self):
+        """
+        Process the packets of the ingress queue in the order of their priority.
+        """
+        while self._is_running:
+            item = self._ingress.get(timeout=0.5)
+            if self._ingress_drops:
+                self._count_ingress_drops()
+            if item is not None:
+                self.process_packet(*item)
+
+    def _count_ingress_drops(self):
+        drops = self._ingress_drops
+        while drops:
+            self._metrics.ingress_drop(drops.popleft())
+
+    def receive(self) -> Tuple[bytes, float]:
+        """
+        Receive a datagram and its receive time in Unix time from the socket of the driver.
+        """
+        if self._ancillary_size == 0:
+            packet, _ = self.sock.recvfrom(self.BUFFER_SIZE)
+            return packet, time.time()
+
+        packet, ancillary_data, _, _ = self.sock.recvmsg(self.BUFFER_SIZE, self._ancillary_size)
+        receive_time = None
+        for level, cmsg_type, cmsg_data in ancillary_data:
+            if level != socket.SOL_SOCKET:
                 continue
+            if cmsg_type == SCM_TIMESTAMPNS:
+                seconds, nanoseconds = TIMESPEC_STRUCT.unpack_from(cmsg_data)
+                receive_time = seconds + nanoseconds * 1e-9
+            elif cmsg_type == SO_RXQ_OVFL:
+                # Total number of datagrams dropped by the kernel since the socket was created.
+                self._metrics.kernel_drops = RXQ_OVFL_STRUCT.unpack_from(cmsg_data)[0]
+        if receive_time is None:
+            receive_time = time.time()
+        return packet, receive_time
+
+    def process_packet(self, packet: bytes, receive_time: Optional[float] = None):
+        """
+        Decode a raw packet from the Cohda device and pass it to the matching callback.
+
+        This is the processing step of the driver loop. It can also be called directly to inject
+        packets without a socket, e.g. when replaying a recording.
+
+        Parameters
+        ----------
+        packet : bytes
+            Raw datagram including the CommonHeader and BtpDataIndication.
+        receive_time : Optional[float]
+            Unix time the packet was received. Defaults to the current time.
+        """
+        if receive_time is None:
+            receive_time = time.time()
+        tracer = self._tracer
+        trace = None if tracer is None else tracer.start_packet(INDICATION, receive_time)
+        if trace is None:
+            self._process_packet(packet, receive_time, None)
+            return
+        trace.add("receive", time.time() - receive_time)
+        try:
+            self._process_packet(packet, receive_time, trace)
+        finally:
+            tracer.finish(trace)
+
+    def _process_packet(self, packet: bytes, receive_time: float, trace: Optional[PacketTrace]):
+        data = packet[self.HEADER_SIZE :]
+        metrics = self._metrics
+        if metrics is not None:
+            metrics.packet_received()
+
+        if len(data) < ITS_PDU_HEADER_SIZE:
+            if metrics is not None:
+                metrics.malformed_packet()
+            self._warnings.warning(
+                ("malformed",), "Dropping datagram of %d bytes without ItsPduHeader", len(packet)
+            )
+            return
+        its_pdu_header = self._decoder.decode_header(data)
+        if trace is not None:
+            trace.mark("header")
+        if self._archive is not None or self._publisher is not None:
+            receive_time_ns = int(receive_time * 1e9)
+            if self._archive is not None:
+                self._archive.write(data, its_pdu_header, receive_time_ns)
+            if self._publisher is not None:
+                self._publisher.write(data, its_pdu_header, receive_time_ns)
+        protocol_version = its_pdu_header.protocol_version
+        if protocol_version not in self._decoder.PROTOCOL_VERSIONS:
+            if metrics is not None:
+                metrics.unsupported_version()
+            self._warnings.warning(
+                ("version", protocol_version), "Unsupported protocol version: %s", protocol_version
+            )
+            return
+
+        try:
+            message_type = EtsiMessageType(its_pdu_header.message_id)
+        except ValueError:
+            message_type = None
+        if message_type is None or not self._decoder.is_decodable(message_type, protocol_version):
+            if metrics is not None:
+                metrics.unknown_type()
+            message_id = its_pdu_header.message_id
+            self._warnings.warning(
+                ("type", message_id, protocol_version),
+                "Unsupported message type: %s v%s",
+                message_id if message_type is None else message_type.name,
+                protocol_version,
+            )
+            return
+        if trace is not None:
+            trace.message_type = message_type
+        generation_delta_time = peek_generation_delta_time(message_type, data)
+        if metrics is not None:
+            metrics.message_received(message_type)
+            if generation_delta_time is not None:
+                metrics.generation_delta_time(
+                    message_type, its_pdu_header.station_id, generation_delta_time
+                )
+
+        subscribers = self._subscriptions.subscribers(message_type)
+        if not subscribers:
+            return
+
+        generated = None
+        if generation_delta_time is not None:
+            generated = generation_time(generation_delta_time, receive_time)
+            if (
+                self._max_message_age is not None
+                and time.time() - generated > self._max_message_age
+            ):
+                if metrics is not None:
+                    metrics.stale_drop(message_type)
+                return
+
+        subscribers = self._filter_payload(subscribers, message_type, data)
+        if not subscribers:
+            if metrics is not None:
+                metrics.filter_drop(message_type)
+            return
 
-            if message_type == EtsiMessageType.CAM and protocol_version == 2:
-                try:
-                    cam_msg = CAM.from_dict(self._specs["cam"].decode("CAM", data))
-                    self._callbacks[EtsiMessageType.CAM](cam_msg)
-                except Exception as e:
-                    logger.warning(f"Error decoding CAM message: {e}")
-                    continue
-            elif message_type == EtsiMessageType.SPATEM and protocol_version == 2:
-                spatem_msg = SPATEM.from_dict(self._specs["spatem"].decode("SPATEM", data))
-                self._callbacks[EtsiMessageType.SPATEM](spatem_msg)
-            elif message_type == EtsiMessageType.CPM and protocol_version == 2:
-                cpm_msg = CPM.from_dict(self._specs["cpm_tr103562"].decode("CPM", data))
-                self._callbacks[EtsiMessageType.CPM](cpm_msg)
-            elif message_type == EtsiMessageType.MAPEM and protocol_version == 2:
-                mapem_msg = MAPEM.from_dict(self._specs["mapem"].decode("MAPEM", data))
-                self._callbacks[EtsiMessageType.MAPEM](mapem_msg)
-            else:
-                logger.warning(f"Unsupported message type: {message_type}")
+        if trace is not None:
+            trace.mark("dispatch")
+        start = time.perf_counter()
+        try:
+            etsi_msg = self._decoder.decode_message(message_type, data, trace, protocol_version)
+        except Exception as e:
+            if metrics is not None:
+                metrics.decode_error(message_type)
+            self._warnings.warning(
+                ("decode", message_type), "Error decoding %s message: %s", message_type.name, e
+            )
+            return
+        if metrics is not None:
+            decoded = time.perf_counter()
+            metrics.message_decoded(message_type, decoded - start)
+            start = decoded
+            now = time.time()
+            metrics.receive_to_callback(message_type, now - receive_time)
+            if generated is not None:
+                metrics.message_age(message_type, now - generated)
+            if trace is not None:
+                trace.mark("metrics")
+
+        for subscription in subscribers:
+            try:
+                if subscription.message_filter is None or subscription.message_filter(etsi_msg):
+                    subscription.callback(etsi_msg)
+            except Exception as e:
+                if metrics is not None:
+                    metrics.callback_error(message_type)
+                self._warnings.warning(
+                    ("callback", message_type), "Error in %s callback: %s", message_type.name, e
+                )
+            if trace is not None:
+                trace.mark("callback")
+        if metrics is not None:
+            metrics.callback_done(message_type, time.perf_counter() - start)
+
+    def _filter_payload(
+        self, subscribers: Tuple[Subscription, ...], message_type: EtsiMessageType, data: bytes
+    ) -> Tuple[Subscription, ...]:
+        """
+        Get the subscribers whose payload filter accepts the UPER encoded message.
+        """
+        if all(subscription.payload_filter is None for subscription in subscribers):
+            return subscribers
+        accepted = []
+        for subscription in subscribers:
+            try:
+                if subscription.payload_filter is None or subscription.payload_filter(data):
+                    accepted.append(subscription)
+            except Exception as e:
+                if self._metrics is not None:
+                    self._metrics.callback_error(message_type)
+                self._warnings.warning(
+                    ("payload_filter", message_type),
+                    "Error in %s payload filter: %s",
+                    message_type.name,
+                    e,
+                )
+        return tuple(accepted)
 
     def send_request(self, message_type: EtsiMessageType, message_data: dict):
         """
@@ -226,10 +673,22 @@ class CohdaDriver:
             The data of the message to send, in a dictionary format.
         """
 
+        tracer = self._tracer
+        trace = None if tracer is None else tracer.start_packet(REQUEST)
         # Serialize the message data using the ASN.1 specification
         try:
             serialized_data = self._specs[str(message_type)].encode("CPM", message_data["cpm"])
+            if trace is not None:
+                trace.message_type = EtsiMessageType.CPM
+                trace.mark("encode")
             btp_packet = btp_request.create_btp_request_packet(EtsiMessageType.CPM, serialized_data)
+            if trace is not None:
+                trace.mark("btp_header")
             self.sock.sendto(btp_packet, (self._cohda_ip, self._cohda_req_port))
+            if trace is not None:
+                trace.mark("send")
         except Exception as e:
             logger.error(f"Failed to serialize message data for {message_type}: {e}")
+        finally:
+            if trace is not None:
+                tracer.finish(trace)
@@ -0,0 +1,483 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# This module implements a local stand-in for a Cohda device for load
+# and latency tests of the driver. It sends BTP Data Indications with
+# synthetic ETSI messages to the indication port and accepts BTP Data
+# Requests on the request port:
+#
+#   python -m cohda_driver.emulator --rate CAM=2000 --rate CPM=200 \
+#       --duration 10 --with-driver
+# ---------------------------------------------------------------------
+import argparse
+import json
+import random
+import socket
+import struct
+import sys
+import threading
+import time
+
+from collections import OrderedDict, defaultdict, deque
+from pathlib import Path
+from typing import Deque, Dict, List, NamedTuple, Optional, Tuple
+
+from cohda_driver.btp_indication import create_btp_indication_packet
+from cohda_driver.btp_request import BTP_REQUEST_SIZE, BtpDataRequest, btp_ports
+from cohda_driver.common_header import COMMON_HEADER_SIZE
+from cohda_driver.corpus import MessageCorpus
+from cohda_driver.decoder import EtsiMessageClasses
+from cohda_driver.driver import CohdaDriver
+from cohda_driver.etsi_message_type import EtsiMessageType
+from cohda_driver.etsi_messages.its_pdu_header import ITS_PDU_HEADER_SIZE
+from cohda_driver.its_time import (
+    GENERATION_DELTA_TIME_MESSAGE_TYPES,
+    GENERATION_DELTA_TIME_MODULO,
+    timestamp_its,
+)
+from cohda_driver.logger import logger, setup_logger
+from cohda_driver.metrics import Histogram
+from cohda_driver.subscription import Subscription
+
+# Corpus arguments of the emulated messages. The datagrams stay well below the receive buffer of
+# the driver.
+DEFAULT_MESSAGE_OPTIONS = {
+    EtsiMessageType.CAM: {},
+    EtsiMessageType.CPM: {"objects": 8},
+    EtsiMessageType.MAPEM: {"lanes": 4, "nodes": 4},
+    EtsiMessageType.SPATEM: {"intersections": 1},
+}
+# Different messages generated per type, sent in turns.
+DEFAULT_CORPUS_SIZE = 64
+# Length of the precomputed sequence of message types that realizes the traffic mix.
+MIX_LENGTH = 1000
+# The stationId follows protocolVersion and messageId in the ItsPduHeader.
+STATION_ID_OFFSET = 2
+STATION_ID_STRUCT = struct.Struct(">I")
+STATION_ID_GENERATION_DELTA_TIME_STRUCT = struct.Struct(">IH")
+# The sender skips ahead instead of bursting if it falls behind the schedule by this many seconds.
+MAX_SCHEDULE_LAG = 1.0
+# Seconds to wait for packets in flight after the last one was sent.
+DRAIN_TIMEOUT = 1.0
+# BTP Data Requests kept for inspection.
+MAX_KEPT_REQUESTS = 1000
+# Seconds after which a sent packet that was not received is given up as lost, which keeps the
+# memory of long runs bounded.
+PENDING_TIMEOUT = 5.0
+
+BTP_DESTINATION_PORT_TYPES = {port: message_type for message_type, port in btp_ports.items()}
+
+
+class _PacketTemplate(NamedTuple):
+    message_type: EtsiMessageType
+    # Datagram up to the stationId and the rest after the stamped fields.
+    prefix: bytes
+    suffix: bytes
+    stamps_generation_delta_time: bool
+
+
+class DeliveryTracker:
+    """
+    Matches the messages received by a driver with the packets sent by a CohdaEmulator.
+
+    The emulator stamps every packet with a sequence number in the stationId of the ItsPduHeader,
+    so the tracker must run in the same process as the emulator. Add `record` as callback of
+    every emulated type, e.g. with `CohdaEmulator.attach`.
+    """
+
+    def __init__(self):
+        self._pending: "OrderedDict[int, Tuple[EtsiMessageType, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.sent: Dict[EtsiMessageType, int] = defaultdict(int)
+        self.received: Dict[EtsiMessageType, int] = defaultdict(int)
+        self.latency: Dict[EtsiMessageType, Histogram] = defaultdict(Histogram)
+        self.max_latency: Dict[EtsiMessageType, float] = defaultdict(float)
+        # Messages that were not sent by the emulator or were received twice.
+        self.unexpected = 0
+
+    def sent_packet(self, station_id: int, message_type: EtsiMessageType, send_time: float):
+        with self._lock:
+            self._pending[station_id] = (message_type, send_time)
+            self.sent[message_type] += 1
+            pending = self._pending
+            while pending[next(iter(pending))][1] < send_time - PENDING_TIMEOUT:
+                pending.popitem(last=False)
+
+    def record(self, etsi_msg: EtsiMessageClasses):
+        """
+        Callback recording the receipt of a message.
+        """
+        now = time.perf_counter()
+        with self._lock:
+            entry = self._pending.pop(etsi_msg.header.station_id, None)
+            if entry is None:
+                self.unexpected += 1
+                return
+            message_type, send_time = entry
+            latency = now - send_time
+            self.received[message_type] += 1
+            self.latency[message_type].observe(latency)
+            self.max_latency[message_type] = max(self.max_latency[message_type], latency)
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._pending)
+
+    def snapshot(self) -> Dict:
+        """
+        Sent, received and lost messages and the send to callback latency per message type.
+        """
+        with self._lock:
+            message_types = {}
+            for message_type, sent in self.sent.items():
+                received = self.received[message_type]
+                histogram = self.latency[message_type]
+                message_types[message_type.name] = {
+                    "sent": sent,
+                    "received": received,
+                    "lost": sent - received,
+                    "latency": {
+                        "mean": histogram.sum / histogram.count if histogram.count else 0.0,
+                        "p50": histogram.quantile(0.5),
+                        "p99": histogram.quantile(0.99),
+                        "max": self.max_latency[message_type],
+                    },
+                }
+            return {"message_types": message_types, "unexpected": self.unexpected}
+
+
+class CohdaEmulator:
+    """
+    Local stand-in for a Cohda device.
+
+    Sends a configurable mix of CAMs, CPMs, MAPEMs and SPATEMs at a fixed total rate to the
+    indication port of a driver, and receives the BTP Data Requests the driver sends to the
+    request port. The messages are synthetic, see `cohda_driver.corpus`, and generated before
+    sending starts, so rates of several thousand packets per second are possible.
+
+    Every packet carries a sequence number as stationId, which lets the DeliveryTracker attribute
+    received messages to sent packets. CAMs and CPMs carry the current generationDeltaTime, so
+    `max_message_age` of the driver does not drop them.
+    """
+
+    def __init__(
+        self,
+        rates: Dict[EtsiMessageType, float],
+        host_ip: str = "127.0.0.1",
+        cohda_ind_port: int = 5000,
+        cohda_ip: str = "127.0.0.1",
+        cohda_req_port: int = 5001,
+        message_options: Optional[Dict[EtsiMessageType, Dict]] = None,
+        corpus_size: int = DEFAULT_CORPUS_SIZE,
+        corpus: Optional[MessageCorpus] = None,
+    ):
+        """
+        Initialize the emulator, generate the messages and bind the request port.
+
+        Parameters
+        ----------
+        rates : Dict[EtsiMessageType, float]
+            Packets per second per message type. CAM, CPM, MAPEM and SPATEM are supported.
+        host_ip : str
+            Address the driver receives on, as passed to CohdaDriver.
+        cohda_ind_port : int
+            Indication port the driver receives on.
+        cohda_ip : str
+            Address of the emulated device, the driver sends its requests to.
+        cohda_req_port : int
+            Request port of the emulated device.
+        message_options : Optional[Dict[EtsiMessageType, Dict]]
+            Arguments of the MessageCorpus methods per type, e.g. `{EtsiMessageType.CPM:
+            {"objects": 32}}`. Defaults to DEFAULT_MESSAGE_OPTIONS.
+        corpus_size : int
+            Different messages generated per type.
+        corpus : Optional[MessageCorpus]
+            Generator of the messages. A new corpus with seed 0 is created if None.
+        """
+        rates = {message_type: rate for message_type, rate in rates.items() if rate > 0}
+        if not rates:
+            raise ValueError("At least one message type needs a positive rate.")
+        unsupported = set(rates) - set(DEFAULT_MESSAGE_OPTIONS)
+        if unsupported:
+            raise ValueError(f"Cannot emulate {sorted(t.name for t in unsupported)}.")
+        self.rates = rates
+        self.tracker = DeliveryTracker()
+        self.requests: Deque[Tuple[BtpDataRequest, bytes]] = deque(maxlen=MAX_KEPT_REQUESTS)
+        self.request_counts: Dict[str, int] = defaultdict(int)
+        self.malformed_requests = 0
+        self._destination = (host_ip, cohda_ind_port)
+        self._is_running = False
+        self._send_thread: Optional[threading.Thread] = None
+        self._send_duration = 0.0
+
+        corpus = MessageCorpus() if corpus is None else corpus
+        options = dict(DEFAULT_MESSAGE_OPTIONS, **(message_options or {}))
+        self._templates: Dict[EtsiMessageType, List[_PacketTemplate]] = {}
+        for message_type in rates:
+            logger.info(f"Generating {corpus_size} {message_type.name} messages.")
+            self._templates[message_type] = [
+                self._template(message_type, data)
+                for data in corpus.payloads(message_type, corpus_size, **options[message_type])
+            ]
+        rng = random.Random(corpus.rng.random())
+        self._mix = rng.choices(list(rates), weights=list(rates.values()), k=MIX_LENGTH)
+
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.request_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.request_sock.settimeout(0.5)
+        self.request_sock.bind((cohda_ip, cohda_req_port))
+        self._request_thread = threading.Thread(target=self._receive_requests, daemon=True)
+        self._request_thread.start()
+        logger.info(
+            f"Emulating a Cohda device at {cohda_ip}:{cohda_req_port}, sending to "
+            f"{host_ip}:{cohda_ind_port}."
+        )
+
+    @staticmethod
+    def _template(message_type: EtsiMessageType, data: bytes) -> _PacketTemplate:
+        packet = create_btp_indication_packet(message_type, data)
+        if len(packet) > CohdaDriver.BUFFER_SIZE:
+            logger.warning(
+                f"{message_type.name} packet of {len(packet)} bytes exceeds the receive buffer "
+                f"of the driver ({CohdaDriver.BUFFER_SIZE} bytes)."
+            )
+        stamps_generation_delta_time = message_type in GENERATION_DELTA_TIME_MESSAGE_TYPES
+        stamp_offset = CohdaDriver.HEADER_SIZE + STATION_ID_OFFSET
+        stamp_size = (
+            STATION_ID_GENERATION_DELTA_TIME_STRUCT.size
+            if stamps_generation_delta_time
+            else STATION_ID_STRUCT.size
+        )
+        return _PacketTemplate(
+            message_type,
+            packet[:stamp_offset],
+            packet[stamp_offset + stamp_size :],
+            stamps_generation_delta_time,
+        )
+
+    @property
+    def rate(self) -> float:
+        return sum(self.rates.values())
+
+    def attach(self, driver: CohdaDriver) -> List[Subscription]:
+        """
+        Subscribe the delivery tracker to all emulated message types of a driver.
+        """
+        return [driver.subscribe(message_type, self.tracker.record) for message_type in self.rates]
+
+    def start(self, duration: Optional[float] = None):
+        """
+        Start sending.
+
+        Parameters
+        ----------
+        duration : Optional[float]
+            Seconds after which sending stops. Sends until `stop` if None.
+        """
+        if self._is_running:
+            raise RuntimeError("The emulator is already sending.")
+        logger.info(f"Sending {self.rate:.0f} packets per second.")
+        self._is_running = True
+        self._send_thread = threading.Thread(target=self._send, args=(duration,), daemon=True)
+        self._send_thread.start()
+
+    def wait(self):
+        """
+        Wait until sending stopped.
+        """
+        if self._send_thread is not None:
+            self._send_thread.join()
+
+    def stop(self):
+        """
+        Stop sending.
+        """
+        self._is_running = False
+        self.wait()
+
+    def close(self):
+        """
+        Stop sending and close the sockets.
+        """
+        self.stop()
+        self.request_sock.close()
+        self._request_thread.join()
+        self.sock.close()
+
+    def run(self, duration: float, drain_timeout: float = DRAIN_TIMEOUT) -> Dict:
+        """
+        Send for the given number of seconds and wait for the packets in flight.
+
+        Returns
+        -------
+        Dict
+            Report, see `report`.
+        """
+        self.start(duration)
+        self.wait()
+        deadline = time.monotonic() + drain_timeout
+        while self.tracker.in_flight and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return self.report()
+
+    def report(self) -> Dict:
+        """
+        Get a JSON serializable report of the sent packets, the messages received by an attached
+        driver with their latency from sending to the callback, and the received requests.
+        """
+        tracker = self.tracker.snapshot()
+        sent = sum(self.tracker.sent.values())
+        return {
+            "duration": self._send_duration,
+            "target_rate": self.rate,
+            "send_rate": sent / self._send_duration if self._send_duration else 0.0,
+            "message_types": tracker["message_types"],
+            "unexpected": tracker["unexpected"],
+            "requests": dict(self.request_counts),
+            "malformed_requests": self.malformed_requests,
+        }
+
+    def _send(self, duration: Optional[float]):
+        interval = 1.0 / self.rate
+        templates = {message_type: iter_cycle(t) for message_type, t in self._templates.items()}
+        mix = self._mix
+        tracker = self.tracker
+        sendto = self.sock.sendto
+        destination = self._destination
+        modulo = GENERATION_DELTA_TIME_MODULO
+        sequence = 0
+        start = time.perf_counter()
+        end = float("inf") if duration is None else start + duration
+        next_send = start
+        while self._is_running:
+            now = time.perf_counter()
+            if now >= end:
+                break
+            if now < next_send:
+                time.sleep(min(next_send - now, 0.001))
+                continue
+            if now - next_send > MAX_SCHEDULE_LAG:
+                next_send = now
+            # Send all packets that are due, so rates above the sleep resolution are reached.
+            while next_send <= now:
+                message_type = mix[sequence % MIX_LENGTH]
+                template = next(templates[message_type])
+                sequence += 1
+                station_id = sequence & 0xFFFFFFFF
+                if template.stamps_generation_delta_time:
+                    generation_delta_time = timestamp_its(time.time()) % modulo
+                    stamp = STATION_ID_GENERATION_DELTA_TIME_STRUCT.pack(
+                        station_id, generation_delta_time
+                    )
+                else:
+                    stamp = STATION_ID_STRUCT.pack(station_id)
+                send_time = time.perf_counter()
+                tracker.sent_packet(station_id, message_type, send_time)
+                try:
+                    sendto(template.prefix + stamp + template.suffix, destination)
+                except OSError as e:
+                    logger.warning(f"Error sending packet: {e}")
+                next_send += interval
+        self._send_duration = time.perf_counter() - start
+        self._is_running = False
+        logger.info(f"Sent {sequence} packets in {self._send_duration:.1f} s.")
+
+    def _receive_requests(self):
+        while True:
+            try:
+                packet = self.request_sock.recv(65535)
+            except socket.timeout:
+                continue
+            except OSError:
+                # The socket was closed.
+                return
+            header_size = COMMON_HEADER_SIZE + BTP_REQUEST_SIZE
+            if len(packet) < header_size + ITS_PDU_HEADER_SIZE:
+                self.malformed_requests += 1
+                continue
+            request = BtpDataRequest.from_packed(packet[COMMON_HEADER_SIZE:header_size])
+            message_type = BTP_DESTINATION_PORT_TYPES.get(request.btp_destination_port)
+            name = message_type.name if message_type is not None else "UNKNOWN"
+            self.request_counts[name] += 1
+            self.requests.append((request, packet[header_size:]))
+
+
+def iter_cycle(items: List[_PacketTemplate]):
+    while True:
+        yield from items
+
+
+def parse_rate(text: str) -> Tuple[EtsiMessageType, float]:
+    name, _, rate = text.partition("=")
+    try:
+        return EtsiMessageType[name.upper()], float(rate)
+    except (KeyError, ValueError):
+        raise argparse.ArgumentTypeError(f"Expected TYPE=RATE, e.g. CAM=1000, got '{text}'.")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Emulate a Cohda device.")
+    parser.add_argument(
+        "--rate",
+        type=parse_rate,
+        action="append",
+        help="Packets per second of a message type, e.g. CAM=1000. Can be repeated.",
+    )
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to send.")
+    parser.add_argument("--host-ip", default="127.0.0.1", help="Address of the driver.")
+    parser.add_argument("--ind-port", type=int, default=5000, help="Indication port.")
+    parser.add_argument("--cohda-ip", default="127.0.0.1", help="Address of the emulator.")
+    parser.add_argument("--req-port", type=int, default=5001, help="Request port.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the message corpus.")
+    parser.add_argument(
+        "--with-driver",
+        action="store_true",
+        help="Run a CohdaDriver in this process and report its deliveries, drops and latency.",
+    )
+    parser.add_argument("--output", type=Path, help="JSON report file, stdout if not given.")
+    args = parser.parse_args(argv)
+    # The report may be written to stdout, so the log goes to stderr.
+    setup_logger(stream=sys.stderr)
+
+    rates = dict(args.rate or [(EtsiMessageType.CAM, 100.0)])
+    corpus = MessageCorpus(seed=args.seed)
+    emulator = CohdaEmulator(
+        rates, args.host_ip, args.ind_port, args.cohda_ip, args.req_port, corpus=corpus
+    )
+    driver = None
+    if args.with_driver:
+        driver = CohdaDriver(
+            args.host_ip,
+            args.cohda_ip,
+            args.ind_port,
+            args.req_port,
+            enable_metrics=True,
+            decoder=corpus.decoder,
+        )
+        emulator.attach(driver)
+        driver.start_loop()
+    report = None
+    try:
+        report = emulator.run(args.duration)
+    finally:
+        emulator.close()
+        if driver is not None:
+            if report is not None:
+                report["driver"] = driver.stats()
+            driver.stop_loop()
+            driver.sock.close()
+    text = json.dumps(report, indent=2)
+    if args.output is None:
+        print(text)
+    else:
+        args.output.write_text(text + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,40 @@
-from .cam import *
-from .spatem import *
-from .cpm import *
-from .mapem import *
-from .its_pdu_header import *
+# The message modules are imported on first use of their names (PEP 562), so importing the
+# package or only its_pdu_header stays cheap.
+import importlib
+
+# Modules in the order of precedence of the names they export, the last one wins.
+_MODULES = ["cam", "spatem", "cpm", "mapem", "its_pdu_header"]
+# Names looked up without importing all modules.
+_NAME_MODULES = {
+    "CAM": "cam",
+    "SPATEM": "spatem",
+    "CPM": "cpm",
+    "MAPEM": "mapem",
+    "ItsPduHeader": "its_pdu_header",
+}
+
+
+def _import_all() -> dict:
+    names = {}
+    for module_name in _MODULES:
+        module = importlib.import_module(f"{__name__}.{module_name}")
+        names.update((name, value) for name, value in vars(module).items() if name[0] != "_")
+    globals().update(names)
+    return names
+
+
+def __getattr__(name: str):
+    if name in _NAME_MODULES:
+        return getattr(importlib.import_module(f"{__name__}.{_NAME_MODULES[name]}"), name)
+    if name in _MODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    names = _import_all()
+    if name == "__all__":
+        return list(names) + _MODULES
+    if name in names:
+        return names[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_import_all()))
@@ -15,6 +15,9 @@ from typing import Dict, List
 
 from .its_pdu_header import ItsPduHeader
 
+# StationType of road side units, which send the RSU high frequency container.
+ROAD_SIDE_UNIT = 15
+
 
 def clamp(value: float, min_value: float, max_value: float) -> float:
     return min(max_value, max(min_value, value))
@@ -336,6 +339,9 @@ class HighFrequencyContainer:
 
     @classmethod
     def from_dict(cls, data: Dict) -> "HighFrequencyContainer":
+        # asn1tools decodes the CHOICE as a (name, value) tuple.
+        if isinstance(data, tuple):
+            data = {data[0]: data[1]}
         return cls(
             basic_vehicle_container_high_frequency=BasicVehicleContainerHighFrequency.from_dict(
                 data.get("basicVehicleContainerHighFrequency", {})
@@ -177,8 +177,9 @@ class CPM:
             referencePosition=decode_reference_position(data["cpm"]["cpmParameters"]["managementContainer"]["referencePosition"])
         )
 
+        # The container is absent in CPMs without perceived objects.
         perceived_objects = [
-            decode_cpm_perceived_object(obj) for obj in data["cpm"]["cpmParameters"]["perceivedObjectContainer"]
+            decode_cpm_perceived_object(obj) for obj in data["cpm"]["cpmParameters"].get("perceivedObjectContainer", [])
         ]
 
         cpm_parameters = CpmParameters(
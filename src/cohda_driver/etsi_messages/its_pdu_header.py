@@ -10,9 +10,16 @@
 #
 #
 # ---------------------------------------------------------------------
+import struct
+
 from dataclasses import dataclass
 from typing import Dict
 
+# In UPER, all fields of the ItsPduHeader are byte-aligned: protocolVersion (8 bit),
+# messageId (8 bit) and stationId (32 bit).
+ITS_PDU_HEADER_STRUCT = struct.Struct(">BBI")
+ITS_PDU_HEADER_SIZE = ITS_PDU_HEADER_STRUCT.size
+
 
 @dataclass
 class ItsPduHeader:
@@ -28,6 +35,15 @@ class ItsPduHeader:
             station_id=data.get("stationID") or data.get("stationId") or 0,
         )
 
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "ItsPduHeader":
+        protocol_version, message_id, station_id = ITS_PDU_HEADER_STRUCT.unpack_from(data)
+        return cls(
+            protocol_version=protocol_version,
+            message_id=message_id,
+            station_id=station_id,
+        )
+
     def to_dict(self) -> Dict:
         return {
             "protocolVersion": self.protocol_version,
@@ -0,0 +1,295 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# This module implements a streaming export of decoded CAMs and CPM
+# perceived objects to columnar Arrow IPC or Parquet files.
+#
+# Requires the optional pyarrow dependency: pip install -e .[export]
+# ---------------------------------------------------------------------
+import time
+
+from array import array
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple, Union
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+from cohda_driver.etsi_messages import CAM
+from cohda_driver.etsi_messages import CPM
+from cohda_driver.logger import logger
+
+# Column name and Arrow type name. All values are kept in the units of the
+# ETSI message classes.
+CAM_COLUMNS = [
+    ("timestamp_ns", "int64"),
+    ("station_id", "uint32"),
+    ("generation_delta_time", "int32"),
+    ("station_type", "int32"),
+    ("latitude", "int32"),
+    ("longitude", "int32"),
+    ("altitude", "int32"),
+    ("heading", "int32"),
+    ("speed", "int32"),
+    ("drive_direction", "int32"),
+    ("longitudinal_acceleration", "int32"),
+    ("curvature", "int32"),
+    ("yaw_rate", "int32"),
+    ("vehicle_length", "int32"),
+    ("vehicle_width", "int32"),
+]
+
+CPM_OBJECT_COLUMNS = [
+    ("timestamp_ns", "int64"),
+    ("station_id", "uint32"),
+    ("generation_delta_time", "int32"),
+    ("reference_latitude", "float64"),
+    ("reference_longitude", "float64"),
+    ("object_id", "int32"),
+    ("time_of_measurement", "float64"),
+    ("x_distance", "float64"),
+    ("y_distance", "float64"),
+    ("x_speed", "float64"),
+    ("y_speed", "float64"),
+    ("dimension_planar_1", "float64"),
+    ("dimension_planar_2", "float64"),
+    ("classification_type", "int32"),
+    ("classification_confidence", "int32"),
+]
+
+# Array typecodes of 4 and 8 byte integers differ between platforms.
+_TYPECODES = {
+    "int32": next(code for code in "ilq" if array(code).itemsize == 4),
+    "uint32": next(code for code in "ILQ" if array(code).itemsize == 4),
+    "int64": next(code for code in "lq" if array(code).itemsize == 8),
+    "float64": "d",
+}
+
+EXPORT_FORMATS = ["parquet", "arrow"]
+
+
+class _ColumnarExporter:
+    """
+    Base class buffering rows in typed column arrays and writing them as record batches.
+    """
+
+    COLUMNS: List[Tuple[str, str]] = []
+    FILE_PREFIX = ""
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        export_format: str = "parquet",
+        batch_size: int = 65536,
+        max_file_size: int = 512 * 1024 * 1024,
+    ):
+        """
+        Initialize the exporter.
+
+        Parameters
+        ----------
+        directory : Union[str, pathlib.Path]
+            Output directory. It is created if it does not exist.
+        export_format : str
+            "parquet" or "arrow" (Arrow IPC file format).
+        batch_size : int
+            Number of rows buffered before a record batch is written. This bounds the memory
+            usage of the exporter.
+        max_file_size : int
+            Size in bytes after which a new file is started.
+        """
+        if pa is None:
+            raise ImportError(
+                "The export requires pyarrow. Install it with 'pip install .[export]'."
+            )
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported export format '{export_format}'.")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.export_format = export_format
+        self.batch_size = batch_size
+        self.max_file_size = max_file_size
+        self.row_count = 0
+
+        self._schema = pa.schema(
+            [(name, getattr(pa, type_name)()) for name, type_name in self.COLUMNS]
+        )
+        self._columns = [array(_TYPECODES[type_name]) for _, type_name in self.COLUMNS]
+        self._file_number = 0
+        self._sink = None
+        self._writer = None
+
+    def _buffered_rows(self) -> int:
+        return len(self._columns[0])
+
+    def _append_rows(self, rows: List[Tuple]):
+        """
+        Append complete rows to the columns. If a value does not fit its column, none of the rows
+        is appended, so the columns keep the same length.
+        """
+        row_count = self._buffered_rows()
+        try:
+            for column, values in zip(self._columns, zip(*rows)):
+                column.extend(values)
+        except Exception:
+            for column in self._columns:
+                del column[row_count:]
+            raise
+        if self._buffered_rows() >= self.batch_size:
+            self.flush()
+
+    def _open_file(self):
+        suffix = "parquet" if self.export_format == "parquet" else "arrow"
+        path = self.directory / f"{self.FILE_PREFIX}-{self._file_number:05d}.{suffix}"
+        logger.debug(f"Starting export file {path}.")
+        self._file_number += 1
+        self._sink = pa.OSFile(str(path), "wb")
+        if self.export_format == "parquet":
+            self._writer = pq.ParquetWriter(self._sink, self._schema)
+        else:
+            self._writer = pa.ipc.new_file(self._sink, self._schema)
+
+    def _close_file(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._sink.close()
+            self._writer = None
+            self._sink = None
+
+    def flush(self):
+        """
+        Write the buffered rows as a record batch.
+        """
+        row_count = self._buffered_rows()
+        if row_count == 0:
+            return
+        arrays = [
+            pa.Array.from_buffers(field.type, row_count, [None, pa.py_buffer(column)])
+            for field, column in zip(self._schema, self._columns)
+        ]
+        if self._writer is None:
+            self._open_file()
+        self._writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=self._schema))
+        self.row_count += row_count
+        # The written batch may still reference the buffers, so start with new arrays.
+        self._columns = [array(column.typecode) for column in self._columns]
+        if self._sink.tell() >= self.max_file_size:
+            self._close_file()
+
+    def close(self):
+        self.flush()
+        self._close_file()
+        logger.info(f"Exported {self.row_count} rows to {self.directory}.")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc_info):
+        self.close()
+
+
+class CamExporter(_ColumnarExporter):
+    """
+    Export CAMs with one row per message.
+    """
+
+    COLUMNS = CAM_COLUMNS
+    FILE_PREFIX = "cam"
+
+    def add(self, cam: CAM, timestamp_ns: Optional[int] = None):
+        """
+        Add a CAM to the export.
+
+        Parameters
+        ----------
+        cam : CAM
+            Decoded CAM.
+        timestamp_ns : Optional[int]
+            Receive timestamp in nanoseconds since the epoch. Defaults to `time.time_ns()`.
+        """
+        basic_container = cam.cam.cam_parameters.basic_container
+        reference_position = basic_container.reference_position
+        high_frequency = (
+            cam.cam.cam_parameters.high_frequency_container.basic_vehicle_container_high_frequency
+        )
+        row = (
+            time.time_ns() if timestamp_ns is None else timestamp_ns,
+            cam.header.station_id,
+            cam.cam.generation_delta_time,
+            basic_container.station_type,
+            reference_position.latitude,
+            reference_position.longitude,
+            reference_position.altitude.altitude_value,
+            high_frequency.heading.heading_value,
+            high_frequency.speed.speed_value,
+            high_frequency.drive_direction,
+            high_frequency.longitudinal_acceleration.longitudinal_acceleration_value,
+            high_frequency.curvature.curvature_value,
+            high_frequency.yaw_rate.yaw_rate_value,
+            high_frequency.vehicle_length.vehicle_length_value,
+            high_frequency.vehicle_width,
+        )
+        self._append_rows([row])
+
+    def add_all(self, cams: Iterable[Tuple[int, CAM]]):
+        for timestamp_ns, cam in cams:
+            self.add(cam, timestamp_ns)
+
+
+class CpmObjectExporter(_ColumnarExporter):
+    """
+    Export CPMs with one row per perceived object.
+    """
+
+    COLUMNS = CPM_OBJECT_COLUMNS
+    FILE_PREFIX = "cpm_objects"
+
+    def add(self, cpm: CPM, timestamp_ns: Optional[int] = None):
+        """
+        Add the perceived objects of a CPM to the export.
+
+        Parameters
+        ----------
+        cpm : CPM
+            Decoded CPM.
+        timestamp_ns : Optional[int]
+            Receive timestamp in nanoseconds since the epoch. Defaults to `time.time_ns()`.
+        """
+        if timestamp_ns is None:
+            timestamp_ns = time.time_ns()
+        reference_position = cpm.cpmParameters.managementContainer.referencePosition
+        station_id = cpm.header.station_id
+        rows = [
+            (
+                timestamp_ns,
+                station_id,
+                cpm.generationDeltaTime,
+                reference_position.latitude,
+                reference_position.longitude,
+                perceived_object.objectId,
+                perceived_object.time_of_measurement,
+                perceived_object.xDistance.value,
+                perceived_object.yDistance.value,
+                perceived_object.xSpeed.value,
+                perceived_object.ySpeed.value,
+                perceived_object.dimensionPlanar1.value,
+                perceived_object.dimensionPlanar2.value,
+                int(perceived_object.classification.classificationType or 0),
+                perceived_object.classification.confidence,
+            )
+            for perceived_object in cpm.cpmParameters.cpmPerceivedObjectContainer
+        ]
+        self._append_rows(rows)
+
+    def add_all(self, cpms: Iterable[Tuple[int, CPM]]):
+        for timestamp_ns, cpm in cpms:
+            self.add(cpm, timestamp_ns)
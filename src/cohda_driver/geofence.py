@@ -0,0 +1,149 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# This module implements a geofence that filters UPER encoded CAMs by
+# their reference position before they are decoded.
+# ---------------------------------------------------------------------
+import math
+
+from typing import Collection, Optional
+
+from cohda_driver.partial_decoder import peek_cam_position
+
+# Mean Earth radius in meters.
+EARTH_RADIUS = 6371000.0
+# The CAM position unit is 0.1 microdegrees.
+POSITION_UNITS_PER_DEGREE = 10_000_000
+
+
+class Geofence:
+    """
+    Circular or rectangular region of interest for CAMs.
+
+    Distances are computed with an equirectangular approximation around the center, which is
+    accurate to well below a meter for regions of a few kilometers.
+    """
+
+    def __init__(
+        self,
+        min_latitude: float,
+        min_longitude: float,
+        max_latitude: float,
+        max_longitude: float,
+        radius: Optional[float] = None,
+        station_types: Optional[Collection[int]] = None,
+    ):
+        """
+        Initialize the geofence. Use `circle` or `box` to create one.
+
+        Parameters
+        ----------
+        min_latitude, min_longitude, max_latitude, max_longitude : float
+            Bounding box in degrees.
+        radius : Optional[float]
+            Radius in meters around the center of the bounding box. Only the bounding box is
+            checked if None.
+        station_types : Optional[Collection[int]]
+            Accepted station types. All station types are accepted if None.
+        """
+        self._min_latitude = round(min_latitude * POSITION_UNITS_PER_DEGREE)
+        self._min_longitude = round(min_longitude * POSITION_UNITS_PER_DEGREE)
+        self._max_latitude = round(max_latitude * POSITION_UNITS_PER_DEGREE)
+        self._max_longitude = round(max_longitude * POSITION_UNITS_PER_DEGREE)
+        self._center_latitude = (self._min_latitude + self._max_latitude) // 2
+        self._center_longitude = (self._min_longitude + self._max_longitude) // 2
+        meters_per_unit = math.radians(1 / POSITION_UNITS_PER_DEGREE) * EARTH_RADIUS
+        self._meters_per_latitude_unit = meters_per_unit
+        self._meters_per_longitude_unit = meters_per_unit * math.cos(
+            math.radians(self._center_latitude / POSITION_UNITS_PER_DEGREE)
+        )
+        self._squared_radius = None if radius is None else radius * radius
+        self._station_types = None if station_types is None else frozenset(station_types)
+
+    @classmethod
+    def circle(
+        cls,
+        latitude: float,
+        longitude: float,
+        radius: float,
+        station_types: Optional[Collection[int]] = None,
+    ) -> "Geofence":
+        """
+        Create a circular geofence.
+
+        Parameters
+        ----------
+        latitude, longitude : float
+            Center in degrees.
+        radius : float
+            Radius in meters.
+        station_types : Optional[Collection[int]]
+            Accepted station types. All station types are accepted if None.
+        """
+        latitude_delta = math.degrees(radius / EARTH_RADIUS)
+        longitude_delta = latitude_delta / max(math.cos(math.radians(latitude)), 1e-9)
+        return cls(
+            latitude - latitude_delta,
+            longitude - longitude_delta,
+            latitude + latitude_delta,
+            longitude + longitude_delta,
+            radius,
+            station_types,
+        )
+
+    @classmethod
+    def box(
+        cls,
+        min_latitude: float,
+        min_longitude: float,
+        max_latitude: float,
+        max_longitude: float,
+        station_types: Optional[Collection[int]] = None,
+    ) -> "Geofence":
+        """
+        Create a rectangular geofence from its corners in degrees.
+        """
+        return cls(min_latitude, min_longitude, max_latitude, max_longitude, None, station_types)
+
+    def contains(self, latitude: int, longitude: int) -> bool:
+        """
+        Check a position given in 0.1 microdegrees, as in CAMs.
+        """
+        if not (
+            self._min_latitude <= latitude <= self._max_latitude
+            and self._min_longitude <= longitude <= self._max_longitude
+        ):
+            return False
+        if self._squared_radius is None:
+            return True
+        north = (latitude - self._center_latitude) * self._meters_per_latitude_unit
+        east = (longitude - self._center_longitude) * self._meters_per_longitude_unit
+        return north * north + east * east <= self._squared_radius
+
+    def accepts_cam(self, data: bytes) -> bool:
+        """
+        Check a UPER encoded CAM without decoding it. Can be used as payload filter of a
+        subscription.
+
+        Parameters
+        ----------
+        data : bytes
+            UPER encoded CAM, starting with the ItsPduHeader.
+
+        Returns
+        -------
+        bool
+            True if the station type is accepted and the reference position is inside the
+            geofence. CAMs without an available position are rejected.
+        """
+        position = peek_cam_position(data)
+        if position is None:
+            return False
+        if self._station_types is not None and position.station_type not in self._station_types:
+            return False
+        return self.contains(position.latitude, position.longitude)
@@ -0,0 +1,266 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# This module implements a bounded, priority-aware ingress queue between
+# the socket and the decoding stage of the driver.
+#
+# Packets are classified without decoding by the messageID and stationID
+# of the ItsPduHeader and the GeoNetworking traffic class of the
+# BtpDataIndication. Under overload, packets are dropped according to
+# per message type policies instead of in arrival order.
+# ---------------------------------------------------------------------
+import struct
+import threading
+
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Deque, Dict, List, Optional, Tuple
+
+from cohda_driver.btp_indication import BTP_DATA_INDICATION_SIZE
+from cohda_driver.common_header import COMMON_HEADER_SIZE
+from cohda_driver.etsi_message_type import EtsiMessageType
+
+# Offset of gn_traffic_class in the datagram.
+TRAFFIC_CLASS_OFFSET = COMMON_HEADER_SIZE + 2
+# The lower six bits of the traffic class are the traffic class ID. 0 has the highest priority.
+TRAFFIC_CLASS_ID_MASK = 0x3F
+
+ITS_PDU_HEADER_OFFSET = COMMON_HEADER_SIZE + BTP_DATA_INDICATION_SIZE
+# messageId and stationId of the ItsPduHeader, see its_pdu_header.py.
+MESSAGE_ID_STATION_ID_STRUCT = struct.Struct(">BI")
+
+
+class DropPolicy(Enum):
+    # Never drop. Packets are queued even beyond the capacity.
+    NEVER = 0
+    # Keep only the newest packets of every station, and drop the oldest packet of the type
+    # under overload.
+    OLDEST_PER_STATION = 1
+    # Drop the oldest packet of the type under overload.
+    OLDEST = 2
+    # Drop incoming packets of the type while the queue is full.
+    NEWEST = 3
+
+
+@dataclass
+class IngressPolicy:
+    # Lower values are dequeued first.
+    priority: int
+    drop_policy: DropPolicy
+    # Packets queued per station with OLDEST_PER_STATION.
+    station_depth: int = 1
+
+
+DEFAULT_POLICIES = {
+    EtsiMessageType.DENM: IngressPolicy(0, DropPolicy.NEVER),
+    EtsiMessageType.SPATEM: IngressPolicy(0, DropPolicy.NEVER),
+    EtsiMessageType.MAPEM: IngressPolicy(1, DropPolicy.OLDEST),
+    EtsiMessageType.CPM: IngressPolicy(2, DropPolicy.OLDEST_PER_STATION),
+    EtsiMessageType.CAM: IngressPolicy(3, DropPolicy.OLDEST_PER_STATION),
+}
+DEFAULT_POLICY = IngressPolicy(4, DropPolicy.NEWEST)
+
+
+class _Entry:
+    __slots__ = ["packet", "receive_time", "message_id", "policy", "station_key", "queued"]
+
+    def __init__(
+        self,
+        packet: bytes,
+        receive_time: float,
+        message_id: int,
+        policy: IngressPolicy,
+        station_key: Optional[Tuple[int, int]],
+    ):
+        self.packet = packet
+        self.receive_time = receive_time
+        self.message_id = message_id
+        self.policy = policy
+        self.station_key = station_key
+        # Entries dropped from the middle of a level are only marked and skipped later, or removed
+        # when the queue is compacted.
+        self.queued = True
+
+
+class IngressQueue:
+    """
+    Bounded queue of raw datagrams, dequeued by priority.
+
+    Packets are ordered by the priority of their message type, then by the traffic class ID of
+    the BtpDataIndication, then by arrival. When the queue is full, the oldest droppable packet
+    of the lowest priority at or below the priority of the incoming packet is dropped. If there
+    is none, the incoming packet is dropped unless its policy is NEVER.
+
+    `put` and `get` may be called from different threads.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1024,
+        policies: Optional[Dict[EtsiMessageType, IngressPolicy]] = None,
+        default_policy: IngressPolicy = DEFAULT_POLICY,
+    ):
+        """
+        Initialize the queue.
+
+        Parameters
+        ----------
+        capacity : int
+            Maximum number of queued packets. Packets whose policy is NEVER are queued beyond it.
+        policies : Optional[Dict[EtsiMessageType, IngressPolicy]]
+            Policies per message type. Defaults to DEFAULT_POLICIES.
+        default_policy : IngressPolicy
+            Policy of all other message types and of unparsable packets.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        self.capacity = capacity
+        policies = DEFAULT_POLICIES if policies is None else policies
+        # Indexed by messageID, which is a single byte.
+        self._policies = [default_policy] * 256
+        for message_type, policy in policies.items():
+            self._policies[message_type.value] = policy
+        self._default_policy = default_policy
+
+        self._levels: Dict[Tuple[int, int], Deque[_Entry]] = {}
+        self._level_keys: List[Tuple[int, int]] = []
+        self._stations: Dict[Tuple[int, int], Deque[_Entry]] = {}
+        self._length = 0
+        # Dropped entries still in the levels.
+        self._tombstones = 0
+        self._condition = threading.Condition()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _classify(self, packet: bytes) -> Tuple[int, Optional[int], IngressPolicy, int]:
+        if len(packet) < ITS_PDU_HEADER_OFFSET + 1 + MESSAGE_ID_STATION_ID_STRUCT.size:
+            return -1, None, self._default_policy, TRAFFIC_CLASS_ID_MASK
+        message_id, station_id = MESSAGE_ID_STATION_ID_STRUCT.unpack_from(
+            packet, ITS_PDU_HEADER_OFFSET + 1
+        )
+        traffic_class_id = packet[TRAFFIC_CLASS_OFFSET] & TRAFFIC_CLASS_ID_MASK
+        return message_id, station_id, self._policies[message_id], traffic_class_id
+
+    def _level(self, key: Tuple[int, int]) -> Deque[_Entry]:
+        level = self._levels.get(key)
+        if level is None:
+            level = self._levels[key] = deque()
+            self._level_keys = sorted(self._levels)
+        return level
+
+    def _remove(self, entry: _Entry, popped: bool = True):
+        entry.queued = False
+        self._length -= 1
+        if entry.station_key is not None:
+            station = self._stations[entry.station_key]
+            station.remove(entry)
+            if not station:
+                del self._stations[entry.station_key]
+        if not popped:
+            self._tombstones += 1
+            # Levels that are rarely dequeued, e.g. CAMs under a flood of SPATEMs, would otherwise
+            # accumulate the tombstones of every replaced packet.
+            if self._tombstones > self.capacity // 2:
+                self._compact()
+
+    def _compact(self):
+        for key, level in self._levels.items():
+            self._levels[key] = deque(entry for entry in level if entry.queued)
+        self._tombstones = 0
+
+    def _pop_tombstones(self, level: Deque[_Entry]):
+        while level and not level[0].queued:
+            level.popleft()
+            self._tombstones -= 1
+
+    def _evict(self, priority: int) -> Optional[_Entry]:
+        for key in reversed(self._level_keys):
+            if key[0] < priority:
+                break
+            level = self._levels[key]
+            self._pop_tombstones(level)
+            if level and level[0].policy.drop_policy != DropPolicy.NEVER:
+                entry = level.popleft()
+                self._remove(entry)
+                return entry
+        return None
+
+    def put(self, packet: bytes, receive_time: float) -> List[int]:
+        """
+        Enqueue a raw datagram.
+
+        Parameters
+        ----------
+        packet : bytes
+            Raw datagram including the CommonHeader and BtpDataIndication.
+        receive_time : float
+            Unix time the packet was received.
+
+        Returns
+        -------
+        List[int]
+            ItsPduHeader messageIDs of the dropped packets, including the incoming packet if it
+            was dropped. -1 stands for packets too short to be classified.
+        """
+        message_id, station_id, policy, traffic_class_id = self._classify(packet)
+        drop_policy = policy.drop_policy
+        dropped = []
+        with self._condition:
+            station_key = None
+            if drop_policy == DropPolicy.OLDEST_PER_STATION:
+                station_key = (message_id, station_id)
+                station = self._stations.get(station_key)
+                if station is not None and len(station) >= policy.station_depth:
+                    oldest = station[0]
+                    self._remove(oldest, popped=False)
+                    dropped.append(oldest.message_id)
+
+            if drop_policy != DropPolicy.NEVER and self._length >= self.capacity:
+                victim = None
+                if drop_policy != DropPolicy.NEWEST:
+                    victim = self._evict(policy.priority)
+                if victim is None:
+                    dropped.append(message_id)
+                    return dropped
+                dropped.append(victim.message_id)
+
+            entry = _Entry(packet, receive_time, message_id, policy, station_key)
+            self._level((policy.priority, traffic_class_id)).append(entry)
+            if station_key is not None:
+                self._stations.setdefault(station_key, deque()).append(entry)
+            self._length += 1
+            self._condition.notify()
+        return dropped
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Tuple[bytes, float]]:
+        """
+        Dequeue the packet with the highest priority.
+
+        Parameters
+        ----------
+        timeout : Optional[float]
+            Maximum time to wait for a packet in seconds. Waits indefinitely if None.
+
+        Returns
+        -------
+        Optional[Tuple[bytes, float]]
+            Raw datagram and its receive time, or None on timeout.
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._length > 0, timeout):
+                return None
+            for key in self._level_keys:
+                level = self._levels[key]
+                self._pop_tombstones(level)
+                if level:
+                    entry = level.popleft()
+                    self._remove(entry)
+                    return entry.packet, entry.receive_time
+        return None
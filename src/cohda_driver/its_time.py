@@ -0,0 +1,126 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# This module implements conversions between Unix time, ITS timestamps
+# (TimestampIts) and the generationDeltaTime of CAMs and CPMs.
+# ---------------------------------------------------------------------
+import struct
+
+from typing import Optional
+
+from cohda_driver.etsi_message_type import EtsiMessageType
+from cohda_driver.etsi_messages.its_pdu_header import ITS_PDU_HEADER_SIZE
+
+# 2004-01-01T00:00:00.000Z, the start of the ITS epoch, in Unix time.
+ITS_EPOCH = 1072915200
+
+# TimestampIts includes leap seconds, Unix time does not. Leap seconds since the ITS epoch:
+# 2005-12-31, 2008-12-31, 2012-06-30, 2015-06-30 and 2016-12-31.
+ITS_LEAP_SECONDS = 5
+
+# generationDeltaTime = TimestampIts mod 65536
+GENERATION_DELTA_TIME_MODULO = 65536
+
+# Generation times up to this many milliseconds after the reference time are attributed to clock
+# offsets between sender and receiver instead of to the previous wraparound.
+FUTURE_TOLERANCE_MS = 2000
+
+# Message types whose generationDeltaTime directly follows the ItsPduHeader. In UPER, it is then
+# byte-aligned and can be read without decoding the message.
+GENERATION_DELTA_TIME_MESSAGE_TYPES = [EtsiMessageType.CAM, EtsiMessageType.CPM]
+GENERATION_DELTA_TIME_STRUCT = struct.Struct(">H")
+
+
+def timestamp_its(unix_time: float) -> int:
+    """
+    Convert Unix time in seconds to TimestampIts in milliseconds.
+    """
+    return int((unix_time - ITS_EPOCH + ITS_LEAP_SECONDS) * 1000)
+
+
+def timestamp_its_to_unix(timestamp: int) -> float:
+    """
+    Convert TimestampIts in milliseconds to Unix time in seconds.
+    """
+    return timestamp / 1000 + ITS_EPOCH - ITS_LEAP_SECONDS
+
+
+def generation_timestamp_its(
+    generation_delta_time: int,
+    reference_timestamp: int,
+    future_tolerance_ms: int = FUTURE_TOLERANCE_MS,
+) -> int:
+    """
+    Resolve a generationDeltaTime into an absolute TimestampIts.
+
+    The generationDeltaTime wraps around every 65.536 s. The latest matching timestamp not
+    later than the reference time is chosen, except for timestamps slightly in the future, which
+    are attributed to clock offsets.
+
+    Parameters
+    ----------
+    generation_delta_time : int
+        generationDeltaTime of a CAM or CPM.
+    reference_timestamp : int
+        TimestampIts of the reception, usually the local clock.
+    future_tolerance_ms : int
+        Maximum accepted offset of the generation time into the future in milliseconds.
+
+    Returns
+    -------
+    int
+        TimestampIts of the message generation in milliseconds.
+    """
+    age = (reference_timestamp - generation_delta_time) % GENERATION_DELTA_TIME_MODULO
+    if age > GENERATION_DELTA_TIME_MODULO - future_tolerance_ms:
+        age -= GENERATION_DELTA_TIME_MODULO
+    return reference_timestamp - age
+
+
+def generation_time(generation_delta_time: int, reference_time: float) -> float:
+    """
+    Resolve a generationDeltaTime into Unix time in seconds, see `generation_timestamp_its`.
+
+    Parameters
+    ----------
+    generation_delta_time : int
+        generationDeltaTime of a CAM or CPM.
+    reference_time : float
+        Unix time of the reception in seconds.
+
+    Returns
+    -------
+    float
+        Unix time of the message generation in seconds.
+    """
+    return timestamp_its_to_unix(
+        generation_timestamp_its(generation_delta_time, timestamp_its(reference_time))
+    )
+
+
+def peek_generation_delta_time(message_type: EtsiMessageType, data: bytes) -> Optional[int]:
+    """
+    Read the generationDeltaTime of a UPER encoded message without decoding it.
+
+    Parameters
+    ----------
+    message_type : EtsiMessageType
+        Type of the message.
+    data : bytes
+        UPER encoded ETSI message, starting with the ItsPduHeader.
+
+    Returns
+    -------
+    Optional[int]
+        generationDeltaTime or None if the message type has none at a fixed position.
+    """
+    if message_type not in GENERATION_DELTA_TIME_MESSAGE_TYPES:
+        return None
+    if len(data) < ITS_PDU_HEADER_SIZE + GENERATION_DELTA_TIME_STRUCT.size:
+        return None
+    return GENERATION_DELTA_TIME_STRUCT.unpack_from(data, ITS_PDU_HEADER_SIZE)[0]
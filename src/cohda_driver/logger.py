@@ -12,28 +12,50 @@
 # logger_config.py
 
 import logging
+import logging.handlers
+import os
+import queue
 import sys
 from pathlib import Path
 import time
-import colorlog
+from typing import Callable, Dict, Hashable, Optional, Tuple, Union
 
+LOGGER_NAME = "project_logger"
+# Environment variable with the default level of setup_logger, e.g. "DEBUG".
+LOG_LEVEL_VARIABLE = "COHDA_DRIVER_LOG_LEVEL"
+# Seconds over which repeated warnings are aggregated, see WarningAggregator.
+WARNING_INTERVAL = 10.0
+# Records buffered by the background logging thread before new ones are dropped.
+LOG_QUEUE_SIZE = 10000
 
-def setup_logger(log_file=None, log_level=logging.INFO):
+
+def setup_logger(log_file=None, log_level=None, stream=None):
     """
     Set up a logger with colored console output and optional file output.
 
+    The driver does not configure logging when it is imported. Applications call this function
+    or configure the LOGGER_NAME or root logger themselves. Without any configuration, only
+    warnings and errors are written to stderr.
+
     Parameters
     ----------
     log_file : str
         Path to the log file. If None, the logger will not write to a file.
-    log_level : int
-        Logging level. Default is logging.INFO.
+    log_level : Optional[Union[int, str]]
+        Logging level. Defaults to the COHDA_DRIVER_LOG_LEVEL environment variable or INFO.
+    stream : Optional[TextIO]
+        Stream of the console output. Defaults to stdout.
 
     Returns
     -------
     logging.Logger
     """
-    logger = logging.getLogger("project_logger")
+    # Imported on first use, so applications with their own logging setup do not load it.
+    import colorlog
+
+    if log_level is None:
+        log_level = os.environ.get(LOG_LEVEL_VARIABLE, "INFO").upper()
+    logger = logging.getLogger(LOGGER_NAME)
     logger.setLevel(log_level)
 
     # Prevent adding handlers if they already exist
@@ -55,11 +77,11 @@ def setup_logger(log_file=None, log_level=logging.INFO):
         )
 
         file_formatter = logging.Formatter(
-            "%(log_color)s[%(asctime)s.%(msecs)06d] [%(levelname)-8s] %(message)s", datefmt="%s"
+            "[%(asctime)s.%(msecs)06d] [%(levelname)-8s] %(message)s", datefmt="%s"
         )
 
         # Create console handler and set level
-        console_handler = colorlog.StreamHandler(sys.stdout)
+        console_handler = colorlog.StreamHandler(sys.stdout if stream is None else stream)
         console_handler.setLevel(log_level)
         console_handler.setFormatter(console_formatter)
         logger.addHandler(console_handler)
@@ -74,4 +96,177 @@ def setup_logger(log_file=None, log_level=logging.INFO):
     return logger
 
 
-logger = setup_logger(log_file=None, log_level=logging.DEBUG)
+def set_log_level(log_level: Union[int, str]):
+    """
+    Set the level of the driver logger and its handlers, e.g. `set_log_level("WARNING")`.
+    """
+    logger.setLevel(log_level)
+    for handler in logger.handlers:
+        handler.setLevel(log_level)
+
+
+class _BackgroundHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that neither formats records on the calling thread nor blocks when the queue
+    is full.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Formatting is left to the handlers on the background thread. The arguments of a
+        # record must therefore not be modified after logging it.
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _BackgroundListener(logging.handlers.QueueListener):
+    """
+    Queue listener that waits for space in a full queue to stop.
+    """
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
+_background_handler: Optional[_BackgroundHandler] = None
+_background_listener: Optional[_BackgroundListener] = None
+
+
+def enable_background_logging(max_queue_size: int = LOG_QUEUE_SIZE):
+    """
+    Move the output of the driver logger to a background thread.
+
+    Log calls only put the record into a bounded queue, and the handlers format and write it on
+    the background thread. When the queue is full, new records are dropped instead of blocking
+    the driver loop, see `dropped_log_records`.
+
+    Parameters
+    ----------
+    max_queue_size : int
+        Records buffered before new ones are dropped.
+    """
+    global _background_handler, _background_listener
+    if _background_handler is not None:
+        return
+    handlers = list(logger.handlers)
+    _background_handler = _BackgroundHandler(queue.Queue(max_queue_size))
+    _background_listener = _BackgroundListener(
+        _background_handler.queue, *handlers, respect_handler_level=True
+    )
+    for handler in handlers:
+        logger.removeHandler(handler)
+    logger.addHandler(_background_handler)
+    _background_listener.start()
+
+
+def disable_background_logging():
+    """
+    Write the queued records and move the output of the driver logger back to the calling
+    threads.
+    """
+    global _background_handler, _background_listener
+    if _background_handler is None:
+        return
+    logger.removeHandler(_background_handler)
+    # Waits until the queued records are handled.
+    _background_listener.stop()
+    for handler in _background_listener.handlers:
+        logger.addHandler(handler)
+    _background_handler = None
+    _background_listener = None
+
+
+def dropped_log_records() -> int:
+    """
+    Get the number of records dropped by the background logging because its queue was full.
+    """
+    return 0 if _background_handler is None else _background_handler.dropped
+
+
+class WarningAggregator:
+    """
+    Rate limiter for warnings that can repeat for every packet, e.g. about unsupported messages.
+
+    The first warning of a key is logged. Repetitions within the interval are counted and
+    logged as one summary with the time from the first warning to the last repetition, e.g.
+    "250 x Unsupported message type SPATEM v1 within 9.8 s". Summaries are logged by the next
+    warning after the interval or by `flush`, so they can be logged later than the interval
+    ends. Messages use lazy %-style formatting. Not thread-safe, every driver thread needs its
+    own aggregator.
+    """
+
+    def __init__(
+        self,
+        log: logging.Logger,
+        interval: float = WARNING_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the aggregator.
+
+        Parameters
+        ----------
+        log : logging.Logger
+            Logger the warnings and summaries are written to.
+        interval : float
+            Seconds over which repetitions of a key are aggregated.
+        clock : Callable[[], float]
+            Monotonic time in seconds.
+        """
+        self.log = log
+        self.interval = interval
+        self.clock = clock
+        # Start of the interval, time of the last repetition, repetitions, message and arguments
+        # per key.
+        self._entries: Dict[Hashable, Tuple[float, float, int, str, tuple]] = {}
+        self._next_flush = float("inf")
+
+    def warning(self, key: Hashable, msg: str, *args):
+        """
+        Log a warning unless one with the same key was logged within the interval.
+
+        Parameters
+        ----------
+        key : Hashable
+            Identity of the warning, e.g. `("unsupported", message_id, protocol_version)`.
+        msg : str
+            %-style message, formatted only when it is written.
+        """
+        now = self.clock()
+        if now >= self._next_flush:
+            self.flush(now)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries[key] = (entry[0], now, entry[2] + 1, msg, args)
+            return
+        self.log.warning(msg, *args)
+        self._entries[key] = (now, now, 0, msg, args)
+        self._next_flush = min(self._next_flush, now + self.interval)
+
+    def flush(self, now: Optional[float] = None):
+        """
+        Log the summaries of the keys whose interval ended, or of all keys if `now` is None.
+        """
+        flush_all = now is None
+        if flush_all:
+            now = self.clock()
+        next_flush = float("inf")
+        for key, (start, last, repetitions, msg, args) in list(self._entries.items()):
+            if not flush_all and now - start < self.interval:
+                next_flush = min(next_flush, start + self.interval)
+                continue
+            del self._entries[key]
+            if repetitions:
+                self.log.warning("%d x " + msg + " within %.1f s", repetitions, *args, last - start)
+        self._next_flush = next_flush
+
+
+logger = logging.getLogger(LOGGER_NAME)
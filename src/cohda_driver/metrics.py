@@ -0,0 +1,496 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# This module implements the driver metrics: per message type counters and
+# rates, latency histograms, drop counters and an optional HTTP endpoint
+# serving them in Prometheus text or JSON format.
+# ---------------------------------------------------------------------
+import bisect
+import json
+import threading
+import time
+
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional
+
+from cohda_driver.etsi_message_type import EtsiMessageType
+from cohda_driver.its_time import GENERATION_DELTA_TIME_MODULO
+from cohda_driver.logger import logger
+
+# Upper bounds of the latency histogram buckets in seconds.
+LATENCY_BUCKETS = [
+    0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+]  # fmt: skip
+
+RATE_WINDOW = 10
+
+# CAMs and CPMs are generated at least once per second (T_GenCamMax), so a larger gap between
+# the generationDeltaTimes of consecutive messages of a station means that messages were lost.
+# Gaps beyond the reset threshold are attributed to the station leaving and re-entering the
+# communication range.
+GENERATION_GAP_THRESHOLD_MS = 1100
+GENERATION_GAP_RESET_MS = 10000
+
+# Stations not heard of for this many seconds are removed from the gap tracking.
+STATION_TIMEOUT = 60.0
+
+
+class Histogram:
+    """
+    Histogram with fixed buckets.
+    """
+
+    def __init__(self, buckets: Optional[List[float]] = None):
+        """
+        Initialize the histogram.
+
+        Parameters
+        ----------
+        buckets : Optional[List[float]]
+            Sorted upper bounds of the buckets. An overflow bucket is added implicitly. Defaults
+            to LATENCY_BUCKETS.
+        """
+        self.buckets = LATENCY_BUCKETS if buckets is None else buckets
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile as the upper bound of the bucket containing it.
+        """
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            if cumulative >= rank:
+                return bound
+        return float("inf")
+
+    def merge(self, other: "Histogram"):
+        """
+        Add the observations of a histogram with the same buckets.
+        """
+        if other.buckets != self.buckets:
+            raise ValueError("Histograms with different buckets cannot be merged.")
+        self.counts = [count + other_count for count, other_count in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.sum += other.sum
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict) -> "Histogram":
+        histogram = cls(list(snapshot["buckets"]))
+        histogram.counts = list(snapshot["counts"])
+        histogram.count = snapshot["count"]
+        histogram.sum = snapshot["sum"]
+        return histogram
+
+    def snapshot(self) -> Dict:
+        return {
+            "buckets": self.buckets,
+            "counts": list(self.counts),
+            "count": self.count,
+            "sum": self.sum,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+        }
+
+
+class RateCounter:
+    """
+    Event rate over a sliding window of one-second slots.
+    """
+
+    def __init__(self, window: int = RATE_WINDOW):
+        self.window = window
+        self._seconds = [0] * window
+        self._counts = [0] * window
+
+    def add(self, now: float):
+        second = int(now)
+        slot = second % self.window
+        if self._seconds[slot] != second:
+            self._seconds[slot] = second
+            self._counts[slot] = 0
+        self._counts[slot] += 1
+
+    def rate(self, now: float) -> float:
+        # The current, incomplete second is excluded.
+        second = int(now)
+        total = sum(
+            count
+            for slot_second, count in zip(self._seconds, self._counts)
+            if second - self.window < slot_second < second
+        )
+        return total / (self.window - 1)
+
+
+class GenerationGapTracker:
+    """
+    Detect lost messages from gaps in the generationDeltaTime sequence of every station.
+    """
+
+    def __init__(
+        self,
+        gap_threshold_ms: int = GENERATION_GAP_THRESHOLD_MS,
+        reset_threshold_ms: int = GENERATION_GAP_RESET_MS,
+    ):
+        self.gap_threshold_ms = gap_threshold_ms
+        self.reset_threshold_ms = reset_threshold_ms
+        self._stations: Dict[int, tuple] = {}
+        self._updates = 0
+
+    def update(self, station_id: int, generation_delta_time: int, now: float) -> bool:
+        """
+        Track the generationDeltaTime of a received message.
+
+        Returns
+        -------
+        bool
+            True if messages of the station were lost since its previous message.
+        """
+        last = self._stations.get(station_id)
+        self._stations[station_id] = (generation_delta_time, now)
+        self._updates += 1
+        if self._updates % 4096 == 0:
+            self._prune(now)
+        if last is None or (now - last[1]) * 1000 > self.reset_threshold_ms:
+            return False
+        gap = (generation_delta_time - last[0]) % GENERATION_DELTA_TIME_MODULO
+        return self.gap_threshold_ms < gap < self.reset_threshold_ms
+
+    def _prune(self, now: float):
+        self._stations = {
+            station_id: last
+            for station_id, last in self._stations.items()
+            if now - last[1] < STATION_TIMEOUT
+        }
+
+
+class MessageTypeMetrics:
+    def __init__(self):
+        self.received = 0
+        self.decoded = 0
+        self.decode_errors = 0
+        self.callback_errors = 0
+        self.stale_drops = 0
+        self.ingress_drops = 0
+        self.filter_drops = 0
+        self.generation_gaps = 0
+        self.generation_gap_tracker = GenerationGapTracker()
+        self.receive_rate = RateCounter()
+        self.decode_latency = Histogram()
+        self.callback_duration = Histogram()
+        self.receive_to_callback = Histogram()
+        self.message_age = Histogram()
+
+    def snapshot(self, now: float) -> Dict:
+        return {
+            "received": self.received,
+            "decoded": self.decoded,
+            "decode_errors": self.decode_errors,
+            "callback_errors": self.callback_errors,
+            "stale_drops": self.stale_drops,
+            "ingress_drops": self.ingress_drops,
+            "filter_drops": self.filter_drops,
+            "generation_gaps": self.generation_gaps,
+            "receive_rate_hz": self.receive_rate.rate(now),
+            "decode_latency_seconds": self.decode_latency.snapshot(),
+            "callback_duration_seconds": self.callback_duration.snapshot(),
+            "receive_to_callback_seconds": self.receive_to_callback.snapshot(),
+            "message_age_seconds": self.message_age.snapshot(),
+        }
+
+
+class DriverMetrics:
+    """
+    Metrics of a CohdaDriver.
+
+    The update methods are called from the thread processing the packets only. Snapshots can be
+    taken from any thread.
+    """
+
+    def __init__(self):
+        self.start_time = time.time()
+        self.packets_received = 0
+        self.unsupported_version_drops = 0
+        self.unknown_type_drops = 0
+        self.malformed_drops = 0
+        # Updated from the SO_RXQ_OVFL counter of the socket on Linux.
+        self.kernel_drops = 0
+        self.ingress_drops = 0
+        self.message_types: Dict[EtsiMessageType, MessageTypeMetrics] = defaultdict(
+            MessageTypeMetrics
+        )
+
+    def packet_received(self):
+        self.packets_received += 1
+
+    def unsupported_version(self):
+        self.unsupported_version_drops += 1
+
+    def unknown_type(self):
+        self.unknown_type_drops += 1
+
+    def malformed_packet(self):
+        self.malformed_drops += 1
+
+    def message_received(self, message_type: EtsiMessageType):
+        metrics = self.message_types[message_type]
+        metrics.received += 1
+        metrics.receive_rate.add(time.monotonic())
+
+    def message_decoded(self, message_type: EtsiMessageType, latency: float):
+        metrics = self.message_types[message_type]
+        metrics.decoded += 1
+        metrics.decode_latency.observe(latency)
+
+    def decode_error(self, message_type: EtsiMessageType):
+        self.message_types[message_type].decode_errors += 1
+
+    def callback_done(self, message_type: EtsiMessageType, duration: float):
+        self.message_types[message_type].callback_duration.observe(duration)
+
+    def callback_error(self, message_type: EtsiMessageType):
+        self.message_types[message_type].callback_errors += 1
+
+    def generation_delta_time(
+        self, message_type: EtsiMessageType, station_id: int, generation_delta_time: int
+    ):
+        metrics = self.message_types[message_type]
+        if metrics.generation_gap_tracker.update(
+            station_id, generation_delta_time, time.monotonic()
+        ):
+            metrics.generation_gaps += 1
+
+    def ingress_drop(self, message_id: int):
+        self.ingress_drops += 1
+        try:
+            message_type = EtsiMessageType(message_id)
+        except ValueError:
+            return
+        self.message_types[message_type].ingress_drops += 1
+
+    def filter_drop(self, message_type: EtsiMessageType):
+        self.message_types[message_type].filter_drops += 1
+
+    def stale_drop(self, message_type: EtsiMessageType):
+        self.message_types[message_type].stale_drops += 1
+
+    def receive_to_callback(self, message_type: EtsiMessageType, latency: float):
+        self.message_types[message_type].receive_to_callback.observe(latency)
+
+    def message_age(self, message_type: EtsiMessageType, age: float):
+        self.message_types[message_type].message_age.observe(age)
+
+    def snapshot(self) -> Dict:
+        """
+        Get a snapshot of all metrics.
+
+        Returns
+        -------
+        Dict
+            JSON serializable metrics. Message types are keyed by their name.
+        """
+        now = time.monotonic()
+        return {
+            "uptime_seconds": time.time() - self.start_time,
+            "packets_received": self.packets_received,
+            "unsupported_version_drops": self.unsupported_version_drops,
+            "unknown_type_drops": self.unknown_type_drops,
+            "malformed_drops": self.malformed_drops,
+            "kernel_drops": self.kernel_drops,
+            "ingress_drops": self.ingress_drops,
+            "message_types": {
+                message_type.name: metrics.snapshot(now)
+                for message_type, metrics in list(self.message_types.items())
+            },
+        }
+
+
+def merge_snapshots(snapshots: List[Dict]) -> Dict:
+    """
+    Merge the metrics snapshots of several drivers, e.g. of worker processes.
+
+    Counters and rates are summed, histograms are merged and the uptime is the maximum.
+
+    Parameters
+    ----------
+    snapshots : List[Dict]
+        Snapshots as returned by `DriverMetrics.snapshot`. Empty snapshots are ignored.
+
+    Returns
+    -------
+    Dict
+        Merged snapshot in the same format.
+    """
+    snapshots = [snapshot for snapshot in snapshots if snapshot]
+    if not snapshots:
+        return {}
+    merged = {}
+    for name in snapshots[0]:
+        if name == "message_types":
+            continue
+        values = [snapshot[name] for snapshot in snapshots]
+        merged[name] = max(values) if name == "uptime_seconds" else sum(values)
+
+    message_types: Dict[str, Dict] = {}
+    for snapshot in snapshots:
+        for type_name, metrics in snapshot["message_types"].items():
+            merged_metrics = message_types.setdefault(type_name, {})
+            for name, value in metrics.items():
+                if isinstance(value, dict):
+                    histogram = Histogram.from_snapshot(value)
+                    if name in merged_metrics:
+                        histogram.merge(Histogram.from_snapshot(merged_metrics[name]))
+                    merged_metrics[name] = histogram.snapshot()
+                else:
+                    merged_metrics[name] = merged_metrics.get(name, 0) + value
+    merged["message_types"] = message_types
+    return merged
+
+
+def to_prometheus(snapshot: Dict, prefix: str = "cohda_driver") -> str:
+    """
+    Format a metrics snapshot in the Prometheus text exposition format.
+
+    Parameters
+    ----------
+    snapshot : Dict
+        Snapshot as returned by `DriverMetrics.snapshot`.
+    prefix : str
+        Prefix of all metric names.
+
+    Returns
+    -------
+    str
+        Metrics in the Prometheus text exposition format.
+    """
+    lines = []
+
+    def add_metric(name: str, metric_type: str, samples: List):
+        lines.append(f"# TYPE {prefix}_{name} {metric_type}")
+        for labels, value in samples:
+            label_text = ",".join(f'{key}="{label}"' for key, label in labels.items())
+            if label_text:
+                label_text = f"{{{label_text}}}"
+            lines.append(f"{prefix}_{name}{label_text} {value}")
+
+    message_types = snapshot["message_types"]
+    for name in [
+        "packets_received",
+        "unsupported_version_drops",
+        "unknown_type_drops",
+        "malformed_drops",
+        "kernel_drops",
+        "ingress_drops",
+    ]:
+        add_metric(f"{name}_total", "counter", [({}, snapshot[name])])
+    for name in [
+        "received",
+        "decoded",
+        "decode_errors",
+        "callback_errors",
+        "stale_drops",
+        "ingress_drops",
+        "filter_drops",
+        "generation_gaps",
+    ]:
+        add_metric(
+            f"messages_{name}_total",
+            "counter",
+            [({"type": type_name}, metrics[name]) for type_name, metrics in message_types.items()],
+        )
+    add_metric(
+        "messages_receive_rate_hz",
+        "gauge",
+        [({"type": type_name}, m["receive_rate_hz"]) for type_name, m in message_types.items()],
+    )
+    for name in [
+        "decode_latency_seconds",
+        "callback_duration_seconds",
+        "receive_to_callback_seconds",
+        "message_age_seconds",
+    ]:
+        lines.append(f"# TYPE {prefix}_{name} histogram")
+        for type_name, metrics in message_types.items():
+            histogram = metrics[name]
+            cumulative = 0
+            bounds = [str(bound) for bound in histogram["buckets"]] + ["+Inf"]
+            for bound, count in zip(bounds, histogram["counts"]):
+                cumulative += count
+                lines.append(
+                    f'{prefix}_{name}_bucket{{type="{type_name}",le="{bound}"}} {cumulative}'
+                )
+            lines.append(f'{prefix}_{name}_sum{{type="{type_name}"}} {histogram["sum"]}')
+            lines.append(f'{prefix}_{name}_count{{type="{type_name}"}} {histogram["count"]}')
+    return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """
+    HTTP server on a background thread exposing metrics snapshots.
+
+    `/metrics` serves the Prometheus text format and `/stats` serves JSON.
+    """
+
+    def __init__(self, snapshot: Callable[[], Dict], port: int, host: str = "127.0.0.1"):
+        """
+        Initialize and start the server.
+
+        Parameters
+        ----------
+        snapshot : Callable[[], Dict]
+            Function returning the current metrics snapshot, e.g. `CohdaDriver.stats`.
+        port : int
+            Port to listen on. 0 selects a free port.
+        host : str
+            Address to listen on. Defaults to localhost only.
+        """
+        # Imported on first use, most drivers do not serve metrics.
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):  # pylint: disable=invalid-name
+                if self.path == "/metrics":
+                    body = to_prometheus(snapshot()).encode()
+                    content_type = "text/plain; version=0.0.4"
+                elif self.path in ("/stats", "/stats.json"):
+                    body = json.dumps(snapshot()).encode()
+                    content_type = "application/json"
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *_args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self.address = self._server.server_address
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Serving metrics on http://{self.address[0]}:{self.address[1]}/metrics.")
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
@@ -0,0 +1,231 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# This module implements a driver serving several Cohda devices on a
+# single thread with one selectors-based event loop.
+# ---------------------------------------------------------------------
+import selectors
+import threading
+import time
+
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from cohda_driver.decoder import EtsiDecoder, EtsiMessageClasses
+from cohda_driver.driver import CohdaDriver
+from cohda_driver.etsi_message_type import EtsiMessageType
+from cohda_driver.logger import WarningAggregator, logger
+from cohda_driver.subscription import Subscription
+
+# Seconds without any packet after which a warning is logged, as in the CohdaDriver loop.
+RECEIVE_WARNING_INTERVAL = 5.0
+
+
+class CohdaEndpoint(NamedTuple):
+    host_ip: str
+    cohda_ip: str
+    cohda_ind_port: int
+    cohda_req_port: int
+    # Tag of the messages received from this device. Defaults to "<cohda_ip>:<cohda_ind_port>".
+    name: Optional[str] = None
+
+    @property
+    def device_name(self) -> str:
+        return self.name or f"{self.cohda_ip}:{self.cohda_ind_port}"
+
+
+class MultiDeviceDriver:
+    """
+    Driver for several Cohda devices.
+
+    All devices share one decoder, so the ASN.1 specifications are compiled once, and all
+    sockets are served by one thread. Every device is handled by a CohdaDriver whose loop is
+    not started, so recording, archiving and metrics work per device as with a single driver.
+    Devices with an ingress queue, see `CohdaDriver.setup_ingress`, decode on their own process
+    thread.
+    """
+
+    def __init__(
+        self,
+        endpoints: List[CohdaEndpoint],
+        enable_metrics: bool = False,
+        kernel_timestamps: bool = True,
+        max_message_age: Optional[float] = None,
+        receive_buffer_size: Optional[int] = None,
+        decoder: Optional[EtsiDecoder] = None,
+    ):
+        """
+        Initialize the driver and bind the sockets of all devices.
+
+        Parameters
+        ----------
+        endpoints : List[CohdaEndpoint]
+            Addresses of the devices. Their names must be unique.
+        enable_metrics : bool
+            Collect metrics per device, see `stats`.
+        kernel_timestamps : bool
+            See CohdaDriver.
+        max_message_age : Optional[float]
+            See CohdaDriver.
+        receive_buffer_size : Optional[int]
+            See CohdaDriver.
+        decoder : Optional[EtsiDecoder]
+            Decoder shared by all devices, see CohdaDriver. A new decoder is created if None.
+        """
+        names = [endpoint.device_name for endpoint in endpoints]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Device names must be unique: {names}")
+        self._decoder = EtsiDecoder() if decoder is None else decoder
+        self.devices: Dict[str, CohdaDriver] = {}
+        self._selector = selectors.DefaultSelector()
+        for name, endpoint in zip(names, endpoints):
+            logger.info(f"Adding device '{name}'.")
+            device = CohdaDriver(
+                endpoint.host_ip,
+                endpoint.cohda_ip,
+                endpoint.cohda_ind_port,
+                endpoint.cohda_req_port,
+                enable_metrics=enable_metrics,
+                kernel_timestamps=kernel_timestamps,
+                max_message_age=max_message_age,
+                receive_buffer_size=receive_buffer_size,
+                decoder=self._decoder,
+            )
+            device.sock.setblocking(False)
+            self._selector.register(device.sock, selectors.EVENT_READ, (name, device))
+            self.devices[name] = device
+        # Warnings about packets that could not be processed, per device.
+        self._warnings = WarningAggregator(logger)
+        self._is_running = False
+        self._run_thread = threading.Thread(target=self._run, daemon=True)
+
+    def setup_callback(
+        self,
+        callback: Callable[[EtsiMessageClasses, str], None],
+        etsi_msg_type: EtsiMessageType,
+        device: Optional[str] = None,
+    ):
+        """
+        Add callback for the given etsi_msg_type.
+
+        Parameters
+        ----------
+        callback : Callable[[EtsiMessageClasses, str], None]
+            Callback function that will be called when the etsi_msg_type is received. The
+            function must have the following signature:
+
+            ```
+            callback(etsi_msg: EtsiMessageClasses, device: str)
+            ```
+
+            where device is the name of the device that received the message.
+
+        etsi_msg_type : EtsiMessageType
+            ETSI message type for which the callback should be added.
+        device : Optional[str]
+            Name of the device. The callback is added to all devices if None.
+        """
+        names = list(self.devices) if device is None else [device]
+        for name in names:
+            self.devices[name].setup_callback(
+                lambda etsi_msg, name=name: callback(etsi_msg, name), etsi_msg_type
+            )
+
+    def subscribe(
+        self,
+        etsi_msg_type: EtsiMessageType,
+        callback: Callable[[EtsiMessageClasses, str], None],
+        message_filter: Optional[Callable[[EtsiMessageClasses], bool]] = None,
+        device: Optional[str] = None,
+        payload_filter: Optional[Callable[[bytes], bool]] = None,
+    ) -> List[Subscription]:
+        """
+        Subscribe to the given etsi_msg_type, see CohdaDriver.subscribe.
+
+        The callback receives the message and the name of the device that received it.
+
+        Returns
+        -------
+        List[Subscription]
+            One handle per device.
+        """
+        names = list(self.devices) if device is None else [device]
+        return [
+            self.devices[name].subscribe(
+                etsi_msg_type,
+                lambda etsi_msg, name=name: callback(etsi_msg, name),
+                message_filter,
+                payload_filter,
+            )
+            for name in names
+        ]
+
+    def stats(self) -> Dict[str, Dict]:
+        """
+        Get a snapshot of the metrics of every device, see CohdaDriver.stats.
+        """
+        return {name: device.stats() for name, device in self.devices.items()}
+
+    def send_request(self, device: str, message_type: EtsiMessageType, message_data: dict):
+        """
+        Send a request to a device, see CohdaDriver.send_request.
+        """
+        self.devices[device].send_request(message_type, message_data)
+
+    def start_loop(self):
+        """
+        Start the driver loop.
+        """
+        logger.info(f"Starting driver loop for {len(self.devices)} devices.")
+        self._is_running = True
+        for device in self.devices.values():
+            device.start_processing()
+        self._run_thread.start()
+
+    def stop_loop(self):
+        """
+        Stop the driver loop and close the sockets.
+        """
+        logger.info("Stopping driver loop.")
+        self._is_running = False
+        if self._run_thread.is_alive():
+            self._run_thread.join()
+        self._selector.close()
+        for device in self.devices.values():
+            device.stop_processing()
+            device.sock.close()
+        self._warnings.flush()
+
+    def _run(self):
+        """
+        Run the driver and receive and process the incoming packets of all devices.
+        """
+        if not any(device.has_subscriptions for device in self.devices.values()):
+            logger.warning("No callbacks added. Will not receive any packets.")
+            self._is_running = False
+            return
+
+        last_receive = time.monotonic()
+        while self._is_running:
+            events = self._selector.select(timeout=0.5)
+            if not events:
+                if time.monotonic() - last_receive > RECEIVE_WARNING_INTERVAL:
+                    logger.warning("Trying to receive data...")
+                    last_receive = time.monotonic()
+                continue
+            last_receive = time.monotonic()
+            for key, _ in events:
+                name, device = key.data
+                try:
+                    packet, receive_time = device.receive()
+                    device.handle_datagram(packet, receive_time)
+                except BlockingIOError:
+                    continue
+                except Exception as e:
+                    self._warnings.warning(
+                        (name,), "Error processing packet of device '%s': %s", name, e
+                    )
@@ -0,0 +1,257 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# This module implements a tracker of the perceived objects of CPMs.
+# It keeps one track per sender station and object ID and turns every
+# CPM into the changes to the previous one, so downstream consumers
+# process new, updated and vanished objects instead of full lists.
+# ---------------------------------------------------------------------
+import threading
+import time
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from cohda_driver.etsi_messages.cpm import CPM, Classification, CpmPerceivedObject
+from cohda_driver.its_time import generation_time
+
+# Seconds after their last measurement that objects expire. Two generation intervals of a sender
+# at the lowest CPM rate of 1 Hz.
+OBJECT_TIMEOUT = 2.0
+
+
+@dataclass
+class ObjectTrack:
+    """
+    Latest state of an object perceived by a station.
+
+    Attributes
+    ----------
+    station_id : int
+        Station ID of the sender of the CPMs.
+    object_id : int
+        Object ID assigned by the sender.
+    object : CpmPerceivedObject
+        Object of the latest CPM that contained it.
+    measurement_time : float
+        Unix time of the latest measurement, the generation time of its CPM minus its
+        `time_of_measurement`, which is the offset back to the measurement in ms.
+    first_measurement_time : float
+        Unix time of the first measurement.
+    updates : int
+        Number of CPMs the object was contained in.
+    """
+
+    station_id: int
+    object_id: int
+    object: CpmPerceivedObject
+    measurement_time: float
+    first_measurement_time: float
+    updates: int = 1
+
+    @property
+    def key(self) -> Tuple[int, int]:
+        return self.station_id, self.object_id
+
+    @property
+    def velocity(self) -> Tuple[float, float]:
+        """
+        Speed in x and y direction of the sender's reference frame in m/s.
+        """
+        return self.object.xSpeed.value, self.object.ySpeed.value
+
+    @property
+    def classification(self) -> Classification:
+        return self.object.classification
+
+
+@dataclass
+class ObjectChanges:
+    """
+    Changes of the tracks of a station by one CPM, or of all stations by `expire`.
+
+    Attributes
+    ----------
+    station_id : Optional[int]
+        Station ID of the sender of the CPM, None for expired objects of several stations.
+    generation_time : Optional[float]
+        Unix time the CPM was generated, None for expired objects.
+    new : List[ObjectTrack]
+        Tracks of objects the station did not report before.
+    updated : List[ObjectTrack]
+        Tracks with a newer measurement.
+    vanished : List[ObjectTrack]
+        Removed tracks, with the last state of their objects.
+    """
+
+    station_id: Optional[int] = None
+    generation_time: Optional[float] = None
+    new: List[ObjectTrack] = field(default_factory=list)
+    updated: List[ObjectTrack] = field(default_factory=list)
+    vanished: List[ObjectTrack] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.new or self.updated or self.vanished)
+
+
+class CpmObjectTracker:
+    """
+    Tracks of the perceived objects of CPMs per sender station and object ID.
+
+    Every CPM is applied as a diff to the tracks of its sender, and the changes are returned.
+    The tracks are updated in place, so the tracks of the changes remain the current state until
+    they vanish. CPMs that are older than the latest CPM of their sender are ignored.
+
+    The tracker is meant to be fed from a CPM subscription:
+
+    ```
+    tracker = CpmObjectTracker()
+    driver.subscribe(EtsiMessageType.CPM, lambda cpm: fusion.apply(tracker.update(cpm)))
+    ```
+
+    All methods may be called from any thread.
+    """
+
+    def __init__(self, timeout: float = OBJECT_TIMEOUT, full_object_lists: bool = True):
+        """
+        Initialize the tracker.
+
+        Parameters
+        ----------
+        timeout : float
+            Seconds after their last measurement that objects vanish.
+        full_object_lists : bool
+            Whether every CPM contains all objects of its sender, so objects missing in a CPM
+            vanish immediately. With False, for senders that only include changed objects as
+            allowed by TR 103 562, missing objects vanish when they time out.
+        """
+        self.timeout = timeout
+        self.full_object_lists = full_object_lists
+        # Tracks by object ID and generation time of the latest CPM of every station.
+        self._stations: Dict[int, Dict[int, ObjectTrack]] = {}
+        self._generation_times: Dict[int, float] = {}
+        self._lock = threading.Lock()
+
+    def update(self, cpm: CPM, now: Optional[float] = None) -> ObjectChanges:
+        """
+        Apply the perceived objects of a CPM to the tracks of its sender.
+
+        Parameters
+        ----------
+        cpm : CPM
+            Decoded CPM.
+        now : Optional[float]
+            Unix time the CPM was received, to resolve its generationDeltaTime. Defaults to now.
+
+        Returns
+        -------
+        ObjectChanges
+            New, updated and vanished objects of the sender. Empty if the CPM is not newer than
+            the latest CPM of the sender.
+        """
+        if now is None:
+            now = time.time()
+        station_id = cpm.header.station_id
+        generated = generation_time(cpm.generationDeltaTime, now)
+        changes = ObjectChanges(station_id, generated)
+        with self._lock:
+            last_generated = self._generation_times.get(station_id)
+            if last_generated is not None and generated <= last_generated:
+                return changes
+            self._generation_times[station_id] = generated
+            tracks = self._stations.setdefault(station_id, {})
+            seen = set()
+            for obj in cpm.cpmParameters.cpmPerceivedObjectContainer:
+                object_id = obj.objectId
+                seen.add(object_id)
+                # timeOfMeasurement counts back from the generation time, negative values are
+                # measurements after it.
+                measured = generated - obj.time_of_measurement / 1000
+                track = tracks.get(object_id)
+                if track is None:
+                    track = ObjectTrack(station_id, object_id, obj, measured, measured)
+                    tracks[object_id] = track
+                    changes.new.append(track)
+                elif measured > track.measurement_time:
+                    track.object = obj
+                    track.measurement_time = measured
+                    track.updates += 1
+                    changes.updated.append(track)
+            expired = generated - self.timeout
+            for object_id, track in list(tracks.items()):
+                if object_id in seen:
+                    continue
+                if self.full_object_lists or track.measurement_time < expired:
+                    del tracks[object_id]
+                    changes.vanished.append(track)
+            if not tracks:
+                del self._stations[station_id]
+        return changes
+
+    def expire(self, now: Optional[float] = None) -> ObjectChanges:
+        """
+        Remove the tracks whose last measurement is older than the timeout, e.g. of stations
+        that stopped sending. Call it periodically.
+
+        Parameters
+        ----------
+        now : Optional[float]
+            Unix time. Defaults to now.
+
+        Returns
+        -------
+        ObjectChanges
+            Expired tracks of all stations as vanished objects.
+        """
+        if now is None:
+            now = time.time()
+        expired = now - self.timeout
+        changes = ObjectChanges()
+        with self._lock:
+            for station_id, tracks in list(self._stations.items()):
+                for object_id, track in list(tracks.items()):
+                    if track.measurement_time < expired:
+                        del tracks[object_id]
+                        changes.vanished.append(track)
+                if not tracks:
+                    del self._stations[station_id]
+            # Stations without tracks are forgotten after the timeout, so their next CPM is
+            # accepted even after a restart of their clock.
+            self._generation_times = {
+                station_id: generated
+                for station_id, generated in self._generation_times.items()
+                if station_id in self._stations or generated >= expired
+            }
+        return changes
+
+    def tracks(self, station_id: Optional[int] = None) -> List[ObjectTrack]:
+        """
+        Get the current tracks.
+
+        Parameters
+        ----------
+        station_id : Optional[int]
+            Only the tracks of this sender. The tracks of all senders if None.
+        """
+        with self._lock:
+            if station_id is not None:
+                return list(self._stations.get(station_id, {}).values())
+            return [track for tracks in self._stations.values() for track in tracks.values()]
+
+    def get(self, station_id: int, object_id: int) -> Optional[ObjectTrack]:
+        with self._lock:
+            return self._stations.get(station_id, {}).get(object_id)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(tracks) for tracks in self._stations.values())
+
+    def clear(self):
+        with self._lock:
+            self._stations.clear()
+            self._generation_times.clear()
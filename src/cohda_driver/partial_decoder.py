@@ -0,0 +1,88 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# This module implements the partial decoding of fields at fixed bit
+# positions of UPER encoded CAMs, without the ASN.1 decoder.
+#
+# CAM (EN 302 637-2 v1.4.1 and v2) in UPER, after the ItsPduHeader (6 bytes) and the
+# generationDeltaTime (2 bytes):
+#
+#   CamParameters:  extension bit, lowFrequencyContainer and
+#                   specialVehicleContainer presence bits (3 bits)
+#   BasicContainer: extension bit (1 bit)
+#   stationType:    0..255 (8 bits)
+#   latitude:       -900000000..900000001 (31 bits, offset encoded)
+#   longitude:      -1800000000..1800000001 (32 bits, offset encoded)
+#
+# Extension additions are appended at the end of a sequence, so these
+# positions do not depend on the extension bits. Both protocol versions
+# share this layout up to the end of the reference position.
+# ---------------------------------------------------------------------
+from typing import NamedTuple, Optional
+
+from cohda_driver.etsi_messages.its_pdu_header import ITS_PDU_HEADER_STRUCT
+
+CAM_PROTOCOL_VERSIONS = (1, 2)
+CAM_MESSAGE_ID = 2
+
+# Start of the CamParameters, after the ItsPduHeader and the generationDeltaTime.
+CAM_PARAMETERS_OFFSET = 8
+# Bytes holding the bits up to the end of the longitude: 3 + 1 + 8 + 31 + 32 = 75 bits.
+CAM_POSITION_SIZE = 10
+CAM_POSITION_BITS = CAM_POSITION_SIZE * 8
+
+STATION_TYPE_SHIFT = CAM_POSITION_BITS - 12
+LATITUDE_SHIFT = CAM_POSITION_BITS - 43
+LONGITUDE_SHIFT = CAM_POSITION_BITS - 75
+LATITUDE_MIN = -900000000
+LONGITUDE_MIN = -1800000000
+LATITUDE_UNAVAILABLE = 900000001
+LONGITUDE_UNAVAILABLE = 1800000001
+
+
+class CamPosition(NamedTuple):
+    station_id: int
+    station_type: int
+    # Latitude and longitude in 0.1 microdegrees, as in the CAM.
+    latitude: int
+    longitude: int
+
+    @property
+    def is_available(self) -> bool:
+        return self.latitude != LATITUDE_UNAVAILABLE and self.longitude != LONGITUDE_UNAVAILABLE
+
+
+def peek_cam_position(data: bytes) -> Optional[CamPosition]:
+    """
+    Read the stationType and the reference position of a UPER encoded CAM without decoding it.
+
+    Parameters
+    ----------
+    data : bytes
+        UPER encoded ETSI message, starting with the ItsPduHeader.
+
+    Returns
+    -------
+    Optional[CamPosition]
+        Station ID, station type and reference position, or None if the data is no CAM of
+        protocol version 1 or 2 or too short.
+    """
+    if len(data) < CAM_PARAMETERS_OFFSET + CAM_POSITION_SIZE:
+        return None
+    protocol_version, message_id, station_id = ITS_PDU_HEADER_STRUCT.unpack_from(data)
+    if protocol_version not in CAM_PROTOCOL_VERSIONS or message_id != CAM_MESSAGE_ID:
+        return None
+    bits = int.from_bytes(
+        data[CAM_PARAMETERS_OFFSET : CAM_PARAMETERS_OFFSET + CAM_POSITION_SIZE], "big"
+    )
+    return CamPosition(
+        station_id,
+        (bits >> STATION_TYPE_SHIFT) & 0xFF,
+        ((bits >> LATITUDE_SHIFT) & 0x7FFFFFFF) + LATITUDE_MIN,
+        ((bits >> LONGITUDE_SHIFT) & 0xFFFFFFFF) + LONGITUDE_MIN,
+    )
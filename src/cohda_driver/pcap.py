@@ -0,0 +1,314 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# This module implements a streaming reader for the rx.pcap/tx.pcap files
+# written by Cohda devices (Cohda_C2XLogEnableFlag) and extracts the BTP
+# payloads from the contained GeoNetworking frames.
+# ---------------------------------------------------------------------
+import gzip
+import struct
+
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, NamedTuple, Optional, Tuple, Union
+
+from cohda_driver.decoder import EtsiDecoder, EtsiMessageClasses
+from cohda_driver.etsi_message_type import EtsiMessageType
+from cohda_driver.logger import logger
+
+# Link-layer header types, see https://www.tcpdump.org/linktypes.html
+LINKTYPE_ETHERNET = 1
+LINKTYPE_IEEE802_11 = 105
+LINKTYPE_LINUX_SLL = 113
+LINKTYPE_IEEE802_11_RADIOTAP = 127
+
+ETHERTYPE_GEONETWORKING = 0x8947
+LLC_SNAP_HEADER = b"\xaa\xaa\x03\x00\x00\x00"
+
+PCAP_MAGIC_US = 0xA1B2C3D4
+PCAP_MAGIC_NS = 0xA1B23C4D
+PCAPNG_MAGIC = 0x0A0D0D0A
+
+# GeoNetworking Basic Header next header field (EN 302 636-4-1)
+GN_BASIC_NH_COMMON_HEADER = 1
+GN_BASIC_NH_SECURED_PACKET = 2
+
+# GeoNetworking Common Header next header field
+GN_COMMON_NH_BTP_A = 1
+GN_COMMON_NH_BTP_B = 2
+
+GN_BASIC_HEADER_SIZE = 4
+GN_COMMON_HEADER_SIZE = 8
+BTP_HEADER_SIZE = 4
+
+# Length of the GeoNetworking extended header per (header type, header subtype). A subtype of
+# None applies to all subtypes of the header type.
+GN_EXTENDED_HEADER_SIZES = {
+    (1, None): 24,  # Beacon
+    (2, None): 48,  # GeoUnicast
+    (3, None): 44,  # GeoAnycast
+    (4, None): 44,  # GeoBroadcast
+    (5, None): 28,  # Topologically-scoped broadcast, single hop and multi hop
+    (6, 0): 36,  # Location service request
+    (6, 1): 48,  # Location service reply
+}
+
+
+class BtpPacket(NamedTuple):
+    # Capture timestamp in seconds since the epoch.
+    timestamp: float
+    # 1 = BTP-A, 2 = BTP-B
+    btp_type: int
+    btp_destination_port: int
+    gn_traffic_class: int
+    # UPER encoded ETSI message.
+    payload: bytes
+
+
+class CohdaPcapReader:
+    """
+    Streaming reader for pcap files written by Cohda devices.
+
+    Frames are read one at a time, so the memory usage does not depend on the file size. Files
+    ending with `.gz` are decompressed on the fly.
+
+    Attributes
+    ----------
+    frame_count : int
+        Number of frames read so far.
+    btp_packet_count : int
+        Number of BTP packets extracted so far.
+    secured_packet_count : int
+        Number of skipped GeoNetworking packets with a security header.
+    skipped_frame_count : int
+        Number of skipped frames that do not carry a BTP packet.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initialize the reader.
+
+        Parameters
+        ----------
+        path : Union[str, pathlib.Path]
+            Path to the pcap file.
+        """
+        self.path = Path(path)
+        self.frame_count = 0
+        self.btp_packet_count = 0
+        self.secured_packet_count = 0
+        self.skipped_frame_count = 0
+
+    def _open(self) -> BinaryIO:
+        if self.path.suffix == ".gz":
+            return gzip.open(self.path, "rb")
+        return open(self.path, "rb")
+
+    def frames(self) -> Iterator[Tuple[float, int, bytes]]:
+        """
+        Iterate over the raw frames of the pcap file.
+
+        Returns
+        -------
+        Iterator[Tuple[float, int, bytes]]
+            Capture timestamp in seconds, link-layer header type and frame data.
+        """
+        with self._open() as file:
+            global_header = file.read(24)
+            if len(global_header) < 24:
+                raise ValueError(f"{self.path} is not a pcap file.")
+            (magic,) = struct.unpack("<I", global_header[:4])
+            if magic == PCAPNG_MAGIC:
+                raise ValueError(f"{self.path} is a pcapng file. Only pcap files are supported.")
+            for endian in "<>":
+                (magic,) = struct.unpack(f"{endian}I", global_header[:4])
+                if magic in (PCAP_MAGIC_US, PCAP_MAGIC_NS):
+                    break
+            else:
+                raise ValueError(f"{self.path} is not a pcap file.")
+            fraction = 1e-9 if magic == PCAP_MAGIC_NS else 1e-6
+            (linktype,) = struct.unpack(f"{endian}I", global_header[20:24])
+            record_header = struct.Struct(f"{endian}IIII")
+
+            while True:
+                raw_header = file.read(record_header.size)
+                if len(raw_header) < record_header.size:
+                    return
+                seconds, fraction_part, captured_length, _ = record_header.unpack(raw_header)
+                frame = file.read(captured_length)
+                if len(frame) < captured_length:
+                    logger.warning(f"Ignoring truncated frame at the end of {self.path}.")
+                    return
+                self.frame_count += 1
+                yield seconds + fraction_part * fraction, linktype, frame
+
+    def __iter__(self) -> Iterator[BtpPacket]:
+        for timestamp, linktype, frame in self.frames():
+            offset = geonetworking_offset(linktype, frame)
+            btp_packet = None
+            if offset is not None:
+                btp_packet = self._parse_geonetworking(timestamp, memoryview(frame)[offset:])
+            if btp_packet is None:
+                self.skipped_frame_count += 1
+                continue
+            self.btp_packet_count += 1
+            yield btp_packet
+
+    def _parse_geonetworking(self, timestamp: float, data: memoryview) -> Optional[BtpPacket]:
+        if len(data) < GN_BASIC_HEADER_SIZE + GN_COMMON_HEADER_SIZE:
+            return None
+        basic_next_header = data[0] & 0x0F
+        if basic_next_header == GN_BASIC_NH_SECURED_PACKET:
+            self.secured_packet_count += 1
+            return None
+        if basic_next_header != GN_BASIC_NH_COMMON_HEADER:
+            return None
+
+        common = data[GN_BASIC_HEADER_SIZE : GN_BASIC_HEADER_SIZE + GN_COMMON_HEADER_SIZE]
+        btp_type = common[0] >> 4
+        if btp_type not in (GN_COMMON_NH_BTP_A, GN_COMMON_NH_BTP_B):
+            return None
+        header_type, header_subtype = common[1] >> 4, common[1] & 0x0F
+        extended_header_size = GN_EXTENDED_HEADER_SIZES.get(
+            (header_type, None), GN_EXTENDED_HEADER_SIZES.get((header_type, header_subtype))
+        )
+        if extended_header_size is None:
+            return None
+        traffic_class = common[2]
+        (payload_length,) = struct.unpack_from(">H", common, 4)
+
+        btp_offset = GN_BASIC_HEADER_SIZE + GN_COMMON_HEADER_SIZE + extended_header_size
+        payload_end = btp_offset + payload_length
+        if payload_length < BTP_HEADER_SIZE or len(data) < payload_end:
+            return None
+        (destination_port,) = struct.unpack_from(">H", data, btp_offset)
+        return BtpPacket(
+            timestamp=timestamp,
+            btp_type=btp_type,
+            btp_destination_port=destination_port,
+            gn_traffic_class=traffic_class,
+            payload=bytes(data[btp_offset + BTP_HEADER_SIZE : payload_end]),
+        )
+
+
+def geonetworking_offset(linktype: int, frame: bytes) -> Optional[int]:
+    """
+    Get the offset of the GeoNetworking Basic Header within a captured frame.
+
+    Parameters
+    ----------
+    linktype : int
+        Link-layer header type of the pcap file.
+    frame : bytes
+        Captured frame.
+
+    Returns
+    -------
+    Optional[int]
+        Offset of the GeoNetworking Basic Header or None if the frame is not a GeoNetworking
+        frame.
+    """
+    if linktype == LINKTYPE_ETHERNET:
+        return _ethertype_offset(frame, 12)
+    if linktype == LINKTYPE_LINUX_SLL:
+        return _ethertype_offset(frame, 14)
+    if linktype == LINKTYPE_IEEE802_11_RADIOTAP:
+        if len(frame) < 4:
+            return None
+        (radiotap_length,) = struct.unpack_from("<H", frame, 2)
+        return _ieee802_11_offset(frame, radiotap_length)
+    if linktype == LINKTYPE_IEEE802_11:
+        return _ieee802_11_offset(frame, 0)
+    return None
+
+
+def _ethertype_offset(frame: bytes, offset: int) -> Optional[int]:
+    if len(frame) < offset + 2:
+        return None
+    (ethertype,) = struct.unpack_from(">H", frame, offset)
+    if ethertype != ETHERTYPE_GEONETWORKING:
+        return None
+    return offset + 2
+
+
+def _ieee802_11_offset(frame: bytes, offset: int) -> Optional[int]:
+    if len(frame) < offset + 24:
+        return None
+    frame_control, flags = frame[offset], frame[offset + 1]
+    if (frame_control >> 2) & 0x03 != 2:
+        # Not a data frame.
+        return None
+    header_length = 24
+    if flags & 0x03 == 0x03:
+        # ToDS and FromDS, i.e. a fourth address field is present.
+        header_length += 6
+    if frame_control & 0x80:
+        # QoS data frame with QoS control field and optional HT control field.
+        header_length += 2
+        if flags & 0x80:
+            header_length += 4
+    llc_offset = offset + header_length
+    if frame[llc_offset : llc_offset + len(LLC_SNAP_HEADER)] != LLC_SNAP_HEADER:
+        return None
+    return _ethertype_offset(frame, llc_offset + len(LLC_SNAP_HEADER))
+
+
+def decode_pcap(
+    path: Union[str, Path],
+    decoder: Optional[EtsiDecoder] = None,
+    message_types: Optional[Iterable[EtsiMessageType]] = None,
+) -> Iterator[Tuple[float, EtsiMessageClasses]]:
+    """
+    Decode the ETSI messages in a pcap file written by a Cohda device.
+
+    The messages run through the same ItsPduHeader dispatch and ETSI message classes as live
+    traffic received by the driver.
+
+    Parameters
+    ----------
+    path : Union[str, pathlib.Path]
+        Path to the pcap file.
+    decoder : Optional[EtsiDecoder]
+        Decoder to use. A new decoder is created if None.
+    message_types : Optional[Iterable[EtsiMessageType]]
+        ETSI message types to decode. Other messages are skipped before the full decode. All
+        supported types are decoded if None.
+
+    Returns
+    -------
+    Iterator[Tuple[float, EtsiMessageClasses]]
+        Capture timestamp in seconds and the decoded ETSI message.
+    """
+    if decoder is None:
+        decoder = EtsiDecoder()
+    if message_types is not None:
+        message_types = set(message_types)
+
+    reader = CohdaPcapReader(path)
+    decode_error_count = 0
+    for btp_packet in reader:
+        try:
+            its_pdu_header = decoder.decode_header(btp_packet.payload)
+            message_type = EtsiMessageType(its_pdu_header.message_id)
+            if message_types is not None and message_type not in message_types:
+                continue
+            if not decoder.is_decodable(message_type, its_pdu_header.protocol_version):
+                continue
+            etsi_msg = decoder.decode_message(
+                message_type, btp_packet.payload, protocol_version=its_pdu_header.protocol_version
+            )
+        except Exception as e:
+            decode_error_count += 1
+            logger.debug("Error decoding packet at %s: %s", btp_packet.timestamp, e)
+            continue
+        yield btp_packet.timestamp, etsi_msg
+
+    logger.info(
+        f"Read {reader.frame_count} frames from {path}: {reader.btp_packet_count} BTP packets, "
+        f"{reader.secured_packet_count} secured packets skipped, "
+        f"{decode_error_count} decode errors."
+    )
@@ -0,0 +1,223 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# This module implements recording and replaying of raw Cohda UDP traffic.
+# ---------------------------------------------------------------------
+import socket
+import time
+
+from pathlib import Path
+from typing import BinaryIO, Iterator, NamedTuple, Optional, Tuple, Union
+
+import dataclasses_struct as ds
+
+from typing_extensions import Annotated
+
+from cohda_driver.logger import logger
+
+RECORDING_MAGIC = b"CDRL"
+RECORDING_VERSION = 1
+
+
+@ds.dataclass(endian=ds.BIG_ENDIAN)
+class RecordingFileHeader:
+    magic: Annotated[bytes, 4] = RECORDING_MAGIC
+    version: ds.U16 = RECORDING_VERSION
+    reserved_0: ds.U16 = 0
+
+
+@ds.dataclass(endian=ds.BIG_ENDIAN)
+class RecordHeader:
+    # Monotonic receive timestamp in nanoseconds.
+    timestamp_ns: ds.U64 = 0
+
+    # Length of the raw datagram in bytes.
+    length: ds.U32 = 0
+
+
+RECORDING_FILE_HEADER_SIZE = ds.get_struct_size(RecordingFileHeader)
+RECORD_HEADER_SIZE = ds.get_struct_size(RecordHeader)
+
+
+class RecordedPacket(NamedTuple):
+    timestamp_ns: int
+    data: bytes
+
+
+class PacketRecorder:
+    """
+    Append raw datagrams received from a Cohda device to a binary log.
+
+    Every record consists of a RecordHeader followed by the unmodified datagram, i.e. including
+    the CommonHeader and BtpDataIndication.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initialize the recorder.
+
+        Parameters
+        ----------
+        path : Union[str, pathlib.Path]
+            Path to the recording. If the file exists, records are appended to it.
+        """
+        self.path = Path(path)
+        is_new = not self.path.exists() or self.path.stat().st_size == 0
+        if not is_new:
+            _check_file_header(self.path)
+        self._file: Optional[BinaryIO] = open(self.path, "ab")
+        if is_new:
+            self._file.write(RecordingFileHeader().pack())
+        self.packet_count = 0
+
+    def write(self, packet: bytes, timestamp_ns: Optional[int] = None):
+        """
+        Append a datagram to the recording.
+
+        Parameters
+        ----------
+        packet : bytes
+            Raw datagram as received from the Cohda device.
+        timestamp_ns : Optional[int]
+            Monotonic receive timestamp in nanoseconds. Defaults to `time.monotonic_ns()`.
+        """
+        if timestamp_ns is None:
+            timestamp_ns = time.monotonic_ns()
+        self._file.write(RecordHeader(timestamp_ns=timestamp_ns, length=len(packet)).pack())
+        self._file.write(packet)
+        self.packet_count += 1
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            logger.info(f"Recorded {self.packet_count} packets to {self.path}.")
+
+    def __enter__(self) -> "PacketRecorder":
+        return self
+
+    def __exit__(self, *_exc_info):
+        self.close()
+
+
+def _check_file_header(path: Path):
+    with open(path, "rb") as file:
+        _read_file_header(file, path)
+
+
+def _read_file_header(file: BinaryIO, path: Path):
+    header = RecordingFileHeader.from_packed(file.read(RECORDING_FILE_HEADER_SIZE))
+    if header.magic != RECORDING_MAGIC or header.version != RECORDING_VERSION:
+        raise ValueError(f"{path} is not a Cohda packet recording (version {RECORDING_VERSION}).")
+
+
+def read_recording(path: Union[str, Path]) -> Iterator[RecordedPacket]:
+    """
+    Iterate over the packets of a recording.
+
+    Parameters
+    ----------
+    path : Union[str, pathlib.Path]
+        Path to the recording.
+
+    Returns
+    -------
+    Iterator[RecordedPacket]
+        Recorded packets in the order they were received. A truncated last record, e.g. from a
+        recorder that was killed, is ignored.
+    """
+    path = Path(path)
+    with open(path, "rb") as file:
+        _read_file_header(file, path)
+        while True:
+            raw_header = file.read(RECORD_HEADER_SIZE)
+            if len(raw_header) < RECORD_HEADER_SIZE:
+                return
+            header = RecordHeader.from_packed(raw_header)
+            data = file.read(header.length)
+            if len(data) < header.length:
+                logger.warning(f"Ignoring truncated record at the end of {path}.")
+                return
+            yield RecordedPacket(header.timestamp_ns, data)
+
+
+class PacketReplayer:
+    """
+    Replay a recording into a CohdaDriver, either in-process or over a local UDP socket.
+    """
+
+    def __init__(self, path: Union[str, Path], speed: Optional[float] = 1.0):
+        """
+        Initialize the replayer.
+
+        Parameters
+        ----------
+        path : Union[str, pathlib.Path]
+            Path to the recording.
+        speed : Optional[float]
+            Replay speed relative to the recorded timing, e.g. 1.0 for real time and 10.0 for
+            ten times faster. None or 0 replays the packets as fast as possible.
+        """
+        if speed is not None and speed < 0:
+            raise ValueError("Replay speed must not be negative.")
+        self.path = Path(path)
+        self.speed = speed or None
+
+    def replay_to_driver(self, driver) -> int:
+        """
+        Inject the recorded packets into a driver without using a socket.
+
+        Parameters
+        ----------
+        driver : cohda_driver.driver.CohdaDriver
+            Driver whose `process_packet` method is called for every recorded packet.
+
+        Returns
+        -------
+        int
+            Number of replayed packets.
+        """
+        return self._replay(driver.process_packet)
+
+    def replay_to_socket(self, address: Tuple[str, int]) -> int:
+        """
+        Send the recorded packets to a UDP address, e.g. the indication port of a driver.
+
+        Parameters
+        ----------
+        address : Tuple[str, int]
+            Destination IP address and port.
+
+        Returns
+        -------
+        int
+            Number of replayed packets.
+        """
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            return self._replay(lambda packet: sock.sendto(packet, address))
+
+    def _replay(self, send) -> int:
+        logger.info(f"Replaying {self.path} at {f'{self.speed}x' if self.speed else 'max'} speed.")
+        count = 0
+        first_timestamp_ns = None
+        start = time.perf_counter()
+        for timestamp_ns, data in read_recording(self.path):
+            if self.speed is not None:
+                if first_timestamp_ns is None:
+                    first_timestamp_ns = timestamp_ns
+                delay = (timestamp_ns - first_timestamp_ns) / 1e9 / self.speed
+                remaining = start + delay - time.perf_counter()
+                if remaining > 0:
+                    time.sleep(remaining)
+            send(data)
+            count += 1
+        logger.info(f"Replayed {count} packets in {time.perf_counter() - start:.3f} s.")
+        return count
@@ -0,0 +1,427 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# This module implements the re-publishing of decoded CAMs and CPM
+# perceived objects as compact fixed-size binary records over local UDP
+# or TCP connections, for consumers that are not written in Python.
+#
+# Wire format, all integers little-endian and without padding:
+#
+# Frame:  magic "CDRP", schema version (u16), record count (u16),
+#         frame sequence number (u32), send timestamp in ns (i64),
+#         followed by the records. Over TCP, every frame is prefixed by
+#         its size in bytes (u32).
+# Record: record type (u8), record size in bytes (u8), followed by the
+#         fields of CAM_RECORD_STRUCT or CPM_OBJECT_RECORD_STRUCT.
+#
+# New fields are only ever appended to a record, so consumers can skip
+# unknown trailing bytes using the record size. Integer fields outside
+# the range of their type are saturated.
+# ---------------------------------------------------------------------
+import errno
+import select
+import socket
+import struct
+import threading
+import time
+
+from collections import deque
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+from cohda_driver.decoder import EtsiMessageClasses
+from cohda_driver.etsi_messages import CAM
+from cohda_driver.etsi_messages import CPM
+from cohda_driver.logger import logger
+
+SCHEMA_VERSION = 1
+FRAME_MAGIC = b"CDRP"
+FRAME_HEADER_STRUCT = struct.Struct("<4sHHIq")
+TCP_PREFIX_STRUCT = struct.Struct("<I")
+RECORD_HEADER_STRUCT = struct.Struct("<BB")
+
+RECORD_TYPE_CAM = 1
+RECORD_TYPE_CPM_OBJECT = 2
+
+# timestamp_ns, station_id, generation_delta_time, station_type, drive_direction, latitude,
+# longitude, altitude, heading, speed, longitudinal_acceleration, curvature, yaw_rate,
+# vehicle_length, vehicle_width, all in the units of the ETSI message classes.
+CAM_RECORD_STRUCT = struct.Struct("<qIHBBiiiHHhhhHB")
+
+# timestamp_ns, station_id, generation_delta_time, object_id, classification_type,
+# classification_confidence, reference_latitude, reference_longitude, time_of_measurement,
+# x_distance, y_distance, x_speed, y_speed, dimension_planar_1, dimension_planar_2
+CPM_OBJECT_RECORD_STRUCT = struct.Struct("<qIHHBBddddddddd")
+
+RECORD_STRUCTS = {
+    RECORD_TYPE_CAM: CAM_RECORD_STRUCT,
+    RECORD_TYPE_CPM_OBJECT: CPM_OBJECT_RECORD_STRUCT,
+}
+
+
+def _field_ranges(record_struct: struct.Struct) -> List[Optional[Tuple[int, int]]]:
+    """
+    Minimum and maximum of every integer field of a record, None for the other fields.
+    """
+    ranges = []
+    for code in record_struct.format.lstrip("<"):
+        bits = struct.calcsize("<" + code) * 8
+        if code in "bhiq":
+            ranges.append((-(1 << (bits - 1)), (1 << (bits - 1)) - 1))
+        elif code in "BHIQ":
+            ranges.append((0, (1 << bits) - 1))
+        else:
+            ranges.append(None)
+    return ranges
+
+
+RECORD_FIELD_RANGES: Dict[int, List[Optional[Tuple[int, int]]]] = {
+    record_type: _field_ranges(record_struct)
+    for record_type, record_struct in RECORD_STRUCTS.items()
+}
+
+# Frames sent over UDP stay below this size.
+MAX_DATAGRAM_SIZE = 8192
+
+# Seconds between connection attempts to an unreachable TCP endpoint.
+RECONNECT_INTERVAL = 1.0
+
+
+def _pack_record(record_type: int, *values) -> bytes:
+    """
+    Pack a record including its record header, saturating the integer fields.
+    """
+    record_struct = RECORD_STRUCTS[record_type]
+    fields = [
+        float(value) if bounds is None else min(max(int(value), bounds[0]), bounds[1])
+        for value, bounds in zip(values, RECORD_FIELD_RANGES[record_type])
+    ]
+    return RECORD_HEADER_STRUCT.pack(record_type, record_struct.size) + record_struct.pack(*fields)
+
+
+def _classification_type(value) -> int:
+    # The type of the object class CHOICE is an integer for vehicles. Other alternatives and
+    # missing classifications are recorded as 0, unknown.
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def encode_records(
+    etsi_msg: EtsiMessageClasses, timestamp_ns: Optional[int] = None
+) -> List[bytes]:
+    """
+    Encode a decoded message as binary records, one per CAM and one per CPM perceived object.
+
+    Parameters
+    ----------
+    etsi_msg : EtsiMessageClasses
+        Decoded ETSI message. Other types than CAM and CPM yield no records.
+    timestamp_ns : Optional[int]
+        Receive timestamp in nanoseconds since the epoch. Defaults to `time.time_ns()`.
+
+    Returns
+    -------
+    List[bytes]
+        Records including their record header.
+    """
+    if timestamp_ns is None:
+        timestamp_ns = time.time_ns()
+    if isinstance(etsi_msg, CAM):
+        basic_container = etsi_msg.cam.cam_parameters.basic_container
+        reference_position = basic_container.reference_position
+        high_frequency = (
+            etsi_msg.cam.cam_parameters.high_frequency_container
+        ).basic_vehicle_container_high_frequency
+        return [
+            _pack_record(
+                RECORD_TYPE_CAM,
+                timestamp_ns,
+                etsi_msg.header.station_id,
+                etsi_msg.cam.generation_delta_time,
+                basic_container.station_type,
+                high_frequency.drive_direction,
+                reference_position.latitude,
+                reference_position.longitude,
+                reference_position.altitude.altitude_value,
+                high_frequency.heading.heading_value,
+                high_frequency.speed.speed_value,
+                high_frequency.longitudinal_acceleration.longitudinal_acceleration_value,
+                high_frequency.curvature.curvature_value,
+                high_frequency.yaw_rate.yaw_rate_value,
+                high_frequency.vehicle_length.vehicle_length_value,
+                high_frequency.vehicle_width,
+            )
+        ]
+    if isinstance(etsi_msg, CPM):
+        reference_position = etsi_msg.cpmParameters.managementContainer.referencePosition
+        return [
+            _pack_record(
+                RECORD_TYPE_CPM_OBJECT,
+                timestamp_ns,
+                etsi_msg.header.station_id,
+                etsi_msg.generationDeltaTime,
+                perceived_object.objectId,
+                _classification_type(perceived_object.classification.classificationType),
+                perceived_object.classification.confidence,
+                reference_position.latitude,
+                reference_position.longitude,
+                perceived_object.time_of_measurement,
+                perceived_object.xDistance.value,
+                perceived_object.yDistance.value,
+                perceived_object.xSpeed.value,
+                perceived_object.ySpeed.value,
+                perceived_object.dimensionPlanar1.value,
+                perceived_object.dimensionPlanar2.value,
+            )
+            for perceived_object in etsi_msg.cpmParameters.cpmPerceivedObjectContainer
+        ]
+    return []
+
+
+def decode_frame(frame: bytes) -> Iterator[Tuple[int, tuple]]:
+    """
+    Decode a frame, e.g. for testing consumers.
+
+    Parameters
+    ----------
+    frame : bytes
+        Frame without the TCP size prefix.
+
+    Returns
+    -------
+    Iterator[Tuple[int, tuple]]
+        Record type and the fields of every known record.
+    """
+    magic, _, record_count, _, _ = FRAME_HEADER_STRUCT.unpack_from(frame)
+    if magic != FRAME_MAGIC:
+        raise ValueError("Not a re-published frame.")
+    offset = FRAME_HEADER_STRUCT.size
+    for _ in range(record_count):
+        record_type, record_size = RECORD_HEADER_STRUCT.unpack_from(frame, offset)
+        offset += RECORD_HEADER_STRUCT.size
+        record_struct = RECORD_STRUCTS.get(record_type)
+        if record_struct is not None:
+            yield record_type, record_struct.unpack_from(frame, offset)
+        offset += record_size
+
+
+class _Endpoint:
+    def __init__(self, protocol: str, host: str, port: int, max_pending_frames: int):
+        self.protocol = protocol
+        self.address = (host, port)
+        self.dropped_frames = 0
+        self._pending: Deque[bytes] = deque()
+        self._max_pending_frames = max_pending_frames
+        self._sock: Optional[socket.socket] = None
+        self._unsent = b""
+        self._next_connect = 0.0
+        self._connecting = False
+        if protocol == "udp":
+            self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self._sock.setblocking(False)
+        else:
+            # Resolved once, so that the sender thread never blocks on name resolution.
+            self._family, _, _, _, self._sockaddr = socket.getaddrinfo(
+                host, port, type=socket.SOCK_STREAM
+            )[0]
+
+    def _connect(self):
+        """
+        Start a non-blocking connection attempt, at most once per RECONNECT_INTERVAL.
+        """
+        now = time.monotonic()
+        if now < self._next_connect:
+            return
+        self._next_connect = now + RECONNECT_INTERVAL
+        sock = socket.socket(self._family, socket.SOCK_STREAM)
+        sock.setblocking(False)
+        error = sock.connect_ex(self._sockaddr)
+        if error not in (0, errno.EINPROGRESS, errno.EWOULDBLOCK):
+            logger.debug(f"Cannot connect to {self.address}: {errno.errorcode.get(error, error)}")
+            sock.close()
+            return
+        self._sock = sock
+        self._connecting = True
+
+    def _connected(self) -> bool:
+        """
+        Whether the pending connection attempt has completed, without waiting for it. Attempts
+        that did not complete within RECONNECT_INTERVAL are abandoned.
+        """
+        _, writable, _ = select.select([], [self._sock], [], 0)
+        if writable:
+            error = self._sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+        elif time.monotonic() < self._next_connect:
+            return False
+        else:
+            error = errno.ETIMEDOUT
+        if error:
+            logger.debug(f"Cannot connect to {self.address}: {errno.errorcode.get(error, error)}")
+            self.close()
+            return False
+        self._connecting = False
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        logger.info(f"Re-publishing to tcp://{self.address[0]}:{self.address[1]}.")
+        return True
+
+    def send(self, frame: bytes):
+        if self.protocol == "udp":
+            try:
+                self._sock.sendto(frame, self.address)
+            except OSError:
+                # Socket buffer full or no receiver. Datagrams are dropped, not queued.
+                self.dropped_frames += 1
+            return
+
+        # TCP: frames are queued per endpoint, and the oldest ones are dropped while the
+        # consumer does not keep up.
+        self._pending.append(TCP_PREFIX_STRUCT.pack(len(frame)) + frame)
+        while len(self._pending) > self._max_pending_frames:
+            self._pending.popleft()
+            self.dropped_frames += 1
+
+    def drain(self):
+        """
+        Send as many queued TCP frames as possible without blocking.
+        """
+        if self.protocol == "udp" or not (self._unsent or self._pending):
+            return
+        if self._sock is None:
+            self._connect()
+            if self._sock is None:
+                return
+        if self._connecting and not self._connected():
+            return
+        try:
+            while self._unsent or self._pending:
+                if not self._unsent:
+                    self._unsent = self._pending.popleft()
+                sent = self._sock.send(self._unsent)
+                self._unsent = self._unsent[sent:]
+        except BlockingIOError:
+            pass
+        except OSError as e:
+            logger.warning(f"Connection to {self.address} lost: {e}")
+            self._sock.close()
+            self._sock = None
+            # A partially sent frame cannot be completed on a new connection.
+            self._unsent = b""
+
+    def close(self):
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+        self._connecting = False
+
+
+class BinaryRepublisher:
+    """
+    Re-publish decoded CAMs and CPM perceived objects as binary records.
+
+    Messages are encoded when they are added, usually from a driver callback, and sent as one
+    batch per tick from a background thread. The queue of encoded records is bounded; when the
+    sender falls behind, the oldest records are dropped.
+    """
+
+    def __init__(
+        self,
+        endpoints: List[Tuple[str, str, int]],
+        tick: float = 0.02,
+        max_pending_records: int = 65536,
+        max_pending_frames: int = 256,
+    ):
+        """
+        Initialize the re-publisher and start its sender thread.
+
+        Parameters
+        ----------
+        endpoints : List[Tuple[str, str, int]]
+            Protocol ("udp" or "tcp"), host and port of every consumer.
+        tick : float
+            Interval between batches in seconds.
+        max_pending_records : int
+            Maximum number of encoded records waiting for the next batch.
+        max_pending_frames : int
+            Maximum number of frames queued per TCP endpoint.
+        """
+        for protocol, _, _ in endpoints:
+            if protocol not in ("udp", "tcp"):
+                raise ValueError(f"Unsupported protocol '{protocol}'.")
+        self.tick = tick
+        self.dropped_records = 0
+        self._endpoints = [
+            _Endpoint(protocol, host, port, max_pending_frames)
+            for protocol, host, port in endpoints
+        ]
+        self._records: Deque[bytes] = deque(maxlen=max_pending_records)
+        self._sequence = 0
+        self._is_running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def add(self, etsi_msg: EtsiMessageClasses, timestamp_ns: Optional[int] = None):
+        """
+        Add a decoded message to the next batch. Can be used as a driver callback directly.
+        """
+        records = self._records
+        for record in encode_records(etsi_msg, timestamp_ns):
+            if len(records) == records.maxlen:
+                self.dropped_records += 1
+            records.append(record)
+
+    @property
+    def dropped_frames(self) -> int:
+        return sum(endpoint.dropped_frames for endpoint in self._endpoints)
+
+    def _frames(self, records: List[bytes]) -> Iterator[bytes]:
+        start = 0
+        while start < len(records):
+            size = FRAME_HEADER_STRUCT.size
+            end = start
+            while end < len(records) and end - start < 0xFFFF:
+                if size + len(records[end]) > MAX_DATAGRAM_SIZE and end > start:
+                    break
+                size += len(records[end])
+                end += 1
+            header = FRAME_HEADER_STRUCT.pack(
+                FRAME_MAGIC, SCHEMA_VERSION, end - start, self._sequence, time.time_ns()
+            )
+            self._sequence = (self._sequence + 1) & 0xFFFFFFFF
+            yield header + b"".join(records[start:end])
+            start = end
+
+    def _send_batch(self):
+        records = []
+        while self._records:
+            records.append(self._records.popleft())
+        for frame in self._frames(records):
+            for endpoint in self._endpoints:
+                endpoint.send(frame)
+        for endpoint in self._endpoints:
+            endpoint.drain()
+
+    def _run(self):
+        next_tick = time.monotonic()
+        while self._is_running:
+            next_tick += self.tick
+            self._send_batch()
+            time.sleep(max(0.0, next_tick - time.monotonic()))
+
+    def close(self):
+        self._is_running = False
+        self._thread.join()
+        self._send_batch()
+        for endpoint in self._endpoints:
+            endpoint.close()
+
+    def __enter__(self) -> "BinaryRepublisher":
+        return self
+
+    def __exit__(self, *_exc_info):
+        self.close()
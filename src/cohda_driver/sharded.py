@@ -0,0 +1,263 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# This module implements a launcher running CohdaDriver receive loops in
+# several worker processes that share the indication port with
+# SO_REUSEPORT.
+#
+# All datagrams of a Cohda device have the same source address, so the
+# default SO_REUSEPORT hash would send all of them to one worker. On
+# Linux, a classic BPF program is attached that selects the worker by the
+# stationID of the ItsPduHeader instead. This spreads the load and keeps
+# the messages of every station in order on one worker.
+# ---------------------------------------------------------------------
+import ctypes
+import multiprocessing
+import socket
+import struct
+import threading
+
+from multiprocessing.connection import Connection
+from typing import Callable, Dict, List, Optional, Tuple
+
+from cohda_driver.decoder import EtsiMessageClasses
+from cohda_driver.driver import CohdaDriver
+from cohda_driver.etsi_message_type import EtsiMessageType
+from cohda_driver.logger import logger
+from cohda_driver.metrics import MetricsServer, merge_snapshots
+
+# See linux/filter.h and asm-generic/socket.h. Python does not export these constants.
+SO_ATTACH_REUSEPORT_CBPF = 51
+BPF_LD_W_ABS = 0x20
+BPF_ALU_MOD_K = 0x94
+BPF_RET_A = 0x16
+SOCK_FILTER_STRUCT = struct.Struct("@HBBI")
+SOCK_FPROG_STRUCT = struct.Struct("@HP")
+
+# The BPF program of a reuseport group sees the UDP payload, i.e. the raw Cohda datagram.
+STATION_ID_OFFSET = CohdaDriver.HEADER_SIZE + 2
+
+# Seconds to wait for a worker to stop before it is terminated.
+STOP_TIMEOUT = 10.0
+
+
+def station_sharding_filter(workers: int) -> List[Tuple[int, int, int, int]]:
+    """
+    Classic BPF program returning the index of the socket of a reuseport group that receives a
+    datagram, the stationID of its ItsPduHeader modulo the number of sockets.
+
+    Parameters
+    ----------
+    workers : int
+        Number of sockets in the group.
+
+    Returns
+    -------
+    List[Tuple[int, int, int, int]]
+        Instructions as code, jump if true, jump if false and constant, see struct sock_filter.
+    """
+    return [
+        # A = the big-endian stationID.
+        (BPF_LD_W_ABS, 0, 0, STATION_ID_OFFSET),
+        (BPF_ALU_MOD_K, 0, 0, workers),
+        (BPF_RET_A, 0, 0, 0),
+    ]
+
+
+def attach_station_sharding(sock: socket.socket, workers: int) -> bool:
+    """
+    Select the socket of a reuseport group by the stationID of the datagrams.
+
+    Parameters
+    ----------
+    sock : socket.socket
+        Any socket of the reuseport group.
+    workers : int
+        Number of sockets in the group.
+
+    Returns
+    -------
+    bool
+        True if the program was attached. Datagrams are distributed by the default hash of
+        their addresses otherwise.
+    """
+    instructions = station_sharding_filter(workers)
+    program = ctypes.create_string_buffer(
+        b"".join(SOCK_FILTER_STRUCT.pack(*instruction) for instruction in instructions)
+    )
+    fprog = SOCK_FPROG_STRUCT.pack(len(instructions), ctypes.addressof(program))
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, SO_ATTACH_REUSEPORT_CBPF, fprog)
+    except OSError as e:
+        logger.warning(f"Cannot shard by stationID, falling back to the address hash: {e}")
+        return False
+    return True
+
+
+def _worker_main(
+    worker_index: int,
+    workers: int,
+    endpoint: Tuple[str, str, int, int],
+    driver_options: Dict,
+    subscriptions: List[Tuple[Callable[[EtsiMessageClasses], None], EtsiMessageType]],
+    connection: Connection,
+):
+    driver = CohdaDriver(*endpoint, reuse_port=True, **driver_options)
+    attach_station_sharding(driver.sock, workers)
+    for callback, etsi_msg_type in subscriptions:
+        driver.subscribe(etsi_msg_type, callback)
+    driver.start_loop()
+    logger.info(f"Worker {worker_index} started.")
+    connection.send("ready")
+    try:
+        while True:
+            command = connection.recv()
+            if command == "stats":
+                connection.send(driver.stats())
+            elif command == "stop":
+                break
+    except (EOFError, KeyboardInterrupt):
+        pass
+    driver.stop_loop()
+    connection.close()
+
+
+class ShardedDriver:
+    """
+    Launcher of several worker processes, each running a CohdaDriver on the same indication
+    port.
+
+    Callbacks are set up once before starting and run in every worker process, so they must be
+    picklable, e.g. module-level functions, and must not rely on state of the launching
+    process.
+    """
+
+    def __init__(
+        self,
+        host_ip: str,
+        cohda_ip: str,
+        cohda_ind_port: int,
+        cohda_req_port: int,
+        workers: Optional[int] = None,
+        start_method: Optional[str] = None,
+        **driver_options,
+    ):
+        """
+        Initialize the launcher.
+
+        Parameters
+        ----------
+        host_ip, cohda_ip, cohda_ind_port, cohda_req_port
+            See CohdaDriver.
+        workers : Optional[int]
+            Number of worker processes. Defaults to the number of CPUs.
+        start_method : Optional[str]
+            multiprocessing start method of the workers, e.g. "spawn". Defaults to the platform
+            default.
+        **driver_options
+            Further arguments of every worker's CohdaDriver, e.g. enable_metrics.
+        """
+        self.workers = workers or multiprocessing.cpu_count()
+        self._endpoint = (host_ip, cohda_ip, cohda_ind_port, cohda_req_port)
+        self._driver_options = driver_options
+        self._context = multiprocessing.get_context(start_method)
+        self._subscriptions: List[Tuple[Callable, EtsiMessageType]] = []
+        self._processes: List[multiprocessing.Process] = []
+        self._connections: List[Connection] = []
+        self._metrics_server: Optional[MetricsServer] = None
+        # The HTTP server may request stats from several threads at once.
+        self._stats_lock = threading.Lock()
+
+    def setup_callback(
+        self,
+        callback: Callable[[EtsiMessageClasses], None],
+        etsi_msg_type: EtsiMessageType,
+    ):
+        """
+        Add a callback for the given etsi_msg_type to all workers, see CohdaDriver.
+
+        Must be called before `start_loop`.
+        """
+        if self._processes:
+            raise RuntimeError("Callbacks must be set up before starting the workers.")
+        logger.info(f"Adding callback for '{etsi_msg_type}' to all workers.")
+        self._subscriptions.append((callback, etsi_msg_type))
+
+    def start_loop(self):
+        """
+        Start the worker processes and wait until all of them receive packets.
+        """
+        logger.info(f"Starting {self.workers} workers on port {self._endpoint[2]}.")
+        for worker_index in range(self.workers):
+            connection, worker_connection = self._context.Pipe()
+            process = self._context.Process(
+                target=_worker_main,
+                args=(
+                    worker_index,
+                    self.workers,
+                    self._endpoint,
+                    self._driver_options,
+                    self._subscriptions,
+                    worker_connection,
+                ),
+                daemon=True,
+            )
+            process.start()
+            self._processes.append(process)
+            self._connections.append(connection)
+        try:
+            for connection in self._connections:
+                connection.recv()
+        except EOFError:
+            self.stop_loop()
+            raise RuntimeError("A worker failed to start, see its log.") from None
+
+    def stop_loop(self):
+        """
+        Stop the worker processes.
+        """
+        logger.info("Stopping workers.")
+        if self._metrics_server is not None:
+            self._metrics_server.close()
+            self._metrics_server = None
+        for connection in self._connections:
+            try:
+                connection.send("stop")
+            except OSError:
+                pass
+        for process in self._processes:
+            process.join(STOP_TIMEOUT)
+            if process.is_alive():
+                logger.warning(f"Terminating worker {process.pid}.")
+                process.terminate()
+        for connection in self._connections:
+            connection.close()
+        self._processes = []
+        self._connections = []
+
+    def stats(self) -> Dict:
+        """
+        Get the merged metrics snapshot of all workers, see CohdaDriver.stats.
+        """
+        snapshots = []
+        with self._stats_lock:
+            for connection in self._connections:
+                try:
+                    connection.send("stats")
+                    snapshots.append(connection.recv())
+                except (EOFError, OSError):
+                    logger.warning("A worker did not respond to the stats request.")
+        return merge_snapshots(snapshots)
+
+    def serve_metrics(self, port: int, host: str = "127.0.0.1") -> MetricsServer:
+        """
+        Serve the merged metrics of all workers over HTTP, see CohdaDriver.serve_metrics.
+        """
+        if self._metrics_server is None:
+            self._metrics_server = MetricsServer(self.stats, port, host)
+        return self._metrics_server
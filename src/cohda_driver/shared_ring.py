@@ -0,0 +1,333 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# This module implements a single-producer, multi-consumer ring buffer of
+# raw ETSI messages in shared memory, so several local processes can read
+# the received stream without binding their own driver.
+#
+# Layout: a ring header followed by fixed-size slots. Every slot holds a
+# slot header (sequence number and ItsPduHeader metadata) and the UPER
+# encoded payload. The writer invalidates the sequence number of a slot
+# before overwriting it and publishes the new sequence number last, so
+# readers detect slots that were overwritten while they read them.
+# ---------------------------------------------------------------------
+import struct
+import time
+
+from multiprocessing import resource_tracker, shared_memory
+from typing import Iterator, List, NamedTuple, Optional
+
+from cohda_driver.decoder import EtsiDecoder, EtsiMessageClasses
+from cohda_driver.etsi_messages import ItsPduHeader
+from cohda_driver.logger import WarningAggregator, logger
+
+RING_MAGIC = b"CDSR"
+RING_VERSION = 1
+# magic, version, reserved, slot_count, slot_size, next sequence number
+RING_HEADER_STRUCT = struct.Struct("<4sHHIIQ")
+WRITE_SEQUENCE_STRUCT = struct.Struct("<Q")
+WRITE_SEQUENCE_OFFSET = RING_HEADER_STRUCT.size - WRITE_SEQUENCE_STRUCT.size
+# sequence number, timestamp_ns, station_id, message_type, protocol_version, length
+SLOT_HEADER_STRUCT = struct.Struct("<QQIBBH")
+SLOT_SEQUENCE_STRUCT = struct.Struct("<Q")
+# Sequence number of a slot that is being written.
+SLOT_INVALID = 0xFFFFFFFFFFFFFFFF
+
+
+class SharedRecord(NamedTuple):
+    sequence: int
+    # Receive timestamp in nanoseconds since the epoch.
+    timestamp_ns: int
+    station_id: int
+    message_type: int
+    protocol_version: int
+    # UPER encoded ETSI message. This is a view into the shared memory, which the writer may
+    # overwrite at any time, see `SharedRingReader.payload`.
+    payload: memoryview
+
+
+class SharedRingWriter:
+    """
+    Publish raw ETSI messages into a shared memory ring buffer.
+
+    There must be only one writer per ring buffer. Readers never block the writer: when they
+    fall behind by more than the number of slots, they lose the oldest messages.
+    """
+
+    def __init__(self, name: Optional[str] = None, slot_count: int = 1024, slot_size: int = 4096):
+        """
+        Create the shared memory block.
+
+        Parameters
+        ----------
+        name : Optional[str]
+            Name of the shared memory block. A unique name is generated if None.
+        slot_count : int
+            Number of messages kept in the ring buffer.
+        slot_size : int
+            Size of a slot in bytes, including its header. Larger messages are dropped.
+        """
+        if slot_size <= SLOT_HEADER_STRUCT.size:
+            raise ValueError(f"slot_size must be larger than {SLOT_HEADER_STRUCT.size}.")
+        self.slot_count = slot_count
+        self.slot_size = slot_size
+        self.max_payload_size = slot_size - SLOT_HEADER_STRUCT.size
+        self.oversize_drops = 0
+        # Oversize messages can repeat for every packet, e.g. for all MAPEMs of an intersection.
+        self._warnings = WarningAggregator(logger)
+        self._shm = shared_memory.SharedMemory(
+            name=name, create=True, size=RING_HEADER_STRUCT.size + slot_count * slot_size
+        )
+        self.name = self._shm.name
+        self._buffer = self._shm.buf
+        self._sequence = 0
+        for slot in range(slot_count):
+            SLOT_SEQUENCE_STRUCT.pack_into(self._buffer, self._slot_offset(slot), SLOT_INVALID)
+        RING_HEADER_STRUCT.pack_into(
+            self._buffer, 0, RING_MAGIC, RING_VERSION, 0, slot_count, slot_size, 0
+        )
+        logger.debug(f"Created shared memory ring buffer '{self.name}' with {slot_count} slots.")
+
+    def _slot_offset(self, slot: int) -> int:
+        return RING_HEADER_STRUCT.size + slot * self.slot_size
+
+    def write(
+        self,
+        payload: bytes,
+        its_pdu_header: Optional[ItsPduHeader] = None,
+        timestamp_ns: Optional[int] = None,
+    ):
+        """
+        Publish a message.
+
+        Parameters
+        ----------
+        payload : bytes
+            UPER encoded ETSI message, starting with the ItsPduHeader.
+        its_pdu_header : Optional[ItsPduHeader]
+            Header of the message. It is read from the payload if None.
+        timestamp_ns : Optional[int]
+            Receive timestamp in nanoseconds since the epoch. Defaults to `time.time_ns()`.
+        """
+        length = len(payload)
+        if length > self.max_payload_size:
+            self.oversize_drops += 1
+            self._warnings.warning(
+                ("oversize",), "Message of %d bytes does not fit into a shared memory slot.", length
+            )
+            return
+        if its_pdu_header is None:
+            its_pdu_header = ItsPduHeader.from_bytes(payload)
+        if timestamp_ns is None:
+            timestamp_ns = time.time_ns()
+
+        sequence = self._sequence
+        offset = self._slot_offset(sequence % self.slot_count)
+        buffer = self._buffer
+        SLOT_SEQUENCE_STRUCT.pack_into(buffer, offset, SLOT_INVALID)
+        payload_offset = offset + SLOT_HEADER_STRUCT.size
+        buffer[payload_offset : payload_offset + length] = payload
+        SLOT_HEADER_STRUCT.pack_into(
+            buffer,
+            offset,
+            SLOT_INVALID,
+            timestamp_ns,
+            its_pdu_header.station_id,
+            its_pdu_header.message_id,
+            its_pdu_header.protocol_version,
+            length,
+        )
+        SLOT_SEQUENCE_STRUCT.pack_into(buffer, offset, sequence)
+        self._sequence = sequence + 1
+        WRITE_SEQUENCE_STRUCT.pack_into(buffer, WRITE_SEQUENCE_OFFSET, self._sequence)
+
+    def close(self):
+        """
+        Close and remove the shared memory block. Attached readers keep their mapping.
+        """
+        self._warnings.flush()
+        self._buffer = None
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self) -> "SharedRingWriter":
+        return self
+
+    def __exit__(self, *_exc_info):
+        self.close()
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    # Only the writer owns the block. If the block was tracked, the resource tracker would remove
+    # it when a reader process exits.
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        pass
+    register = resource_tracker.register
+    resource_tracker.register = lambda *_args: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+class SharedRingReader:
+    """
+    Read the messages of a ring buffer written by SharedRingWriter.
+
+    Records expose the header metadata and a view of the payload without copying, so consumers
+    can filter by station ID or message type and only copy and decode the messages they need.
+    """
+
+    def __init__(self, name: str, from_start: bool = False, decoder: Optional[EtsiDecoder] = None):
+        """
+        Attach to a ring buffer.
+
+        Parameters
+        ----------
+        name : str
+            Name of the shared memory block, see `SharedRingWriter.name`.
+        from_start : bool
+            Start with the oldest message still in the ring buffer instead of the next one.
+        decoder : Optional[EtsiDecoder]
+            Decoder used by `decode`. A new decoder is created on first use if None.
+        """
+        self._shm = _attach(name)
+        self._buffer = self._shm.buf
+        magic, version, _, self.slot_count, self.slot_size, _ = RING_HEADER_STRUCT.unpack_from(
+            self._buffer
+        )
+        if magic != RING_MAGIC or version != RING_VERSION:
+            self._shm.close()
+            raise ValueError(f"Shared memory '{name}' is not a message ring buffer.")
+        self._decoder = decoder
+        self.lost = 0
+        write_sequence = self._write_sequence()
+        self._next = max(0, write_sequence - self.slot_count) if from_start else write_sequence
+
+    def _write_sequence(self) -> int:
+        return WRITE_SEQUENCE_STRUCT.unpack_from(self._buffer, WRITE_SEQUENCE_OFFSET)[0]
+
+    def _slot_offset(self, sequence: int) -> int:
+        return RING_HEADER_STRUCT.size + (sequence % self.slot_count) * self.slot_size
+
+    def poll(self, max_records: Optional[int] = None) -> List[SharedRecord]:
+        """
+        Get the messages published since the last call without waiting.
+
+        Parameters
+        ----------
+        max_records : Optional[int]
+            Maximum number of returned records.
+
+        Returns
+        -------
+        List[SharedRecord]
+            New messages in the order they were published. Messages that were overwritten
+            before they could be read are counted in `lost`.
+        """
+        write_sequence = self._write_sequence()
+        if write_sequence - self._next > self.slot_count:
+            self.lost += write_sequence - self.slot_count - self._next
+            self._next = write_sequence - self.slot_count
+        end = write_sequence
+        if max_records is not None:
+            end = min(end, self._next + max_records)
+
+        records = []
+        buffer = self._buffer
+        for sequence in range(self._next, end):
+            offset = self._slot_offset(sequence)
+            (
+                slot_sequence,
+                timestamp_ns,
+                station_id,
+                message_type,
+                protocol_version,
+                length,
+            ) = SLOT_HEADER_STRUCT.unpack_from(buffer, offset)
+            payload_offset = offset + SLOT_HEADER_STRUCT.size
+            # The header fields are only consistent if the slot was not overwritten meanwhile.
+            if slot_sequence != sequence or self._slot_sequence(offset) != sequence:
+                self.lost += 1
+                continue
+            records.append(
+                SharedRecord(
+                    sequence,
+                    timestamp_ns,
+                    station_id,
+                    message_type,
+                    protocol_version,
+                    buffer[payload_offset : payload_offset + length],
+                )
+            )
+        self._next = end
+        return records
+
+    def _slot_sequence(self, offset: int) -> int:
+        return SLOT_SEQUENCE_STRUCT.unpack_from(self._buffer, offset)[0]
+
+    def read(self, poll_interval: float = 0.001) -> Iterator[SharedRecord]:
+        """
+        Iterate over the published messages, waiting for new ones indefinitely.
+        """
+        while True:
+            records = self.poll()
+            if not records:
+                time.sleep(poll_interval)
+            yield from records
+
+    def payload(self, record: SharedRecord) -> Optional[bytes]:
+        """
+        Copy the payload of a record.
+
+        Returns
+        -------
+        Optional[bytes]
+            The payload or None if the slot was overwritten since the record was read.
+        """
+        payload = bytes(record.payload)
+        if self._slot_sequence(self._slot_offset(record.sequence)) != record.sequence:
+            return None
+        return payload
+
+    def decode(self, record: SharedRecord) -> Optional[EtsiMessageClasses]:
+        """
+        Decode the message of a record.
+
+        Returns
+        -------
+        Optional[EtsiMessageClasses]
+            Decoded ETSI message or None if the slot was overwritten or the message type or
+            protocol version is not supported.
+        """
+        payload = self.payload(record)
+        if payload is None:
+            return None
+        if self._decoder is None:
+            self._decoder = EtsiDecoder()
+        return self._decoder.decode(payload)
+
+    def close(self):
+        """
+        Detach from the ring buffer. Views of returned records must be released first.
+        """
+        self._buffer = None
+        try:
+            self._shm.close()
+        except BufferError:
+            # Payloads of returned records are still referenced. The mapping is closed when they
+            # are garbage collected.
+            pass
+
+    def __enter__(self) -> "SharedRingReader":
+        return self
+
+    def __exit__(self, *_exc_info):
+        self.close()
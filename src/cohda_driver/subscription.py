@@ -0,0 +1,94 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# This module implements the subscriptions of the driver: several
+# subscribers per message type with optional filters and unsubscribe
+# handles.
+# ---------------------------------------------------------------------
+import threading
+
+from typing import Callable, Dict, Optional, Tuple
+
+from cohda_driver.etsi_message_type import EtsiMessageType
+
+MessageCallback = Callable[..., None]
+MessageFilter = Callable[..., bool]
+PayloadFilter = Callable[[bytes], bool]
+
+
+class Subscription:
+    """
+    Handle of a subscriber, returned by `SubscriptionRegistry.subscribe`.
+    """
+
+    def __init__(
+        self,
+        registry: "SubscriptionRegistry",
+        message_type: EtsiMessageType,
+        callback: MessageCallback,
+        message_filter: Optional[MessageFilter],
+        payload_filter: Optional[PayloadFilter] = None,
+    ):
+        self.message_type = message_type
+        self.callback = callback
+        self.message_filter = message_filter
+        self.payload_filter = payload_filter
+        self._registry = registry
+
+    @property
+    def active(self) -> bool:
+        return self in self._registry.subscribers(self.message_type)
+
+    def unsubscribe(self):
+        """
+        Stop delivering messages to the subscriber. Calling it again has no effect.
+        """
+        self._registry.remove(self)
+
+
+class SubscriptionRegistry:
+    """
+    Subscribers per message type.
+
+    The subscribers of a type are stored as a tuple that is replaced on every change, so the
+    driver loop can iterate over them while other threads subscribe or unsubscribe.
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[EtsiMessageType, Tuple[Subscription, ...]] = {}
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self._subscribers)
+
+    def subscribers(self, message_type: EtsiMessageType) -> Tuple[Subscription, ...]:
+        return self._subscribers.get(message_type, ())
+
+    def subscribe(
+        self,
+        message_type: EtsiMessageType,
+        callback: MessageCallback,
+        message_filter: Optional[MessageFilter] = None,
+        payload_filter: Optional[PayloadFilter] = None,
+    ) -> Subscription:
+        subscription = Subscription(self, message_type, callback, message_filter, payload_filter)
+        with self._lock:
+            self._subscribers[message_type] = self.subscribers(message_type) + (subscription,)
+        return subscription
+
+    def remove(self, subscription: Subscription):
+        with self._lock:
+            subscribers = tuple(
+                other
+                for other in self.subscribers(subscription.message_type)
+                if other is not subscription
+            )
+            if subscribers:
+                self._subscribers[subscription.message_type] = subscribers
+            else:
+                self._subscribers.pop(subscription.message_type, None)
@@ -0,0 +1,205 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# This module implements sampled tracing of the per packet stages of the
+# driver, to find out where the time of slow packets went.
+#
+# A Tracer decides which packets are traced and receives their finished
+# traces. RingBufferTracer keeps the latest traces in memory. Other
+# tracing systems are plugged in by subclassing Tracer.
+# ---------------------------------------------------------------------
+import threading
+import time
+
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from cohda_driver.etsi_message_type import EtsiMessageType
+
+# Kinds of traced packets.
+INDICATION = "indication"
+REQUEST = "request"
+
+
+class PacketTrace:
+    """
+    Durations of the stages of one packet, in the order they ran.
+
+    Stages of received packets:
+    - receive: from the receive time of the packet to the start of its processing. With kernel
+      timestamps, this includes the time in the socket buffer, `recvmsg` and the ingress queue.
+    - header: ItsPduHeader decoding.
+    - dispatch: archive, publisher, metrics, subscriber lookup, age check and payload filters.
+    - decode: generated UPER decoder, or uper_decode and from_dict with asn1tools.
+    - metrics: metrics of the decoded message, only with `enable_metrics`.
+    - callback: one stage per subscriber, including its message filter.
+
+    Stages of requests: encode, btp_header and send.
+    """
+
+    __slots__ = ["kind", "start_time", "message_type", "stages", "_last"]
+
+    def __init__(self, kind: str, start_time: Optional[float] = None):
+        """
+        Initialize the trace.
+
+        Parameters
+        ----------
+        kind : str
+            INDICATION or REQUEST.
+        start_time : Optional[float]
+            Unix time the packet was received or the request started. Defaults to now.
+        """
+        self.kind = kind
+        self.start_time = time.time() if start_time is None else start_time
+        self.message_type: Optional[EtsiMessageType] = None
+        self.stages: List[Tuple[str, float]] = []
+        self._last = time.perf_counter()
+
+    def mark(self, stage: str):
+        """
+        End a stage that started with the previous stage.
+        """
+        now = time.perf_counter()
+        self.stages.append((stage, now - self._last))
+        self._last = now
+
+    def add(self, stage: str, duration: float):
+        """
+        Add a stage measured elsewhere, without moving the start of the next stage.
+        """
+        self.stages.append((stage, duration))
+
+    @property
+    def duration(self) -> float:
+        return sum(duration for _, duration in self.stages)
+
+    def to_dict(self) -> Dict:
+        return {
+            "kind": self.kind,
+            "start_time": self.start_time,
+            "message_type": None if self.message_type is None else self.message_type.name,
+            "duration": self.duration,
+            "stages": [{"stage": stage, "duration": duration} for stage, duration in self.stages],
+        }
+
+
+class Tracer(ABC):
+    """
+    Interface between CohdaDriver and a tracing system, see `CohdaDriver.setup_tracer`.
+
+    Subclasses implement `finish`, which receives every sampled trace on the thread that
+    processed the packet, and may override `start_packet` for their own sampling. Both are
+    called from several threads, e.g. the process thread of an ingress queue and the callers of
+    `send_request`.
+    """
+
+    def __init__(self, sample_rate: float = 1.0):
+        """
+        Initialize the tracer.
+
+        Parameters
+        ----------
+        sample_rate : float
+            Share of the packets that are traced, between 0 and 1. Packets are sampled at even
+            intervals, e.g. every tenth packet for 0.1.
+        """
+        if not 0 <= sample_rate <= 1:
+            raise ValueError(f"The sample rate must be between 0 and 1, got {sample_rate}.")
+        self.sample_rate = sample_rate
+        self._credit = 0.0
+        self._credit_lock = threading.Lock()
+
+    def start_packet(self, kind: str, start_time: Optional[float] = None) -> Optional[PacketTrace]:
+        """
+        Start the trace of a packet.
+
+        Returns
+        -------
+        Optional[PacketTrace]
+            The trace, or None if the packet is not sampled.
+        """
+        with self._credit_lock:
+            self._credit += self.sample_rate
+            if self._credit < 1:
+                return None
+            self._credit -= 1
+        return PacketTrace(kind, start_time)
+
+    @abstractmethod
+    def finish(self, trace: PacketTrace):
+        """
+        Receive a trace after its last stage, also when the packet was dropped. Runs on the
+        driver loop and must not block.
+        """
+
+
+class RingBufferTracer(Tracer):
+    """
+    Tracer keeping the latest traces in memory, e.g. to dump the slowest packets after a
+    latency spike.
+    """
+
+    def __init__(self, capacity: int = 10000, sample_rate: float = 1.0):
+        """
+        Initialize the tracer.
+
+        Parameters
+        ----------
+        capacity : int
+            Number of traces kept. Older traces are discarded.
+        sample_rate : float
+            Share of the packets that are traced, see Tracer.
+        """
+        super().__init__(sample_rate)
+        self._traces: Deque[PacketTrace] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def finish(self, trace: PacketTrace):
+        with self._lock:
+            self._traces.append(trace)
+
+    def traces(self) -> List[PacketTrace]:
+        """
+        Get the kept traces, oldest first.
+        """
+        with self._lock:
+            return list(self._traces)
+
+    def slowest(self, count: int = 10, kind: Optional[str] = None) -> List[PacketTrace]:
+        """
+        Get the slowest kept traces, slowest first.
+
+        Parameters
+        ----------
+        count : int
+            Maximum number of traces.
+        kind : Optional[str]
+            Only traces of INDICATION or REQUEST packets. All traces if None.
+        """
+        traces = [trace for trace in self.traces() if kind is None or trace.kind == kind]
+        return sorted(traces, key=lambda trace: trace.duration, reverse=True)[:count]
+
+    def dump(self, count: int = 10, kind: Optional[str] = None) -> str:
+        """
+        Format the slowest kept traces with their stage durations in microseconds.
+        """
+        lines = []
+        for trace in self.slowest(count, kind):
+            message_type = "-" if trace.message_type is None else trace.message_type.name
+            stages = " ".join(f"{stage}={duration * 1e6:.0f}" for stage, duration in trace.stages)
+            lines.append(
+                f"{trace.start_time:.6f} {trace.kind:<10} {message_type:<7} "
+                f"{trace.duration * 1e6:9.0f} us  {stages}"
+            )
+        return "\n".join(lines)
+
+    def clear(self):
+        with self._lock:
+            self._traces.clear()
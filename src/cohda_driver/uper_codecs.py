@@ -0,0 +1,4334 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# This module implements specialized UPER codecs for the ETSI messages.
+#
+# GENERATED by cohda_driver.codegen from the bundled ASN.1 specifications.
+# Do not edit; run `python -m cohda_driver.codegen` instead.
+#
+# The decoders read the message as one integer and track the number of
+# remaining bits r. Values are read with (v >> (r - offset)) & mask.
+# ---------------------------------------------------------------------
+# pylint: skip-file
+from cohda_driver.etsi_messages import cam as _cam
+from cohda_driver.etsi_messages import cpm as _cpm
+
+# Digest of the ASN.1 specification the codecs were generated from.
+SPECIFICATION_DIGEST = '2575c70ffb6eea8a'
+
+
+class UperDecodeError(ValueError):
+    pass
+
+
+class UperEncodeError(ValueError):
+    pass
+
+
+def _read_length(v, r):
+    length = (v >> (r - 8)) & 0xFF
+    if length < 0x80:
+        return length, r - 8
+    if length & 0xC0 == 0x80:
+        return ((length & 0x7F) << 8) | ((v >> (r - 16)) & 0xFF), r - 16
+    raise UperDecodeError("Fragmented length determinants are not supported.")
+
+
+def _read_unconstrained(v, r):
+    length, r = _read_length(v, r)
+    bits = 8 * length
+    value = (v >> (r - bits)) & ((1 << bits) - 1)
+    if value >> (bits - 1):
+        value -= 1 << bits
+    return value, r - bits
+
+
+def _read_normally_small(v, r):
+    if not (v >> (r - 1)) & 1:
+        return (v >> (r - 7)) & 0x3F, r - 7
+    length, r = _read_length(v, r - 1)
+    bits = 8 * length
+    return (v >> (r - bits)) & ((1 << bits) - 1), r - bits
+
+
+def _read_normally_small_length(v, r):
+    if not (v >> (r - 1)) & 1:
+        return ((v >> (r - 7)) & 0x3F) + 1, r - 7
+    if not (v >> (r - 2)) & 1:
+        return (v >> (r - 9)) & 0x7F, r - 9
+    raise UperDecodeError("Normally small lengths above 127 are not supported.")
+
+
+def _read_bytes(v, r, length):
+    bits = 8 * length
+    return ((v >> (r - bits)) & ((1 << bits) - 1)).to_bytes(length, "big"), r - bits
+
+
+def _read_bits(v, r, bits):
+    padding = -bits % 8
+    value = ((v >> (r - bits)) & ((1 << bits) - 1)) << padding
+    return (value.to_bytes((bits + padding) // 8, "big"), bits), r - bits
+
+
+def _skip_additions(v, r):
+    count, r = _read_normally_small_length(v, r)
+    present = (v >> (r - count)) & ((1 << count) - 1)
+    r -= count
+    while present:
+        if present & 1:
+            length, r = _read_length(v, r)
+            r -= 8 * length
+        present >>= 1
+    return r
+
+
+def _skip_choice_addition(v, r):
+    _, r = _read_normally_small(v, r)
+    length, r = _read_length(v, r)
+    return r - 8 * length
+
+
+def _write_length(e, m, length):
+    if length < 0x80:
+        return (e << 8) | length, m + 8
+    if length < 0x4000:
+        return (e << 16) | 0x8000 | length, m + 16
+    raise UperEncodeError("Fragmented length determinants are not supported.")
+
+
+def _write_unconstrained(e, m, value):
+    bits = value.bit_length()
+    if value < 0:
+        length = (bits + 7) // 8
+        value += 1 << (8 * length)
+        if not value & (1 << (8 * length - 1)):
+            value |= 0xFF << (8 * length)
+            length += 1
+    elif value > 0:
+        length = (bits + 7) // 8
+        if bits == 8 * length:
+            length += 1
+    else:
+        length = 1
+    e, m = _write_length(e, m, length)
+    return (e << (8 * length)) | value, m + 8 * length
+
+
+def _write_normally_small(e, m, value):
+    if value < 64:
+        return (e << 7) | value, m + 7
+    length = (value.bit_length() + 7) // 8
+    e, m = _write_length((e << 1) | 1, m + 1, length)
+    return (e << (8 * length)) | value, m + 8 * length
+
+
+def _write_normally_small_length(e, m, value):
+    if value <= 64:
+        return (e << 7) | (value - 1), m + 7
+    if value <= 127:
+        return (e << 9) | 0x100 | value, m + 9
+    raise UperEncodeError("Normally small lengths above 127 are not supported.")
+
+
+def _write_bytes(e, m, data):
+    return (e << (8 * len(data))) | int.from_bytes(data, "big"), m + 8 * len(data)
+
+
+def _write_bits(e, m, data, bits):
+    if not bits:
+        return e, m
+    value = int.from_bytes(data, "big") >> (8 * len(data) - bits)
+    return (e << bits) | value, m + bits
+
+
+def _write_open_type(e, m, addition, bits):
+    padding = -bits % 8
+    e, m = _write_length(e, m, (bits + padding) // 8)
+    return (e << (bits + padding)) | (addition << padding), m + bits + padding
+
+
+def _rstrip_bits(data, bits, minimum):
+    value = int.from_bytes(data, "big") >> (8 * len(data) - bits) if bits else 0
+    while bits and not value & 1:
+        value >>= 1
+        bits -= 1
+    if minimum is not None and bits < minimum:
+        value <<= minimum - bits
+        bits = minimum
+    padding = -bits % 8
+    return (value << padding).to_bytes((bits + padding) // 8, "big"), bits
+
+
+def _out_of_data(error):
+    if isinstance(error, UperDecodeError):
+        return error
+    return UperDecodeError(f"Out of data or invalid message: {error}")
+
+
+_CONSTANT_0 = {}
+_CONSTANT_1 = {0: 1}
+_CONSTANT_2 = {0: 4}
+_CONSTANT_3 = {0: 0, 1: 1, 2: 2, 3: 3, 4: 4, 5: 5, 6: 6, 7: 7, 8: 8, 9: 9, 10: 10, 11: 11, 12: 12, 13: 13, 14: 14, 15: 15}
+_CONSTANT_4 = {0: 0, 1: 1, 2: 2}
+_CONSTANT_5 = {0: 0, 1: 1, 2: 2, 3: 3, 4: 4}
+_CONSTANT_6 = {0: 0, 1: 1, 2: 2, 3: 3, 4: 4, 5: 5, 6: 6, 7: 7}
+_CONSTANT_7 = {0: 0, 1: 1, 2: 2}
+_CONSTANT_8 = {}
+_CONSTANT_9 = {0: 0, 1: 1, 2: 2, 3: 3, 4: 4, 5: 5, 6: 6, 7: 7, 8: 8}
+_CONSTANT_10 = {0: 0}
+_CONSTANT_11 = {1: 0}
+_CONSTANT_12 = {0: 0, 1: 1, 2: 2, 3: 3, 4: 4, 5: 5, 6: 6, 7: 7, 8: 8, 9: 9, 10: 10, 11: 11, 12: 12, 13: 13, 14: 14, 15: 15}
+_CONSTANT_13 = {0: 0, 1: 1, 2: 2, 3: 3, 4: 4, 5: 5, 6: 6, 7: 7, 8: 8, 9: 9, 10: 10, 11: 11, 12: 12, 13: 13, 14: 14, 15: 15, 16: 16, 17: 17, 18: 18, 19: 19}
+_CONSTANT_14 = {0: 0, 1: 1, 2: 2}
+_CONSTANT_15 = {0: 0, 1: 1, 2: 2}
+_CONSTANT_16 = {0: 0, 1: 1, 2: 2, 3: 3}
+_CONSTANT_17 = {4: 0}
+_CONSTANT_18 = {}
+_CONSTANT_19 = {0: 1}
+_CONSTANT_20 = {0: 4}
+_CONSTANT_21 = {0: 0, 1: 1, 2: 2}
+
+
+def _decode_CAM(v, r):
+    header, r = _decode_header(v, r)
+    cam, r = _decode_cam(v, r)
+    result = {'header': header, 'cam': cam}
+    return result, r
+
+
+def _decode_header(v, r):
+    protocolVersion = (v >> (r - 8)) & 0xff
+    messageId = (v >> (r - 16)) & 0xff
+    stationId = (v >> (r - 48)) & 0xffffffff
+    result = {'protocolVersion': protocolVersion, 'messageId': messageId, 'stationId': stationId}
+    r -= 48
+    return result, r
+
+
+def _decode_cam(v, r):
+    generationDeltaTime = (v >> (r - 16)) & 0xffff
+    r -= 16
+    camParameters, r = _decode_camParameters(v, r)
+    result = {'generationDeltaTime': generationDeltaTime, 'camParameters': camParameters}
+    return result, r
+
+
+def _decode_camParameters(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    present = (v >> (r - 3)) & 0x3
+    r -= 3
+    basicContainer, r = _decode_basicContainer(v, r)
+    highFrequencyContainer, r = _decode_highFrequencyContainer(v, r)
+    if present & 2:
+        lowFrequencyContainer, r = _decode_lowFrequencyContainer(v, r)
+    if present & 1:
+        specialVehicleContainer, r = _decode_specialVehicleContainer(v, r)
+    result = {'basicContainer': basicContainer, 'highFrequencyContainer': highFrequencyContainer}
+    if present & 2:
+        result['lowFrequencyContainer'] = lowFrequencyContainer
+    if present & 1:
+        result['specialVehicleContainer'] = specialVehicleContainer
+    if extension:
+        r = _skip_additions(v, r)
+    return result, r
+
+
+def _decode_basicContainer(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    stationType = (v >> (r - 9)) & 0xff
+    r -= 9
+    referencePosition, r = _decode_referencePosition(v, r)
+    result = {'stationType': stationType, 'referencePosition': referencePosition}
+    if extension:
+        r = _skip_additions(v, r)
+    return result, r
+
+
+def _decode_referencePosition(v, r):
+    latitude = ((v >> (r - 31)) & 0x7fffffff) + -900000000
+    longitude = ((v >> (r - 63)) & 0xffffffff) + -1800000000
+    r -= 63
+    positionConfidenceEllipse, r = _decode_positionConfidenceEllipse(v, r)
+    altitude, r = _decode_altitude(v, r)
+    result = {'latitude': latitude, 'longitude': longitude, 'positionConfidenceEllipse': positionConfidenceEllipse, 'altitude': altitude}
+    return result, r
+
+
+def _decode_positionConfidenceEllipse(v, r):
+    semiMajorConfidence = (v >> (r - 12)) & 0xfff
+    semiMinorConfidence = (v >> (r - 24)) & 0xfff
+    semiMajorOrientation = (v >> (r - 36)) & 0xfff
+    result = {'semiMajorConfidence': semiMajorConfidence, 'semiMinorConfidence': semiMinorConfidence, 'semiMajorOrientation': semiMajorOrientation}
+    r -= 36
+    return result, r
+
+
+def _decode_altitude(v, r):
+    altitudeValue = ((v >> (r - 20)) & 0xfffff) + -100000
+    altitudeConfidence = (v >> (r - 24)) & 0xf
+    result = {'altitudeValue': altitudeValue, 'altitudeConfidence': altitudeConfidence}
+    r -= 24
+    return result, r
+
+
+def _decode_highFrequencyContainer(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    r -= 1
+    if extension:
+        index, r = _read_normally_small(v, r)
+        end, r = _read_length(v, r)
+        end = r - 8 * end
+        result = (None, None)
+        r = end
+    else:
+        index_2 = (v >> (r - 1)) & 0x1
+        r -= 1
+        if index_2 == 0:
+            basicVehicleContainerHighFrequency, r = _decode_basicVehicleContainerHighFrequency(v, r)
+            result = ('basicVehicleContainerHighFrequency', basicVehicleContainerHighFrequency)
+        elif index_2 == 1:
+            rsuContainerHighFrequency, r = _decode_rsuContainerHighFrequency(v, r)
+            result = ('rsuContainerHighFrequency', rsuContainerHighFrequency)
+        else:
+            raise UperDecodeError(f"Invalid choice index {index_2}.")
+    return result, r
+
+
+def _decode_basicVehicleContainerHighFrequency(v, r):
+    present = (v >> (r - 7)) & 0x7f
+    r -= 7
+    heading, r = _decode_heading(v, r)
+    speed, r = _decode_speed(v, r)
+    driveDirection = (v >> (r - 2)) & 0x3
+    r -= 2
+    if driveDirection >= 3:
+        raise UperDecodeError(f"Invalid enumeration index {driveDirection}.")
+    vehicleLength, r = _decode_vehicleLength(v, r)
+    vehicleWidth = ((v >> (r - 6)) & 0x3f) + 1
+    r -= 6
+    longitudinalAcceleration, r = _decode_longitudinalAcceleration(v, r)
+    curvature, r = _decode_curvature(v, r)
+    extension = (v >> (r - 1)) & 0x1
+    r -= 1
+    if extension:
+        curvatureCalculationMode, r = _read_normally_small(v, r)
+        curvatureCalculationMode = _CONSTANT_0.get(curvatureCalculationMode)
+    else:
+        curvatureCalculationMode = (v >> (r - 2)) & 0x3
+        r -= 2
+        if curvatureCalculationMode >= 3:
+            raise UperDecodeError(f"Invalid enumeration index {curvatureCalculationMode}.")
+    yawRate, r = _decode_yawRate(v, r)
+    if present & 64:
+        accelerationControl, r = _read_bits(v, r, 7)
+    if present & 32:
+        lanePosition = ((v >> (r - 4)) & 0xf) + -1
+        r -= 4
+    if present & 16:
+        steeringWheelAngle, r = _decode_steeringWheelAngle(v, r)
+    if present & 8:
+        lateralAcceleration, r = _decode_lateralAcceleration(v, r)
+    if present & 4:
+        verticalAcceleration, r = _decode_verticalAcceleration(v, r)
+    if present & 2:
+        performanceClass = (v >> (r - 3)) & 0x7
+        r -= 3
+    if present & 1:
+        cenDsrcTollingZone, r = _decode_cenDsrcTollingZone(v, r)
+    result = {'heading': heading, 'speed': speed, 'driveDirection': driveDirection, 'vehicleLength': vehicleLength, 'vehicleWidth': vehicleWidth, 'longitudinalAcceleration': longitudinalAcceleration, 'curvature': curvature, 'curvatureCalculationMode': curvatureCalculationMode, 'yawRate': yawRate}
+    if present & 64:
+        result['accelerationControl'] = accelerationControl
+    if present & 32:
+        result['lanePosition'] = lanePosition
+    if present & 16:
+        result['steeringWheelAngle'] = steeringWheelAngle
+    if present & 8:
+        result['lateralAcceleration'] = lateralAcceleration
+    if present & 4:
+        result['verticalAcceleration'] = verticalAcceleration
+    if present & 2:
+        result['performanceClass'] = performanceClass
+    if present & 1:
+        result['cenDsrcTollingZone'] = cenDsrcTollingZone
+    return result, r
+
+
+def _decode_heading(v, r):
+    headingValue = (v >> (r - 12)) & 0xfff
+    headingConfidence = ((v >> (r - 19)) & 0x7f) + 1
+    result = {'headingValue': headingValue, 'headingConfidence': headingConfidence}
+    r -= 19
+    return result, r
+
+
+def _decode_speed(v, r):
+    speedValue = (v >> (r - 14)) & 0x3fff
+    speedConfidence = ((v >> (r - 21)) & 0x7f) + 1
+    result = {'speedValue': speedValue, 'speedConfidence': speedConfidence}
+    r -= 21
+    return result, r
+
+
+def _decode_vehicleLength(v, r):
+    vehicleLengthValue = ((v >> (r - 10)) & 0x3ff) + 1
+    vehicleLengthConfidenceIndication = (v >> (r - 13)) & 0x7
+    r -= 13
+    if vehicleLengthConfidenceIndication >= 5:
+        raise UperDecodeError(f"Invalid enumeration index {vehicleLengthConfidenceIndication}.")
+    result = {'vehicleLengthValue': vehicleLengthValue, 'vehicleLengthConfidenceIndication': vehicleLengthConfidenceIndication}
+    return result, r
+
+
+def _decode_longitudinalAcceleration(v, r):
+    longitudinalAccelerationValue = ((v >> (r - 9)) & 0x1ff) + -160
+    longitudinalAccelerationConfidence = (v >> (r - 16)) & 0x7f
+    result = {'longitudinalAccelerationValue': longitudinalAccelerationValue, 'longitudinalAccelerationConfidence': longitudinalAccelerationConfidence}
+    r -= 16
+    return result, r
+
+
+def _decode_curvature(v, r):
+    curvatureValue = ((v >> (r - 11)) & 0x7ff) + -1023
+    curvatureConfidence = (v >> (r - 14)) & 0x7
+    result = {'curvatureValue': curvatureValue, 'curvatureConfidence': curvatureConfidence}
+    r -= 14
+    return result, r
+
+
+def _decode_yawRate(v, r):
+    yawRateValue = ((v >> (r - 16)) & 0xffff) + -32766
+    yawRateConfidence = (v >> (r - 20)) & 0xf
+    r -= 20
+    if yawRateConfidence >= 9:
+        raise UperDecodeError(f"Invalid enumeration index {yawRateConfidence}.")
+    result = {'yawRateValue': yawRateValue, 'yawRateConfidence': yawRateConfidence}
+    return result, r
+
+
+def _decode_steeringWheelAngle(v, r):
+    steeringWheelAngleValue = ((v >> (r - 10)) & 0x3ff) + -511
+    steeringWheelAngleConfidence = ((v >> (r - 17)) & 0x7f) + 1
+    result = {'steeringWheelAngleValue': steeringWheelAngleValue, 'steeringWheelAngleConfidence': steeringWheelAngleConfidence}
+    r -= 17
+    return result, r
+
+
+def _decode_lateralAcceleration(v, r):
+    lateralAccelerationValue = ((v >> (r - 9)) & 0x1ff) + -160
+    lateralAccelerationConfidence = (v >> (r - 16)) & 0x7f
+    result = {'lateralAccelerationValue': lateralAccelerationValue, 'lateralAccelerationConfidence': lateralAccelerationConfidence}
+    r -= 16
+    return result, r
+
+
+def _decode_verticalAcceleration(v, r):
+    verticalAccelerationValue = ((v >> (r - 9)) & 0x1ff) + -160
+    verticalAccelerationConfidence = (v >> (r - 16)) & 0x7f
+    result = {'verticalAccelerationValue': verticalAccelerationValue, 'verticalAccelerationConfidence': verticalAccelerationConfidence}
+    r -= 16
+    return result, r
+
+
+def _decode_cenDsrcTollingZone(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    present = (v >> (r - 2)) & 0x1
+    protectedZoneLatitude = ((v >> (r - 33)) & 0x7fffffff) + -900000000
+    protectedZoneLongitude = ((v >> (r - 65)) & 0xffffffff) + -1800000000
+    r -= 65
+    if present & 1:
+        cenDsrcTollingZoneId = (v >> (r - 27)) & 0x7ffffff
+        r -= 27
+    result = {'protectedZoneLatitude': protectedZoneLatitude, 'protectedZoneLongitude': protectedZoneLongitude}
+    if present & 1:
+        result['cenDsrcTollingZoneId'] = cenDsrcTollingZoneId
+    if extension:
+        r = _skip_additions(v, r)
+    return result, r
+
+
+def _decode_rsuContainerHighFrequency(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    present = (v >> (r - 2)) & 0x1
+    r -= 2
+    if present & 1:
+        protectedCommunicationZonesRSU, r = _decode_protectedCommunicationZonesRSU(v, r)
+    result = {}
+    if present & 1:
+        result['protectedCommunicationZonesRSU'] = protectedCommunicationZonesRSU
+    if extension:
+        r = _skip_additions(v, r)
+    return result, r
+
+
+def _decode_protectedCommunicationZonesRSU(v, r):
+    count = ((v >> (r - 4)) & 0xf) + 1
+    result = []
+    r -= 4
+    for _ in range(count):
+        item, r = _decode_value(v, r)
+        result.append(item)
+    return result, r
+
+
+def _decode_value(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    present = (v >> (r - 4)) & 0x7
+    extension_2 = (v >> (r - 5)) & 0x1
+    r -= 5
+    if extension_2:
+        protectedZoneType, r = _read_normally_small(v, r)
+        protectedZoneType = _CONSTANT_1.get(protectedZoneType)
+    else:
+        protectedZoneType = 0
+    if present & 4:
+        expiryTime = (v >> (r - 42)) & 0x3ffffffffff
+        r -= 42
+    protectedZoneLatitude = ((v >> (r - 31)) & 0x7fffffff) + -900000000
+    protectedZoneLongitude = ((v >> (r - 63)) & 0xffffffff) + -1800000000
+    r -= 63
+    if present & 2:
+        extension_3 = (v >> (r - 1)) & 0x1
+        r -= 1
+        if extension_3:
+            protectedZoneRadius, r = _read_unconstrained(v, r)
+        else:
+            protectedZoneRadius = ((v >> (r - 8)) & 0xff) + 1
+            r -= 8
+    if present & 1:
+        protectedZoneId = (v >> (r - 27)) & 0x7ffffff
+        r -= 27
+    result = {'protectedZoneType': protectedZoneType, 'protectedZoneLatitude': protectedZoneLatitude, 'protectedZoneLongitude': protectedZoneLongitude}
+    if present & 4:
+        result['expiryTime'] = expiryTime
+    if present & 2:
+        result['protectedZoneRadius'] = protectedZoneRadius
+    if present & 1:
+        result['protectedZoneId'] = protectedZoneId
+    if extension:
+        r = _skip_additions(v, r)
+    return result, r
+
+
+def _decode_lowFrequencyContainer(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    r -= 1
+    if extension:
+        index, r = _read_normally_small(v, r)
+        end, r = _read_length(v, r)
+        end = r - 8 * end
+        result = (None, None)
+        r = end
+    else:
+        basicVehicleContainerLowFrequency, r = _decode_basicVehicleContainerLowFrequency(v, r)
+        result = ('basicVehicleContainerLowFrequency', basicVehicleContainerLowFrequency)
+    return result, r
+
+
+def _decode_basicVehicleContainerLowFrequency(v, r):
+    vehicleRole = (v >> (r - 4)) & 0xf
+    r -= 4
+    exteriorLights, r = _read_bits(v, r, 8)
+    pathHistory, r = _decode_pathHistory(v, r)
+    result = {'vehicleRole': vehicleRole, 'exteriorLights': exteriorLights, 'pathHistory': pathHistory}
+    return result, r
+
+
+def _decode_pathHistory(v, r):
+    count = (v >> (r - 6)) & 0x3f
+    result = []
+    r -= 6
+    for _ in range(count):
+        item, r = _decode_value_2(v, r)
+        result.append(item)
+    return result, r
+
+
+def _decode_value_2(v, r):
+    present = (v >> (r - 1)) & 0x1
+    r -= 1
+    pathPosition, r = _decode_pathPosition(v, r)
+    if present & 1:
+        extension = (v >> (r - 1)) & 0x1
+        r -= 1
+        if extension:
+            pathDeltaTime, r = _read_unconstrained(v, r)
+        else:
+            pathDeltaTime = ((v >> (r - 16)) & 0xffff) + 1
+            r -= 16
+    result = {'pathPosition': pathPosition}
+    if present & 1:
+        result['pathDeltaTime'] = pathDeltaTime
+    return result, r
+
+
+def _decode_pathPosition(v, r):
+    deltaLatitude = ((v >> (r - 18)) & 0x3ffff) + -131071
+    deltaLongitude = ((v >> (r - 36)) & 0x3ffff) + -131071
+    deltaAltitude = ((v >> (r - 51)) & 0x7fff) + -12700
+    result = {'deltaLatitude': deltaLatitude, 'deltaLongitude': deltaLongitude, 'deltaAltitude': deltaAltitude}
+    r -= 51
+    return result, r
+
+
+def _decode_specialVehicleContainer(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    r -= 1
+    if extension:
+        index, r = _read_normally_small(v, r)
+        end, r = _read_length(v, r)
+        end = r - 8 * end
+        result = (None, None)
+        r = end
+    else:
+        index_2 = (v >> (r - 3)) & 0x7
+        r -= 3
+        if index_2 == 0:
+            publicTransportContainer, r = _decode_publicTransportContainer(v, r)
+            result = ('publicTransportContainer', publicTransportContainer)
+        elif index_2 == 1:
+            specialTransportContainer, r = _decode_specialTransportContainer(v, r)
+            result = ('specialTransportContainer', specialTransportContainer)
+        elif index_2 == 2:
+            dangerousGoodsContainer, r = _decode_dangerousGoodsContainer(v, r)
+            result = ('dangerousGoodsContainer', dangerousGoodsContainer)
+        elif index_2 == 3:
+            roadWorksContainerBasic, r = _decode_roadWorksContainerBasic(v, r)
+            result = ('roadWorksContainerBasic', roadWorksContainerBasic)
+        elif index_2 == 4:
+            rescueContainer, r = _decode_rescueContainer(v, r)
+            result = ('rescueContainer', rescueContainer)
+        elif index_2 == 5:
+            emergencyContainer, r = _decode_emergencyContainer(v, r)
+            result = ('emergencyContainer', emergencyContainer)
+        elif index_2 == 6:
+            safetyCarContainer, r = _decode_safetyCarContainer(v, r)
+            result = ('safetyCarContainer', safetyCarContainer)
+        else:
+            raise UperDecodeError(f"Invalid choice index {index_2}.")
+    return result, r
+
+
+def _decode_publicTransportContainer(v, r):
+    present = (v >> (r - 1)) & 0x1
+    embarkationStatus = bool((v >> (r - 2)) & 0x1)
+    r -= 2
+    if present & 1:
+        ptActivation, r = _decode_ptActivation(v, r)
+    result = {'embarkationStatus': embarkationStatus}
+    if present & 1:
+        result['ptActivation'] = ptActivation
+    return result, r
+
+
+def _decode_ptActivation(v, r):
+    ptActivationType = (v >> (r - 8)) & 0xff
+    ptActivationData = ((v >> (r - 13)) & 0x1f) + 1
+    r -= 13
+    ptActivationData, r = _read_bytes(v, r, ptActivationData)
+    result = {'ptActivationType': ptActivationType, 'ptActivationData': ptActivationData}
+    return result, r
+
+
+def _decode_specialTransportContainer(v, r):
+    specialTransportType, r = _read_bits(v, r, 4)
+    lightBarSirenInUse, r = _read_bits(v, r, 2)
+    result = {'specialTransportType': specialTransportType, 'lightBarSirenInUse': lightBarSirenInUse}
+    return result, r
+
+
+def _decode_dangerousGoodsContainer(v, r):
+    dangerousGoodsBasic = (v >> (r - 5)) & 0x1f
+    r -= 5
+    if dangerousGoodsBasic >= 20:
+        raise UperDecodeError(f"Invalid enumeration index {dangerousGoodsBasic}.")
+    result = {'dangerousGoodsBasic': dangerousGoodsBasic}
+    return result, r
+
+
+def _decode_roadWorksContainerBasic(v, r):
+    present = (v >> (r - 2)) & 0x3
+    r -= 2
+    if present & 2:
+        roadworksSubCauseCode = (v >> (r - 8)) & 0xff
+        r -= 8
+    lightBarSirenInUse, r = _read_bits(v, r, 2)
+    if present & 1:
+        closedLanes, r = _decode_closedLanes(v, r)
+    result = {'lightBarSirenInUse': lightBarSirenInUse}
+    if present & 2:
+        result['roadworksSubCauseCode'] = roadworksSubCauseCode
+    if present & 1:
+        result['closedLanes'] = closedLanes
+    return result, r
+
+
+def _decode_closedLanes(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    present = (v >> (r - 4)) & 0x7
+    r -= 4
+    if present & 4:
+        innerhardShoulderStatus = (v >> (r - 2)) & 0x3
+        r -= 2
+        if innerhardShoulderStatus >= 3:
+            raise UperDecodeError(f"Invalid enumeration index {innerhardShoulderStatus}.")
+    if present & 2:
+        outerhardShoulderStatus = (v >> (r - 2)) & 0x3
+        r -= 2
+        if outerhardShoulderStatus >= 3:
+            raise UperDecodeError(f"Invalid enumeration index {outerhardShoulderStatus}.")
+    if present & 1:
+        drivingLaneStatus = ((v >> (r - 4)) & 0xf) + 1
+        r -= 4
+        drivingLaneStatus, r = _read_bits(v, r, drivingLaneStatus)
+    result = {}
+    if present & 4:
+        result['innerhardShoulderStatus'] = innerhardShoulderStatus
+    if present & 2:
+        result['outerhardShoulderStatus'] = outerhardShoulderStatus
+    if present & 1:
+        result['drivingLaneStatus'] = drivingLaneStatus
+    if extension:
+        r = _skip_additions(v, r)
+    return result, r
+
+
+def _decode_rescueContainer(v, r):
+    lightBarSirenInUse, r = _read_bits(v, r, 2)
+    result = {'lightBarSirenInUse': lightBarSirenInUse}
+    return result, r
+
+
+def _decode_emergencyContainer(v, r):
+    present = (v >> (r - 2)) & 0x3
+    r -= 2
+    lightBarSirenInUse, r = _read_bits(v, r, 2)
+    if present & 2:
+        incidentIndication, r = _decode_incidentIndication(v, r)
+    if present & 1:
+        emergencyPriority, r = _read_bits(v, r, 2)
+    result = {'lightBarSirenInUse': lightBarSirenInUse}
+    if present & 2:
+        result['incidentIndication'] = incidentIndication
+    if present & 1:
+        result['emergencyPriority'] = emergencyPriority
+    return result, r
+
+
+def _decode_incidentIndication(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    causeCode = (v >> (r - 9)) & 0xff
+    subCauseCode = (v >> (r - 17)) & 0xff
+    result = {'causeCode': causeCode, 'subCauseCode': subCauseCode}
+    r -= 17
+    if extension:
+        r = _skip_additions(v, r)
+    return result, r
+
+
+def _decode_safetyCarContainer(v, r):
+    present = (v >> (r - 3)) & 0x7
+    r -= 3
+    lightBarSirenInUse, r = _read_bits(v, r, 2)
+    if present & 4:
+        incidentIndication, r = _decode_incidentIndication(v, r)
+    if present & 2:
+        extension = (v >> (r - 1)) & 0x1
+        r -= 1
+        if extension:
+            trafficRule, r = _read_normally_small(v, r)
+            trafficRule = _CONSTANT_2.get(trafficRule)
+        else:
+            trafficRule = (v >> (r - 2)) & 0x3
+            r -= 2
+    if present & 1:
+        speedLimit = ((v >> (r - 8)) & 0xff) + 1
+        r -= 8
+    result = {'lightBarSirenInUse': lightBarSirenInUse}
+    if present & 4:
+        result['incidentIndication'] = incidentIndication
+    if present & 2:
+        result['trafficRule'] = trafficRule
+    if present & 1:
+        result['speedLimit'] = speedLimit
+    return result, r
+
+
+def _encode_CAM(e, m, value):
+    header = value['header']
+    e, m = _encode_header(e, m, header)
+    cam = value['cam']
+    e, m = _encode_cam(e, m, cam)
+    return e, m
+
+
+def _encode_header(e, m, value):
+    protocolVersion = value['protocolVersion']
+    if not 0 <= protocolVersion <= 255:
+        raise UperEncodeError(f"protocolVersion {protocolVersion} not in 0..255.")
+    e = (e << 8) | protocolVersion
+    messageId = value['messageId']
+    m += 8
+    if not 0 <= messageId <= 255:
+        raise UperEncodeError(f"messageId {messageId} not in 0..255.")
+    e = (e << 8) | messageId
+    stationId = value['stationId']
+    m += 8
+    if not 0 <= stationId <= 4294967295:
+        raise UperEncodeError(f"stationId {stationId} not in 0..4294967295.")
+    e = (e << 32) | stationId
+    m += 32
+    return e, m
+
+
+def _encode_cam(e, m, value):
+    generationDeltaTime = value['generationDeltaTime']
+    if not 0 <= generationDeltaTime <= 65535:
+        raise UperEncodeError(f"generationDeltaTime {generationDeltaTime} not in 0..65535.")
+    e = (e << 16) | generationDeltaTime
+    camParameters = value['camParameters']
+    m += 16
+    e, m = _encode_camParameters(e, m, camParameters)
+    return e, m
+
+
+def _encode_camParameters(e, m, value):
+    extension = 0
+    e = (e << 1) | extension
+    e = (e << 1) | (1 if 'lowFrequencyContainer' in value else 0)
+    e = (e << 1) | (1 if 'specialVehicleContainer' in value else 0)
+    basicContainer = value['basicContainer']
+    m += 3
+    e, m = _encode_basicContainer(e, m, basicContainer)
+    highFrequencyContainer = value['highFrequencyContainer']
+    e, m = _encode_highFrequencyContainer(e, m, highFrequencyContainer)
+    if 'lowFrequencyContainer' in value:
+        e, m = _encode_lowFrequencyContainer(e, m, value['lowFrequencyContainer'])
+    if 'specialVehicleContainer' in value:
+        e, m = _encode_specialVehicleContainer(e, m, value['specialVehicleContainer'])
+    return e, m
+
+
+def _encode_basicContainer(e, m, value):
+    extension = 0
+    e = (e << 1) | extension
+    stationType = value['stationType']
+    m += 1
+    if not 0 <= stationType <= 255:
+        raise UperEncodeError(f"stationType {stationType} not in 0..255.")
+    e = (e << 8) | stationType
+    referencePosition = value['referencePosition']
+    m += 8
+    e, m = _encode_referencePosition(e, m, referencePosition)
+    return e, m
+
+
+def _encode_referencePosition(e, m, value):
+    latitude = value['latitude']
+    if not -900000000 <= latitude <= 900000001:
+        raise UperEncodeError(f"latitude {latitude} not in -900000000..900000001.")
+    e = (e << 31) | (latitude - -900000000)
+    longitude = value['longitude']
+    m += 31
+    if not -1800000000 <= longitude <= 1800000001:
+        raise UperEncodeError(f"longitude {longitude} not in -1800000000..1800000001.")
+    e = (e << 32) | (longitude - -1800000000)
+    positionConfidenceEllipse = value['positionConfidenceEllipse']
+    m += 32
+    e, m = _encode_positionConfidenceEllipse(e, m, positionConfidenceEllipse)
+    altitude = value['altitude']
+    e, m = _encode_altitude(e, m, altitude)
+    return e, m
+
+
+def _encode_positionConfidenceEllipse(e, m, value):
+    semiMajorConfidence = value['semiMajorConfidence']
+    if not 0 <= semiMajorConfidence <= 4095:
+        raise UperEncodeError(f"semiMajorConfidence {semiMajorConfidence} not in 0..4095.")
+    e = (e << 12) | semiMajorConfidence
+    semiMinorConfidence = value['semiMinorConfidence']
+    m += 12
+    if not 0 <= semiMinorConfidence <= 4095:
+        raise UperEncodeError(f"semiMinorConfidence {semiMinorConfidence} not in 0..4095.")
+    e = (e << 12) | semiMinorConfidence
+    semiMajorOrientation = value['semiMajorOrientation']
+    m += 12
+    if not 0 <= semiMajorOrientation <= 3601:
+        raise UperEncodeError(f"semiMajorOrientation {semiMajorOrientation} not in 0..3601.")
+    e = (e << 12) | semiMajorOrientation
+    m += 12
+    return e, m
+
+
+def _encode_altitude(e, m, value):
+    altitudeValue = value['altitudeValue']
+    if not -100000 <= altitudeValue <= 800001:
+        raise UperEncodeError(f"altitudeValue {altitudeValue} not in -100000..800001.")
+    e = (e << 20) | (altitudeValue - -100000)
+    altitudeConfidence = value['altitudeConfidence']
+    e = (e << 4) | _CONSTANT_3[altitudeConfidence]
+    m += 24
+    return e, m
+
+
+def _encode_highFrequencyContainer(e, m, value):
+    name, alternative = value
+    if name == 'basicVehicleContainerHighFrequency':
+        e = (e << 1) | 0
+        e = (e << 1) | 0
+        m += 2
+        e, m = _encode_basicVehicleContainerHighFrequency(e, m, alternative)
+    elif name == 'rsuContainerHighFrequency':
+        e = (e << 1) | 0
+        e = (e << 1) | 1
+        m += 2
+        e, m = _encode_rsuContainerHighFrequency(e, m, alternative)
+    else:
+        raise UperEncodeError(f"Invalid choice {name!r}.")
+    return e, m
+
+
+def _encode_basicVehicleContainerHighFrequency(e, m, value):
+    e = (e << 1) | (1 if 'accelerationControl' in value else 0)
+    e = (e << 1) | (1 if 'lanePosition' in value else 0)
+    e = (e << 1) | (1 if 'steeringWheelAngle' in value else 0)
+    e = (e << 1) | (1 if 'lateralAcceleration' in value else 0)
+    e = (e << 1) | (1 if 'verticalAcceleration' in value else 0)
+    e = (e << 1) | (1 if 'performanceClass' in value else 0)
+    e = (e << 1) | (1 if 'cenDsrcTollingZone' in value else 0)
+    heading = value['heading']
+    m += 7
+    e, m = _encode_heading(e, m, heading)
+    speed = value['speed']
+    e, m = _encode_speed(e, m, speed)
+    driveDirection = value['driveDirection']
+    e = (e << 2) | _CONSTANT_4[driveDirection]
+    vehicleLength = value['vehicleLength']
+    m += 2
+    e, m = _encode_vehicleLength(e, m, vehicleLength)
+    vehicleWidth = value['vehicleWidth']
+    if not 1 <= vehicleWidth <= 62:
+        raise UperEncodeError(f"vehicleWidth {vehicleWidth} not in 1..62.")
+    e = (e << 6) | (vehicleWidth - 1)
+    longitudinalAcceleration = value['longitudinalAcceleration']
+    m += 6
+    e, m = _encode_longitudinalAcceleration(e, m, longitudinalAcceleration)
+    curvature = value['curvature']
+    e, m = _encode_curvature(e, m, curvature)
+    curvatureCalculationMode = value['curvatureCalculationMode']
+    if curvatureCalculationMode in _CONSTANT_7:
+        e = (e << 1) | 0
+        e = (e << 2) | _CONSTANT_7[curvatureCalculationMode]
+        m += 3
+    else:
+        e = (e << 1) | 1
+        m += 1
+        e, m = _write_normally_small(e, m, _CONSTANT_8[curvatureCalculationMode])
+    yawRate = value['yawRate']
+    e, m = _encode_yawRate(e, m, yawRate)
+    if 'accelerationControl' in value:
+        data, bits = value['accelerationControl']
+        data, bits = _rstrip_bits(data, bits, 7)
+        if not 7 <= bits <= 7:
+            raise UperEncodeError(f"accelerationControl size {bits} out of range.")
+        e, m = _write_bits(e, m, data, bits)
+    if 'lanePosition' in value:
+        if not -1 <= value['lanePosition'] <= 14:
+            raise UperEncodeError(f"lanePosition {value['lanePosition']} not in -1..14.")
+        e = (e << 4) | (value['lanePosition'] - -1)
+        m += 4
+    if 'steeringWheelAngle' in value:
+        e, m = _encode_steeringWheelAngle(e, m, value['steeringWheelAngle'])
+    if 'lateralAcceleration' in value:
+        e, m = _encode_lateralAcceleration(e, m, value['lateralAcceleration'])
+    if 'verticalAcceleration' in value:
+        e, m = _encode_verticalAcceleration(e, m, value['verticalAcceleration'])
+    if 'performanceClass' in value:
+        if not 0 <= value['performanceClass'] <= 7:
+            raise UperEncodeError(f"performanceClass {value['performanceClass']} not in 0..7.")
+        e = (e << 3) | value['performanceClass']
+        m += 3
+    if 'cenDsrcTollingZone' in value:
+        e, m = _encode_cenDsrcTollingZone(e, m, value['cenDsrcTollingZone'])
+    return e, m
+
+
+def _encode_heading(e, m, value):
+    headingValue = value['headingValue']
+    if not 0 <= headingValue <= 3601:
+        raise UperEncodeError(f"headingValue {headingValue} not in 0..3601.")
+    e = (e << 12) | headingValue
+    headingConfidence = value['headingConfidence']
+    m += 12
+    if not 1 <= headingConfidence <= 127:
+        raise UperEncodeError(f"headingConfidence {headingConfidence} not in 1..127.")
+    e = (e << 7) | (headingConfidence - 1)
+    m += 7
+    return e, m
+
+
+def _encode_speed(e, m, value):
+    speedValue = value['speedValue']
+    if not 0 <= speedValue <= 16383:
+        raise UperEncodeError(f"speedValue {speedValue} not in 0..16383.")
+    e = (e << 14) | speedValue
+    speedConfidence = value['speedConfidence']
+    m += 14
+    if not 1 <= speedConfidence <= 127:
+        raise UperEncodeError(f"speedConfidence {speedConfidence} not in 1..127.")
+    e = (e << 7) | (speedConfidence - 1)
+    m += 7
+    return e, m
+
+
+def _encode_vehicleLength(e, m, value):
+    vehicleLengthValue = value['vehicleLengthValue']
+    if not 1 <= vehicleLengthValue <= 1023:
+        raise UperEncodeError(f"vehicleLengthValue {vehicleLengthValue} not in 1..1023.")
+    e = (e << 10) | (vehicleLengthValue - 1)
+    vehicleLengthConfidenceIndication = value['vehicleLengthConfidenceIndication']
+    e = (e << 3) | _CONSTANT_5[vehicleLengthConfidenceIndication]
+    m += 13
+    return e, m
+
+
+def _encode_longitudinalAcceleration(e, m, value):
+    longitudinalAccelerationValue = value['longitudinalAccelerationValue']
+    if not -160 <= longitudinalAccelerationValue <= 161:
+        raise UperEncodeError(f"longitudinalAccelerationValue {longitudinalAccelerationValue} not in -160..161.")
+    e = (e << 9) | (longitudinalAccelerationValue - -160)
+    longitudinalAccelerationConfidence = value['longitudinalAccelerationConfidence']
+    m += 9
+    if not 0 <= longitudinalAccelerationConfidence <= 102:
+        raise UperEncodeError(f"longitudinalAccelerationConfidence {longitudinalAccelerationConfidence} not in 0..102.")
+    e = (e << 7) | longitudinalAccelerationConfidence
+    m += 7
+    return e, m
+
+
+def _encode_curvature(e, m, value):
+    curvatureValue = value['curvatureValue']
+    if not -1023 <= curvatureValue <= 1023:
+        raise UperEncodeError(f"curvatureValue {curvatureValue} not in -1023..1023.")
+    e = (e << 11) | (curvatureValue - -1023)
+    curvatureConfidence = value['curvatureConfidence']
+    e = (e << 3) | _CONSTANT_6[curvatureConfidence]
+    m += 14
+    return e, m
+
+
+def _encode_yawRate(e, m, value):
+    yawRateValue = value['yawRateValue']
+    if not -32766 <= yawRateValue <= 32767:
+        raise UperEncodeError(f"yawRateValue {yawRateValue} not in -32766..32767.")
+    e = (e << 16) | (yawRateValue - -32766)
+    yawRateConfidence = value['yawRateConfidence']
+    e = (e << 4) | _CONSTANT_9[yawRateConfidence]
+    m += 20
+    return e, m
+
+
+def _encode_steeringWheelAngle(e, m, value):
+    steeringWheelAngleValue = value['steeringWheelAngleValue']
+    if not -511 <= steeringWheelAngleValue <= 512:
+        raise UperEncodeError(f"steeringWheelAngleValue {steeringWheelAngleValue} not in -511..512.")
+    e = (e << 10) | (steeringWheelAngleValue - -511)
+    steeringWheelAngleConfidence = value['steeringWheelAngleConfidence']
+    m += 10
+    if not 1 <= steeringWheelAngleConfidence <= 127:
+        raise UperEncodeError(f"steeringWheelAngleConfidence {steeringWheelAngleConfidence} not in 1..127.")
+    e = (e << 7) | (steeringWheelAngleConfidence - 1)
+    m += 7
+    return e, m
+
+
+def _encode_lateralAcceleration(e, m, value):
+    lateralAccelerationValue = value['lateralAccelerationValue']
+    if not -160 <= lateralAccelerationValue <= 161:
+        raise UperEncodeError(f"lateralAccelerationValue {lateralAccelerationValue} not in -160..161.")
+    e = (e << 9) | (lateralAccelerationValue - -160)
+    lateralAccelerationConfidence = value['lateralAccelerationConfidence']
+    m += 9
+    if not 0 <= lateralAccelerationConfidence <= 102:
+        raise UperEncodeError(f"lateralAccelerationConfidence {lateralAccelerationConfidence} not in 0..102.")
+    e = (e << 7) | lateralAccelerationConfidence
+    m += 7
+    return e, m
+
+
+def _encode_verticalAcceleration(e, m, value):
+    verticalAccelerationValue = value['verticalAccelerationValue']
+    if not -160 <= verticalAccelerationValue <= 161:
+        raise UperEncodeError(f"verticalAccelerationValue {verticalAccelerationValue} not in -160..161.")
+    e = (e << 9) | (verticalAccelerationValue - -160)
+    verticalAccelerationConfidence = value['verticalAccelerationConfidence']
+    m += 9
+    if not 0 <= verticalAccelerationConfidence <= 102:
+        raise UperEncodeError(f"verticalAccelerationConfidence {verticalAccelerationConfidence} not in 0..102.")
+    e = (e << 7) | verticalAccelerationConfidence
+    m += 7
+    return e, m
+
+
+def _encode_cenDsrcTollingZone(e, m, value):
+    extension = 0
+    e = (e << 1) | extension
+    e = (e << 1) | (1 if 'cenDsrcTollingZoneId' in value else 0)
+    protectedZoneLatitude = value['protectedZoneLatitude']
+    m += 2
+    if not -900000000 <= protectedZoneLatitude <= 900000001:
+        raise UperEncodeError(f"protectedZoneLatitude {protectedZoneLatitude} not in -900000000..900000001.")
+    e = (e << 31) | (protectedZoneLatitude - -900000000)
+    protectedZoneLongitude = value['protectedZoneLongitude']
+    m += 31
+    if not -1800000000 <= protectedZoneLongitude <= 1800000001:
+        raise UperEncodeError(f"protectedZoneLongitude {protectedZoneLongitude} not in -1800000000..1800000001.")
+    e = (e << 32) | (protectedZoneLongitude - -1800000000)
+    m += 32
+    if 'cenDsrcTollingZoneId' in value:
+        if not 0 <= value['cenDsrcTollingZoneId'] <= 134217727:
+            raise UperEncodeError(f"cenDsrcTollingZoneId {value['cenDsrcTollingZoneId']} not in 0..134217727.")
+        e = (e << 27) | value['cenDsrcTollingZoneId']
+        m += 27
+    return e, m
+
+
+def _encode_rsuContainerHighFrequency(e, m, value):
+    extension = 0
+    e = (e << 1) | extension
+    e = (e << 1) | (1 if 'protectedCommunicationZonesRSU' in value else 0)
+    m += 2
+    if 'protectedCommunicationZonesRSU' in value:
+        e, m = _encode_protectedCommunicationZonesRSU(e, m, value['protectedCommunicationZonesRSU'])
+    return e, m
+
+
+def _encode_protectedCommunicationZonesRSU(e, m, value):
+    count = len(value)
+    if not 1 <= count <= 16:
+        raise UperEncodeError(f"protectedCommunicationZonesRSU size {count} out of range.")
+    e = (e << 4) | (count - 1)
+    m += 4
+    for item in value:
+        e, m = _encode_value(e, m, item)
+    return e, m
+
+
+def _encode_value(e, m, value):
+    extension = 0
+    e = (e << 1) | extension
+    e = (e << 1) | (1 if 'expiryTime' in value else 0)
+    e = (e << 1) | (1 if 'protectedZoneRadius' in value else 0)
+    e = (e << 1) | (1 if 'protectedZoneId' in value else 0)
+    protectedZoneType = value['protectedZoneType']
+    m += 4
+    if protectedZoneType in _CONSTANT_10:
+        e = (e << 1) | 0
+        m += 1
+    else:
+        e = (e << 1) | 1
+        m += 1
+        e, m = _write_normally_small(e, m, _CONSTANT_11[protectedZoneType])
+    if 'expiryTime' in value:
+        if not 0 <= value['expiryTime'] <= 4398046511103:
+            raise UperEncodeError(f"expiryTime {value['expiryTime']} not in 0..4398046511103.")
+        e = (e << 42) | value['expiryTime']
+        m += 42
+    protectedZoneLatitude = value['protectedZoneLatitude']
+    if not -900000000 <= protectedZoneLatitude <= 900000001:
+        raise UperEncodeError(f"protectedZoneLatitude {protectedZoneLatitude} not in -900000000..900000001.")
+    e = (e << 31) | (protectedZoneLatitude - -900000000)
+    protectedZoneLongitude = value['protectedZoneLongitude']
+    m += 31
+    if not -1800000000 <= protectedZoneLongitude <= 1800000001:
+        raise UperEncodeError(f"protectedZoneLongitude {protectedZoneLongitude} not in -1800000000..1800000001.")
+    e = (e << 32) | (protectedZoneLongitude - -1800000000)
+    m += 32
+    if 'protectedZoneRadius' in value:
+        if 1 <= value['protectedZoneRadius'] <= 255:
+            e = (e << 1) | 0
+            e = (e << 8) | (value['protectedZoneRadius'] - 1)
+            m += 9
+        else:
+            e = (e << 1) | 1
+            m += 1
+            e, m = _write_unconstrained(e, m, value['protectedZoneRadius'])
+    if 'protectedZoneId' in value:
+        if not 0 <= value['protectedZoneId'] <= 134217727:
+            raise UperEncodeError(f"protectedZoneId {value['protectedZoneId']} not in 0..134217727.")
+        e = (e << 27) | value['protectedZoneId']
+        m += 27
+    return e, m
+
+
+def _encode_lowFrequencyContainer(e, m, value):
+    name, alternative = value
+    if name == 'basicVehicleContainerLowFrequency':
+        e = (e << 1) | 0
+        m += 1
+        e, m = _encode_basicVehicleContainerLowFrequency(e, m, alternative)
+    else:
+        raise UperEncodeError(f"Invalid choice {name!r}.")
+    return e, m
+
+
+def _encode_basicVehicleContainerLowFrequency(e, m, value):
+    vehicleRole = value['vehicleRole']
+    e = (e << 4) | _CONSTANT_12[vehicleRole]
+    exteriorLights = value['exteriorLights']
+    data, bits = exteriorLights
+    data, bits = _rstrip_bits(data, bits, 8)
+    m += 4
+    if not 8 <= bits <= 8:
+        raise UperEncodeError(f"exteriorLights size {bits} out of range.")
+    e, m = _write_bits(e, m, data, bits)
+    pathHistory = value['pathHistory']
+    e, m = _encode_pathHistory(e, m, pathHistory)
+    return e, m
+
+
+def _encode_pathHistory(e, m, value):
+    count = len(value)
+    if not 0 <= count <= 40:
+        raise UperEncodeError(f"pathHistory size {count} out of range.")
+    e = (e << 6) | (count - 0)
+    m += 6
+    for item in value:
+        e, m = _encode_value_2(e, m, item)
+    return e, m
+
+
+def _encode_value_2(e, m, value):
+    e = (e << 1) | (1 if 'pathDeltaTime' in value else 0)
+    pathPosition = value['pathPosition']
+    m += 1
+    e, m = _encode_pathPosition(e, m, pathPosition)
+    if 'pathDeltaTime' in value:
+        if 1 <= value['pathDeltaTime'] <= 65535:
+            e = (e << 1) | 0
+            e = (e << 16) | (value['pathDeltaTime'] - 1)
+            m += 17
+        else:
+            e = (e << 1) | 1
+            m += 1
+            e, m = _write_unconstrained(e, m, value['pathDeltaTime'])
+    return e, m
+
+
+def _encode_pathPosition(e, m, value):
+    deltaLatitude = value['deltaLatitude']
+    if not -131071 <= deltaLatitude <= 131072:
+        raise UperEncodeError(f"deltaLatitude {deltaLatitude} not in -131071..131072.")
+    e = (e << 18) | (deltaLatitude - -131071)
+    deltaLongitude = value['deltaLongitude']
+    m += 18
+    if not -131071 <= deltaLongitude <= 131072:
+        raise UperEncodeError(f"deltaLongitude {deltaLongitude} not in -131071..131072.")
+    e = (e << 18) | (deltaLongitude - -131071)
+    deltaAltitude = value['deltaAltitude']
+    m += 18
+    if not -12700 <= deltaAltitude <= 12800:
+        raise UperEncodeError(f"deltaAltitude {deltaAltitude} not in -12700..12800.")
+    e = (e << 15) | (deltaAltitude - -12700)
+    m += 15
+    return e, m
+
+
+def _encode_specialVehicleContainer(e, m, value):
+    name, alternative = value
+    if name == 'publicTransportContainer':
+        e = (e << 1) | 0
+        e = (e << 3) | 0
+        m += 4
+        e, m = _encode_publicTransportContainer(e, m, alternative)
+    elif name == 'specialTransportContainer':
+        e = (e << 1) | 0
+        e = (e << 3) | 1
+        m += 4
+        e, m = _encode_specialTransportContainer(e, m, alternative)
+    elif name == 'dangerousGoodsContainer':
+        e = (e << 1) | 0
+        e = (e << 3) | 2
+        m += 4
+        e, m = _encode_dangerousGoodsContainer(e, m, alternative)
+    elif name == 'roadWorksContainerBasic':
+        e = (e << 1) | 0
+        e = (e << 3) | 3
+        m += 4
+        e, m = _encode_roadWorksContainerBasic(e, m, alternative)
+    elif name == 'rescueContainer':
+        e = (e << 1) | 0
+        e = (e << 3) | 4
+        m += 4
+        e, m = _encode_rescueContainer(e, m, alternative)
+    elif name == 'emergencyContainer':
+        e = (e << 1) | 0
+        e = (e << 3) | 5
+        m += 4
+        e, m = _encode_emergencyContainer(e, m, alternative)
+    elif name == 'safetyCarContainer':
+        e = (e << 1) | 0
+        e = (e << 3) | 6
+        m += 4
+        e, m = _encode_safetyCarContainer(e, m, alternative)
+    else:
+        raise UperEncodeError(f"Invalid choice {name!r}.")
+    return e, m
+
+
+def _encode_publicTransportContainer(e, m, value):
+    e = (e << 1) | (1 if 'ptActivation' in value else 0)
+    embarkationStatus = value['embarkationStatus']
+    e = (e << 1) | (1 if embarkationStatus else 0)
+    m += 2
+    if 'ptActivation' in value:
+        e, m = _encode_ptActivation(e, m, value['ptActivation'])
+    return e, m
+
+
+def _encode_ptActivation(e, m, value):
+    ptActivationType = value['ptActivationType']
+    if not 0 <= ptActivationType <= 255:
+        raise UperEncodeError(f"ptActivationType {ptActivationType} not in 0..255.")
+    e = (e << 8) | ptActivationType
+    ptActivationData = value['ptActivationData']
+    m += 8
+    if not 1 <= len(ptActivationData) <= 20:
+        raise UperEncodeError(f"ptActivationData size {len(ptActivationData)} out of range.")
+    e = (e << 5) | (len(ptActivationData) - 1)
+    m += 5
+    e, m = _write_bytes(e, m, ptActivationData)
+    return e, m
+
+
+def _encode_specialTransportContainer(e, m, value):
+    specialTransportType = value['specialTransportType']
+    data, bits = specialTransportType
+    data, bits = _rstrip_bits(data, bits, 4)
+    if not 4 <= bits <= 4:
+        raise UperEncodeError(f"specialTransportType size {bits} out of range.")
+    e, m = _write_bits(e, m, data, bits)
+    lightBarSirenInUse = value['lightBarSirenInUse']
+    data_2, bits_2 = lightBarSirenInUse
+    data_2, bits_2 = _rstrip_bits(data_2, bits_2, 2)
+    if not 2 <= bits_2 <= 2:
+        raise UperEncodeError(f"lightBarSirenInUse size {bits_2} out of range.")
+    e, m = _write_bits(e, m, data_2, bits_2)
+    return e, m
+
+
+def _encode_dangerousGoodsContainer(e, m, value):
+    dangerousGoodsBasic = value['dangerousGoodsBasic']
+    e = (e << 5) | _CONSTANT_13[dangerousGoodsBasic]
+    m += 5
+    return e, m
+
+
+def _encode_roadWorksContainerBasic(e, m, value):
+    e = (e << 1) | (1 if 'roadworksSubCauseCode' in value else 0)
+    e = (e << 1) | (1 if 'closedLanes' in value else 0)
+    m += 2
+    if 'roadworksSubCauseCode' in value:
+        if not 0 <= value['roadworksSubCauseCode'] <= 255:
+            raise UperEncodeError(f"roadworksSubCauseCode {value['roadworksSubCauseCode']} not in 0..255.")
+        e = (e << 8) | value['roadworksSubCauseCode']
+        m += 8
+    lightBarSirenInUse = value['lightBarSirenInUse']
+    data, bits = lightBarSirenInUse
+    data, bits = _rstrip_bits(data, bits, 2)
+    if not 2 <= bits <= 2:
+        raise UperEncodeError(f"lightBarSirenInUse size {bits} out of range.")
+    e, m = _write_bits(e, m, data, bits)
+    if 'closedLanes' in value:
+        e, m = _encode_closedLanes(e, m, value['closedLanes'])
+    return e, m
+
+
+def _encode_closedLanes(e, m, value):
+    extension = 0
+    e = (e << 1) | extension
+    e = (e << 1) | (1 if 'innerhardShoulderStatus' in value else 0)
+    e = (e << 1) | (1 if 'outerhardShoulderStatus' in value else 0)
+    e = (e << 1) | (1 if 'drivingLaneStatus' in value else 0)
+    m += 4
+    if 'innerhardShoulderStatus' in value:
+        e = (e << 2) | _CONSTANT_14[value['innerhardShoulderStatus']]
+        m += 2
+    if 'outerhardShoulderStatus' in value:
+        e = (e << 2) | _CONSTANT_15[value['outerhardShoulderStatus']]
+        m += 2
+    if 'drivingLaneStatus' in value:
+        data, bits = value['drivingLaneStatus']
+        if not 1 <= bits <= 13:
+            raise UperEncodeError(f"drivingLaneStatus size {bits} out of range.")
+        e = (e << 4) | (bits - 1)
+        m += 4
+        e, m = _write_bits(e, m, data, bits)
+    return e, m
+
+
+def _encode_rescueContainer(e, m, value):
+    lightBarSirenInUse = value['lightBarSirenInUse']
+    data, bits = lightBarSirenInUse
+    data, bits = _rstrip_bits(data, bits, 2)
+    if not 2 <= bits <= 2:
+        raise UperEncodeError(f"lightBarSirenInUse size {bits} out of range.")
+    e, m = _write_bits(e, m, data, bits)
+    return e, m
+
+
+def _encode_emergencyContainer(e, m, value):
+    e = (e << 1) | (1 if 'incidentIndication' in value else 0)
+    e = (e << 1) | (1 if 'emergencyPriority' in value else 0)
+    lightBarSirenInUse = value['lightBarSirenInUse']
+    data, bits = lightBarSirenInUse
+    data, bits = _rstrip_bits(data, bits, 2)
+    m += 2
+    if not 2 <= bits <= 2:
+        raise UperEncodeError(f"lightBarSirenInUse size {bits} out of range.")
+    e, m = _write_bits(e, m, data, bits)
+    if 'incidentIndication' in value:
+        e, m = _encode_incidentIndication(e, m, value['incidentIndication'])
+    if 'emergencyPriority' in value:
+        data_2, bits_2 = value['emergencyPriority']
+        data_2, bits_2 = _rstrip_bits(data_2, bits_2, 2)
+        if not 2 <= bits_2 <= 2:
+            raise UperEncodeError(f"emergencyPriority size {bits_2} out of range.")
+        e, m = _write_bits(e, m, data_2, bits_2)
+    return e, m
+
+
+def _encode_incidentIndication(e, m, value):
+    extension = 0
+    e = (e << 1) | extension
+    causeCode = value['causeCode']
+    m += 1
+    if not 0 <= causeCode <= 255:
+        raise UperEncodeError(f"causeCode {causeCode} not in 0..255.")
+    e = (e << 8) | causeCode
+    subCauseCode = value['subCauseCode']
+    m += 8
+    if not 0 <= subCauseCode <= 255:
+        raise UperEncodeError(f"subCauseCode {subCauseCode} not in 0..255.")
+    e = (e << 8) | subCauseCode
+    m += 8
+    return e, m
+
+
+def _encode_safetyCarContainer(e, m, value):
+    e = (e << 1) | (1 if 'incidentIndication' in value else 0)
+    e = (e << 1) | (1 if 'trafficRule' in value else 0)
+    e = (e << 1) | (1 if 'speedLimit' in value else 0)
+    lightBarSirenInUse = value['lightBarSirenInUse']
+    data, bits = lightBarSirenInUse
+    data, bits = _rstrip_bits(data, bits, 2)
+    m += 3
+    if not 2 <= bits <= 2:
+        raise UperEncodeError(f"lightBarSirenInUse size {bits} out of range.")
+    e, m = _write_bits(e, m, data, bits)
+    if 'incidentIndication' in value:
+        e, m = _encode_incidentIndication(e, m, value['incidentIndication'])
+    if 'trafficRule' in value:
+        if value['trafficRule'] in _CONSTANT_16:
+            e = (e << 1) | 0
+            e = (e << 2) | _CONSTANT_16[value['trafficRule']]
+            m += 3
+        else:
+            e = (e << 1) | 1
+            m += 1
+            e, m = _write_normally_small(e, m, _CONSTANT_17[value['trafficRule']])
+    if 'speedLimit' in value:
+        if not 1 <= value['speedLimit'] <= 255:
+            raise UperEncodeError(f"speedLimit {value['speedLimit']} not in 1..255.")
+        e = (e << 8) | (value['speedLimit'] - 1)
+        m += 8
+    return e, m
+
+
+def _skip_cenDsrcTollingZone(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    present = (v >> (r - 2)) & 0x1
+    r -= 65
+    if present & 1:
+        r -= 27
+    if extension:
+        r = _skip_additions(v, r)
+    return r
+
+
+def _skip_lowFrequencyContainer(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    r -= 1
+    if extension:
+        r = _skip_choice_addition(v, r)
+    else:
+        r = _skip_basicVehicleContainerLowFrequency(v, r)
+    return r
+
+
+def _skip_basicVehicleContainerLowFrequency(v, r):
+    r -= 4
+    _, r = _read_bits(v, r, 8)
+    r = _skip_pathHistory(v, r)
+    return r
+
+
+def _skip_pathHistory(v, r):
+    count = (v >> (r - 6)) & 0x3f
+    r -= 6
+    for _ in range(count):
+        r = _skip_value(v, r)
+    return r
+
+
+def _skip_value(v, r):
+    present = (v >> (r - 1)) & 0x1
+    r -= 52
+    if present & 1:
+        extension = (v >> (r - 1)) & 0x1
+        r -= 1
+        if extension:
+            _, r = _read_unconstrained(v, r)
+        else:
+            _ = ((v >> (r - 16)) & 0xffff) + 1
+            r -= 16
+    return r
+
+
+def _skip_specialVehicleContainer(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    r -= 1
+    if extension:
+        r = _skip_choice_addition(v, r)
+    else:
+        index = (v >> (r - 3)) & 0x7
+        r -= 3
+        if index == 0:
+            r = _skip_publicTransportContainer(v, r)
+        elif index == 1:
+            r = _skip_specialTransportContainer(v, r)
+        elif index == 2:
+            r -= 5
+        elif index == 3:
+            r = _skip_roadWorksContainerBasic(v, r)
+        elif index == 4:
+            r = _skip_rescueContainer(v, r)
+        elif index == 5:
+            r = _skip_emergencyContainer(v, r)
+        elif index == 6:
+            r = _skip_safetyCarContainer(v, r)
+        else:
+            raise UperDecodeError(f"Invalid choice index {index}.")
+    return r
+
+
+def _skip_publicTransportContainer(v, r):
+    present = (v >> (r - 1)) & 0x1
+    r -= 2
+    if present & 1:
+        r = _skip_ptActivation(v, r)
+    return r
+
+
+def _skip_ptActivation(v, r):
+    _ = ((v >> (r - 13)) & 0x1f) + 1
+    r -= 13
+    _, r = _read_bytes(v, r, _)
+    return r
+
+
+def _skip_specialTransportContainer(v, r):
+    _, r = _read_bits(v, r, 4)
+    __2, r = _read_bits(v, r, 2)
+    return r
+
+
+def _skip_roadWorksContainerBasic(v, r):
+    present = (v >> (r - 2)) & 0x3
+    r -= 2
+    if present & 2:
+        r -= 8
+    _, r = _read_bits(v, r, 2)
+    if present & 1:
+        r = _skip_closedLanes(v, r)
+    return r
+
+
+def _skip_closedLanes(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    present = (v >> (r - 4)) & 0x7
+    r -= 4
+    if present & 4:
+        r -= 2
+    if present & 2:
+        r -= 2
+    if present & 1:
+        _ = ((v >> (r - 4)) & 0xf) + 1
+        r -= 4
+        _, r = _read_bits(v, r, _)
+    if extension:
+        r = _skip_additions(v, r)
+    return r
+
+
+def _skip_rescueContainer(v, r):
+    _, r = _read_bits(v, r, 2)
+    return r
+
+
+def _skip_emergencyContainer(v, r):
+    present = (v >> (r - 2)) & 0x3
+    r -= 2
+    _, r = _read_bits(v, r, 2)
+    if present & 2:
+        r = _skip_incidentIndication(v, r)
+    if present & 1:
+        __2, r = _read_bits(v, r, 2)
+    return r
+
+
+def _skip_incidentIndication(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    r -= 17
+    if extension:
+        r = _skip_additions(v, r)
+    return r
+
+
+def _skip_safetyCarContainer(v, r):
+    present = (v >> (r - 3)) & 0x7
+    r -= 3
+    _, r = _read_bits(v, r, 2)
+    if present & 4:
+        r = _skip_incidentIndication(v, r)
+    if present & 2:
+        extension = (v >> (r - 1)) & 0x1
+        r -= 1
+        if extension:
+            __2, r = _read_normally_small(v, r)
+            __2 = _CONSTANT_20.get(__2)
+        else:
+            __2 = (v >> (r - 2)) & 0x3
+            r -= 2
+    if present & 1:
+        r -= 8
+    return r
+
+
+def _decode_CPM(v, r):
+    header, r = _decode_header_2(v, r)
+    cpm, r = _decode_cpm(v, r)
+    result = {'header': header, 'cpm': cpm}
+    return result, r
+
+
+def _decode_header_2(v, r):
+    protocolVersion = (v >> (r - 8)) & 0xff
+    messageID = (v >> (r - 16)) & 0xff
+    stationID = (v >> (r - 48)) & 0xffffffff
+    result = {'protocolVersion': protocolVersion, 'messageID': messageID, 'stationID': stationID}
+    r -= 48
+    return result, r
+
+
+def _decode_cpm(v, r):
+    generationDeltaTime = (v >> (r - 16)) & 0xffff
+    r -= 16
+    cpmParameters, r = _decode_cpmParameters(v, r)
+    result = {'generationDeltaTime': generationDeltaTime, 'cpmParameters': cpmParameters}
+    return result, r
+
+
+def _decode_cpmParameters(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    present = (v >> (r - 5)) & 0xf
+    r -= 5
+    managementContainer, r = _decode_managementContainer(v, r)
+    if present & 8:
+        stationDataContainer, r = _decode_stationDataContainer(v, r)
+    if present & 4:
+        sensorInformationContainer, r = _decode_sensorInformationContainer(v, r)
+    if present & 2:
+        perceivedObjectContainer, r = _decode_perceivedObjectContainer(v, r)
+    if present & 1:
+        freeSpaceAddendumContainer, r = _decode_freeSpaceAddendumContainer(v, r)
+    numberOfPerceivedObjects = (v >> (r - 8)) & 0xff
+    result = {'managementContainer': managementContainer, 'numberOfPerceivedObjects': numberOfPerceivedObjects}
+    r -= 8
+    if present & 8:
+        result['stationDataContainer'] = stationDataContainer
+    if present & 4:
+        result['sensorInformationContainer'] = sensorInformationContainer
+    if present & 2:
+        result['perceivedObjectContainer'] = perceivedObjectContainer
+    if present & 1:
+        result['freeSpaceAddendumContainer'] = freeSpaceAddendumContainer
+    if extension:
+        r = _skip_additions(v, r)
+    return result, r
+
+
+def _decode_managementContainer(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    present = (v >> (r - 2)) & 0x1
+    stationType = (v >> (r - 10)) & 0xff
+    r -= 10
+    if present & 1:
+        perceivedObjectContainerSegmentInfo, r = _decode_perceivedObjectContainerSegmentInfo(v, r)
+    referencePosition, r = _decode_referencePosition(v, r)
+    result = {'stationType': stationType, 'referencePosition': referencePosition}
+    if present & 1:
+        result['perceivedObjectContainerSegmentInfo'] = perceivedObjectContainerSegmentInfo
+    if extension:
+        r = _skip_additions(v, r)
+    return result, r
+
+
+def _decode_perceivedObjectContainerSegmentInfo(v, r):
+    totalMsgSegments = ((v >> (r - 7)) & 0x7f) + 1
+    thisSegmentNum = ((v >> (r - 14)) & 0x7f) + 1
+    result = {'totalMsgSegments': totalMsgSegments, 'thisSegmentNum': thisSegmentNum}
+    r -= 14
+    return result, r
+
+
+def _decode_stationDataContainer(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    r -= 1
+    if extension:
+        index, r = _read_normally_small(v, r)
+        end, r = _read_length(v, r)
+        end = r - 8 * end
+        result = (None, None)
+        r = end
+    else:
+        index_2 = (v >> (r - 1)) & 0x1
+        r -= 1
+        if index_2 == 0:
+            originatingVehicleContainer, r = _decode_originatingVehicleContainer(v, r)
+            result = ('originatingVehicleContainer', originatingVehicleContainer)
+        elif index_2 == 1:
+            originatingRSUContainer, r = _decode_originatingRSUContainer(v, r)
+            result = ('originatingRSUContainer', originatingRSUContainer)
+        else:
+            raise UperDecodeError(f"Invalid choice index {index_2}.")
+    return result, r
+
+
+def _decode_originatingVehicleContainer(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    present = (v >> (r - 13)) & 0xfff
+    r -= 13
+    heading, r = _decode_heading(v, r)
+    speed, r = _decode_speed(v, r)
+    if present & 2048:
+        vehicleOrientationAngle, r = _decode_vehicleOrientationAngle(v, r)
+    if present & 1024:
+        driveDirection = (v >> (r - 2)) & 0x3
+        r -= 2
+        if driveDirection >= 3:
+            raise UperDecodeError(f"Invalid enumeration index {driveDirection}.")
+    if present & 512:
+        longitudinalAcceleration, r = _decode_longitudinalAcceleration(v, r)
+    if present & 256:
+        lateralAcceleration, r = _decode_lateralAcceleration(v, r)
+    if present & 128:
+        verticalAcceleration, r = _decode_verticalAcceleration(v, r)
+    if present & 64:
+        yawRate, r = _decode_yawRate(v, r)
+    if present & 32:
+        pitchAngle, r = _decode_vehicleOrientationAngle(v, r)
+    if present & 16:
+        rollAngle, r = _decode_vehicleOrientationAngle(v, r)
+    if present & 8:
+        vehicleLength, r = _decode_vehicleLength(v, r)
+    if present & 4:
+        vehicleWidth = ((v >> (r - 6)) & 0x3f) + 1
+        r -= 6
+    if present & 2:
+        vehicleHeight = (v >> (r - 7)) & 0x7f
+        r -= 7
+    if present & 1:
+        trailerDataContainer, r = _decode_trailerDataContainer(v, r)
+    result = {'heading': heading, 'speed': speed}
+    if present & 2048:
+        result['vehicleOrientationAngle'] = vehicleOrientationAngle
+    if present & 1024:
+        result['driveDirection'] = driveDirection
+    else:
+        result['driveDirection'] = 0
+    if present & 512:
+        result['longitudinalAcceleration'] = longitudinalAcceleration
+    if present & 256:
+        result['lateralAcceleration'] = lateralAcceleration
+    if present & 128:
+        result['verticalAcceleration'] = verticalAcceleration
+    if present & 64:
+        result['yawRate'] = yawRate
+    if present & 32:
+        result['pitchAngle'] = pitchAngle
+    if present & 16:
+        result['rollAngle'] = rollAngle
+    if present & 8:
+        result['vehicleLength'] = vehicleLength
+    if present & 4:
+        result['vehicleWidth'] = vehicleWidth
+    if present & 2:
+        result['vehicleHeight'] = vehicleHeight
+    if present & 1:
+        result['trailerDataContainer'] = trailerDataContainer
+    if extension:
+        r = _skip_additions(v, r)
+    return result, r
+
+
+def _decode_vehicleOrientationAngle(v, r):
+    value_2 = (v >> (r - 12)) & 0xfff
+    confidence = ((v >> (r - 19)) & 0x7f) + 1
+    result = {'value': value_2, 'confidence': confidence}
+    r -= 19
+    return result, r
+
+
+def _decode_trailerDataContainer(v, r):
+    count = ((v >> (r - 1)) & 0x1) + 1
+    result = []
+    r -= 1
+    for _ in range(count):
+        item, r = _decode_value_3(v, r)
+        result.append(item)
+    return result, r
+
+
+def _decode_value_3(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    present = (v >> (r - 3)) & 0x3
+    refPointId = (v >> (r - 11)) & 0xff
+    hitchPointOffset = (v >> (r - 18)) & 0x7f
+    frontOverhang = (v >> (r - 24)) & 0x3f
+    rearOverhang = (v >> (r - 32)) & 0xff
+    r -= 32
+    if present & 2:
+        trailerWidth = ((v >> (r - 6)) & 0x3f) + 1
+        r -= 6
+    if present & 1:
+        hitchAngle, r = _decode_vehicleOrientationAngle(v, r)
+    result = {'refPointId': refPointId, 'hitchPointOffset': hitchPointOffset, 'frontOverhang': frontOverhang, 'rearOverhang': rearOverhang}
+    if present & 2:
+        result['trailerWidth'] = trailerWidth
+    if present & 1:
+        result['hitchAngle'] = hitchAngle
+    if extension:
+        r = _skip_additions(v, r)
+    return result, r
+
+
+def _decode_originatingRSUContainer(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    r -= 1
+    if extension:
+        index, r = _read_normally_small(v, r)
+        end, r = _read_length(v, r)
+        end = r - 8 * end
+        result = (None, None)
+        r = end
+    else:
+        index_2 = (v >> (r - 1)) & 0x1
+        r -= 1
+        if index_2 == 0:
+            intersectionReferenceId, r = _decode_intersectionReferenceId(v, r)
+            result = ('intersectionReferenceId', intersectionReferenceId)
+        elif index_2 == 1:
+            roadSegmentReferenceId, r = _decode_intersectionReferenceId(v, r)
+            result = ('roadSegmentReferenceId', roadSegmentReferenceId)
+        else:
+            raise UperDecodeError(f"Invalid choice index {index_2}.")
+    return result, r
+
+
+def _decode_intersectionReferenceId(v, r):
+    present = (v >> (r - 1)) & 0x1
+    r -= 1
+    if present & 1:
+        region = (v >> (r - 16)) & 0xffff
+        r -= 16
+    id_2 = (v >> (r - 16)) & 0xffff
+    result = {'id': id_2}
+    r -= 16
+    if present & 1:
+        result['region'] = region
+    return result, r
+
+
+def _decode_sensorInformationContainer(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    r -= 1
+    if extension:
+        count, r = _read_length(v, r)
+    else:
+        count = ((v >> (r - 7)) & 0x7f) + 1
+        r -= 7
+    result = []
+    for _ in range(count):
+        item, r = _decode_value_4(v, r)
+        result.append(item)
+    return result, r
+
+
+def _decode_value_4(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    present = (v >> (r - 2)) & 0x1
+    sensorID = (v >> (r - 10)) & 0xff
+    type_2 = (v >> (r - 14)) & 0xf
+    r -= 14
+    detectionArea, r = _decode_detectionArea(v, r)
+    if present & 1:
+        freeSpaceConfidence = (v >> (r - 7)) & 0x7f
+        r -= 7
+    result = {'sensorID': sensorID, 'type': type_2, 'detectionArea': detectionArea}
+    if present & 1:
+        result['freeSpaceConfidence'] = freeSpaceConfidence
+    if extension:
+        r = _skip_additions(v, r)
+    return result, r
+
+
+def _decode_detectionArea(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    r -= 1
+    if extension:
+        index, r = _read_normally_small(v, r)
+        end, r = _read_length(v, r)
+        end = r - 8 * end
+        result = (None, None)
+        r = end
+    else:
+        index_2 = (v >> (r - 3)) & 0x7
+        r -= 3
+        if index_2 == 0:
+            vehicleSensor, r = _decode_vehicleSensor(v, r)
+            result = ('vehicleSensor', vehicleSensor)
+        elif index_2 == 1:
+            stationarySensorRadial, r = _decode_stationarySensorRadial(v, r)
+            result = ('stationarySensorRadial', stationarySensorRadial)
+        elif index_2 == 2:
+            stationarySensorPolygon, r = _decode_stationarySensorPolygon(v, r)
+            result = ('stationarySensorPolygon', stationarySensorPolygon)
+        elif index_2 == 3:
+            stationarySensorCircular, r = _decode_stationarySensorCircular(v, r)
+            result = ('stationarySensorCircular', stationarySensorCircular)
+        elif index_2 == 4:
+            stationarySensorEllipse, r = _decode_stationarySensorEllipse(v, r)
+            result = ('stationarySensorEllipse', stationarySensorEllipse)
+        elif index_2 == 5:
+            stationarySensorRectangle, r = _decode_stationarySensorRectangle(v, r)
+            result = ('stationarySensorRectangle', stationarySensorRectangle)
+        else:
+            raise UperDecodeError(f"Invalid choice index {index_2}.")
+    return result, r
+
+
+def _decode_vehicleSensor(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    present = (v >> (r - 3)) & 0x3
+    r -= 3
+    if present & 2:
+        refPointId = (v >> (r - 8)) & 0xff
+        r -= 8
+    xSensorOffset = ((v >> (r - 13)) & 0x1fff) + -5000
+    ySensorOffset = ((v >> (r - 24)) & 0x7ff) + -1000
+    r -= 24
+    if present & 1:
+        zSensorOffset = (v >> (r - 10)) & 0x3ff
+        r -= 10
+    vehicleSensorPropertyList, r = _decode_vehicleSensorPropertyList(v, r)
+    result = {'xSensorOffset': xSensorOffset, 'ySensorOffset': ySensorOffset, 'vehicleSensorPropertyList': vehicleSensorPropertyList}
+    if present & 2:
+        result['refPointId'] = refPointId
+    else:
+        result['refPointId'] = 0
+    if present & 1:
+        result['zSensorOffset'] = zSensorOffset
+    if extension:
+        r = _skip_additions(v, r)
+    return result, r
+
+
+def _decode_vehicleSensorPropertyList(v, r):
+    count = ((v >> (r - 4)) & 0xf) + 1
+    result = []
+    r -= 4
+    for _ in range(count):
+        item, r = _decode_value_5(v, r)
+        result.append(item)
+    return result, r
+
+
+def _decode_value_5(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    present = (v >> (r - 3)) & 0x3
+    range_2 = (v >> (r - 17)) & 0x3fff
+    horizontalOpeningAngleStart = (v >> (r - 29)) & 0xfff
+    horizontalOpeningAngleEnd = (v >> (r - 41)) & 0xfff
+    r -= 41
+    if present & 2:
+        verticalOpeningAngleStart = (v >> (r - 12)) & 0xfff
+        r -= 12
+    if present & 1:
+        verticalOpeningAngleEnd = (v >> (r - 12)) & 0xfff
+        r -= 12
+    result = {'range': range_2, 'horizontalOpeningAngleStart': horizontalOpeningAngleStart, 'horizontalOpeningAngleEnd': horizontalOpeningAngleEnd}
+    if present & 2:
+        result['verticalOpeningAngleStart'] = verticalOpeningAngleStart
+    if present & 1:
+        result['verticalOpeningAngleEnd'] = verticalOpeningAngleEnd
+    if extension:
+        r = _skip_additions(v, r)
+    return result, r
+
+
+def _decode_stationarySensorRadial(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    present = (v >> (r - 5)) & 0xf
+    range_2 = (v >> (r - 19)) & 0x3fff
+    stationaryHorizontalOpeningAngleStart = (v >> (r - 31)) & 0xfff
+    stationaryHorizontalOpeningAngleEnd = (v >> (r - 43)) & 0xfff
+    r -= 43
+    if present & 8:
+        verticalOpeningAngleStart = (v >> (r - 12)) & 0xfff
+        r -= 12
+    if present & 4:
+        verticalOpeningAngleEnd = (v >> (r - 12)) & 0xfff
+        r -= 12
+    if present & 2:
+        sensorPositionOffset, r = _decode_sensorPositionOffset(v, r)
+    if present & 1:
+        sensorHeight = ((v >> (r - 14)) & 0x3fff) + -5000
+        r -= 14
+    result = {'range': range_2, 'stationaryHorizontalOpeningAngleStart': stationaryHorizontalOpeningAngleStart, 'stationaryHorizontalOpeningAngleEnd': stationaryHorizontalOpeningAngleEnd}
+    if present & 8:
+        result['verticalOpeningAngleStart'] = verticalOpeningAngleStart
+    if present & 4:
+        result['verticalOpeningAngleEnd'] = verticalOpeningAngleEnd
+    if present & 2:
+        result['sensorPositionOffset'] = sensorPositionOffset
+    if present & 1:
+        result['sensorHeight'] = sensorHeight
+    if extension:
+        r = _skip_additions(v, r)
+    return result, r
+
+
+def _decode_sensorPositionOffset(v, r):
+    present = (v >> (r - 1)) & 0x1
+    r -= 1
+    nodeOffsetPointxy, r = _decode_nodeOffsetPointxy(v, r)
+    if present & 1:
+        nodeOffsetPointZ, r = _decode_nodeOffsetPointZ(v, r)
+    result = {'nodeOffsetPointxy': nodeOffsetPointxy}
+    if present & 1:
+        result['nodeOffsetPointZ'] = nodeOffsetPointZ
+    return result, r
+
+
+def _decode_nodeOffsetPointxy(v, r):
+    index = (v >> (r - 3)) & 0x7
+    r -= 3
+    if index == 0:
+        node_XY1, r = _decode_node_XY1(v, r)
+        result = ('node-XY1', node_XY1)
+    elif index == 1:
+        node_XY2, r = _decode_node_XY2(v, r)
+        result = ('node-XY2', node_XY2)
+    elif index == 2:
+        node_XY3, r = _decode_node_XY3(v, r)
+        result = ('node-XY3', node_XY3)
+    elif index == 3:
+        node_XY4, r = _decode_node_XY4(v, r)
+        result = ('node-XY4', node_XY4)
+    elif index == 4:
+        node_XY5, r = _decode_node_XY5(v, r)
+        result = ('node-XY5', node_XY5)
+    elif index == 5:
+        node_XY6, r = _decode_node_XY6(v, r)
+        result = ('node-XY6', node_XY6)
+    elif index == 6:
+        node_LatLon, r = _decode_node_LatLon(v, r)
+        result = ('node-LatLon', node_LatLon)
+    elif index == 7:
+        regional, r = _decode_regional(v, r)
+        result = ('regional', regional)
+    else:
+        raise UperDecodeError(f"Invalid choice index {index}.")
+    return result, r
+
+
+def _decode_node_XY1(v, r):
+    x = ((v >> (r - 10)) & 0x3ff) + -512
+    y = ((v >> (r - 20)) & 0x3ff) + -512
+    result = {'x': x, 'y': y}
+    r -= 20
+    return result, r
+
+
+def _decode_node_XY2(v, r):
+    x = ((v >> (r - 11)) & 0x7ff) + -1024
+    y = ((v >> (r - 22)) & 0x7ff) + -1024
+    result = {'x': x, 'y': y}
+    r -= 22
+    return result, r
+
+
+def _decode_node_XY3(v, r):
+    x = ((v >> (r - 12)) & 0xfff) + -2048
+    y = ((v >> (r - 24)) & 0xfff) + -2048
+    result = {'x': x, 'y': y}
+    r -= 24
+    return result, r
+
+
+def _decode_node_XY4(v, r):
+    x = ((v >> (r - 13)) & 0x1fff) + -4096
+    y = ((v >> (r - 26)) & 0x1fff) + -4096
+    result = {'x': x, 'y': y}
+    r -= 26
+    return result, r
+
+
+def _decode_node_XY5(v, r):
+    x = ((v >> (r - 14)) & 0x3fff) + -8192
+    y = ((v >> (r - 28)) & 0x3fff) + -8192
+    result = {'x': x, 'y': y}
+    r -= 28
+    return result, r
+
+
+def _decode_node_XY6(v, r):
+    x = ((v >> (r - 16)) & 0xffff) + -32768
+    y = ((v >> (r - 32)) & 0xffff) + -32768
+    result = {'x': x, 'y': y}
+    r -= 32
+    return result, r
+
+
+def _decode_node_LatLon(v, r):
+    lon = ((v >> (r - 32)) & 0xffffffff) + -1800000000
+    lat = ((v >> (r - 63)) & 0x7fffffff) + -900000000
+    result = {'lon': lon, 'lat': lat}
+    r -= 63
+    return result, r
+
+
+def _decode_regional(v, r):
+    regionId = (v >> (r - 8)) & 0xff
+    r -= 8
+    regExtValue, r = _read_length(v, r)
+    regExtValue, r = _read_bytes(v, r, regExtValue)
+    result = {'regionId': regionId, 'regExtValue': regExtValue}
+    return result, r
+
+
+def _decode_nodeOffsetPointZ(v, r):
+    index = (v >> (r - 3)) & 0x7
+    r -= 3
+    if index == 0:
+        node_Z1 = ((v >> (r - 10)) & 0x3ff) + -512
+        result = ('node-Z1', node_Z1)
+        r -= 10
+    elif index == 1:
+        node_Z2 = ((v >> (r - 11)) & 0x7ff) + -1024
+        result = ('node-Z2', node_Z2)
+        r -= 11
+    elif index == 2:
+        node_Z3 = ((v >> (r - 12)) & 0xfff) + -2048
+        result = ('node-Z3', node_Z3)
+        r -= 12
+    elif index == 3:
+        node_Z4 = ((v >> (r - 13)) & 0x1fff) + -4096
+        result = ('node-Z4', node_Z4)
+        r -= 13
+    elif index == 4:
+        node_Z5 = ((v >> (r - 14)) & 0x3fff) + -8192
+        result = ('node-Z5', node_Z5)
+        r -= 14
+    elif index == 5:
+        node_Z6 = ((v >> (r - 16)) & 0xffff) + -32768
+        result = ('node-Z6', node_Z6)
+        r -= 16
+    else:
+        raise UperDecodeError(f"Invalid choice index {index}.")
+    return result, r
+
+
+def _decode_stationarySensorPolygon(v, r):
+    polyPointList, r = _decode_polyPointList(v, r)
+    result = {'polyPointList': polyPointList}
+    return result, r
+
+
+def _decode_polyPointList(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    r -= 1
+    if extension:
+        count, r = _read_length(v, r)
+    else:
+        count = ((v >> (r - 4)) & 0xf) + 3
+        r -= 4
+    result = []
+    for _ in range(count):
+        item, r = _decode_sensorPositionOffset(v, r)
+        result.append(item)
+    return result, r
+
+
+def _decode_stationarySensorCircular(v, r):
+    present = (v >> (r - 1)) & 0x1
+    r -= 1
+    if present & 1:
+        nodeCenterPoint, r = _decode_sensorPositionOffset(v, r)
+    radius = (v >> (r - 14)) & 0x3fff
+    result = {'radius': radius}
+    r -= 14
+    if present & 1:
+        result['nodeCenterPoint'] = nodeCenterPoint
+    return result, r
+
+
+def _decode_stationarySensorEllipse(v, r):
+    present = (v >> (r - 2)) & 0x3
+    r -= 2
+    if present & 2:
+        nodeCenterPoint, r = _decode_sensorPositionOffset(v, r)
+    semiMinorRangeLength = (v >> (r - 14)) & 0x3fff
+    semiMajorRangeLength = (v >> (r - 28)) & 0x3fff
+    semiMajorRangeOrientation = (v >> (r - 40)) & 0xfff
+    r -= 40
+    if present & 1:
+        semiHeight = (v >> (r - 14)) & 0x3fff
+        r -= 14
+    result = {'semiMinorRangeLength': semiMinorRangeLength, 'semiMajorRangeLength': semiMajorRangeLength, 'semiMajorRangeOrientation': semiMajorRangeOrientation}
+    if present & 2:
+        result['nodeCenterPoint'] = nodeCenterPoint
+    if present & 1:
+        result['semiHeight'] = semiHeight
+    return result, r
+
+
+def _decode_stationarySensorRectangle(v, r):
+    present = (v >> (r - 2)) & 0x3
+    r -= 2
+    if present & 2:
+        nodeCenterPoint, r = _decode_sensorPositionOffset(v, r)
+    semiMajorRangeLength = (v >> (r - 14)) & 0x3fff
+    semiMinorRangeLength = (v >> (r - 28)) & 0x3fff
+    semiMajorRangeOrientation = (v >> (r - 40)) & 0xfff
+    r -= 40
+    if present & 1:
+        semiHeight = (v >> (r - 14)) & 0x3fff
+        r -= 14
+    result = {'semiMajorRangeLength': semiMajorRangeLength, 'semiMinorRangeLength': semiMinorRangeLength, 'semiMajorRangeOrientation': semiMajorRangeOrientation}
+    if present & 2:
+        result['nodeCenterPoint'] = nodeCenterPoint
+    if present & 1:
+        result['semiHeight'] = semiHeight
+    return result, r
+
+
+def _decode_perceivedObjectContainer(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    r -= 1
+    if extension:
+        count, r = _read_length(v, r)
+    else:
+        count = ((v >> (r - 7)) & 0x7f) + 1
+        r -= 7
+    result = []
+    for _ in range(count):
+        item, r = _decode_value_6(v, r)
+        result.append(item)
+    return result, r
+
+
+def _decode_value_6(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    present = (v >> (r - 17)) & 0xffff
+    objectID = (v >> (r - 25)) & 0xff
+    r -= 25
+    if present & 32768:
+        sensorIDList, r = _decode_sensorIDList(v, r)
+    timeOfMeasurement = ((v >> (r - 12)) & 0xfff) + -1500
+    r -= 12
+    if present & 16384:
+        objectAge = (v >> (r - 11)) & 0x7ff
+        r -= 11
+    if present & 8192:
+        objectConfidence = (v >> (r - 7)) & 0x7f
+        r -= 7
+    xDistance, r = _decode_xDistance(v, r)
+    yDistance, r = _decode_xDistance(v, r)
+    if present & 4096:
+        zDistance, r = _decode_xDistance(v, r)
+    xSpeed, r = _decode_xSpeed(v, r)
+    ySpeed, r = _decode_xSpeed(v, r)
+    if present & 2048:
+        zSpeed, r = _decode_xSpeed(v, r)
+    if present & 1024:
+        xAcceleration, r = _decode_longitudinalAcceleration(v, r)
+    if present & 512:
+        yAcceleration, r = _decode_lateralAcceleration(v, r)
+    if present & 256:
+        zAcceleration, r = _decode_verticalAcceleration(v, r)
+    if present & 128:
+        yawAngle, r = _decode_vehicleOrientationAngle(v, r)
+    if present & 64:
+        planarObjectDimension1, r = _decode_planarObjectDimension1(v, r)
+    if present & 32:
+        planarObjectDimension2, r = _decode_planarObjectDimension1(v, r)
+    if present & 16:
+        verticalObjectDimension, r = _decode_planarObjectDimension1(v, r)
+    if present & 8:
+        objectRefPoint = (v >> (r - 4)) & 0xf
+        r -= 4
+    if present & 4:
+        dynamicStatus = (v >> (r - 2)) & 0x3
+        r -= 2
+    if present & 2:
+        classification, r = _decode_classification(v, r)
+    if present & 1:
+        matchedPosition, r = _decode_matchedPosition(v, r)
+    result = {'objectID': objectID, 'timeOfMeasurement': timeOfMeasurement, 'xDistance': xDistance, 'yDistance': yDistance, 'xSpeed': xSpeed, 'ySpeed': ySpeed}
+    if present & 32768:
+        result['sensorIDList'] = sensorIDList
+    if present & 16384:
+        result['objectAge'] = objectAge
+    if present & 8192:
+        result['objectConfidence'] = objectConfidence
+    else:
+        result['objectConfidence'] = 0
+    if present & 4096:
+        result['zDistance'] = zDistance
+    if present & 2048:
+        result['zSpeed'] = zSpeed
+    if present & 1024:
+        result['xAcceleration'] = xAcceleration
+    if present & 512:
+        result['yAcceleration'] = yAcceleration
+    if present & 256:
+        result['zAcceleration'] = zAcceleration
+    if present & 128:
+        result['yawAngle'] = yawAngle
+    if present & 64:
+        result['planarObjectDimension1'] = planarObjectDimension1
+    if present & 32:
+        result['planarObjectDimension2'] = planarObjectDimension2
+    if present & 16:
+        result['verticalObjectDimension'] = verticalObjectDimension
+    if present & 8:
+        result['objectRefPoint'] = objectRefPoint
+    else:
+        result['objectRefPoint'] = 0
+    if present & 4:
+        result['dynamicStatus'] = dynamicStatus
+    if present & 2:
+        result['classification'] = classification
+    if present & 1:
+        result['matchedPosition'] = matchedPosition
+    if extension:
+        r = _skip_additions(v, r)
+    return result, r
+
+
+def _decode_sensorIDList(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    r -= 1
+    if extension:
+        count, r = _read_length(v, r)
+    else:
+        count = ((v >> (r - 7)) & 0x7f) + 1
+        r -= 7
+    result = []
+    for _ in range(count):
+        item = (v >> (r - 8)) & 0xff
+        result.append(item)
+        r -= 8
+    return result, r
+
+
+def _decode_xDistance(v, r):
+    value_2 = ((v >> (r - 19)) & 0x7ffff) + -132768
+    confidence = (v >> (r - 26)) & 0x7f
+    result = {'value': value_2, 'confidence': confidence}
+    r -= 26
+    return result, r
+
+
+def _decode_xSpeed(v, r):
+    value_2 = ((v >> (r - 15)) & 0x7fff) + -16383
+    confidence = ((v >> (r - 22)) & 0x7f) + 1
+    result = {'value': value_2, 'confidence': confidence}
+    r -= 22
+    return result, r
+
+
+def _decode_planarObjectDimension1(v, r):
+    value_2 = (v >> (r - 10)) & 0x3ff
+    confidence = (v >> (r - 17)) & 0x7f
+    result = {'value': value_2, 'confidence': confidence}
+    r -= 17
+    return result, r
+
+
+def _decode_classification(v, r):
+    count = ((v >> (r - 3)) & 0x7) + 1
+    result = []
+    r -= 3
+    for _ in range(count):
+        item, r = _decode_value_7(v, r)
+        result.append(item)
+    return result, r
+
+
+def _decode_value_7(v, r):
+    confidence = (v >> (r - 7)) & 0x7f
+    r -= 7
+    class_2, r = _decode_class(v, r)
+    result = {'confidence': confidence, 'class': class_2}
+    return result, r
+
+
+def _decode_class(v, r):
+    index = (v >> (r - 2)) & 0x3
+    r -= 2
+    if index == 0:
+        vehicle, r = _decode_vehicle(v, r)
+        result = ('vehicle', vehicle)
+    elif index == 1:
+        person, r = _decode_vehicle(v, r)
+        result = ('person', person)
+    elif index == 2:
+        animal, r = _decode_vehicle(v, r)
+        result = ('animal', animal)
+    elif index == 3:
+        other, r = _decode_vehicle(v, r)
+        result = ('other', other)
+    else:
+        raise UperDecodeError(f"Invalid choice index {index}.")
+    return result, r
+
+
+def _decode_vehicle(v, r):
+    present = (v >> (r - 2)) & 0x3
+    r -= 2
+    if present & 2:
+        type_2 = (v >> (r - 8)) & 0xff
+        r -= 8
+    if present & 1:
+        confidence = (v >> (r - 7)) & 0x7f
+        r -= 7
+    result = {}
+    if present & 2:
+        result['type'] = type_2
+    else:
+        result['type'] = 0
+    if present & 1:
+        result['confidence'] = confidence
+    else:
+        result['confidence'] = 0
+    return result, r
+
+
+def _decode_matchedPosition(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    present = (v >> (r - 3)) & 0x3
+    r -= 3
+    if present & 2:
+        laneID = (v >> (r - 8)) & 0xff
+        r -= 8
+    if present & 1:
+        longitudinalLanePosition, r = _decode_longitudinalLanePosition(v, r)
+    result = {}
+    if present & 2:
+        result['laneID'] = laneID
+    if present & 1:
+        result['longitudinalLanePosition'] = longitudinalLanePosition
+    if extension:
+        r = _skip_additions(v, r)
+    return result, r
+
+
+def _decode_longitudinalLanePosition(v, r):
+    longitudinalLanePositionValue = (v >> (r - 15)) & 0x7fff
+    longitudinalLanePositionConfidence = (v >> (r - 22)) & 0x7f
+    result = {'longitudinalLanePositionValue': longitudinalLanePositionValue, 'longitudinalLanePositionConfidence': longitudinalLanePositionConfidence}
+    r -= 22
+    return result, r
+
+
+def _decode_freeSpaceAddendumContainer(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    r -= 1
+    if extension:
+        count, r = _read_length(v, r)
+    else:
+        count = ((v >> (r - 7)) & 0x7f) + 1
+        r -= 7
+    result = []
+    for _ in range(count):
+        item, r = _decode_value_8(v, r)
+        result.append(item)
+    return result, r
+
+
+def _decode_value_8(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    present = (v >> (r - 3)) & 0x3
+    freeSpaceConfidence = (v >> (r - 10)) & 0x7f
+    r -= 10
+    freeSpaceArea, r = _decode_freeSpaceArea(v, r)
+    if present & 2:
+        sensorIDList, r = _decode_sensorIDList(v, r)
+    if present & 1:
+        shadowingApplies = bool((v >> (r - 1)) & 0x1)
+        r -= 1
+    result = {'freeSpaceConfidence': freeSpaceConfidence, 'freeSpaceArea': freeSpaceArea}
+    if present & 2:
+        result['sensorIDList'] = sensorIDList
+    if present & 1:
+        result['shadowingApplies'] = shadowingApplies
+    else:
+        result['shadowingApplies'] = 'TRUE'
+    if extension:
+        r = _skip_additions(v, r)
+    return result, r
+
+
+def _decode_freeSpaceArea(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    r -= 1
+    if extension:
+        index, r = _read_normally_small(v, r)
+        end, r = _read_length(v, r)
+        end = r - 8 * end
+        result = (None, None)
+        r = end
+    else:
+        index_2 = (v >> (r - 2)) & 0x3
+        r -= 2
+        if index_2 == 0:
+            freeSpacePolygon, r = _decode_stationarySensorPolygon(v, r)
+            result = ('freeSpacePolygon', freeSpacePolygon)
+        elif index_2 == 1:
+            freeSpaceCircular, r = _decode_stationarySensorCircular(v, r)
+            result = ('freeSpaceCircular', freeSpaceCircular)
+        elif index_2 == 2:
+            freeSpaceEllipse, r = _decode_stationarySensorEllipse(v, r)
+            result = ('freeSpaceEllipse', freeSpaceEllipse)
+        elif index_2 == 3:
+            freeSpaceRectangle, r = _decode_stationarySensorRectangle(v, r)
+            result = ('freeSpaceRectangle', freeSpaceRectangle)
+        else:
+            raise UperDecodeError(f"Invalid choice index {index_2}.")
+    return result, r
+
+
+def _encode_CPM(e, m, value):
+    header = value['header']
+    e, m = _encode_header_2(e, m, header)
+    cpm = value['cpm']
+    e, m = _encode_cpm(e, m, cpm)
+    return e, m
+
+
+def _encode_header_2(e, m, value):
+    protocolVersion = value['protocolVersion']
+    if not 0 <= protocolVersion <= 255:
+        raise UperEncodeError(f"protocolVersion {protocolVersion} not in 0..255.")
+    e = (e << 8) | protocolVersion
+    messageID = value['messageID']
+    m += 8
+    if not 0 <= messageID <= 255:
+        raise UperEncodeError(f"messageID {messageID} not in 0..255.")
+    e = (e << 8) | messageID
+    stationID = value['stationID']
+    m += 8
+    if not 0 <= stationID <= 4294967295:
+        raise UperEncodeError(f"stationID {stationID} not in 0..4294967295.")
+    e = (e << 32) | stationID
+    m += 32
+    return e, m
+
+
+def _encode_cpm(e, m, value):
+    generationDeltaTime = value['generationDeltaTime']
+    if not 0 <= generationDeltaTime <= 65535:
+        raise UperEncodeError(f"generationDeltaTime {generationDeltaTime} not in 0..65535.")
+    e = (e << 16) | generationDeltaTime
+    cpmParameters = value['cpmParameters']
+    m += 16
+    e, m = _encode_cpmParameters(e, m, cpmParameters)
+    return e, m
+
+
+def _encode_cpmParameters(e, m, value):
+    extension = 0
+    e = (e << 1) | extension
+    e = (e << 1) | (1 if 'stationDataContainer' in value else 0)
+    e = (e << 1) | (1 if 'sensorInformationContainer' in value else 0)
+    e = (e << 1) | (1 if 'perceivedObjectContainer' in value else 0)
+    e = (e << 1) | (1 if 'freeSpaceAddendumContainer' in value else 0)
+    managementContainer = value['managementContainer']
+    m += 5
+    e, m = _encode_managementContainer(e, m, managementContainer)
+    if 'stationDataContainer' in value:
+        e, m = _encode_stationDataContainer(e, m, value['stationDataContainer'])
+    if 'sensorInformationContainer' in value:
+        e, m = _encode_sensorInformationContainer(e, m, value['sensorInformationContainer'])
+    if 'perceivedObjectContainer' in value:
+        e, m = _encode_perceivedObjectContainer(e, m, value['perceivedObjectContainer'])
+    if 'freeSpaceAddendumContainer' in value:
+        e, m = _encode_freeSpaceAddendumContainer(e, m, value['freeSpaceAddendumContainer'])
+    numberOfPerceivedObjects = value['numberOfPerceivedObjects']
+    if not 0 <= numberOfPerceivedObjects <= 255:
+        raise UperEncodeError(f"numberOfPerceivedObjects {numberOfPerceivedObjects} not in 0..255.")
+    e = (e << 8) | numberOfPerceivedObjects
+    m += 8
+    return e, m
+
+
+def _encode_managementContainer(e, m, value):
+    extension = 0
+    e = (e << 1) | extension
+    e = (e << 1) | (1 if 'perceivedObjectContainerSegmentInfo' in value else 0)
+    stationType = value['stationType']
+    m += 2
+    if not 0 <= stationType <= 255:
+        raise UperEncodeError(f"stationType {stationType} not in 0..255.")
+    e = (e << 8) | stationType
+    m += 8
+    if 'perceivedObjectContainerSegmentInfo' in value:
+        e, m = _encode_perceivedObjectContainerSegmentInfo(e, m, value['perceivedObjectContainerSegmentInfo'])
+    referencePosition = value['referencePosition']
+    e, m = _encode_referencePosition(e, m, referencePosition)
+    return e, m
+
+
+def _encode_perceivedObjectContainerSegmentInfo(e, m, value):
+    totalMsgSegments = value['totalMsgSegments']
+    if not 1 <= totalMsgSegments <= 127:
+        raise UperEncodeError(f"totalMsgSegments {totalMsgSegments} not in 1..127.")
+    e = (e << 7) | (totalMsgSegments - 1)
+    thisSegmentNum = value['thisSegmentNum']
+    m += 7
+    if not 1 <= thisSegmentNum <= 127:
+        raise UperEncodeError(f"thisSegmentNum {thisSegmentNum} not in 1..127.")
+    e = (e << 7) | (thisSegmentNum - 1)
+    m += 7
+    return e, m
+
+
+def _encode_stationDataContainer(e, m, value):
+    name, alternative = value
+    if name == 'originatingVehicleContainer':
+        e = (e << 1) | 0
+        e = (e << 1) | 0
+        m += 2
+        e, m = _encode_originatingVehicleContainer(e, m, alternative)
+    elif name == 'originatingRSUContainer':
+        e = (e << 1) | 0
+        e = (e << 1) | 1
+        m += 2
+        e, m = _encode_originatingRSUContainer(e, m, alternative)
+    else:
+        raise UperEncodeError(f"Invalid choice {name!r}.")
+    return e, m
+
+
+def _encode_originatingVehicleContainer(e, m, value):
+    extension = 0
+    e = (e << 1) | extension
+    e = (e << 1) | (1 if 'vehicleOrientationAngle' in value else 0)
+    e = (e << 1) | (1 if value.get('driveDirection', 0) != 0 else 0)
+    e = (e << 1) | (1 if 'longitudinalAcceleration' in value else 0)
+    e = (e << 1) | (1 if 'lateralAcceleration' in value else 0)
+    e = (e << 1) | (1 if 'verticalAcceleration' in value else 0)
+    e = (e << 1) | (1 if 'yawRate' in value else 0)
+    e = (e << 1) | (1 if 'pitchAngle' in value else 0)
+    e = (e << 1) | (1 if 'rollAngle' in value else 0)
+    e = (e << 1) | (1 if 'vehicleLength' in value else 0)
+    e = (e << 1) | (1 if 'vehicleWidth' in value else 0)
+    e = (e << 1) | (1 if 'vehicleHeight' in value else 0)
+    e = (e << 1) | (1 if 'trailerDataContainer' in value else 0)
+    heading = value['heading']
+    m += 13
+    e, m = _encode_heading(e, m, heading)
+    speed = value['speed']
+    e, m = _encode_speed(e, m, speed)
+    if 'vehicleOrientationAngle' in value:
+        e, m = _encode_vehicleOrientationAngle(e, m, value['vehicleOrientationAngle'])
+    if value.get('driveDirection', 0) != 0:
+        e = (e << 2) | _CONSTANT_21[value['driveDirection']]
+        m += 2
+    if 'longitudinalAcceleration' in value:
+        e, m = _encode_longitudinalAcceleration(e, m, value['longitudinalAcceleration'])
+    if 'lateralAcceleration' in value:
+        e, m = _encode_lateralAcceleration(e, m, value['lateralAcceleration'])
+    if 'verticalAcceleration' in value:
+        e, m = _encode_verticalAcceleration(e, m, value['verticalAcceleration'])
+    if 'yawRate' in value:
+        e, m = _encode_yawRate(e, m, value['yawRate'])
+    if 'pitchAngle' in value:
+        e, m = _encode_vehicleOrientationAngle(e, m, value['pitchAngle'])
+    if 'rollAngle' in value:
+        e, m = _encode_vehicleOrientationAngle(e, m, value['rollAngle'])
+    if 'vehicleLength' in value:
+        e, m = _encode_vehicleLength(e, m, value['vehicleLength'])
+    if 'vehicleWidth' in value:
+        if not 1 <= value['vehicleWidth'] <= 62:
+            raise UperEncodeError(f"vehicleWidth {value['vehicleWidth']} not in 1..62.")
+        e = (e << 6) | (value['vehicleWidth'] - 1)
+        m += 6
+    if 'vehicleHeight' in value:
+        if not 0 <= value['vehicleHeight'] <= 127:
+            raise UperEncodeError(f"vehicleHeight {value['vehicleHeight']} not in 0..127.")
+        e = (e << 7) | value['vehicleHeight']
+        m += 7
+    if 'trailerDataContainer' in value:
+        e, m = _encode_trailerDataContainer(e, m, value['trailerDataContainer'])
+    return e, m
+
+
+def _encode_vehicleOrientationAngle(e, m, value):
+    value_2 = value['value']
+    if not 0 <= value_2 <= 3601:
+        raise UperEncodeError(f"value {value_2} not in 0..3601.")
+    e = (e << 12) | value_2
+    confidence = value['confidence']
+    m += 12
+    if not 1 <= confidence <= 127:
+        raise UperEncodeError(f"confidence {confidence} not in 1..127.")
+    e = (e << 7) | (confidence - 1)
+    m += 7
+    return e, m
+
+
+def _encode_trailerDataContainer(e, m, value):
+    count = len(value)
+    if not 1 <= count <= 2:
+        raise UperEncodeError(f"trailerDataContainer size {count} out of range.")
+    e = (e << 1) | (count - 1)
+    m += 1
+    for item in value:
+        e, m = _encode_value_3(e, m, item)
+    return e, m
+
+
+def _encode_value_3(e, m, value):
+    extension = 0
+    e = (e << 1) | extension
+    e = (e << 1) | (1 if 'trailerWidth' in value else 0)
+    e = (e << 1) | (1 if 'hitchAngle' in value else 0)
+    refPointId = value['refPointId']
+    m += 3
+    if not 0 <= refPointId <= 255:
+        raise UperEncodeError(f"refPointId {refPointId} not in 0..255.")
+    e = (e << 8) | refPointId
+    hitchPointOffset = value['hitchPointOffset']
+    m += 8
+    if not 0 <= hitchPointOffset <= 100:
+        raise UperEncodeError(f"hitchPointOffset {hitchPointOffset} not in 0..100.")
+    e = (e << 7) | hitchPointOffset
+    frontOverhang = value['frontOverhang']
+    m += 7
+    if not 0 <= frontOverhang <= 50:
+        raise UperEncodeError(f"frontOverhang {frontOverhang} not in 0..50.")
+    e = (e << 6) | frontOverhang
+    rearOverhang = value['rearOverhang']
+    m += 6
+    if not 0 <= rearOverhang <= 150:
+        raise UperEncodeError(f"rearOverhang {rearOverhang} not in 0..150.")
+    e = (e << 8) | rearOverhang
+    m += 8
+    if 'trailerWidth' in value:
+        if not 1 <= value['trailerWidth'] <= 62:
+            raise UperEncodeError(f"trailerWidth {value['trailerWidth']} not in 1..62.")
+        e = (e << 6) | (value['trailerWidth'] - 1)
+        m += 6
+    if 'hitchAngle' in value:
+        e, m = _encode_vehicleOrientationAngle(e, m, value['hitchAngle'])
+    return e, m
+
+
+def _encode_originatingRSUContainer(e, m, value):
+    name, alternative = value
+    if name == 'intersectionReferenceId':
+        e = (e << 1) | 0
+        e = (e << 1) | 0
+        m += 2
+        e, m = _encode_intersectionReferenceId(e, m, alternative)
+    elif name == 'roadSegmentReferenceId':
+        e = (e << 1) | 0
+        e = (e << 1) | 1
+        m += 2
+        e, m = _encode_intersectionReferenceId(e, m, alternative)
+    else:
+        raise UperEncodeError(f"Invalid choice {name!r}.")
+    return e, m
+
+
+def _encode_intersectionReferenceId(e, m, value):
+    e = (e << 1) | (1 if 'region' in value else 0)
+    m += 1
+    if 'region' in value:
+        if not 0 <= value['region'] <= 65535:
+            raise UperEncodeError(f"region {value['region']} not in 0..65535.")
+        e = (e << 16) | value['region']
+        m += 16
+    id_2 = value['id']
+    if not 0 <= id_2 <= 65535:
+        raise UperEncodeError(f"id {id_2} not in 0..65535.")
+    e = (e << 16) | id_2
+    m += 16
+    return e, m
+
+
+def _encode_sensorInformationContainer(e, m, value):
+    count = len(value)
+    if 1 <= count <= 128:
+        e = (e << 1) | 0
+        m += 1
+        if not 1 <= count <= 128:
+            raise UperEncodeError(f"sensorInformationContainer size {count} out of range.")
+        e = (e << 7) | (count - 1)
+        m += 7
+    else:
+        e = (e << 1) | 1
+        m += 1
+        e, m = _write_length(e, m, count)
+    for item in value:
+        e, m = _encode_value_4(e, m, item)
+    return e, m
+
+
+def _encode_value_4(e, m, value):
+    extension = 0
+    e = (e << 1) | extension
+    e = (e << 1) | (1 if 'freeSpaceConfidence' in value else 0)
+    sensorID = value['sensorID']
+    m += 2
+    if not 0 <= sensorID <= 255:
+        raise UperEncodeError(f"sensorID {sensorID} not in 0..255.")
+    e = (e << 8) | sensorID
+    type_2 = value['type']
+    m += 8
+    if not 0 <= type_2 <= 15:
+        raise UperEncodeError(f"type {type_2} not in 0..15.")
+    e = (e << 4) | type_2
+    detectionArea = value['detectionArea']
+    m += 4
+    e, m = _encode_detectionArea(e, m, detectionArea)
+    if 'freeSpaceConfidence' in value:
+        if not 0 <= value['freeSpaceConfidence'] <= 101:
+            raise UperEncodeError(f"freeSpaceConfidence {value['freeSpaceConfidence']} not in 0..101.")
+        e = (e << 7) | value['freeSpaceConfidence']
+        m += 7
+    return e, m
+
+
+def _encode_detectionArea(e, m, value):
+    name, alternative = value
+    if name == 'vehicleSensor':
+        e = (e << 1) | 0
+        e = (e << 3) | 0
+        m += 4
+        e, m = _encode_vehicleSensor(e, m, alternative)
+    elif name == 'stationarySensorRadial':
+        e = (e << 1) | 0
+        e = (e << 3) | 1
+        m += 4
+        e, m = _encode_stationarySensorRadial(e, m, alternative)
+    elif name == 'stationarySensorPolygon':
+        e = (e << 1) | 0
+        e = (e << 3) | 2
+        m += 4
+        e, m = _encode_stationarySensorPolygon(e, m, alternative)
+    elif name == 'stationarySensorCircular':
+        e = (e << 1) | 0
+        e = (e << 3) | 3
+        m += 4
+        e, m = _encode_stationarySensorCircular(e, m, alternative)
+    elif name == 'stationarySensorEllipse':
+        e = (e << 1) | 0
+        e = (e << 3) | 4
+        m += 4
+        e, m = _encode_stationarySensorEllipse(e, m, alternative)
+    elif name == 'stationarySensorRectangle':
+        e = (e << 1) | 0
+        e = (e << 3) | 5
+        m += 4
+        e, m = _encode_stationarySensorRectangle(e, m, alternative)
+    else:
+        raise UperEncodeError(f"Invalid choice {name!r}.")
+    return e, m
+
+
+def _encode_vehicleSensor(e, m, value):
+    extension = 0
+    e = (e << 1) | extension
+    e = (e << 1) | (1 if value.get('refPointId', 0) != 0 else 0)
+    e = (e << 1) | (1 if 'zSensorOffset' in value else 0)
+    m += 3
+    if value.get('refPointId', 0) != 0:
+        if not 0 <= value['refPointId'] <= 255:
+            raise UperEncodeError(f"refPointId {value['refPointId']} not in 0..255.")
+        e = (e << 8) | value['refPointId']
+        m += 8
+    xSensorOffset = value['xSensorOffset']
+    if not -5000 <= xSensorOffset <= 0:
+        raise UperEncodeError(f"xSensorOffset {xSensorOffset} not in -5000..0.")
+    e = (e << 13) | (xSensorOffset - -5000)
+    ySensorOffset = value['ySensorOffset']
+    m += 13
+    if not -1000 <= ySensorOffset <= 1000:
+        raise UperEncodeError(f"ySensorOffset {ySensorOffset} not in -1000..1000.")
+    e = (e << 11) | (ySensorOffset - -1000)
+    m += 11
+    if 'zSensorOffset' in value:
+        if not 0 <= value['zSensorOffset'] <= 1000:
+            raise UperEncodeError(f"zSensorOffset {value['zSensorOffset']} not in 0..1000.")
+        e = (e << 10) | value['zSensorOffset']
+        m += 10
+    vehicleSensorPropertyList = value['vehicleSensorPropertyList']
+    e, m = _encode_vehicleSensorPropertyList(e, m, vehicleSensorPropertyList)
+    return e, m
+
+
+def _encode_vehicleSensorPropertyList(e, m, value):
+    count = len(value)
+    if not 1 <= count <= 10:
+        raise UperEncodeError(f"vehicleSensorPropertyList size {count} out of range.")
+    e = (e << 4) | (count - 1)
+    m += 4
+    for item in value:
+        e, m = _encode_value_5(e, m, item)
+    return e, m
+
+
+def _encode_value_5(e, m, value):
+    extension = 0
+    e = (e << 1) | extension
+    e = (e << 1) | (1 if 'verticalOpeningAngleStart' in value else 0)
+    e = (e << 1) | (1 if 'verticalOpeningAngleEnd' in value else 0)
+    range_2 = value['range']
+    m += 3
+    if not 0 <= range_2 <= 10000:
+        raise UperEncodeError(f"range {range_2} not in 0..10000.")
+    e = (e << 14) | range_2
+    horizontalOpeningAngleStart = value['horizontalOpeningAngleStart']
+    m += 14
+    if not 0 <= horizontalOpeningAngleStart <= 3601:
+        raise UperEncodeError(f"horizontalOpeningAngleStart {horizontalOpeningAngleStart} not in 0..3601.")
+    e = (e << 12) | horizontalOpeningAngleStart
+    horizontalOpeningAngleEnd = value['horizontalOpeningAngleEnd']
+    m += 12
+    if not 0 <= horizontalOpeningAngleEnd <= 3601:
+        raise UperEncodeError(f"horizontalOpeningAngleEnd {horizontalOpeningAngleEnd} not in 0..3601.")
+    e = (e << 12) | horizontalOpeningAngleEnd
+    m += 12
+    if 'verticalOpeningAngleStart' in value:
+        if not 0 <= value['verticalOpeningAngleStart'] <= 3601:
+            raise UperEncodeError(f"verticalOpeningAngleStart {value['verticalOpeningAngleStart']} not in 0..3601.")
+        e = (e << 12) | value['verticalOpeningAngleStart']
+        m += 12
+    if 'verticalOpeningAngleEnd' in value:
+        if not 0 <= value['verticalOpeningAngleEnd'] <= 3601:
+            raise UperEncodeError(f"verticalOpeningAngleEnd {value['verticalOpeningAngleEnd']} not in 0..3601.")
+        e = (e << 12) | value['verticalOpeningAngleEnd']
+        m += 12
+    return e, m
+
+
+def _encode_stationarySensorRadial(e, m, value):
+    extension = 0
+    e = (e << 1) | extension
+    e = (e << 1) | (1 if 'verticalOpeningAngleStart' in value else 0)
+    e = (e << 1) | (1 if 'verticalOpeningAngleEnd' in value else 0)
+    e = (e << 1) | (1 if 'sensorPositionOffset' in value else 0)
+    e = (e << 1) | (1 if 'sensorHeight' in value else 0)
+    range_2 = value['range']
+    m += 5
+    if not 0 <= range_2 <= 10000:
+        raise UperEncodeError(f"range {range_2} not in 0..10000.")
+    e = (e << 14) | range_2
+    stationaryHorizontalOpeningAngleStart = value['stationaryHorizontalOpeningAngleStart']
+    m += 14
+    if not 0 <= stationaryHorizontalOpeningAngleStart <= 3601:
+        raise UperEncodeError(f"stationaryHorizontalOpeningAngleStart {stationaryHorizontalOpeningAngleStart} not in 0..3601.")
+    e = (e << 12) | stationaryHorizontalOpeningAngleStart
+    stationaryHorizontalOpeningAngleEnd = value['stationaryHorizontalOpeningAngleEnd']
+    m += 12
+    if not 0 <= stationaryHorizontalOpeningAngleEnd <= 3601:
+        raise UperEncodeError(f"stationaryHorizontalOpeningAngleEnd {stationaryHorizontalOpeningAngleEnd} not in 0..3601.")
+    e = (e << 12) | stationaryHorizontalOpeningAngleEnd
+    m += 12
+    if 'verticalOpeningAngleStart' in value:
+        if not 0 <= value['verticalOpeningAngleStart'] <= 3601:
+            raise UperEncodeError(f"verticalOpeningAngleStart {value['verticalOpeningAngleStart']} not in 0..3601.")
+        e = (e << 12) | value['verticalOpeningAngleStart']
+        m += 12
+    if 'verticalOpeningAngleEnd' in value:
+        if not 0 <= value['verticalOpeningAngleEnd'] <= 3601:
+            raise UperEncodeError(f"verticalOpeningAngleEnd {value['verticalOpeningAngleEnd']} not in 0..3601.")
+        e = (e << 12) | value['verticalOpeningAngleEnd']
+        m += 12
+    if 'sensorPositionOffset' in value:
+        e, m = _encode_sensorPositionOffset(e, m, value['sensorPositionOffset'])
+    if 'sensorHeight' in value:
+        if not -5000 <= value['sensorHeight'] <= 5000:
+            raise UperEncodeError(f"sensorHeight {value['sensorHeight']} not in -5000..5000.")
+        e = (e << 14) | (value['sensorHeight'] - -5000)
+        m += 14
+    return e, m
+
+
+def _encode_sensorPositionOffset(e, m, value):
+    e = (e << 1) | (1 if 'nodeOffsetPointZ' in value else 0)
+    nodeOffsetPointxy = value['nodeOffsetPointxy']
+    m += 1
+    e, m = _encode_nodeOffsetPointxy(e, m, nodeOffsetPointxy)
+    if 'nodeOffsetPointZ' in value:
+        e, m = _encode_nodeOffsetPointZ(e, m, value['nodeOffsetPointZ'])
+    return e, m
+
+
+def _encode_nodeOffsetPointxy(e, m, value):
+    name, alternative = value
+    if name == 'node-XY1':
+        e = (e << 3) | 0
+        m += 3
+        e, m = _encode_node_XY1(e, m, alternative)
+    elif name == 'node-XY2':
+        e = (e << 3) | 1
+        m += 3
+        e, m = _encode_node_XY2(e, m, alternative)
+    elif name == 'node-XY3':
+        e = (e << 3) | 2
+        m += 3
+        e, m = _encode_node_XY3(e, m, alternative)
+    elif name == 'node-XY4':
+        e = (e << 3) | 3
+        m += 3
+        e, m = _encode_node_XY4(e, m, alternative)
+    elif name == 'node-XY5':
+        e = (e << 3) | 4
+        m += 3
+        e, m = _encode_node_XY5(e, m, alternative)
+    elif name == 'node-XY6':
+        e = (e << 3) | 5
+        m += 3
+        e, m = _encode_node_XY6(e, m, alternative)
+    elif name == 'node-LatLon':
+        e = (e << 3) | 6
+        m += 3
+        e, m = _encode_node_LatLon(e, m, alternative)
+    elif name == 'regional':
+        e = (e << 3) | 7
+        m += 3
+        e, m = _encode_regional(e, m, alternative)
+    else:
+        raise UperEncodeError(f"Invalid choice {name!r}.")
+    return e, m
+
+
+def _encode_node_XY1(e, m, value):
+    x = value['x']
+    if not -512 <= x <= 511:
+        raise UperEncodeError(f"x {x} not in -512..511.")
+    e = (e << 10) | (x - -512)
+    y = value['y']
+    m += 10
+    if not -512 <= y <= 511:
+        raise UperEncodeError(f"y {y} not in -512..511.")
+    e = (e << 10) | (y - -512)
+    m += 10
+    return e, m
+
+
+def _encode_node_XY2(e, m, value):
+    x = value['x']
+    if not -1024 <= x <= 1023:
+        raise UperEncodeError(f"x {x} not in -1024..1023.")
+    e = (e << 11) | (x - -1024)
+    y = value['y']
+    m += 11
+    if not -1024 <= y <= 1023:
+        raise UperEncodeError(f"y {y} not in -1024..1023.")
+    e = (e << 11) | (y - -1024)
+    m += 11
+    return e, m
+
+
+def _encode_node_XY3(e, m, value):
+    x = value['x']
+    if not -2048 <= x <= 2047:
+        raise UperEncodeError(f"x {x} not in -2048..2047.")
+    e = (e << 12) | (x - -2048)
+    y = value['y']
+    m += 12
+    if not -2048 <= y <= 2047:
+        raise UperEncodeError(f"y {y} not in -2048..2047.")
+    e = (e << 12) | (y - -2048)
+    m += 12
+    return e, m
+
+
+def _encode_node_XY4(e, m, value):
+    x = value['x']
+    if not -4096 <= x <= 4095:
+        raise UperEncodeError(f"x {x} not in -4096..4095.")
+    e = (e << 13) | (x - -4096)
+    y = value['y']
+    m += 13
+    if not -4096 <= y <= 4095:
+        raise UperEncodeError(f"y {y} not in -4096..4095.")
+    e = (e << 13) | (y - -4096)
+    m += 13
+    return e, m
+
+
+def _encode_node_XY5(e, m, value):
+    x = value['x']
+    if not -8192 <= x <= 8191:
+        raise UperEncodeError(f"x {x} not in -8192..8191.")
+    e = (e << 14) | (x - -8192)
+    y = value['y']
+    m += 14
+    if not -8192 <= y <= 8191:
+        raise UperEncodeError(f"y {y} not in -8192..8191.")
+    e = (e << 14) | (y - -8192)
+    m += 14
+    return e, m
+
+
+def _encode_node_XY6(e, m, value):
+    x = value['x']
+    if not -32768 <= x <= 32767:
+        raise UperEncodeError(f"x {x} not in -32768..32767.")
+    e = (e << 16) | (x - -32768)
+    y = value['y']
+    m += 16
+    if not -32768 <= y <= 32767:
+        raise UperEncodeError(f"y {y} not in -32768..32767.")
+    e = (e << 16) | (y - -32768)
+    m += 16
+    return e, m
+
+
+def _encode_node_LatLon(e, m, value):
+    lon = value['lon']
+    if not -1800000000 <= lon <= 1800000001:
+        raise UperEncodeError(f"lon {lon} not in -1800000000..1800000001.")
+    e = (e << 32) | (lon - -1800000000)
+    lat = value['lat']
+    m += 32
+    if not -900000000 <= lat <= 900000001:
+        raise UperEncodeError(f"lat {lat} not in -900000000..900000001.")
+    e = (e << 31) | (lat - -900000000)
+    m += 31
+    return e, m
+
+
+def _encode_regional(e, m, value):
+    regionId = value['regionId']
+    if not 0 <= regionId <= 255:
+        raise UperEncodeError(f"regionId {regionId} not in 0..255.")
+    e = (e << 8) | regionId
+    regExtValue = value['regExtValue']
+    m += 8
+    e, m = _write_length(e, m, len(regExtValue))
+    e, m = _write_bytes(e, m, regExtValue)
+    return e, m
+
+
+def _encode_nodeOffsetPointZ(e, m, value):
+    name, alternative = value
+    if name == 'node-Z1':
+        e = (e << 3) | 0
+        m += 3
+        if not -512 <= alternative <= 511:
+            raise UperEncodeError(f"node-Z1 {alternative} not in -512..511.")
+        e = (e << 10) | (alternative - -512)
+        m += 10
+    elif name == 'node-Z2':
+        e = (e << 3) | 1
+        m += 3
+        if not -1024 <= alternative <= 1023:
+            raise UperEncodeError(f"node-Z2 {alternative} not in -1024..1023.")
+        e = (e << 11) | (alternative - -1024)
+        m += 11
+    elif name == 'node-Z3':
+        e = (e << 3) | 2
+        m += 3
+        if not -2048 <= alternative <= 2047:
+            raise UperEncodeError(f"node-Z3 {alternative} not in -2048..2047.")
+        e = (e << 12) | (alternative - -2048)
+        m += 12
+    elif name == 'node-Z4':
+        e = (e << 3) | 3
+        m += 3
+        if not -4096 <= alternative <= 4095:
+            raise UperEncodeError(f"node-Z4 {alternative} not in -4096..4095.")
+        e = (e << 13) | (alternative - -4096)
+        m += 13
+    elif name == 'node-Z5':
+        e = (e << 3) | 4
+        m += 3
+        if not -8192 <= alternative <= 8191:
+            raise UperEncodeError(f"node-Z5 {alternative} not in -8192..8191.")
+        e = (e << 14) | (alternative - -8192)
+        m += 14
+    elif name == 'node-Z6':
+        e = (e << 3) | 5
+        m += 3
+        if not -32768 <= alternative <= 32767:
+            raise UperEncodeError(f"node-Z6 {alternative} not in -32768..32767.")
+        e = (e << 16) | (alternative - -32768)
+        m += 16
+    else:
+        raise UperEncodeError(f"Invalid choice {name!r}.")
+    return e, m
+
+
+def _encode_stationarySensorPolygon(e, m, value):
+    polyPointList = value['polyPointList']
+    e, m = _encode_polyPointList(e, m, polyPointList)
+    return e, m
+
+
+def _encode_polyPointList(e, m, value):
+    count = len(value)
+    if 3 <= count <= 16:
+        e = (e << 1) | 0
+        m += 1
+        if not 3 <= count <= 16:
+            raise UperEncodeError(f"polyPointList size {count} out of range.")
+        e = (e << 4) | (count - 3)
+        m += 4
+    else:
+        e = (e << 1) | 1
+        m += 1
+        e, m = _write_length(e, m, count)
+    for item in value:
+        e, m = _encode_sensorPositionOffset(e, m, item)
+    return e, m
+
+
+def _encode_stationarySensorCircular(e, m, value):
+    e = (e << 1) | (1 if 'nodeCenterPoint' in value else 0)
+    m += 1
+    if 'nodeCenterPoint' in value:
+        e, m = _encode_sensorPositionOffset(e, m, value['nodeCenterPoint'])
+    radius = value['radius']
+    if not 0 <= radius <= 10000:
+        raise UperEncodeError(f"radius {radius} not in 0..10000.")
+    e = (e << 14) | radius
+    m += 14
+    return e, m
+
+
+def _encode_stationarySensorEllipse(e, m, value):
+    e = (e << 1) | (1 if 'nodeCenterPoint' in value else 0)
+    e = (e << 1) | (1 if 'semiHeight' in value else 0)
+    m += 2
+    if 'nodeCenterPoint' in value:
+        e, m = _encode_sensorPositionOffset(e, m, value['nodeCenterPoint'])
+    semiMinorRangeLength = value['semiMinorRangeLength']
+    if not 0 <= semiMinorRangeLength <= 10000:
+        raise UperEncodeError(f"semiMinorRangeLength {semiMinorRangeLength} not in 0..10000.")
+    e = (e << 14) | semiMinorRangeLength
+    semiMajorRangeLength = value['semiMajorRangeLength']
+    m += 14
+    if not 0 <= semiMajorRangeLength <= 10000:
+        raise UperEncodeError(f"semiMajorRangeLength {semiMajorRangeLength} not in 0..10000.")
+    e = (e << 14) | semiMajorRangeLength
+    semiMajorRangeOrientation = value['semiMajorRangeOrientation']
+    m += 14
+    if not 0 <= semiMajorRangeOrientation <= 3601:
+        raise UperEncodeError(f"semiMajorRangeOrientation {semiMajorRangeOrientation} not in 0..3601.")
+    e = (e << 12) | semiMajorRangeOrientation
+    m += 12
+    if 'semiHeight' in value:
+        if not 0 <= value['semiHeight'] <= 10000:
+            raise UperEncodeError(f"semiHeight {value['semiHeight']} not in 0..10000.")
+        e = (e << 14) | value['semiHeight']
+        m += 14
+    return e, m
+
+
+def _encode_stationarySensorRectangle(e, m, value):
+    e = (e << 1) | (1 if 'nodeCenterPoint' in value else 0)
+    e = (e << 1) | (1 if 'semiHeight' in value else 0)
+    m += 2
+    if 'nodeCenterPoint' in value:
+        e, m = _encode_sensorPositionOffset(e, m, value['nodeCenterPoint'])
+    semiMajorRangeLength = value['semiMajorRangeLength']
+    if not 0 <= semiMajorRangeLength <= 10000:
+        raise UperEncodeError(f"semiMajorRangeLength {semiMajorRangeLength} not in 0..10000.")
+    e = (e << 14) | semiMajorRangeLength
+    semiMinorRangeLength = value['semiMinorRangeLength']
+    m += 14
+    if not 0 <= semiMinorRangeLength <= 10000:
+        raise UperEncodeError(f"semiMinorRangeLength {semiMinorRangeLength} not in 0..10000.")
+    e = (e << 14) | semiMinorRangeLength
+    semiMajorRangeOrientation = value['semiMajorRangeOrientation']
+    m += 14
+    if not 0 <= semiMajorRangeOrientation <= 3601:
+        raise UperEncodeError(f"semiMajorRangeOrientation {semiMajorRangeOrientation} not in 0..3601.")
+    e = (e << 12) | semiMajorRangeOrientation
+    m += 12
+    if 'semiHeight' in value:
+        if not 0 <= value['semiHeight'] <= 10000:
+            raise UperEncodeError(f"semiHeight {value['semiHeight']} not in 0..10000.")
+        e = (e << 14) | value['semiHeight']
+        m += 14
+    return e, m
+
+
+def _encode_perceivedObjectContainer(e, m, value):
+    count = len(value)
+    if 1 <= count <= 128:
+        e = (e << 1) | 0
+        m += 1
+        if not 1 <= count <= 128:
+            raise UperEncodeError(f"perceivedObjectContainer size {count} out of range.")
+        e = (e << 7) | (count - 1)
+        m += 7
+    else:
+        e = (e << 1) | 1
+        m += 1
+        e, m = _write_length(e, m, count)
+    for item in value:
+        e, m = _encode_value_6(e, m, item)
+    return e, m
+
+
+def _encode_value_6(e, m, value):
+    extension = 0
+    e = (e << 1) | extension
+    e = (e << 1) | (1 if 'sensorIDList' in value else 0)
+    e = (e << 1) | (1 if 'objectAge' in value else 0)
+    e = (e << 1) | (1 if value.get('objectConfidence', 0) != 0 else 0)
+    e = (e << 1) | (1 if 'zDistance' in value else 0)
+    e = (e << 1) | (1 if 'zSpeed' in value else 0)
+    e = (e << 1) | (1 if 'xAcceleration' in value else 0)
+    e = (e << 1) | (1 if 'yAcceleration' in value else 0)
+    e = (e << 1) | (1 if 'zAcceleration' in value else 0)
+    e = (e << 1) | (1 if 'yawAngle' in value else 0)
+    e = (e << 1) | (1 if 'planarObjectDimension1' in value else 0)
+    e = (e << 1) | (1 if 'planarObjectDimension2' in value else 0)
+    e = (e << 1) | (1 if 'verticalObjectDimension' in value else 0)
+    e = (e << 1) | (1 if value.get('objectRefPoint', 0) != 0 else 0)
+    e = (e << 1) | (1 if 'dynamicStatus' in value else 0)
+    e = (e << 1) | (1 if 'classification' in value else 0)
+    e = (e << 1) | (1 if 'matchedPosition' in value else 0)
+    objectID = value['objectID']
+    m += 17
+    if not 0 <= objectID <= 255:
+        raise UperEncodeError(f"objectID {objectID} not in 0..255.")
+    e = (e << 8) | objectID
+    m += 8
+    if 'sensorIDList' in value:
+        e, m = _encode_sensorIDList(e, m, value['sensorIDList'])
+    timeOfMeasurement = value['timeOfMeasurement']
+    if not -1500 <= timeOfMeasurement <= 1500:
+        raise UperEncodeError(f"timeOfMeasurement {timeOfMeasurement} not in -1500..1500.")
+    e = (e << 12) | (timeOfMeasurement - -1500)
+    m += 12
+    if 'objectAge' in value:
+        if not 0 <= value['objectAge'] <= 1500:
+            raise UperEncodeError(f"objectAge {value['objectAge']} not in 0..1500.")
+        e = (e << 11) | value['objectAge']
+        m += 11
+    if value.get('objectConfidence', 0) != 0:
+        if not 0 <= value['objectConfidence'] <= 101:
+            raise UperEncodeError(f"objectConfidence {value['objectConfidence']} not in 0..101.")
+        e = (e << 7) | value['objectConfidence']
+        m += 7
+    xDistance = value['xDistance']
+    e, m = _encode_xDistance(e, m, xDistance)
+    yDistance = value['yDistance']
+    e, m = _encode_xDistance(e, m, yDistance)
+    if 'zDistance' in value:
+        e, m = _encode_xDistance(e, m, value['zDistance'])
+    xSpeed = value['xSpeed']
+    e, m = _encode_xSpeed(e, m, xSpeed)
+    ySpeed = value['ySpeed']
+    e, m = _encode_xSpeed(e, m, ySpeed)
+    if 'zSpeed' in value:
+        e, m = _encode_xSpeed(e, m, value['zSpeed'])
+    if 'xAcceleration' in value:
+        e, m = _encode_longitudinalAcceleration(e, m, value['xAcceleration'])
+    if 'yAcceleration' in value:
+        e, m = _encode_lateralAcceleration(e, m, value['yAcceleration'])
+    if 'zAcceleration' in value:
+        e, m = _encode_verticalAcceleration(e, m, value['zAcceleration'])
+    if 'yawAngle' in value:
+        e, m = _encode_vehicleOrientationAngle(e, m, value['yawAngle'])
+    if 'planarObjectDimension1' in value:
+        e, m = _encode_planarObjectDimension1(e, m, value['planarObjectDimension1'])
+    if 'planarObjectDimension2' in value:
+        e, m = _encode_planarObjectDimension1(e, m, value['planarObjectDimension2'])
+    if 'verticalObjectDimension' in value:
+        e, m = _encode_planarObjectDimension1(e, m, value['verticalObjectDimension'])
+    if value.get('objectRefPoint', 0) != 0:
+        if not 0 <= value['objectRefPoint'] <= 8:
+            raise UperEncodeError(f"objectRefPoint {value['objectRefPoint']} not in 0..8.")
+        e = (e << 4) | value['objectRefPoint']
+        m += 4
+    if 'dynamicStatus' in value:
+        if not 0 <= value['dynamicStatus'] <= 2:
+            raise UperEncodeError(f"dynamicStatus {value['dynamicStatus']} not in 0..2.")
+        e = (e << 2) | value['dynamicStatus']
+        m += 2
+    if 'classification' in value:
+        e, m = _encode_classification(e, m, value['classification'])
+    if 'matchedPosition' in value:
+        e, m = _encode_matchedPosition(e, m, value['matchedPosition'])
+    return e, m
+
+
+def _encode_sensorIDList(e, m, value):
+    count = len(value)
+    if 1 <= count <= 128:
+        e = (e << 1) | 0
+        m += 1
+        if not 1 <= count <= 128:
+            raise UperEncodeError(f"sensorIDList size {count} out of range.")
+        e = (e << 7) | (count - 1)
+        m += 7
+    else:
+        e = (e << 1) | 1
+        m += 1
+        e, m = _write_length(e, m, count)
+    for item in value:
+        if not 0 <= item <= 255:
+            raise UperEncodeError(f" {item} not in 0..255.")
+        e = (e << 8) | item
+        m += 8
+    return e, m
+
+
+def _encode_xDistance(e, m, value):
+    value_2 = value['value']
+    if not -132768 <= value_2 <= 132767:
+        raise UperEncodeError(f"value {value_2} not in -132768..132767.")
+    e = (e << 19) | (value_2 - -132768)
+    confidence = value['confidence']
+    m += 19
+    if not 0 <= confidence <= 102:
+        raise UperEncodeError(f"confidence {confidence} not in 0..102.")
+    e = (e << 7) | confidence
+    m += 7
+    return e, m
+
+
+def _encode_xSpeed(e, m, value):
+    value_2 = value['value']
+    if not -16383 <= value_2 <= 16383:
+        raise UperEncodeError(f"value {value_2} not in -16383..16383.")
+    e = (e << 15) | (value_2 - -16383)
+    confidence = value['confidence']
+    m += 15
+    if not 1 <= confidence <= 127:
+        raise UperEncodeError(f"confidence {confidence} not in 1..127.")
+    e = (e << 7) | (confidence - 1)
+    m += 7
+    return e, m
+
+
+def _encode_planarObjectDimension1(e, m, value):
+    value_2 = value['value']
+    if not 0 <= value_2 <= 1023:
+        raise UperEncodeError(f"value {value_2} not in 0..1023.")
+    e = (e << 10) | value_2
+    confidence = value['confidence']
+    m += 10
+    if not 0 <= confidence <= 102:
+        raise UperEncodeError(f"confidence {confidence} not in 0..102.")
+    e = (e << 7) | confidence
+    m += 7
+    return e, m
+
+
+def _encode_classification(e, m, value):
+    count = len(value)
+    if not 1 <= count <= 8:
+        raise UperEncodeError(f"classification size {count} out of range.")
+    e = (e << 3) | (count - 1)
+    m += 3
+    for item in value:
+        e, m = _encode_value_7(e, m, item)
+    return e, m
+
+
+def _encode_value_7(e, m, value):
+    confidence = value['confidence']
+    if not 0 <= confidence <= 101:
+        raise UperEncodeError(f"confidence {confidence} not in 0..101.")
+    e = (e << 7) | confidence
+    class_2 = value['class']
+    m += 7
+    e, m = _encode_class(e, m, class_2)
+    return e, m
+
+
+def _encode_class(e, m, value):
+    name, alternative = value
+    if name == 'vehicle':
+        e = (e << 2) | 0
+        m += 2
+        e, m = _encode_vehicle(e, m, alternative)
+    elif name == 'person':
+        e = (e << 2) | 1
+        m += 2
+        e, m = _encode_vehicle(e, m, alternative)
+    elif name == 'animal':
+        e = (e << 2) | 2
+        m += 2
+        e, m = _encode_vehicle(e, m, alternative)
+    elif name == 'other':
+        e = (e << 2) | 3
+        m += 2
+        e, m = _encode_vehicle(e, m, alternative)
+    else:
+        raise UperEncodeError(f"Invalid choice {name!r}.")
+    return e, m
+
+
+def _encode_vehicle(e, m, value):
+    e = (e << 1) | (1 if value.get('type', 0) != 0 else 0)
+    e = (e << 1) | (1 if value.get('confidence', 0) != 0 else 0)
+    m += 2
+    if value.get('type', 0) != 0:
+        if not 0 <= value['type'] <= 255:
+            raise UperEncodeError(f"type {value['type']} not in 0..255.")
+        e = (e << 8) | value['type']
+        m += 8
+    if value.get('confidence', 0) != 0:
+        if not 0 <= value['confidence'] <= 101:
+            raise UperEncodeError(f"confidence {value['confidence']} not in 0..101.")
+        e = (e << 7) | value['confidence']
+        m += 7
+    return e, m
+
+
+def _encode_matchedPosition(e, m, value):
+    extension = 0
+    e = (e << 1) | extension
+    e = (e << 1) | (1 if 'laneID' in value else 0)
+    e = (e << 1) | (1 if 'longitudinalLanePosition' in value else 0)
+    m += 3
+    if 'laneID' in value:
+        if not 0 <= value['laneID'] <= 255:
+            raise UperEncodeError(f"laneID {value['laneID']} not in 0..255.")
+        e = (e << 8) | value['laneID']
+        m += 8
+    if 'longitudinalLanePosition' in value:
+        e, m = _encode_longitudinalLanePosition(e, m, value['longitudinalLanePosition'])
+    return e, m
+
+
+def _encode_longitudinalLanePosition(e, m, value):
+    longitudinalLanePositionValue = value['longitudinalLanePositionValue']
+    if not 0 <= longitudinalLanePositionValue <= 32767:
+        raise UperEncodeError(f"longitudinalLanePositionValue {longitudinalLanePositionValue} not in 0..32767.")
+    e = (e << 15) | longitudinalLanePositionValue
+    longitudinalLanePositionConfidence = value['longitudinalLanePositionConfidence']
+    m += 15
+    if not 0 <= longitudinalLanePositionConfidence <= 102:
+        raise UperEncodeError(f"longitudinalLanePositionConfidence {longitudinalLanePositionConfidence} not in 0..102.")
+    e = (e << 7) | longitudinalLanePositionConfidence
+    m += 7
+    return e, m
+
+
+def _encode_freeSpaceAddendumContainer(e, m, value):
+    count = len(value)
+    if 1 <= count <= 128:
+        e = (e << 1) | 0
+        m += 1
+        if not 1 <= count <= 128:
+            raise UperEncodeError(f"freeSpaceAddendumContainer size {count} out of range.")
+        e = (e << 7) | (count - 1)
+        m += 7
+    else:
+        e = (e << 1) | 1
+        m += 1
+        e, m = _write_length(e, m, count)
+    for item in value:
+        e, m = _encode_value_8(e, m, item)
+    return e, m
+
+
+def _encode_value_8(e, m, value):
+    extension = 0
+    e = (e << 1) | extension
+    e = (e << 1) | (1 if 'sensorIDList' in value else 0)
+    e = (e << 1) | (1 if value.get('shadowingApplies', 'TRUE') != 'TRUE' else 0)
+    freeSpaceConfidence = value['freeSpaceConfidence']
+    m += 3
+    if not 0 <= freeSpaceConfidence <= 101:
+        raise UperEncodeError(f"freeSpaceConfidence {freeSpaceConfidence} not in 0..101.")
+    e = (e << 7) | freeSpaceConfidence
+    freeSpaceArea = value['freeSpaceArea']
+    m += 7
+    e, m = _encode_freeSpaceArea(e, m, freeSpaceArea)
+    if 'sensorIDList' in value:
+        e, m = _encode_sensorIDList(e, m, value['sensorIDList'])
+    if value.get('shadowingApplies', 'TRUE') != 'TRUE':
+        e = (e << 1) | (1 if value['shadowingApplies'] else 0)
+        m += 1
+    return e, m
+
+
+def _encode_freeSpaceArea(e, m, value):
+    name, alternative = value
+    if name == 'freeSpacePolygon':
+        e = (e << 1) | 0
+        e = (e << 2) | 0
+        m += 3
+        e, m = _encode_stationarySensorPolygon(e, m, alternative)
+    elif name == 'freeSpaceCircular':
+        e = (e << 1) | 0
+        e = (e << 2) | 1
+        m += 3
+        e, m = _encode_stationarySensorCircular(e, m, alternative)
+    elif name == 'freeSpaceEllipse':
+        e = (e << 1) | 0
+        e = (e << 2) | 2
+        m += 3
+        e, m = _encode_stationarySensorEllipse(e, m, alternative)
+    elif name == 'freeSpaceRectangle':
+        e = (e << 1) | 0
+        e = (e << 2) | 3
+        m += 3
+        e, m = _encode_stationarySensorRectangle(e, m, alternative)
+    else:
+        raise UperEncodeError(f"Invalid choice {name!r}.")
+    return e, m
+
+
+def _skip_stationDataContainer(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    r -= 1
+    if extension:
+        r = _skip_choice_addition(v, r)
+    else:
+        index = (v >> (r - 1)) & 0x1
+        r -= 1
+        if index == 0:
+            r = _skip_originatingVehicleContainer(v, r)
+        elif index == 1:
+            r = _skip_originatingRSUContainer(v, r)
+        else:
+            raise UperDecodeError(f"Invalid choice index {index}.")
+    return r
+
+
+def _skip_originatingVehicleContainer(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    present = (v >> (r - 13)) & 0xfff
+    r -= 53
+    if present & 2048:
+        r -= 19
+    if present & 1024:
+        r -= 2
+    if present & 512:
+        r -= 16
+    if present & 256:
+        r -= 16
+    if present & 128:
+        r -= 16
+    if present & 64:
+        r -= 20
+    if present & 32:
+        r -= 19
+    if present & 16:
+        r -= 19
+    if present & 8:
+        r -= 13
+    if present & 4:
+        r -= 6
+    if present & 2:
+        r -= 7
+    if present & 1:
+        r = _skip_trailerDataContainer(v, r)
+    if extension:
+        r = _skip_additions(v, r)
+    return r
+
+
+def _skip_trailerDataContainer(v, r):
+    count = ((v >> (r - 1)) & 0x1) + 1
+    r -= 1
+    for _ in range(count):
+        r = _skip_value_2(v, r)
+    return r
+
+
+def _skip_value_2(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    present = (v >> (r - 3)) & 0x3
+    r -= 32
+    if present & 2:
+        r -= 6
+    if present & 1:
+        r -= 19
+    if extension:
+        r = _skip_additions(v, r)
+    return r
+
+
+def _skip_originatingRSUContainer(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    r -= 1
+    if extension:
+        r = _skip_choice_addition(v, r)
+    else:
+        index = (v >> (r - 1)) & 0x1
+        r -= 1
+        if index == 0:
+            r = _skip_intersectionReferenceId(v, r)
+        elif index == 1:
+            r = _skip_intersectionReferenceId(v, r)
+        else:
+            raise UperDecodeError(f"Invalid choice index {index}.")
+    return r
+
+
+def _skip_intersectionReferenceId(v, r):
+    present = (v >> (r - 1)) & 0x1
+    r -= 1
+    if present & 1:
+        r -= 16
+    r -= 16
+    return r
+
+
+def _skip_sensorInformationContainer(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    r -= 1
+    if extension:
+        count, r = _read_length(v, r)
+    else:
+        count = ((v >> (r - 7)) & 0x7f) + 1
+        r -= 7
+    for _ in range(count):
+        r = _skip_value_3(v, r)
+    return r
+
+
+def _skip_value_3(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    present = (v >> (r - 2)) & 0x1
+    r -= 14
+    r = _skip_detectionArea(v, r)
+    if present & 1:
+        r -= 7
+    if extension:
+        r = _skip_additions(v, r)
+    return r
+
+
+def _skip_detectionArea(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    r -= 1
+    if extension:
+        r = _skip_choice_addition(v, r)
+    else:
+        index = (v >> (r - 3)) & 0x7
+        r -= 3
+        if index == 0:
+            r = _skip_vehicleSensor(v, r)
+        elif index == 1:
+            r = _skip_stationarySensorRadial(v, r)
+        elif index == 2:
+            r = _skip_stationarySensorPolygon(v, r)
+        elif index == 3:
+            r = _skip_stationarySensorCircular(v, r)
+        elif index == 4:
+            r = _skip_stationarySensorEllipse(v, r)
+        elif index == 5:
+            r = _skip_stationarySensorRectangle(v, r)
+        else:
+            raise UperDecodeError(f"Invalid choice index {index}.")
+    return r
+
+
+def _skip_vehicleSensor(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    present = (v >> (r - 3)) & 0x3
+    r -= 3
+    if present & 2:
+        r -= 8
+    r -= 24
+    if present & 1:
+        r -= 10
+    r = _skip_vehicleSensorPropertyList(v, r)
+    if extension:
+        r = _skip_additions(v, r)
+    return r
+
+
+def _skip_vehicleSensorPropertyList(v, r):
+    count = ((v >> (r - 4)) & 0xf) + 1
+    r -= 4
+    for _ in range(count):
+        r = _skip_value_4(v, r)
+    return r
+
+
+def _skip_value_4(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    present = (v >> (r - 3)) & 0x3
+    r -= 41
+    if present & 2:
+        r -= 12
+    if present & 1:
+        r -= 12
+    if extension:
+        r = _skip_additions(v, r)
+    return r
+
+
+def _skip_stationarySensorRadial(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    present = (v >> (r - 5)) & 0xf
+    r -= 43
+    if present & 8:
+        r -= 12
+    if present & 4:
+        r -= 12
+    if present & 2:
+        r = _skip_sensorPositionOffset(v, r)
+    if present & 1:
+        r -= 14
+    if extension:
+        r = _skip_additions(v, r)
+    return r
+
+
+def _skip_sensorPositionOffset(v, r):
+    present = (v >> (r - 1)) & 0x1
+    r -= 1
+    r = _skip_nodeOffsetPointxy(v, r)
+    if present & 1:
+        r = _skip_nodeOffsetPointZ(v, r)
+    return r
+
+
+def _skip_nodeOffsetPointxy(v, r):
+    index = (v >> (r - 3)) & 0x7
+    r -= 3
+    if index == 0:
+        r -= 20
+    elif index == 1:
+        r -= 22
+    elif index == 2:
+        r -= 24
+    elif index == 3:
+        r -= 26
+    elif index == 4:
+        r -= 28
+    elif index == 5:
+        r -= 32
+    elif index == 6:
+        r -= 63
+    elif index == 7:
+        r = _skip_regional(v, r)
+    else:
+        raise UperDecodeError(f"Invalid choice index {index}.")
+    return r
+
+
+def _skip_regional(v, r):
+    r -= 8
+    _, r = _read_length(v, r)
+    _, r = _read_bytes(v, r, _)
+    return r
+
+
+def _skip_nodeOffsetPointZ(v, r):
+    index = (v >> (r - 3)) & 0x7
+    r -= 3
+    if index == 0:
+        r -= 10
+    elif index == 1:
+        r -= 11
+    elif index == 2:
+        r -= 12
+    elif index == 3:
+        r -= 13
+    elif index == 4:
+        r -= 14
+    elif index == 5:
+        r -= 16
+    else:
+        raise UperDecodeError(f"Invalid choice index {index}.")
+    return r
+
+
+def _skip_stationarySensorPolygon(v, r):
+    r = _skip_polyPointList(v, r)
+    return r
+
+
+def _skip_polyPointList(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    r -= 1
+    if extension:
+        count, r = _read_length(v, r)
+    else:
+        count = ((v >> (r - 4)) & 0xf) + 3
+        r -= 4
+    for _ in range(count):
+        r = _skip_sensorPositionOffset(v, r)
+    return r
+
+
+def _skip_stationarySensorCircular(v, r):
+    present = (v >> (r - 1)) & 0x1
+    r -= 1
+    if present & 1:
+        r = _skip_sensorPositionOffset(v, r)
+    r -= 14
+    return r
+
+
+def _skip_stationarySensorEllipse(v, r):
+    present = (v >> (r - 2)) & 0x3
+    r -= 2
+    if present & 2:
+        r = _skip_sensorPositionOffset(v, r)
+    r -= 40
+    if present & 1:
+        r -= 14
+    return r
+
+
+def _skip_stationarySensorRectangle(v, r):
+    present = (v >> (r - 2)) & 0x3
+    r -= 2
+    if present & 2:
+        r = _skip_sensorPositionOffset(v, r)
+    r -= 40
+    if present & 1:
+        r -= 14
+    return r
+
+
+def _skip_sensorIDList(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    r -= 1
+    if extension:
+        count, r = _read_length(v, r)
+    else:
+        count = ((v >> (r - 7)) & 0x7f) + 1
+        r -= 7
+    r -= 8 * count
+    return r
+
+
+def _skip_freeSpaceAddendumContainer(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    r -= 1
+    if extension:
+        count, r = _read_length(v, r)
+    else:
+        count = ((v >> (r - 7)) & 0x7f) + 1
+        r -= 7
+    for _ in range(count):
+        r = _skip_value_5(v, r)
+    return r
+
+
+def _skip_value_5(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    present = (v >> (r - 3)) & 0x3
+    r -= 10
+    r = _skip_freeSpaceArea(v, r)
+    if present & 2:
+        r = _skip_sensorIDList(v, r)
+    if present & 1:
+        r -= 1
+    if extension:
+        r = _skip_additions(v, r)
+    return r
+
+
+def _skip_freeSpaceArea(v, r):
+    extension = (v >> (r - 1)) & 0x1
+    r -= 1
+    if extension:
+        r = _skip_choice_addition(v, r)
+    else:
+        index = (v >> (r - 2)) & 0x3
+        r -= 2
+        if index == 0:
+            r = _skip_stationarySensorPolygon(v, r)
+        elif index == 1:
+            r = _skip_stationarySensorCircular(v, r)
+        elif index == 2:
+            r = _skip_stationarySensorEllipse(v, r)
+        elif index == 3:
+            r = _skip_stationarySensorRectangle(v, r)
+        else:
+            raise UperDecodeError(f"Invalid choice index {index}.")
+    return r
+
+
+def decode_cam_value(data: bytes) -> dict:
+    """Decode a CAM to the value asn1tools would return."""
+    try:
+        value, r = _decode_CAM(int.from_bytes(data, "big"), 8 * len(data))
+    except ValueError as error:
+        raise _out_of_data(error) from error
+    if r < 0:
+        raise UperDecodeError("Out of data.")
+    return value
+
+
+def encode_cam_value(value: dict) -> bytes:
+    """Encode a CAM given as asn1tools value."""
+    try:
+        e, m = _encode_CAM(0, 0, value)
+    except KeyError as error:
+        raise UperEncodeError(f"Missing member {error}.") from error
+    padding = -m % 8
+    return (e << padding).to_bytes((m + padding) // 8, "big")
+
+
+def decode_cam(data: bytes) -> _cam.CAM:
+    r = 8 * len(data)
+    v = int.from_bytes(data, "big")
+    try:
+        protocolVersion = (v >> (r - 8)) & 0xff
+        messageId = (v >> (r - 16)) & 0xff
+        stationId = (v >> (r - 48)) & 0xffffffff
+        header = _cam.ItsPduHeader(protocol_version=protocolVersion, message_id=messageId, station_id=stationId)
+        generationDeltaTime = (v >> (r - 64)) & 0xffff
+        extension = (v >> (r - 65)) & 0x1
+        present = (v >> (r - 67)) & 0x3
+        extension_2 = (v >> (r - 68)) & 0x1
+        stationType = (v >> (r - 76)) & 0xff
+        latitude = ((v >> (r - 107)) & 0x7fffffff) + -900000000
+        longitude = ((v >> (r - 139)) & 0xffffffff) + -1800000000
+        semiMajorConfidence = (v >> (r - 151)) & 0xfff
+        semiMinorConfidence = (v >> (r - 163)) & 0xfff
+        semiMajorOrientation = (v >> (r - 175)) & 0xfff
+        altitudeValue = ((v >> (r - 195)) & 0xfffff) + -100000
+        altitudeConfidence = (v >> (r - 199)) & 0xf
+        r -= 199
+        if extension_2:
+            r = _skip_additions(v, r)
+        basicContainer = _cam.BasicContainer(station_type=stationType, reference_position=_cam.ReferencePosition(latitude=latitude, longitude=longitude, position_confidence_ellipse=_cam.PosConfidenceEllipse(semi_major_confidence=semiMajorConfidence, semi_minor_confidence=semiMinorConfidence, semi_major_orientation=semiMajorOrientation), altitude=_cam.Altitude(altitude_value=altitudeValue, altitude_confidence=_cam.clamp(altitudeConfidence, 0, 15))))
+        extension_3 = (v >> (r - 1)) & 0x1
+        r -= 1
+        if extension_3:
+            r = _skip_choice_addition(v, r)
+            basicVehicleContainerHighFrequency = _cam.BasicVehicleContainerHighFrequency.from_dict({})
+            rsuContainerHighFrequency = _cam.RSUContainerHighFrequency.from_dict({})
+        else:
+            index = (v >> (r - 1)) & 0x1
+            r -= 1
+            if index == 0:
+                present_2 = (v >> (r - 7)) & 0x7f
+                headingValue = (v >> (r - 19)) & 0xfff
+                headingConfidence = ((v >> (r - 26)) & 0x7f) + 1
+                speedValue = (v >> (r - 40)) & 0x3fff
+                speedConfidence = ((v >> (r - 47)) & 0x7f) + 1
+                driveDirection = (v >> (r - 49)) & 0x3
+                r -= 49
+                if driveDirection >= 3:
+                    raise UperDecodeError(f"Invalid enumeration index {driveDirection}.")
+                vehicleLengthValue = ((v >> (r - 10)) & 0x3ff) + 1
+                vehicleLengthConfidenceIndication = (v >> (r - 13)) & 0x7
+                r -= 13
+                if vehicleLengthConfidenceIndication >= 5:
+                    raise UperDecodeError(f"Invalid enumeration index {vehicleLengthConfidenceIndication}.")
+                vehicleWidth = ((v >> (r - 6)) & 0x3f) + 1
+                longitudinalAccelerationValue = ((v >> (r - 15)) & 0x1ff) + -160
+                longitudinalAccelerationConfidence = (v >> (r - 22)) & 0x7f
+                curvatureValue = ((v >> (r - 33)) & 0x7ff) + -1023
+                curvatureConfidence = (v >> (r - 36)) & 0x7
+                extension_4 = (v >> (r - 37)) & 0x1
+                r -= 37
+                if extension_4:
+                    curvatureCalculationMode, r = _read_normally_small(v, r)
+                    curvatureCalculationMode = _CONSTANT_18.get(curvatureCalculationMode)
+                else:
+                    curvatureCalculationMode = (v >> (r - 2)) & 0x3
+                    r -= 2
+                    if curvatureCalculationMode >= 3:
+                        raise UperDecodeError(f"Invalid enumeration index {curvatureCalculationMode}.")
+                yawRateValue = ((v >> (r - 16)) & 0xffff) + -32766
+                yawRateConfidence = (v >> (r - 20)) & 0xf
+                r -= 20
+                if yawRateConfidence >= 9:
+                    raise UperDecodeError(f"Invalid enumeration index {yawRateConfidence}.")
+                if present_2 & 64:
+                    _, r = _read_bits(v, r, 7)
+                if present_2 & 32:
+                    r -= 4
+                if present_2 & 16:
+                    r -= 17
+                if present_2 & 8:
+                    r -= 16
+                if present_2 & 4:
+                    r -= 16
+                if present_2 & 2:
+                    r -= 3
+                if present_2 & 1:
+                    r = _skip_cenDsrcTollingZone(v, r)
+                basicVehicleContainerHighFrequency = _cam.BasicVehicleContainerHighFrequency(heading=_cam.Heading(heading_value=headingValue, heading_confidence=headingConfidence), speed=_cam.Speed(speed_value=_cam.clamp(speedValue, 0, 16382), speed_confidence=speedConfidence), drive_direction=_cam.clamp(driveDirection, 0, 2), vehicle_length=_cam.VehicleLength(vehicle_length_value=vehicleLengthValue, vehicle_length_confidence_indication=_cam.clamp(vehicleLengthConfidenceIndication, 0, 4)), vehicle_width=vehicleWidth, longitudinal_acceleration=_cam.LongitudinalAcceleration(longitudinal_acceleration_value=_cam.clamp(longitudinalAccelerationValue, -160, 160), longitudinal_acceleration_confidence=longitudinalAccelerationConfidence), curvature=_cam.Curvature(curvature_value=curvatureValue, curvature_confidence=_cam.clamp(curvatureConfidence, 0, 7)), curvature_calculation_mode=_cam.clamp(curvatureCalculationMode, 0, 2), yaw_rate=_cam.YawRate(yaw_rate_value=yawRateValue, yaw_rate_confidence=_cam.clamp(yawRateConfidence, 0, 8)))
+                rsuContainerHighFrequency = _cam.RSUContainerHighFrequency.from_dict({})
+            elif index == 1:
+                extension_5 = (v >> (r - 1)) & 0x1
+                present_3 = (v >> (r - 2)) & 0x1
+                r -= 2
+                if present_3 & 1:
+                    count = ((v >> (r - 4)) & 0xf) + 1
+                    protectedCommunicationZonesRSU = []
+                    r -= 4
+                    for _ in range(count):
+                        extension_6 = (v >> (r - 1)) & 0x1
+                        present_4 = (v >> (r - 4)) & 0x7
+                        extension_7 = (v >> (r - 5)) & 0x1
+                        r -= 5
+                        if extension_7:
+                            protectedZoneType, r = _read_normally_small(v, r)
+                            protectedZoneType = _CONSTANT_19.get(protectedZoneType)
+                        else:
+                            protectedZoneType = 0
+                        if present_4 & 4:
+                            expiryTime = (v >> (r - 42)) & 0x3ffffffffff
+                            r -= 42
+                        else:
+                            expiryTime = 0
+                        protectedZoneLatitude = ((v >> (r - 31)) & 0x7fffffff) + -900000000
+                        protectedZoneLongitude = ((v >> (r - 63)) & 0xffffffff) + -1800000000
+                        r -= 63
+                        if present_4 & 2:
+                            extension_8 = (v >> (r - 1)) & 0x1
+                            r -= 1
+                            if extension_8:
+                                protectedZoneRadius, r = _read_unconstrained(v, r)
+                            else:
+                                protectedZoneRadius = ((v >> (r - 8)) & 0xff) + 1
+                                r -= 8
+                        else:
+                            protectedZoneRadius = 1
+                        if present_4 & 1:
+                            protectedZoneId = (v >> (r - 27)) & 0x7ffffff
+                            r -= 27
+                        else:
+                            protectedZoneId = 0
+                        if extension_6:
+                            r = _skip_additions(v, r)
+                        __2 = _cam.ProtectedCommunicationZone(protected_zone_type=_cam.clamp(protectedZoneType, 0, 1), expiry_time=expiryTime, protected_zone_latitude=protectedZoneLatitude, protected_zone_longitude=protectedZoneLongitude, protected_zone_radius=_cam.clamp(protectedZoneRadius, 1, 255), protected_zone_id=protectedZoneId)
+                        protectedCommunicationZonesRSU.append(__2)
+                else:
+                    protectedCommunicationZonesRSU = []
+                if extension_5:
+                    r = _skip_additions(v, r)
+                rsuContainerHighFrequency = _cam.RSUContainerHighFrequency(protected_communication_zones_rsu=protectedCommunicationZonesRSU)
+                basicVehicleContainerHighFrequency = _cam.BasicVehicleContainerHighFrequency.from_dict({})
+            else:
+                raise UperDecodeError(f"Invalid choice index {index}.")
+        highFrequencyContainer = _cam.HighFrequencyContainer(basic_vehicle_container_high_frequency=basicVehicleContainerHighFrequency, rsu_container_high_frequency=rsuContainerHighFrequency)
+        if present & 2:
+            r = _skip_lowFrequencyContainer(v, r)
+        if present & 1:
+            r = _skip_specialVehicleContainer(v, r)
+        if extension:
+            r = _skip_additions(v, r)
+        camParameters = _cam.CamParameters(basic_container=basicContainer, high_frequency_container=highFrequencyContainer)
+        cam = _cam.CoopAwareness(generation_delta_time=generationDeltaTime, cam_parameters=camParameters)
+        message = _cam.CAM(header=header, cam=cam)
+    except ValueError as error:
+        raise _out_of_data(error) from error
+    if r < 0:
+        raise UperDecodeError("Out of data.")
+    return message
+
+
+def decode_cpm_value(data: bytes) -> dict:
+    """Decode a CPM to the value asn1tools would return."""
+    try:
+        value, r = _decode_CPM(int.from_bytes(data, "big"), 8 * len(data))
+    except ValueError as error:
+        raise _out_of_data(error) from error
+    if r < 0:
+        raise UperDecodeError("Out of data.")
+    return value
+
+
+def encode_cpm_value(value: dict) -> bytes:
+    """Encode a CPM given as asn1tools value."""
+    try:
+        e, m = _encode_CPM(0, 0, value)
+    except KeyError as error:
+        raise UperEncodeError(f"Missing member {error}.") from error
+    padding = -m % 8
+    return (e << padding).to_bytes((m + padding) // 8, "big")
+
+
+def decode_cpm(data: bytes) -> _cpm.CPM:
+    r = 8 * len(data)
+    v = int.from_bytes(data, "big")
+    try:
+        protocolVersion = (v >> (r - 8)) & 0xff
+        messageID = (v >> (r - 16)) & 0xff
+        stationID = (v >> (r - 48)) & 0xffffffff
+        header = _cpm.ItsPduHeader(protocol_version=protocolVersion, message_id=messageID, station_id=stationID)
+        generationDeltaTime = (v >> (r - 64)) & 0xffff
+        extension = (v >> (r - 65)) & 0x1
+        present = (v >> (r - 69)) & 0xf
+        extension_2 = (v >> (r - 70)) & 0x1
+        present_2 = (v >> (r - 71)) & 0x1
+        r -= 79
+        if present_2 & 1:
+            r -= 14
+        latitude = ((v >> (r - 31)) & 0x7fffffff) + -900000000
+        longitude = ((v >> (r - 63)) & 0xffffffff) + -1800000000
+        semiMajorConfidence = (v >> (r - 75)) & 0xfff
+        semiMinorConfidence = (v >> (r - 87)) & 0xfff
+        semiMajorOrientation = (v >> (r - 99)) & 0xfff
+        altitudeValue = ((v >> (r - 119)) & 0xfffff) + -100000
+        altitudeConfidence = (v >> (r - 123)) & 0xf
+        referencePosition = _cpm.ReferencePosition(latitude=latitude * 1e-7, longitude=longitude * 1e-7, positionConfidenceEllipse=_cpm.PositionConfidenceEllipse(semiMajorConfidence=semiMajorConfidence, semiMinorConfidence=semiMinorConfidence, semiMajorOrientation=semiMajorOrientation), altitude=_cpm.Altitude(altitudeValue=altitudeValue, altitudeConfidence=altitudeConfidence))
+        r -= 123
+        if extension_2:
+            r = _skip_additions(v, r)
+        if present & 8:
+            r = _skip_stationDataContainer(v, r)
+        if present & 4:
+            r = _skip_sensorInformationContainer(v, r)
+        if present & 2:
+            extension_3 = (v >> (r - 1)) & 0x1
+            r -= 1
+            if extension_3:
+                count, r = _read_length(v, r)
+            else:
+                count = ((v >> (r - 7)) & 0x7f) + 1
+                r -= 7
+            perceivedObjectContainer = []
+            for _ in range(count):
+                extension_4 = (v >> (r - 1)) & 0x1
+                present_3 = (v >> (r - 17)) & 0xffff
+                objectID = (v >> (r - 25)) & 0xff
+                r -= 25
+                if present_3 & 32768:
+                    r = _skip_sensorIDList(v, r)
+                timeOfMeasurement = ((v >> (r - 12)) & 0xfff) + -1500
+                r -= 12
+                if present_3 & 16384:
+                    r -= 11
+                if present_3 & 8192:
+                    r -= 7
+                value_2 = ((v >> (r - 19)) & 0x7ffff) + -132768
+                confidence = (v >> (r - 26)) & 0x7f
+                value_3 = ((v >> (r - 45)) & 0x7ffff) + -132768
+                confidence_2 = (v >> (r - 52)) & 0x7f
+                r -= 52
+                if present_3 & 4096:
+                    r -= 26
+                value_4 = ((v >> (r - 15)) & 0x7fff) + -16383
+                confidence_3 = ((v >> (r - 22)) & 0x7f) + 1
+                value_5 = ((v >> (r - 37)) & 0x7fff) + -16383
+                confidence_4 = ((v >> (r - 44)) & 0x7f) + 1
+                r -= 44
+                if present_3 & 2048:
+                    r -= 22
+                if present_3 & 1024:
+                    r -= 16
+                if present_3 & 512:
+                    r -= 16
+                if present_3 & 256:
+                    r -= 16
+                if present_3 & 128:
+                    r -= 19
+                if present_3 & 64:
+                    value_6 = (v >> (r - 10)) & 0x3ff
+                    confidence_5 = (v >> (r - 17)) & 0x7f
+                    planarObjectDimension1 = _cpm.DimensionPlanar(value=value_6 / 100, confidence=confidence_5)
+                    r -= 17
+                else:
+                    planarObjectDimension1 = _cpm.DimensionPlanar()
+                if present_3 & 32:
+                    value_7 = (v >> (r - 10)) & 0x3ff
+                    confidence_6 = (v >> (r - 17)) & 0x7f
+                    planarObjectDimension2 = _cpm.DimensionPlanar(value=value_7 / 100, confidence=confidence_6)
+                    r -= 17
+                else:
+                    planarObjectDimension2 = _cpm.DimensionPlanar()
+                if present_3 & 16:
+                    r -= 17
+                if present_3 & 8:
+                    r -= 4
+                if present_3 & 4:
+                    r -= 2
+                if present_3 & 2:
+                    classification, r = _decode_classification(v, r)
+                else:
+                    classification = None
+                if present_3 & 1:
+                    extension_5 = (v >> (r - 1)) & 0x1
+                    present_4 = (v >> (r - 3)) & 0x3
+                    r -= 3
+                    if present_4 & 2:
+                        laneID = (v >> (r - 8)) & 0xff
+                        r -= 8
+                    else:
+                        laneID = 0
+                    if present_4 & 1:
+                        longitudinalLanePositionValue = (v >> (r - 15)) & 0x7fff
+                        longitudinalLanePositionConfidence = (v >> (r - 22)) & 0x7f
+                        r -= 22
+                    else:
+                        longitudinalLanePositionValue = 0.0
+                        longitudinalLanePositionConfidence = 0
+                    if extension_5:
+                        r = _skip_additions(v, r)
+                    matchedPosition = _cpm.MatchedPosition(laneId=laneID, longitudinalLanePositionValue=longitudinalLanePositionValue, longitudinalLanePositionConfidenceValue=longitudinalLanePositionConfidence)
+                else:
+                    matchedPosition = None
+                if extension_4:
+                    r = _skip_additions(v, r)
+                _ = _cpm.CpmPerceivedObject(objectId=objectID, time_of_measurement=timeOfMeasurement, xDistance=_cpm.XDistance(value=value_2 / 100, confidence=confidence), yDistance=_cpm.YDistance(value=value_3 / 100, confidence=confidence_2), xSpeed=_cpm.XSpeed(value=value_4 / 100, confidence=confidence_3), ySpeed=_cpm.YSpeed(value=value_5 / 100, confidence=confidence_4), dimensionPlanar1=planarObjectDimension1, dimensionPlanar2=planarObjectDimension2, classification=_cpm.Classification(confidence=classification[0]['confidence'], classificationType=classification[0]['class'][1]['type']) if classification is not None else _cpm.Classification(), matchedPosition=matchedPosition)
+                perceivedObjectContainer.append(_)
+        else:
+            perceivedObjectContainer = []
+        if present & 1:
+            r = _skip_freeSpaceAddendumContainer(v, r)
+        numberOfPerceivedObjects = (v >> (r - 8)) & 0xff
+        r -= 8
+        if extension:
+            r = _skip_additions(v, r)
+        cpmParameters = _cpm.CpmParameters(numberOfPerceivedObjects=numberOfPerceivedObjects, cpmPerceivedObjectContainer=perceivedObjectContainer, managementContainer=_cpm.ManagementContainer(referencePosition=referencePosition))
+        message = _cpm.CPM(header=header, generationDeltaTime=generationDeltaTime, cpmParameters=cpmParameters)
+    except ValueError as error:
+        raise _out_of_data(error) from error
+    if r < 0:
+        raise UperDecodeError("Out of data.")
+    return message
+
+
+# Decoders to the ETSI message classes by ASN.1 type name.
+DECODERS = {
+    'CAM': decode_cam,
+    'CPM': decode_cpm,
+}
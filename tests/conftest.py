@@ -0,0 +1,41 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# Shared fixtures of the tests. The ASN.1 specifications are compiled
+# once per session.
+# ---------------------------------------------------------------------
+import pytest
+
+from cohda_driver.corpus import MessageCorpus
+from cohda_driver.decoder import EtsiDecoder
+from cohda_driver.driver import CohdaDriver
+
+
+@pytest.fixture(scope="session")
+def decoder() -> EtsiDecoder:
+    return EtsiDecoder()
+
+
+@pytest.fixture
+def corpus(decoder: EtsiDecoder) -> MessageCorpus:
+    return MessageCorpus(seed=0, decoder=decoder)
+
+
+@pytest.fixture
+def driver(decoder: EtsiDecoder) -> CohdaDriver:
+    driver = CohdaDriver(
+        "127.0.0.1",
+        "127.0.0.1",
+        0,
+        0,
+        enable_metrics=True,
+        kernel_timestamps=False,
+        decoder=decoder,
+    )
+    yield driver
+    driver.sock.close()
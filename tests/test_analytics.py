@@ -0,0 +1,199 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# Tests of the windowed CAM analytics against a loop over the CAM
+# objects.
+# ---------------------------------------------------------------------
+import math
+import random
+
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from cohda_driver.analytics import ApproachMap, CamBuffer  # noqa: E402
+from cohda_driver.corpus import MessageCorpus  # noqa: E402
+from cohda_driver.etsi_message_type import EtsiMessageType  # noqa: E402
+from cohda_driver.etsi_messages.cam import CAM  # noqa: E402
+from cohda_driver.etsi_messages.its_pdu_header import ItsPduHeader  # noqa: E402
+from cohda_driver.etsi_messages.mapem import (  # noqa: E402
+    MAPEM,
+    IntersectionGeometry,
+    MAPData,
+    MAPEMGenericLane,
+    MAPEMNode,
+    MAPEMNodeList,
+    ReferencePosition,
+)
+from cohda_driver.geofence import EARTH_RADIUS, POSITION_UNITS_PER_DEGREE  # noqa: E402
+from cohda_driver.partial_decoder import LATITUDE_UNAVAILABLE  # noqa: E402
+
+ORIGIN = (49.0, 8.4)
+# Half edge length of the area the stations are spread over in position units (0.1 microdegrees).
+AREA = 5000
+CELL_SIZE = 50.0
+METERS_PER_DEGREE = math.radians(1) * EARTH_RADIUS
+
+
+@pytest.fixture
+def cams(corpus: MessageCorpus) -> List[CAM]:
+    rng = random.Random(0)
+    cams = []
+    for payload in corpus.payloads(EtsiMessageType.CAM, 200):
+        cam = corpus.decoder.decode(payload)
+        position = cam.cam.cam_parameters.basic_container.reference_position
+        position.latitude = round(ORIGIN[0] * POSITION_UNITS_PER_DEGREE) + rng.randint(-AREA, AREA)
+        position.longitude = round(ORIGIN[1] * POSITION_UNITS_PER_DEGREE) + rng.randint(-AREA, AREA)
+        cam.header.station_id = rng.randrange(20)
+        cams.append(cam)
+    return cams
+
+
+def place(cam: CAM, north: float, east: float) -> CAM:
+    """
+    Move a CAM to a position in meters from the origin.
+    """
+    position = cam.cam.cam_parameters.basic_container.reference_position
+    position.latitude = round((ORIGIN[0] + north / METERS_PER_DEGREE) * POSITION_UNITS_PER_DEGREE)
+    position.longitude = round(
+        (ORIGIN[1] + east / (METERS_PER_DEGREE * math.cos(math.radians(ORIGIN[0]))))
+        * POSITION_UNITS_PER_DEGREE
+    )
+    return cam
+
+
+def reference_statistics(cams: List[CAM], key) -> Dict[Tuple[int, int], Dict]:
+    """
+    Statistics per group of a loop over the CAM objects.
+    """
+    groups: Dict[Tuple[int, int], Dict] = defaultdict(
+        lambda: {
+            "samples": 0,
+            "stations": set(),
+            "speeds": [],
+            "accelerations": [],
+            "headings": [0] * 8,
+        }
+    )
+    for cam in cams:
+        group_key = key(cam)
+        if group_key is None:
+            continue
+        high_frequency = (
+            cam.cam.cam_parameters.high_frequency_container.basic_vehicle_container_high_frequency
+        )
+        group = groups[group_key]
+        group["samples"] += 1
+        group["stations"].add(cam.header.station_id)
+        if high_frequency.speed.speed_value != 16383:
+            group["speeds"].append(high_frequency.speed.speed_value / 100)
+        acceleration = high_frequency.longitudinal_acceleration.longitudinal_acceleration_value
+        if acceleration != 161:
+            group["accelerations"].append(acceleration / 10)
+        if high_frequency.heading.heading_value != 3601:
+            group["headings"][int(high_frequency.heading.heading_value / 450) % 8] += 1
+    return groups
+
+
+def cell(cam: CAM) -> Tuple[int, int]:
+    position = cam.cam.cam_parameters.basic_container.reference_position
+    north = (position.latitude / POSITION_UNITS_PER_DEGREE - ORIGIN[0]) * METERS_PER_DEGREE
+    east = (
+        (position.longitude / POSITION_UNITS_PER_DEGREE - ORIGIN[1])
+        * METERS_PER_DEGREE
+        * math.cos(math.radians(ORIGIN[0]))
+    )
+    return math.floor(north / CELL_SIZE), math.floor(east / CELL_SIZE)
+
+
+def mean(values: List[float]) -> float:
+    return sum(values) / len(values) if values else math.nan
+
+
+def assert_statistics(rows: List[Dict], expected: Dict[Tuple[int, int], Dict]):
+    assert sorted(row["key"] for row in rows) == sorted(expected)
+    for row in rows:
+        group = expected[row["key"]]
+        assert row["samples"] == group["samples"]
+        assert row["stations"] == len(group["stations"])
+        assert row["mean_speed"] == pytest.approx(mean(group["speeds"]), nan_ok=True)
+        assert row["mean_acceleration"] == pytest.approx(
+            mean(group["accelerations"]), nan_ok=True
+        )
+        assert row["heading_histogram"] == group["headings"]
+
+
+def test_cell_statistics_match_a_loop_over_the_cams(cams: List[CAM]):
+    buffer = CamBuffer(capacity=len(cams), origin=ORIGIN)
+    for i, cam in enumerate(cams):
+        assert buffer.add(cam, float(i))
+    statistics = buffer.cell_statistics(99.5, CELL_SIZE, now=199.0)
+    assert_statistics(statistics.rows(), reference_statistics(cams[100:], cell))
+
+
+def test_window_selects_the_cams_after_the_ring_wrapped(cams: List[CAM]):
+    buffer = CamBuffer(capacity=50, origin=ORIGIN)
+    for i, cam in enumerate(cams[:80]):
+        buffer.add(cam, float(i))
+    assert len(buffer) == 50
+    window = buffer.window(40.0, now=79.0)
+    assert window.time.tolist() == [float(i) for i in range(39, 80)]
+    assert window.station_id.tolist() == [cam.header.station_id for cam in cams[39:80]]
+    # A window longer than the buffer only contains the buffered CAMs.
+    assert buffer.window(1000.0, now=79.0).time.tolist() == [float(i) for i in range(30, 80)]
+    assert len(buffer.window(1.0, now=1000.0)) == 0
+
+
+def test_road_side_units_and_unavailable_positions_are_skipped(corpus: MessageCorpus):
+    buffer = CamBuffer(origin=ORIGIN)
+    payload = corpus.payloads(EtsiMessageType.CAM, 1, road_side_unit=True)[0]
+    assert not buffer.add(corpus.decoder.decode(payload), 0.0)
+    cam = corpus.decoder.decode(corpus.payloads(EtsiMessageType.CAM, 1)[0])
+    cam.cam.cam_parameters.basic_container.reference_position.latitude = LATITUDE_UNAVAILABLE
+    assert not buffer.add(cam, 0.0)
+    assert len(buffer) == 0
+
+
+def test_approach_statistics_include_only_ingress_lanes(cams: List[CAM]):
+    lanes = [
+        # Ingress lane of approach 1 from 100 m south to the reference point.
+        MAPEMGenericLane(
+            laneId=1,
+            ingressApproach=1,
+            mapemNodeList=MAPEMNodeList([MAPEMNode(0, -100), MAPEMNode(0, 100)]),
+        ),
+        # Egress lane from the reference point to 100 m east.
+        MAPEMGenericLane(
+            laneId=2,
+            egressApproach=2,
+            mapemNodeList=MAPEMNodeList([MAPEMNode(0, 0), MAPEMNode(100, 0)]),
+        ),
+    ]
+    intersection = IntersectionGeometry(
+        descriptiveName="test",
+        intersectionReferenceId=7,
+        intersectionReferenceIdRegion=0,
+        revision=0,
+        laneWidth=350,
+        refPoint=ReferencePosition(*ORIGIN),
+        genericLaneListSet=lanes,
+    )
+    header = ItsPduHeader(protocol_version=2, message_id=4, station_id=1)
+    approaches = ApproachMap(MAPEM(header, MAPData(0, [intersection])))
+
+    ingress = [place(cam, -50.0, 1.0) for cam in cams[:10]]
+    egress = [place(cam, -1.0, 50.0) for cam in cams[10:15]]
+    outside = [place(cam, -50.0, 20.0) for cam in cams[15:20]]
+    buffer = CamBuffer(origin=ORIGIN)
+    for i, cam in enumerate(ingress + egress + outside):
+        buffer.add(cam, float(i))
+    statistics = buffer.approach_statistics(100.0, approaches, now=100.0)
+    assert_statistics(statistics.rows(), reference_statistics(ingress, lambda cam: (7, 1)))
@@ -0,0 +1,113 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# Tests of the message archive.
+# ---------------------------------------------------------------------
+from cohda_driver.archive import MessageArchiveReader, MessageArchiveWriter
+from cohda_driver.btp_indication import create_btp_indication_packet
+from cohda_driver.etsi_message_type import EtsiMessageType
+
+
+def write_archive(directory, corpus, segment_size, start_ns=1_700_000_000_000_000_000):
+    cams = corpus.payloads(EtsiMessageType.CAM, 20)
+    spatems = corpus.payloads(EtsiMessageType.SPATEM, 20)
+    records = []
+    with MessageArchiveWriter(directory, segment_size=segment_size) as archive:
+        # CAMs and SPATEMs interleaved, 10 ms apart.
+        for i, payload in enumerate(p for pair in zip(cams, spatems) for p in pair):
+            timestamp_ns = start_ns + i * 10_000_000
+            archive.write(payload, timestamp_ns=timestamp_ns)
+            records.append((timestamp_ns, payload))
+    return records
+
+
+def test_query_round_trip_across_segments(tmp_path, corpus):
+    records = write_archive(tmp_path, corpus, segment_size=512)
+    with MessageArchiveReader(tmp_path, decoder=corpus.decoder) as reader:
+        assert len(reader) == len(records)
+        assert len(reader._segments) > 1
+        assert [
+            (record.timestamp_ns, bytes(record.payload)) for record in reader.query()
+        ] == records
+
+        start_ns, end_ns = records[5][0], records[25][0]
+        assert [record.timestamp_ns for record in reader.query(start_ns, end_ns)] == [
+            timestamp_ns for timestamp_ns, _ in records[5:25]
+        ]
+        spatems = reader.query(start_ns, end_ns, message_type=EtsiMessageType.SPATEM)
+        assert [
+            (record.timestamp_ns, bytes(record.payload)) for record in spatems
+        ] == records[5:25:2]
+
+        station_id = corpus.decoder.decode_header(records[0][1]).station_id
+        matching = [
+            (timestamp_ns, payload)
+            for timestamp_ns, payload in records
+            if corpus.decoder.decode_header(payload).station_id == station_id
+        ]
+        assert [
+            (record.timestamp_ns, bytes(record.payload))
+            for record in reader.query(station_id=station_id)
+        ] == matching
+
+        messages = list(reader.query_messages(end_ns=records[4][0]))
+        assert [timestamp_ns for timestamp_ns, _ in messages] == [
+            timestamp_ns for timestamp_ns, _ in records[:4]
+        ]
+        assert messages[0][1] == corpus.decoder.decode(records[0][1])
+
+
+def test_driver_archives_messages_with_their_receive_time(tmp_path, driver, corpus):
+    payload = corpus.payloads(EtsiMessageType.CAM, 1)[0]
+    packet = create_btp_indication_packet(EtsiMessageType.CAM, payload)
+    with MessageArchiveWriter(tmp_path) as archive:
+        driver.setup_archive(archive)
+        driver.process_packet(packet, 1_700_000_000.25)
+    with MessageArchiveReader(tmp_path) as reader:
+        (record,) = reader.query()
+    assert abs(record.timestamp_ns - 1_700_000_000_250_000_000) < 1000
+    assert bytes(record.payload) == payload
+
+
+def test_reopened_archive_keeps_timestamps_in_order(tmp_path, corpus):
+    records = write_archive(tmp_path, corpus, segment_size=512)
+    last_ns = records[-1][0]
+    payloads = corpus.payloads(EtsiMessageType.CAM, 2)
+    # A clock step back while the archive was closed.
+    with MessageArchiveWriter(tmp_path) as archive:
+        archive.write(payloads[0], timestamp_ns=last_ns - 1_000_000_000)
+        archive.write(payloads[1], timestamp_ns=last_ns + 5)
+
+    with MessageArchiveReader(tmp_path) as reader:
+        timestamps = [record.timestamp_ns for record in reader.query()]
+        assert timestamps == sorted(timestamps)
+        assert timestamps[-2:] == [last_ns, last_ns + 5]
+        assert [bytes(record.payload) for record in reader.query(start_ns=last_ns)] == [
+            records[-1][1]
+        ] + payloads
+
+
+def test_query_checks_segments_that_overlap_in_time(tmp_path, corpus):
+    start_ns = 1_700_000_000_000_000_000
+    late = write_archive(tmp_path / "late", corpus, 1 << 20, start_ns)
+    early = write_archive(tmp_path / "early", corpus, 1 << 20, start_ns - 10_000_000_000)
+    # An archive combined from two archives, with the earlier messages in the later segment.
+    combined = tmp_path / "combined"
+    combined.mkdir()
+    for number, name in enumerate(["late", "early"]):
+        for suffix in [".dat", ".idx"]:
+            segment = tmp_path / name / f"segment-000000{suffix}"
+            segment.rename(combined / f"segment-{number:06d}{suffix}")
+
+    with MessageArchiveReader(combined) as reader:
+        assert [record.timestamp_ns for record in reader.query(end_ns=start_ns)] == [
+            timestamp_ns for timestamp_ns, _ in early
+        ]
+        assert [
+            record.timestamp_ns for record in reader.query(early[5][0], late[5][0])
+        ] == [timestamp_ns for timestamp_ns, _ in late[:5] + early[5:]]
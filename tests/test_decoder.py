@@ -0,0 +1,70 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# Tests of the merged ASN.1 specifications, the digest of the generated
+# codecs and the decoding on worker processes.
+# ---------------------------------------------------------------------
+import shutil
+
+from cohda_driver import uper_codecs
+from cohda_driver.decoder import EtsiDecoder, decode_many, specification_digest
+from cohda_driver.etsi_message_type import EtsiMessageType
+
+
+def test_generated_codecs_are_up_to_date(decoder):
+    modules = EtsiDecoder.ASN_MODULES[EtsiDecoder.DECODABLE_PROTOCOL_VERSION]
+    assert uper_codecs.SPECIFICATION_DIGEST == specification_digest(modules)
+    assert set(decoder._generated_decoders) == {EtsiMessageType.CAM, EtsiMessageType.CPM}
+
+
+def test_digest_covers_every_file_of_the_merged_specification(tmp_path, monkeypatch):
+    shutil.copytree(EtsiDecoder.ASN_DIR, tmp_path / "asn1")
+    monkeypatch.setattr(EtsiDecoder, "ASN_DIR", tmp_path / "asn1")
+    modules = EtsiDecoder.ASN_MODULES[EtsiDecoder.DECODABLE_PROTOCOL_VERSION]
+    digest = specification_digest(modules)
+
+    # Files outside the selection do not matter.
+    with open(tmp_path / "asn1" / "cam" / "141" / "ITS-Container (2).asn", "a") as f:
+        f.write("\n-- comment\n")
+    assert specification_digest(modules) == digest
+
+    # The CAM codecs depend on the DSRC modules imported from the SPATEM folder.
+    for file_name in sorted(set(modules.values())):
+        with open(tmp_path / "asn1" / file_name, "a") as f:
+            f.write("\n-- comment\n")
+        changed = specification_digest(modules)
+        assert changed != digest, file_name
+        digest = changed
+
+
+def test_digest_covers_the_module_selection():
+    modules = dict(EtsiDecoder.ASN_MODULES[EtsiDecoder.DECODABLE_PROTOCOL_VERSION])
+    digest = specification_digest(modules)
+    modules["ITS-Container"] = "cam/141/ITS-Container (2).asn"
+    assert specification_digest(modules) != digest
+
+
+def test_protocol_versions_decode_their_message_types(decoder):
+    assert decoder.is_decodable(EtsiMessageType.CAM, 1)
+    assert not decoder.is_decodable(EtsiMessageType.SPATEM, 1)
+    for message_type in EtsiDecoder.MESSAGE_SPECS:
+        assert decoder.is_decodable(message_type, 2)
+
+
+def test_decode_many_keeps_the_order_of_the_payloads(corpus):
+    payloads = corpus.payloads(EtsiMessageType.CAM, 6)
+    payloads += corpus.payloads(EtsiMessageType.CPM, 5, objects=2)
+    # A truncated CAM in the middle of the batch.
+    payloads.insert(5, payloads[0][:8])
+    expected = [corpus.decoder.decode(payload) for payload in payloads[:5]]
+    expected += [None] + [corpus.decoder.decode(payload) for payload in payloads[6:]]
+
+    # 6 chunks, more than the 4 chunks in flight, read from a generator.
+    decoded = decode_many((payload for payload in payloads), workers=2, chunk_size=2)
+    assert list(decoded) == expected
+    assert list(decode_many(payloads, workers=1, decoder=corpus.decoder)) == expected
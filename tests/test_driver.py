@@ -0,0 +1,86 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# Tests of the packet processing of the CohdaDriver.
+# ---------------------------------------------------------------------
+import socket
+import sys
+
+import pytest
+
+from cohda_driver.btp_indication import create_btp_indication_packet
+from cohda_driver.driver import CohdaDriver
+from cohda_driver.etsi_message_type import EtsiMessageType
+
+
+def test_process_packet_dispatches_decoded_message(driver, corpus):
+    received = []
+    driver.subscribe(EtsiMessageType.CAM, received.append)
+    payload = corpus.payloads(EtsiMessageType.CAM, 1)[0]
+
+    driver.process_packet(create_btp_indication_packet(EtsiMessageType.CAM, payload))
+
+    assert len(received) == 1
+    assert received[0].header.station_id == corpus.decoder.decode_header(payload).station_id
+    stats = driver.stats()
+    assert stats["message_types"]["CAM"]["decoded"] == 1
+
+
+def test_short_datagrams_are_dropped(driver, corpus):
+    received = []
+    driver.subscribe(EtsiMessageType.CAM, received.append)
+    payload = corpus.payloads(EtsiMessageType.CAM, 1)[0]
+    packet = create_btp_indication_packet(EtsiMessageType.CAM, payload)
+
+    for length in [0, 10, driver.HEADER_SIZE, driver.HEADER_SIZE + 5]:
+        driver.process_packet(packet[:length])
+    driver.process_packet(packet)
+
+    assert len(received) == 1
+    stats = driver.stats()
+    assert stats["packets_received"] == 5
+    assert stats["malformed_drops"] == 4
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="SO_RXQ_OVFL is Linux only.")
+@pytest.mark.parametrize("enable_metrics", [True, False])
+def test_kernel_drops_are_counted_with_metrics(decoder, corpus, enable_metrics):
+    driver = CohdaDriver(
+        "127.0.0.1",
+        "127.0.0.1",
+        0,
+        0,
+        enable_metrics=enable_metrics,
+        kernel_timestamps=False,
+        receive_buffer_size=4096,
+        decoder=decoder,
+    )
+    payload = corpus.payloads(EtsiMessageType.CAM, 1)[0]
+    packet = create_btp_indication_packet(EtsiMessageType.CAM, payload)
+    try:
+        # Overflow the receive buffer of the socket before reading from it.
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sender:
+            for _ in range(200):
+                sender.sendto(packet, driver.sock.getsockname())
+        driver.sock.settimeout(0.2)
+        received = 0
+        try:
+            while True:
+                assert driver.receive()[0] == packet
+                received += 1
+        except socket.timeout:
+            pass
+        if not enable_metrics:
+            assert driver.stats() == {}
+            return
+        kernel_drops = driver.stats()["kernel_drops"]
+        if kernel_drops == 0 and received < 200:
+            pytest.skip("The kernel drops datagrams without reporting SO_RXQ_OVFL.")
+        assert kernel_drops == 200 - received
+    finally:
+        driver.sock.close()
@@ -0,0 +1,97 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# Tests of the Cohda device emulator.
+# ---------------------------------------------------------------------
+import json
+import logging
+import socket
+
+import pytest
+
+from cohda_driver import emulator as emulator_module
+from cohda_driver.driver import CohdaDriver
+from cohda_driver.emulator import CohdaEmulator
+from cohda_driver.etsi_message_type import EtsiMessageType
+from cohda_driver.logger import LOGGER_NAME
+
+
+def free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class QuicklyStoppedDriver(CohdaDriver):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # stop_loop waits for the receive timeout of the driver loop.
+        self.sock.settimeout(0.1)
+
+
+@pytest.fixture
+def emulator_main(monkeypatch, corpus):
+    monkeypatch.setattr(emulator_module, "CohdaDriver", QuicklyStoppedDriver)
+    monkeypatch.setattr(emulator_module, "MessageCorpus", lambda seed: corpus)
+    logger = logging.getLogger(LOGGER_NAME)
+    logger = logging.getLogger(LOGGER_NAME)
+    handlers, level = list(logger.handlers), logger.level
+    yield emulator_module.main
+    logger.handlers = handlers
+    logger.setLevel(level)
+
+
+def test_emulated_packets_are_delivered(corpus):
+    ind_port, req_port = free_port(), free_port()
+    rates = {EtsiMessageType.CAM: 200.0, EtsiMessageType.SPATEM: 100.0}
+    emulator = CohdaEmulator(
+        rates, cohda_ind_port=ind_port, cohda_req_port=req_port, corpus_size=8, corpus=corpus
+    )
+    driver = QuicklyStoppedDriver(
+        "127.0.0.1", "127.0.0.1", ind_port, req_port, enable_metrics=True, decoder=corpus.decoder
+    )
+    try:
+        emulator.attach(driver)
+        driver.start_loop()
+        report = emulator.run(0.5)
+    finally:
+        emulator.close()
+        driver.stop_loop()
+        driver.sock.close()
+
+    message_types = report["message_types"]
+    assert set(message_types) == {"CAM", "SPATEM"}
+    for name, counts in message_types.items():
+        assert counts["sent"] > 0, name
+        assert counts["lost"] == 0, name
+        assert counts["received"] == counts["sent"], name
+    assert report["unexpected"] == 0
+    assert driver.stats()["message_types"]["CAM"]["decoded"] == message_types["CAM"]["sent"]
+
+
+def test_main_prints_only_the_report_to_stdout(emulator_main, capsys):
+    argv = ["--rate", "CAM=50", "--duration", "0.2", "--with-driver"]
+    argv += ["--ind-port", str(free_port()), "--req-port", str(free_port())]
+    assert emulator_main(argv) == 0
+
+    captured = capsys.readouterr()
+    report = json.loads(captured.out)
+    assert report["message_types"]["CAM"]["lost"] == 0
+    assert report["driver"]["message_types"]["CAM"]["decoded"] > 0
+    assert "Sending" in captured.err
+
+
+def test_main_reports_errors_of_the_run(emulator_main, monkeypatch):
+    def fail(*_args, **_kwargs):
+        raise RuntimeError("interrupted")
+
+    monkeypatch.setattr(CohdaEmulator, "run", fail)
+    argv = ["--duration", "0.1", "--with-driver"]
+    argv += ["--ind-port", str(free_port()), "--req-port", str(free_port())]
+    with pytest.raises(RuntimeError, match="interrupted"):
+        emulator_main(argv)
@@ -0,0 +1,35 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# Tests of the ETSI message classes.
+# ---------------------------------------------------------------------
+from cohda_driver.etsi_message_type import EtsiMessageType
+from cohda_driver.etsi_messages import CPM
+
+
+def test_cam_to_dict_keeps_its_layout(corpus):
+    for road_side_unit in [False, True]:
+        payload = corpus.payloads(EtsiMessageType.CAM, 1, road_side_unit=road_side_unit)[0]
+        cam = corpus.decoder.decode(payload)
+        value = cam.to_dict()
+
+        assert value["header"] == cam.header.to_dict()
+        assert set(value["header"]) == {"protocolVersion", "messageID", "stationID"}
+        high_frequency = value["cam"]["camParameters"]["highFrequencyContainer"]
+        assert set(high_frequency) == {
+            "basicVehicleContainerHighFrequency",
+            "rsuContainerHighFrequency",
+        }
+
+
+def test_cpm_without_perceived_objects(corpus):
+    payload = corpus.payloads(EtsiMessageType.CPM, 1, objects=0)[0]
+    cpm = corpus.decoder.decode(payload)
+    assert isinstance(cpm, CPM)
+    assert cpm.cpmParameters.cpmPerceivedObjectContainer == []
+
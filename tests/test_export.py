@@ -0,0 +1,75 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# Tests of the columnar export of CAMs and CPM perceived objects.
+# ---------------------------------------------------------------------
+import pytest
+
+from cohda_driver.etsi_message_type import EtsiMessageType
+from cohda_driver.export import CamExporter, CpmObjectExporter
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def read_table(directory, export_format):
+    if export_format == "parquet":
+        return pa.concat_tables(pq.read_table(path) for path in sorted(directory.iterdir()))
+    tables = []
+    for path in sorted(directory.iterdir()):
+        with pa.memory_map(str(path)) as source:
+            tables.append(pa.ipc.open_file(source).read_all())
+    return pa.concat_tables(tables)
+
+
+@pytest.mark.parametrize("export_format", ["parquet", "arrow"])
+def test_cam_export_round_trip(tmp_path, corpus, export_format):
+    cams = [corpus.decoder.decode(data) for data in corpus.payloads(EtsiMessageType.CAM, 25)]
+    with CamExporter(tmp_path, export_format, batch_size=10) as exporter:
+        exporter.add_all((i, cam) for i, cam in enumerate(cams))
+    assert exporter.row_count == 25
+
+    table = read_table(tmp_path, export_format)
+    assert table.column("timestamp_ns").to_pylist() == list(range(25))
+    assert table.column("station_id").to_pylist() == [cam.header.station_id for cam in cams]
+    assert table.column("latitude").to_pylist() == [
+        cam.cam.cam_parameters.basic_container.reference_position.latitude for cam in cams
+    ]
+
+
+def test_cpm_object_export_has_one_row_per_object(tmp_path, corpus):
+    cpms = [
+        corpus.decoder.decode(data)
+        for objects in [0, 3, 5]
+        for data in corpus.payloads(EtsiMessageType.CPM, 1, objects=objects)
+    ]
+    with CpmObjectExporter(tmp_path) as exporter:
+        exporter.add_all((i, cpm) for i, cpm in enumerate(cpms))
+
+    table = read_table(tmp_path, "parquet")
+    assert table.column("timestamp_ns").to_pylist() == [1] * 3 + [2] * 5
+    assert table.column("object_id").to_pylist() == [
+        obj.objectId for cpm in cpms for obj in cpm.cpmParameters.cpmPerceivedObjectContainer
+    ]
+
+
+def test_failed_add_leaves_columns_aligned(tmp_path, corpus):
+    cams = [corpus.decoder.decode(data) for data in corpus.payloads(EtsiMessageType.CAM, 2)]
+    with CamExporter(tmp_path) as exporter:
+        exporter.add(cams[0], 0)
+        # A negative stationID does not fit the uint32 column, after the timestamp was added.
+        cams[1].header.station_id = -1
+        with pytest.raises(OverflowError):
+            exporter.add(cams[1], 1)
+        assert {len(column) for column in exporter._columns} == {1}
+        cams[1].header.station_id = 7
+        exporter.add(cams[1], 2)
+
+    table = read_table(tmp_path, "parquet")
+    assert table.column("timestamp_ns").to_pylist() == [0, 2]
+    assert table.column("station_id").to_pylist()[1] == 7
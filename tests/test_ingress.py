@@ -0,0 +1,97 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# Tests of the priority-aware ingress queue.
+# ---------------------------------------------------------------------
+from cohda_driver.btp_indication import create_btp_indication_packet
+from cohda_driver.etsi_message_type import EtsiMessageType
+from cohda_driver.etsi_messages.its_pdu_header import ITS_PDU_HEADER_STRUCT
+from cohda_driver.ingress import DropPolicy, IngressPolicy, IngressQueue
+
+
+def make_packet(message_type: EtsiMessageType, station_id: int, sequence: int = 0) -> bytes:
+    payload = ITS_PDU_HEADER_STRUCT.pack(2, message_type.value, station_id) + bytes([sequence])
+    return create_btp_indication_packet(message_type, payload)
+
+
+def drain(queue: IngressQueue):
+    items = []
+    while len(queue):
+        items.append(queue.get(timeout=0))
+    return items
+
+
+def test_packets_are_dequeued_by_priority():
+    queue = IngressQueue(capacity=16)
+    cam = make_packet(EtsiMessageType.CAM, 1)
+    mapem = make_packet(EtsiMessageType.MAPEM, 2)
+    spatem = make_packet(EtsiMessageType.SPATEM, 3)
+    for receive_time, packet in enumerate([cam, mapem, spatem]):
+        assert queue.put(packet, receive_time) == []
+
+    assert drain(queue) == [(spatem, 2), (mapem, 1), (cam, 0)]
+    assert queue.get(timeout=0) is None
+
+
+def test_oldest_per_station_keeps_newest_packet_of_every_station():
+    queue = IngressQueue(capacity=16)
+    assert queue.put(make_packet(EtsiMessageType.CAM, 1, 0), 0.0) == []
+    assert queue.put(make_packet(EtsiMessageType.CAM, 2, 0), 1.0) == []
+    assert queue.put(make_packet(EtsiMessageType.CAM, 1, 1), 2.0) == [EtsiMessageType.CAM.value]
+
+    assert [receive_time for _, receive_time in drain(queue)] == [1.0, 2.0]
+
+
+def test_full_queue_evicts_lower_priority_and_never_drops_spatems():
+    queue = IngressQueue(capacity=2)
+    queue.put(make_packet(EtsiMessageType.CAM, 1), 0.0)
+    queue.put(make_packet(EtsiMessageType.CPM, 2), 1.0)
+
+    assert queue.put(make_packet(EtsiMessageType.MAPEM, 3), 2.0) == [EtsiMessageType.CAM.value]
+    # NEVER is queued beyond the capacity.
+    assert queue.put(make_packet(EtsiMessageType.SPATEM, 4), 3.0) == []
+    assert len(queue) == 3
+    # CAMs cannot evict packets of a higher priority, so the incoming CAM is dropped.
+    assert queue.put(make_packet(EtsiMessageType.CAM, 5), 4.0) == [EtsiMessageType.CAM.value]
+    assert [receive_time for _, receive_time in drain(queue)] == [3.0, 2.0, 1.0]
+
+
+def test_newest_policy_drops_incoming_packets():
+    policy = IngressPolicy(0, DropPolicy.NEWEST)
+    queue = IngressQueue(capacity=1, policies={}, default_policy=policy)
+    assert queue.put(make_packet(EtsiMessageType.CAM, 1), 0.0) == []
+    assert queue.put(make_packet(EtsiMessageType.CAM, 2), 1.0) == [EtsiMessageType.CAM.value]
+    assert drain(queue) == [(make_packet(EtsiMessageType.CAM, 1), 0.0)]
+
+
+def test_short_packets_use_the_default_policy():
+    queue = IngressQueue(capacity=1)
+    assert queue.put(b"\x00" * 4, 0.0) == []
+    assert queue.put(b"\x00" * 4, 1.0) == [-1]
+
+
+def test_replaced_packets_do_not_accumulate():
+    queue = IngressQueue(capacity=8)
+    # Nothing is dequeued, as for CAMs while packets of a higher priority keep the process busy.
+    for sequence in range(1000):
+        queue.put(make_packet(EtsiMessageType.CAM, sequence % 2, sequence % 256), float(sequence))
+    assert len(queue) == 2
+    assert sum(len(level) for level in queue._levels.values()) <= 2 + queue.capacity // 2 + 1
+    assert [receive_time for _, receive_time in drain(queue)] == [998.0, 999.0]
+
+
+def test_driver_counts_ingress_drops_on_process_thread(driver):
+    driver.setup_ingress(IngressQueue(capacity=1))
+    driver._ingress.put(make_packet(EtsiMessageType.CAM, 1), 0.0)
+    driver._ingress_drops.extend(driver._ingress.put(make_packet(EtsiMessageType.CAM, 1, 1), 1.0))
+    assert driver.stats()["ingress_drops"] == 0
+
+    driver._count_ingress_drops()
+    stats = driver.stats()
+    assert stats["ingress_drops"] == 1
+    assert stats["message_types"]["CAM"]["ingress_drops"] == 1
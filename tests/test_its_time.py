@@ -0,0 +1,105 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# Tests of the conversions between Unix time, TimestampIts and the
+# generationDeltaTime.
+# ---------------------------------------------------------------------
+import time
+
+import pytest
+
+from cohda_driver.btp_indication import create_btp_indication_packet
+from cohda_driver.driver import CohdaDriver
+from cohda_driver.etsi_message_type import EtsiMessageType
+from cohda_driver.its_time import (
+    FUTURE_TOLERANCE_MS,
+    GENERATION_DELTA_TIME_MODULO,
+    generation_time,
+    generation_timestamp_its,
+    peek_generation_delta_time,
+    timestamp_its,
+    timestamp_its_to_unix,
+)
+
+MODULO = GENERATION_DELTA_TIME_MODULO
+
+
+def test_timestamp_its_round_trip():
+    # 2004-01-01 in Unix time is the ITS epoch, minus the leap seconds since.
+    assert timestamp_its(1072915200.0) == 5000
+    assert timestamp_its_to_unix(timestamp_its(1700000000.5)) == pytest.approx(1700000000.5)
+
+
+@pytest.mark.parametrize("age_ms", [0, 1, 999, 30000, MODULO - FUTURE_TOLERANCE_MS])
+def test_generation_timestamp_resolves_past_messages(age_ms):
+    # The reference is just after a wraparound of the generationDeltaTime.
+    reference = 1000 * MODULO + 500
+    generated = reference - age_ms
+    assert generation_timestamp_its(generated % MODULO, reference) == generated
+
+
+@pytest.mark.parametrize("offset_ms", [10, 500, FUTURE_TOLERANCE_MS - 1])
+def test_generation_timestamp_tolerates_clock_offsets(offset_ms):
+    reference = 1000 * MODULO + MODULO - 10
+    generated = reference + offset_ms
+    # The generation time wrapped around after the reference time.
+    assert generated % MODULO < reference % MODULO
+    assert generation_timestamp_its(generated % MODULO, reference) == generated
+
+
+def test_generation_timestamp_beyond_tolerance_is_attributed_to_the_previous_period():
+    reference = 1000 * MODULO
+    generated = reference + FUTURE_TOLERANCE_MS + 1
+    assert generation_timestamp_its(generated % MODULO, reference) == generated - MODULO
+
+
+def test_generation_time_across_wraparound():
+    now = timestamp_its_to_unix(1000 * MODULO + 20)
+    generation_delta_time = MODULO - 80
+    assert generation_time(generation_delta_time, now) == pytest.approx(now - 0.1)
+
+
+def test_peek_generation_delta_time_matches_full_decode(corpus):
+    for payload in corpus.payloads(EtsiMessageType.CAM, 10):
+        cam = corpus.decoder.decode(payload)
+        peeked = peek_generation_delta_time(EtsiMessageType.CAM, payload)
+        assert peeked == cam.cam.generation_delta_time
+    for payload in corpus.payloads(EtsiMessageType.CPM, 10, objects=2):
+        cpm = corpus.decoder.decode(payload)
+        assert peek_generation_delta_time(EtsiMessageType.CPM, payload) == cpm.generationDeltaTime
+    spatem = corpus.payloads(EtsiMessageType.SPATEM, 1)[0]
+    assert peek_generation_delta_time(EtsiMessageType.SPATEM, spatem) is None
+    assert peek_generation_delta_time(EtsiMessageType.CAM, spatem[:7]) is None
+
+
+def test_driver_drops_messages_older_than_the_maximum_age(decoder, corpus):
+    driver = CohdaDriver(
+        "127.0.0.1",
+        "127.0.0.1",
+        0,
+        0,
+        enable_metrics=True,
+        kernel_timestamps=False,
+        max_message_age=1.0,
+        decoder=decoder,
+    )
+    received = []
+    driver.subscribe(EtsiMessageType.CAM, received.append)
+    now = time.time()
+    try:
+        for age in [5.0, 0.1]:
+            value = corpus.cam()
+            value["cam"]["generationDeltaTime"] = timestamp_its(now - age) % MODULO
+            payload = corpus.encode(EtsiMessageType.CAM, value)
+            driver.process_packet(create_btp_indication_packet(EtsiMessageType.CAM, payload), now)
+    finally:
+        driver.sock.close()
+
+    assert len(received) == 1
+    assert driver.stats()["message_types"]["CAM"]["stale_drops"] == 1
+    assert driver.stats()["message_types"]["CAM"]["message_age_seconds"]["count"] == 1
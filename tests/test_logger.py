@@ -0,0 +1,181 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# Tests of the driver logger setup, the background logging and the
+# warning aggregation.
+# ---------------------------------------------------------------------
+import io
+import logging
+import threading
+
+import pytest
+
+from cohda_driver.logger import (
+    LOG_LEVEL_VARIABLE,
+    LOGGER_NAME,
+    WarningAggregator,
+    disable_background_logging,
+    dropped_log_records,
+    enable_background_logging,
+    set_log_level,
+    setup_logger,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def project_logger():
+    """
+    Driver logger without handlers, restored after the test.
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+    handlers = list(logger.handlers)
+    level = logger.level
+    for handler in handlers:
+        logger.removeHandler(handler)
+    yield logger
+    disable_background_logging()
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+    for handler in handlers:
+        logger.addHandler(handler)
+    logger.setLevel(level)
+
+
+def messages(caplog) -> list:
+    return [record.getMessage() for record in caplog.records]
+
+
+def test_repetitions_are_summarized_with_their_time_span(project_logger, caplog):
+    clock = FakeClock()
+    aggregator = WarningAggregator(project_logger, interval=10.0, clock=clock)
+    with caplog.at_level(logging.WARNING, logger=LOGGER_NAME):
+        aggregator.warning("type", "Unsupported message type %s", "SPATEM")
+        for _ in range(3):
+            clock.now += 1.5
+            aggregator.warning("type", "Unsupported message type %s", "SPATEM")
+        aggregator.warning("version", "Unsupported version %d", 3)
+        assert messages(caplog) == [
+            "Unsupported message type SPATEM",
+            "Unsupported version 3",
+        ]
+
+        # The summary is logged long after the interval, but covers the repetitions only.
+        clock.now += 3600.0
+        aggregator.warning("type", "Unsupported message type %s", "MAPEM")
+    assert messages(caplog)[2:] == [
+        "3 x Unsupported message type SPATEM within 4.5 s",
+        "Unsupported message type MAPEM",
+    ]
+
+
+def test_keys_without_repetitions_are_not_summarized(project_logger, caplog):
+    clock = FakeClock()
+    aggregator = WarningAggregator(project_logger, interval=10.0, clock=clock)
+    with caplog.at_level(logging.WARNING, logger=LOGGER_NAME):
+        aggregator.warning("malformed", "Malformed datagram")
+        clock.now += 10.0
+        aggregator.warning("malformed", "Malformed datagram")
+        aggregator.flush(clock.now + 1.0)
+    # The second warning starts a new interval and is logged immediately.
+    assert messages(caplog) == ["Malformed datagram", "Malformed datagram"]
+
+
+def test_flush_logs_the_summaries_of_open_intervals(project_logger, caplog):
+    clock = FakeClock()
+    aggregator = WarningAggregator(project_logger, interval=10.0, clock=clock)
+    with caplog.at_level(logging.WARNING, logger=LOGGER_NAME):
+        for _ in range(5):
+            aggregator.warning("callback", "Callback failed: %s", "boom")
+            clock.now += 0.5
+        # Flushing up to a time within the interval keeps the repetitions.
+        aggregator.flush(clock.now)
+        assert messages(caplog) == ["Callback failed: boom"]
+        aggregator.flush()
+    assert messages(caplog) == ["Callback failed: boom", "4 x Callback failed: boom within 2.0 s"]
+
+
+def test_setup_logger_writes_to_the_stream_and_file(project_logger, tmp_path, monkeypatch):
+    monkeypatch.setenv(LOG_LEVEL_VARIABLE, "warning")
+    stream = io.StringIO()
+    log_file = tmp_path / "driver.log"
+    logger = setup_logger(log_file=log_file, stream=stream)
+    assert logger is project_logger
+    assert logger.level == logging.WARNING
+    # Calling it again does not add handlers.
+    setup_logger(log_file=log_file, stream=stream)
+    assert len(logger.handlers) == 2
+
+    logger.info("Hidden")
+    logger.warning("Shown %d", 1)
+    for handler in logger.handlers:
+        handler.flush()
+    assert "Hidden" not in stream.getvalue()
+    assert "[WARNING ] Shown 1" in stream.getvalue()
+    assert "[WARNING ] Shown 1" in log_file.read_text(encoding="utf-8")
+
+
+def test_set_log_level_of_the_logger_and_its_handlers(project_logger):
+    stream = io.StringIO()
+    setup_logger(log_level="WARNING", stream=stream)
+    set_log_level(logging.DEBUG)
+    assert project_logger.level == logging.DEBUG
+    assert all(handler.level == logging.DEBUG for handler in project_logger.handlers)
+    project_logger.debug("Details")
+    assert "Details" in stream.getvalue()
+
+
+def test_background_logging_writes_on_another_thread(project_logger):
+    stream = io.StringIO()
+    setup_logger(log_level="INFO", stream=stream)
+    enable_background_logging()
+    # Enabling twice keeps the first background handler.
+    enable_background_logging()
+    assert len(project_logger.handlers) == 1
+
+    project_logger.info("Queued %s", "record")
+    disable_background_logging()
+    assert "Queued record" in stream.getvalue()
+    assert len(project_logger.handlers) == 1
+    assert project_logger.handlers[0].stream is stream
+    assert dropped_log_records() == 0
+
+
+def test_background_logging_drops_records_when_the_queue_is_full(project_logger):
+    started = threading.Event()
+    release = threading.Event()
+    handled = []
+
+    class BlockingHandler(logging.Handler):
+        def emit(self, record: logging.LogRecord):
+            started.set()
+            release.wait(5.0)
+            handled.append(record.getMessage())
+
+    project_logger.setLevel(logging.INFO)
+    project_logger.addHandler(BlockingHandler())
+    enable_background_logging(max_queue_size=1)
+    try:
+        project_logger.info("Record %d", 0)
+        assert started.wait(5.0)
+        # The background thread blocks on the first record and one more fits into the queue.
+        for i in range(1, 10):
+            project_logger.info("Record %d", i)
+        assert dropped_log_records() == 8
+    finally:
+        release.set()
+        disable_background_logging()
+    assert handled == ["Record 0", "Record 1"]
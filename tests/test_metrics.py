@@ -0,0 +1,185 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# Tests of the driver metrics, their Prometheus format and the HTTP
+# endpoint.
+# ---------------------------------------------------------------------
+import json
+import math
+import urllib.error
+import urllib.request
+
+import pytest
+
+from cohda_driver.etsi_message_type import EtsiMessageType
+from cohda_driver.its_time import GENERATION_DELTA_TIME_MODULO
+from cohda_driver.metrics import (
+    DriverMetrics,
+    GenerationGapTracker,
+    Histogram,
+    MetricsServer,
+    RateCounter,
+    merge_snapshots,
+    to_prometheus,
+)
+
+
+def test_histogram_buckets_include_their_upper_bound():
+    histogram = Histogram([1.0, 2.0])
+    for value in [0.5, 1.0, 1.5, 2.0, 3.0]:
+        histogram.observe(value)
+    assert histogram.counts == [2, 2, 1]
+    assert histogram.count == 5
+    assert histogram.sum == 8.0
+
+
+def test_histogram_quantiles_are_bucket_upper_bounds():
+    histogram = Histogram([1.0, 2.0])
+    assert histogram.quantile(0.5) == 0.0
+    for value in [0.5, 1.5, 1.5, 3.0]:
+        histogram.observe(value)
+    assert histogram.quantile(0.25) == 1.0
+    assert histogram.quantile(0.5) == 2.0
+    assert histogram.quantile(0.75) == 2.0
+    assert histogram.quantile(0.99) == math.inf
+
+
+def test_histograms_with_different_buckets_cannot_be_merged():
+    with pytest.raises(ValueError):
+        Histogram([1.0]).merge(Histogram([2.0]))
+
+
+def test_rate_excludes_the_current_second_and_old_slots():
+    rate = RateCounter(window=10)
+    for _ in range(9):
+        rate.add(100.5)
+    for _ in range(18):
+        rate.add(101.5)
+    rate.add(102.5)
+    assert rate.rate(102.9) == 27 / 9
+    assert rate.rate(110.5) == 19 / 9
+    assert rate.rate(111.5) == 1 / 9
+    assert rate.rate(112.5) == 0.0
+
+
+def test_generation_gaps_of_a_station():
+    tracker = GenerationGapTracker(gap_threshold_ms=1100, reset_threshold_ms=10000)
+    assert not tracker.update(1, 1000, 100.0)
+    assert not tracker.update(1, 2100, 101.1)
+    assert tracker.update(1, 3300, 102.3)
+    # Other stations are tracked separately.
+    assert not tracker.update(2, 60000, 102.3)
+    # Gaps beyond the reset threshold are a station re-entering the communication range, by
+    # the generationDeltaTime or by the receive time.
+    assert not tracker.update(1, 13400, 102.4)
+    assert not tracker.update(1, 13500, 112.5)
+
+
+def test_generation_gaps_across_the_wraparound():
+    tracker = GenerationGapTracker(gap_threshold_ms=1100, reset_threshold_ms=10000)
+    last = GENERATION_DELTA_TIME_MODULO - 500
+    assert not tracker.update(1, last, 100.0)
+    assert not tracker.update(1, 500, 101.0)
+    assert tracker.update(1, 1700, 102.2)
+    assert not tracker.update(2, last, 100.0)
+    assert tracker.update(2, 700, 101.2)
+
+
+def driver_metrics(message_type: EtsiMessageType, messages: int) -> DriverMetrics:
+    metrics = DriverMetrics()
+    for _ in range(messages):
+        metrics.packet_received()
+        metrics.message_received(message_type)
+        metrics.message_decoded(message_type, 0.0004)
+    metrics.malformed_packet()
+    metrics.ingress_drop(message_type.value)
+    metrics.ingress_drop(255)
+    metrics.kernel_drops = 7
+    return metrics
+
+
+def test_snapshot_counts_per_message_type():
+    snapshot = driver_metrics(EtsiMessageType.CAM, 3).snapshot()
+    assert json.loads(json.dumps(snapshot)) == snapshot
+    assert snapshot["packets_received"] == 3
+    assert snapshot["malformed_drops"] == 1
+    assert snapshot["kernel_drops"] == 7
+    assert snapshot["ingress_drops"] == 2
+    cam = snapshot["message_types"]["CAM"]
+    assert cam["received"] == 3
+    assert cam["decoded"] == 3
+    assert cam["ingress_drops"] == 1
+    assert cam["decode_latency_seconds"]["count"] == 3
+    assert cam["decode_latency_seconds"]["p50"] == 0.0005
+
+
+def test_snapshots_are_merged():
+    first = driver_metrics(EtsiMessageType.CAM, 3).snapshot()
+    second = driver_metrics(EtsiMessageType.CAM, 2).snapshot()
+    second["uptime_seconds"] = first["uptime_seconds"] + 10
+    third = driver_metrics(EtsiMessageType.CPM, 1).snapshot()
+    merged = merge_snapshots([first, {}, second, third])
+
+    assert merged["uptime_seconds"] == second["uptime_seconds"]
+    assert merged["packets_received"] == 6
+    assert merged["kernel_drops"] == 21
+    assert set(merged["message_types"]) == {"CAM", "CPM"}
+    cam = merged["message_types"]["CAM"]
+    assert cam["received"] == 5
+    assert cam["decode_latency_seconds"]["count"] == 5
+    assert cam["decode_latency_seconds"]["counts"] == [
+        first_count + second_count
+        for first_count, second_count in zip(
+            first["message_types"]["CAM"]["decode_latency_seconds"]["counts"],
+            second["message_types"]["CAM"]["decode_latency_seconds"]["counts"],
+        )
+    ]
+    assert merged["message_types"]["CPM"] == third["message_types"]["CPM"]
+    assert merge_snapshots([{}]) == {}
+
+
+def test_prometheus_format():
+    metrics = DriverMetrics()
+    metrics.packet_received()
+    metrics.message_received(EtsiMessageType.CAM)
+    metrics.message_decoded(EtsiMessageType.CAM, 0.0004)
+    metrics.message_decoded(EtsiMessageType.CAM, 20.0)
+    lines = to_prometheus(metrics.snapshot(), prefix="test").splitlines()
+
+    assert "# TYPE test_packets_received_total counter" in lines
+    assert "test_packets_received_total 1" in lines
+    assert "# TYPE test_messages_received_total counter" in lines
+    assert 'test_messages_received_total{type="CAM"} 1' in lines
+    assert "# TYPE test_messages_receive_rate_hz gauge" in lines
+    assert "# TYPE test_decode_latency_seconds histogram" in lines
+    # Buckets are cumulative and end with +Inf.
+    assert 'test_decode_latency_seconds_bucket{type="CAM",le="0.00025"} 0' in lines
+    assert 'test_decode_latency_seconds_bucket{type="CAM",le="0.0005"} 1' in lines
+    assert 'test_decode_latency_seconds_bucket{type="CAM",le="10.0"} 1' in lines
+    assert 'test_decode_latency_seconds_bucket{type="CAM",le="+Inf"} 2' in lines
+    assert 'test_decode_latency_seconds_sum{type="CAM"} 20.0004' in lines
+    assert 'test_decode_latency_seconds_count{type="CAM"} 2' in lines
+    assert all(line.startswith(("# TYPE test_", "test_")) for line in lines)
+
+
+def test_server_serves_the_snapshot():
+    metrics = driver_metrics(EtsiMessageType.CAM, 2)
+    server = MetricsServer(metrics.snapshot, port=0)
+    try:
+        url = f"http://{server.address[0]}:{server.address[1]}"
+        with urllib.request.urlopen(f"{url}/metrics", timeout=5) as response:
+            assert response.headers["Content-Type"].startswith("text/plain")
+            text = response.read().decode()
+        assert 'cohda_driver_messages_received_total{type="CAM"} 2' in text.splitlines()
+        with urllib.request.urlopen(f"{url}/stats", timeout=5) as response:
+            assert json.load(response)["packets_received"] == 2
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(f"{url}/unknown", timeout=5)
+        assert error.value.code == 404
+    finally:
+        server.close()
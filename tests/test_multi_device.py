@@ -0,0 +1,72 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# Tests of the driver for several Cohda devices.
+# ---------------------------------------------------------------------
+import socket
+import threading
+
+import pytest
+
+from cohda_driver.btp_indication import create_btp_indication_packet
+from cohda_driver.etsi_message_type import EtsiMessageType
+from cohda_driver.ingress import IngressQueue
+from cohda_driver.multi_device import CohdaEndpoint, MultiDeviceDriver
+
+
+def free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def multi_driver(decoder):
+    endpoints = [
+        CohdaEndpoint("127.0.0.1", "127.0.0.1", free_port(), free_port(), name=name)
+        for name in ["north", "south"]
+    ]
+    driver = MultiDeviceDriver(
+        endpoints, enable_metrics=True, kernel_timestamps=False, decoder=decoder
+    )
+    yield driver, endpoints
+    driver.stop_loop()
+
+
+@pytest.mark.parametrize("ingress", [False, True])
+def test_messages_are_tagged_with_their_device(multi_driver, corpus, ingress):
+    driver, endpoints = multi_driver
+    if ingress:
+        driver.devices["south"].setup_ingress(IngressQueue())
+    received = []
+    done = threading.Event()
+
+    def callback(cam, device):
+        received.append((device, cam.header.station_id))
+        if len(received) == 4:
+            done.set()
+
+    driver.subscribe(EtsiMessageType.CAM, callback)
+    driver.start_loop()
+    payloads = corpus.payloads(EtsiMessageType.CAM, 2)
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        # Short datagrams are dropped without affecting the other packets.
+        sock.sendto(b"\x00" * 10, ("127.0.0.1", endpoints[0].cohda_ind_port))
+        for endpoint in endpoints:
+            for payload in payloads:
+                packet = create_btp_indication_packet(EtsiMessageType.CAM, payload)
+                sock.sendto(packet, ("127.0.0.1", endpoint.cohda_ind_port))
+        assert done.wait(5.0)
+
+    station_ids = [corpus.decoder.decode_header(payload).station_id for payload in payloads]
+    assert sorted(received) == sorted(
+        (name, station_id) for name in ["north", "south"] for station_id in station_ids
+    )
+    stats = driver.stats()
+    assert stats["north"]["malformed_drops"] == 1
+    assert stats["south"]["message_types"]["CAM"]["decoded"] == 2
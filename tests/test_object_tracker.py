@@ -0,0 +1,144 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# Tests of the diffs of the CPM object tracker.
+# ---------------------------------------------------------------------
+import copy
+
+from typing import Dict, List, Optional
+
+import pytest
+
+from cohda_driver.corpus import MessageCorpus
+from cohda_driver.etsi_message_type import EtsiMessageType
+from cohda_driver.etsi_messages.cpm import CPM
+from cohda_driver.its_time import GENERATION_DELTA_TIME_MODULO, timestamp_its
+from cohda_driver.object_tracker import CpmObjectTracker
+
+NOW = 1_800_000_000.0
+STATION_ID = 1234
+
+
+@pytest.fixture
+def template(corpus: MessageCorpus) -> CPM:
+    return corpus.decoder.decode(corpus.payloads(EtsiMessageType.CPM, 1, objects=4)[0])
+
+
+def make_cpm(
+    template: CPM,
+    age: float,
+    object_ids: List[int],
+    station_id: int = STATION_ID,
+    measurement_offsets: Optional[Dict[int, int]] = None,
+):
+    """
+    CPM of the station generated `age` seconds before NOW. The objects are measured at generation
+    unless their timeOfMeasurement in ms is given in `measurement_offsets`.
+    """
+    cpm = copy.deepcopy(template)
+    cpm.header.station_id = station_id
+    cpm.generationDeltaTime = timestamp_its(NOW - age) % GENERATION_DELTA_TIME_MODULO
+    objects = []
+    for object_id in object_ids:
+        obj = copy.deepcopy(template.cpmParameters.cpmPerceivedObjectContainer[0])
+        obj.objectId = object_id
+        obj.time_of_measurement = (measurement_offsets or {}).get(object_id, 0)
+        objects.append(obj)
+    cpm.cpmParameters.cpmPerceivedObjectContainer = objects
+    cpm.cpmParameters.numberOfPerceivedObjects = len(objects)
+    return cpm
+
+
+def ids(tracks) -> List[int]:
+    return sorted(track.object_id for track in tracks)
+
+
+def test_cpms_are_applied_as_diffs(template: CPM):
+    tracker = CpmObjectTracker()
+    changes = tracker.update(make_cpm(template, 1.0, [1, 2, 3]), NOW)
+    assert changes.station_id == STATION_ID
+    assert changes.generation_time == pytest.approx(NOW - 1.0)
+    assert ids(changes.new) == [1, 2, 3]
+    assert not changes.updated and not changes.vanished
+
+    changes = tracker.update(make_cpm(template, 0.5, [2, 3, 4]), NOW)
+    assert ids(changes.new) == [4]
+    assert ids(changes.updated) == [2, 3]
+    assert ids(changes.vanished) == [1]
+    assert ids(tracker.tracks(STATION_ID)) == [2, 3, 4]
+    assert tracker.get(STATION_ID, 2).updates == 2
+    assert tracker.get(STATION_ID, 2).first_measurement_time == pytest.approx(NOW - 1.0)
+    assert tracker.get(STATION_ID, 2).measurement_time == pytest.approx(NOW - 0.5)
+
+
+def test_stations_are_tracked_separately(template: CPM):
+    tracker = CpmObjectTracker()
+    tracker.update(make_cpm(template, 1.0, [1, 2]), NOW)
+    changes = tracker.update(make_cpm(template, 1.0, [1], station_id=STATION_ID + 1), NOW)
+    assert ids(changes.new) == [1]
+    assert not changes.vanished
+    assert len(tracker) == 3
+
+
+def test_cpms_not_newer_than_the_last_of_the_station_are_ignored(template: CPM):
+    tracker = CpmObjectTracker()
+    tracker.update(make_cpm(template, 0.5, [1, 2]), NOW)
+    for age in (0.5, 1.0):
+        changes = tracker.update(make_cpm(template, age, [3]), NOW)
+        assert not changes
+    assert ids(tracker.tracks(STATION_ID)) == [1, 2]
+
+
+def test_missing_objects_time_out_without_full_object_lists(template: CPM):
+    tracker = CpmObjectTracker(timeout=2.0, full_object_lists=False)
+    tracker.update(make_cpm(template, 3.0, [1, 2]), NOW)
+    changes = tracker.update(make_cpm(template, 2.0, [2]), NOW)
+    assert not changes.vanished
+    assert ids(tracker.tracks(STATION_ID)) == [1, 2]
+
+    changes = tracker.update(make_cpm(template, 0.5, [2]), NOW)
+    assert ids(changes.updated) == [2]
+    assert ids(changes.vanished) == [1]
+
+
+def test_expire_removes_tracks_of_silent_stations(template: CPM):
+    tracker = CpmObjectTracker(timeout=2.0)
+    tracker.update(make_cpm(template, 3.0, [1, 2]), NOW)
+    tracker.update(make_cpm(template, 1.0, [1], station_id=STATION_ID + 1), NOW)
+
+    changes = tracker.expire(NOW)
+    assert changes.station_id is None
+    assert sorted(track.key for track in changes.vanished) == [(STATION_ID, 1), (STATION_ID, 2)]
+    assert [track.key for track in tracker.tracks()] == [(STATION_ID + 1, 1)]
+    assert not tracker.expire(NOW)
+
+    # The expired station is forgotten, so an older CPM after a restart of its clock is accepted.
+    changes = tracker.update(make_cpm(template, 4.0, [5]), NOW)
+    assert ids(changes.new) == [5]
+
+
+def test_measurement_time_counts_back_from_the_generation_time(template: CPM):
+    tracker = CpmObjectTracker()
+    tracker.update(make_cpm(template, 1.0, [1, 2], measurement_offsets={1: 500, 2: -200}), NOW)
+    assert tracker.get(STATION_ID, 1).measurement_time == pytest.approx(NOW - 1.5)
+    assert tracker.get(STATION_ID, 2).measurement_time == pytest.approx(NOW - 0.8)
+
+    # A newer CPM may contain an older measurement of an object, which is not an update.
+    changes = tracker.update(
+        make_cpm(template, 0.9, [1, 2], measurement_offsets={1: 500, 2: 300}), NOW
+    )
+    assert ids(changes.updated) == [1]
+    assert tracker.get(STATION_ID, 1).measurement_time == pytest.approx(NOW - 1.4)
+    assert tracker.get(STATION_ID, 2).measurement_time == pytest.approx(NOW - 0.8)
+
+
+def test_objects_expire_after_their_measurement_time(template: CPM):
+    tracker = CpmObjectTracker(timeout=2.0)
+    tracker.update(make_cpm(template, 1.0, [1, 2], measurement_offsets={1: 1500}), NOW)
+    assert [track.object_id for track in tracker.expire(NOW).vanished] == [1]
+    assert ids(tracker.tracks()) == [2]
@@ -0,0 +1,71 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# Tests of the partial decoding of CAMs against the full decoding.
+# ---------------------------------------------------------------------
+import random
+
+import pytest
+
+from cohda_driver.corpus import random_value
+from cohda_driver.etsi_message_type import EtsiMessageType
+from cohda_driver.etsi_messages import ItsPduHeader
+from cohda_driver.geofence import Geofence
+from cohda_driver.partial_decoder import peek_cam_position
+
+
+def encode_cams(decoder, protocol_version: int, count: int):
+    specification = decoder.specifications[protocol_version]
+    root = specification.types["CAM"]._type
+    rng = random.Random(protocol_version)
+    payloads = []
+    for _ in range(count):
+        value = random_value(root, rng)
+        header = value["header"]
+        header["protocolVersion"] = protocol_version
+        # EN 302 637-2 v1.4.1 spells the ID members messageID and stationID.
+        header["messageID" if protocol_version == 1 else "messageId"] = EtsiMessageType.CAM.value
+        payloads.append(bytes(specification.encode("CAM", value)))
+    return payloads
+
+
+@pytest.mark.parametrize("protocol_version", [1, 2])
+def test_peek_cam_position_matches_full_decode(decoder, protocol_version):
+    specification = decoder.specifications[protocol_version]
+    for data in encode_cams(decoder, protocol_version, 200):
+        value = specification.decode("CAM", data)
+        basic_container = value["cam"]["camParameters"]["basicContainer"]
+        position = peek_cam_position(data)
+
+        assert position is not None
+        assert position.station_id == ItsPduHeader.from_dict(value["header"]).station_id
+        assert position.station_type == basic_container["stationType"]
+        assert position.latitude == basic_container["referencePosition"]["latitude"]
+        assert position.longitude == basic_container["referencePosition"]["longitude"]
+
+
+def test_peek_cam_position_rejects_other_messages(decoder, corpus):
+    cam = encode_cams(decoder, 2, 1)[0]
+    assert peek_cam_position(cam[:12]) is None
+    assert peek_cam_position(bytes([3]) + cam[1:]) is None
+    for payload in corpus.payloads(EtsiMessageType.SPATEM, 5):
+        assert peek_cam_position(payload) is None
+
+
+@pytest.mark.parametrize("protocol_version", [1, 2])
+def test_geofence_accepts_cams_of_both_protocol_versions(decoder, protocol_version):
+    specification = decoder.specifications[protocol_version]
+    data = encode_cams(decoder, protocol_version, 1)[0]
+    value = specification.decode("CAM", data)
+    value["cam"]["camParameters"]["basicContainer"]["referencePosition"].update(
+        latitude=490117000, longitude=84043000
+    )
+    data = bytes(specification.encode("CAM", value))
+
+    assert Geofence.circle(49.0117, 8.4043, radius=100).accepts_cam(data)
+    assert not Geofence.circle(48.0, 8.4043, radius=100).accepts_cam(data)
@@ -0,0 +1,206 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# Tests of the pcap reader on synthetic captures of every supported
+# link-layer header type.
+# ---------------------------------------------------------------------
+import gzip
+import struct
+
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+from cohda_driver.corpus import MessageCorpus
+from cohda_driver.etsi_message_type import EtsiMessageType
+from cohda_driver.pcap import (
+    ETHERTYPE_GEONETWORKING,
+    LINKTYPE_ETHERNET,
+    LINKTYPE_IEEE802_11,
+    LINKTYPE_IEEE802_11_RADIOTAP,
+    LINKTYPE_LINUX_SLL,
+    LLC_SNAP_HEADER,
+    PCAP_MAGIC_NS,
+    PCAP_MAGIC_US,
+    CohdaPcapReader,
+    decode_pcap,
+)
+
+LINKTYPE_IPV4 = 228
+BTP_PORT_CAM = 2001
+TRAFFIC_CLASS = 2
+# GeoNetworking header type and subtype of CAMs.
+SINGLE_HOP_BROADCAST = (5, 0)
+# Length of the extended header per header type and subtype, EN 302 636-4-1 clause 9.8.
+EXTENDED_HEADER_SIZES = {
+    (1, 0): 24,  # Beacon
+    (2, 0): 48,  # GeoUnicast
+    (3, 1): 44,  # GeoAnycast, rectangle
+    (4, 2): 44,  # GeoBroadcast, ellipse
+    (5, 0): 28,  # Single hop broadcast
+    (5, 1): 28,  # Topologically-scoped broadcast
+    (6, 0): 36,  # Location service request
+    (6, 1): 48,  # Location service reply
+}
+
+
+def geonetworking(
+    payload: bytes,
+    header_type: Tuple[int, int] = SINGLE_HOP_BROADCAST,
+    next_header: int = 1,
+) -> bytes:
+    """
+    GeoNetworking packet with a BTP-B header and the payload.
+    """
+    basic_header = bytes([0x10 | next_header, 0, 0x1A, 1])
+    btp_header = struct.pack(">HH", BTP_PORT_CAM, 0)
+    common_header = struct.pack(
+        ">BBBBHBB",
+        2 << 4,
+        header_type[0] << 4 | header_type[1],
+        TRAFFIC_CLASS,
+        0,
+        len(btp_header) + len(payload),
+        1,
+        0,
+    )
+    return basic_header + common_header + bytes(EXTENDED_HEADER_SIZES[header_type]) + btp_header + payload
+
+
+def ieee802_11(packet: bytes, frame_control: int = 0x88, flags: int = 0) -> bytes:
+    """
+    802.11 data frame, a QoS data frame by default, with LLC/SNAP encapsulation.
+    """
+    header = bytes([frame_control, flags]) + bytes(22)
+    if flags & 0x03 == 0x03:
+        header += bytes(6)
+    if frame_control & 0x80:
+        header += bytes(2)
+        if flags & 0x80:
+            header += bytes(4)
+    return header + LLC_SNAP_HEADER + struct.pack(">H", ETHERTYPE_GEONETWORKING) + packet
+
+
+def link_layer(linktype: int, packet: bytes) -> bytes:
+    ethertype = struct.pack(">H", ETHERTYPE_GEONETWORKING)
+    if linktype == LINKTYPE_ETHERNET:
+        return bytes(12) + ethertype + packet
+    if linktype == LINKTYPE_LINUX_SLL:
+        return bytes(14) + ethertype + packet
+    if linktype == LINKTYPE_IEEE802_11_RADIOTAP:
+        # Radiotap header with a channel field, followed by the 802.11 frame.
+        radiotap = struct.pack("<BBHI", 0, 0, 12, 1 << 3) + struct.pack("<HH", 5900, 0x0100)
+        return radiotap + ieee802_11(packet)
+    if linktype == LINKTYPE_IEEE802_11:
+        return ieee802_11(packet, frame_control=0x08)
+    return packet
+
+
+def write_pcap(
+    path: Path,
+    linktype: int,
+    frames: List[bytes],
+    endian: str = "<",
+    magic: int = PCAP_MAGIC_US,
+) -> Path:
+    data = struct.pack(f"{endian}IHHiIII", magic, 2, 4, 0, 0, 65535, linktype)
+    for i, frame in enumerate(frames):
+        data += struct.pack(f"{endian}IIII", 1_700_000_000 + i, 500, len(frame), len(frame))
+        data += frame
+    if path.suffix == ".gz":
+        data = gzip.compress(data)
+    path.write_bytes(data)
+    return path
+
+
+@pytest.fixture
+def payloads(corpus: MessageCorpus) -> List[bytes]:
+    return corpus.payloads(EtsiMessageType.CAM, 2) + corpus.payloads(EtsiMessageType.SPATEM, 1)
+
+
+@pytest.mark.parametrize(
+    "linktype",
+    [LINKTYPE_ETHERNET, LINKTYPE_LINUX_SLL, LINKTYPE_IEEE802_11_RADIOTAP, LINKTYPE_IEEE802_11],
+)
+def test_decode_pcap_of_every_link_type(tmp_path, corpus, payloads, linktype):
+    frames = [link_layer(linktype, geonetworking(payload)) for payload in payloads]
+    path = write_pcap(tmp_path / "rx.pcap", linktype, frames)
+
+    messages = list(decode_pcap(path, corpus.decoder))
+    assert [message for _, message in messages] == [
+        corpus.decoder.decode(payload) for payload in payloads
+    ]
+    assert [timestamp for timestamp, _ in messages] == pytest.approx(
+        [1_700_000_000.0005, 1_700_000_001.0005, 1_700_000_002.0005]
+    )
+    only_spatems = decode_pcap(path, corpus.decoder, [EtsiMessageType.SPATEM])
+    assert [message for _, message in only_spatems] == [corpus.decoder.decode(payloads[2])]
+
+
+@pytest.mark.parametrize("header_type", list(EXTENDED_HEADER_SIZES))
+def test_btp_payload_follows_the_extended_header(tmp_path, payloads, header_type):
+    frame = link_layer(LINKTYPE_ETHERNET, geonetworking(payloads[0], header_type))
+    path = write_pcap(tmp_path / "rx.pcap", LINKTYPE_ETHERNET, [frame])
+
+    (btp_packet,) = CohdaPcapReader(path)
+    assert btp_packet.payload == payloads[0]
+    assert btp_packet.btp_type == 2
+    assert btp_packet.btp_destination_port == BTP_PORT_CAM
+    assert btp_packet.gn_traffic_class == TRAFFIC_CLASS
+
+
+def test_ieee802_11_frames_with_four_addresses_and_ht_control(tmp_path, payloads):
+    frames = [
+        ieee802_11(geonetworking(payloads[0]), frame_control=0x08, flags=0x03),
+        ieee802_11(geonetworking(payloads[1]), frame_control=0x88, flags=0x80),
+    ]
+    path = write_pcap(tmp_path / "rx.pcap", LINKTYPE_IEEE802_11, frames)
+    assert [packet.payload for packet in CohdaPcapReader(path)] == payloads[:2]
+
+
+@pytest.mark.parametrize("endian, magic", [(">", PCAP_MAGIC_US), ("<", PCAP_MAGIC_NS)])
+def test_byte_orders_and_timestamp_resolutions(tmp_path, payloads, endian, magic):
+    frames = [link_layer(LINKTYPE_ETHERNET, geonetworking(payloads[0]))]
+    path = write_pcap(tmp_path / "rx.pcap.gz", LINKTYPE_ETHERNET, frames, endian, magic)
+    (btp_packet,) = CohdaPcapReader(path)
+    assert btp_packet.payload == payloads[0]
+    assert btp_packet.timestamp == pytest.approx(
+        1_700_000_000 + 500 * (1e-9 if magic == PCAP_MAGIC_NS else 1e-6)
+    )
+
+
+def test_frames_without_btp_packets_are_skipped(tmp_path, corpus, payloads):
+    path = write_pcap(
+        tmp_path / "rx.pcap",
+        LINKTYPE_ETHERNET,
+        [
+            # Secured packet, IPv4 frame, truncated GeoNetworking packet and a valid one.
+            link_layer(LINKTYPE_ETHERNET, geonetworking(payloads[0], next_header=2)),
+            bytes(12) + b"\x08\x00" + bytes(20),
+            link_layer(LINKTYPE_ETHERNET, geonetworking(payloads[0])[:-1]),
+            link_layer(LINKTYPE_ETHERNET, geonetworking(payloads[1])),
+        ],
+    )
+    reader = CohdaPcapReader(path)
+    assert [packet.payload for packet in reader] == payloads[1:2]
+    assert reader.frame_count == 4
+    assert reader.secured_packet_count == 1
+    assert reader.skipped_frame_count == 3
+
+
+def test_unknown_link_types_are_skipped(tmp_path, corpus, payloads):
+    path = write_pcap(tmp_path / "rx.pcap", LINKTYPE_IPV4, [geonetworking(payloads[0])])
+    assert list(decode_pcap(path, corpus.decoder)) == []
+
+
+def test_other_files_are_rejected(tmp_path):
+    path = tmp_path / "rx.pcapng"
+    path.write_bytes(struct.pack("<I", 0x0A0D0D0A) + bytes(28))
+    with pytest.raises(ValueError):
+        list(CohdaPcapReader(path))
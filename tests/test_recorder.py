@@ -0,0 +1,118 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# Tests of the raw packet recorder and replayer.
+# ---------------------------------------------------------------------
+import logging
+import socket
+import time
+
+from typing import List
+
+import pytest
+
+from cohda_driver.btp_indication import create_btp_indication_packet
+from cohda_driver.corpus import MessageCorpus
+from cohda_driver.driver import CohdaDriver
+from cohda_driver.etsi_message_type import EtsiMessageType
+from cohda_driver.logger import LOGGER_NAME
+from cohda_driver.recorder import (
+    RECORD_HEADER_SIZE,
+    PacketRecorder,
+    PacketReplayer,
+    RecordedPacket,
+    read_recording,
+)
+
+
+@pytest.fixture
+def packets(corpus: MessageCorpus) -> List[bytes]:
+    return [
+        create_btp_indication_packet(EtsiMessageType.CAM, payload)
+        for payload in corpus.payloads(EtsiMessageType.CAM, 4)
+    ]
+
+
+def test_recording_round_trip(tmp_path, packets: List[bytes]):
+    path = tmp_path / "traffic.cdrl"
+    with PacketRecorder(path) as recorder:
+        for i, packet in enumerate(packets[:2]):
+            recorder.write(packet, timestamp_ns=i * 1_000_000_000)
+        assert recorder.packet_count == 2
+    # Records are appended to an existing recording.
+    with PacketRecorder(path) as recorder:
+        recorder.write(packets[2], timestamp_ns=5_000_000_000)
+        recorder.write(b"", timestamp_ns=2**64 - 1)
+
+    assert list(read_recording(path)) == [
+        RecordedPacket(0, packets[0]),
+        RecordedPacket(1_000_000_000, packets[1]),
+        RecordedPacket(5_000_000_000, packets[2]),
+        RecordedPacket(2**64 - 1, b""),
+    ]
+
+
+def test_other_files_are_rejected(tmp_path):
+    path = tmp_path / "traffic.pcap"
+    path.write_bytes(b"\xd4\xc3\xb2\xa1" + bytes(20))
+    with pytest.raises(ValueError):
+        list(read_recording(path))
+    with pytest.raises(ValueError):
+        PacketRecorder(path)
+
+
+def test_truncated_last_record_is_ignored(tmp_path, packets: List[bytes], caplog):
+    path = tmp_path / "traffic.cdrl"
+    with PacketRecorder(path) as recorder:
+        for packet in packets[:2]:
+            recorder.write(packet, timestamp_ns=1)
+    data = path.read_bytes()
+
+    path.write_bytes(data[:-1])
+    with caplog.at_level(logging.WARNING, logger=LOGGER_NAME):
+        assert [packet.data for packet in read_recording(path)] == packets[:1]
+    assert "truncated record" in caplog.text
+
+    # A partial record header, e.g. of a recorder killed while writing, ends the recording too.
+    path.write_bytes(data[: -len(packets[1]) - RECORD_HEADER_SIZE + 3])
+    assert [packet.data for packet in read_recording(path)] == packets[:1]
+
+
+def test_replay_into_a_driver(
+    tmp_path, packets: List[bytes], corpus: MessageCorpus, driver: CohdaDriver
+):
+    path = tmp_path / "traffic.cdrl"
+    with PacketRecorder(path) as recorder:
+        for i, packet in enumerate(packets):
+            recorder.write(packet, timestamp_ns=i * 10_000_000_000)
+    station_ids = []
+    driver.subscribe(EtsiMessageType.CAM, lambda cam: station_ids.append(cam.header.station_id))
+
+    start = time.perf_counter()
+    assert PacketReplayer(path, speed=None).replay_to_driver(driver) == len(packets)
+    # Recorded 10 s apart, replayed without waiting.
+    assert time.perf_counter() - start < 5.0
+    assert station_ids == [
+        corpus.decoder.decode(packet[CohdaDriver.HEADER_SIZE :]).header.station_id
+        for packet in packets
+    ]
+    assert driver.stats()["packets_received"] == len(packets)
+
+
+def test_replay_keeps_the_recorded_timing(tmp_path, packets: List[bytes]):
+    path = tmp_path / "traffic.cdrl"
+    with PacketRecorder(path) as recorder:
+        recorder.write(packets[0], timestamp_ns=0)
+        recorder.write(packets[1], timestamp_ns=400_000_000)
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as receiver:
+        receiver.bind(("127.0.0.1", 0))
+        receiver.settimeout(5.0)
+        start = time.perf_counter()
+        assert PacketReplayer(path, speed=2.0).replay_to_socket(receiver.getsockname()) == 2
+        assert time.perf_counter() - start >= 0.2
+        assert [receiver.recv(4096) for _ in range(2)] == packets[:2]
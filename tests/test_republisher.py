@@ -0,0 +1,183 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# Tests of the binary re-publisher.
+# ---------------------------------------------------------------------
+import socket
+import time
+
+from typing import List, Tuple
+
+import pytest
+
+from cohda_driver.corpus import MessageCorpus
+from cohda_driver.etsi_message_type import EtsiMessageType
+from cohda_driver.etsi_messages import CAM, CPM
+from cohda_driver.republisher import (
+    FRAME_HEADER_STRUCT,
+    FRAME_MAGIC,
+    RECORD_HEADER_STRUCT,
+    RECORD_TYPE_CAM,
+    RECORD_TYPE_CPM_OBJECT,
+    SCHEMA_VERSION,
+    TCP_PREFIX_STRUCT,
+    BinaryRepublisher,
+    decode_frame,
+    encode_records,
+)
+
+
+@pytest.fixture
+def cam(corpus: MessageCorpus) -> CAM:
+    return corpus.decoder.decode(corpus.payloads(EtsiMessageType.CAM, 1)[0])
+
+
+@pytest.fixture
+def cpm(corpus: MessageCorpus) -> CPM:
+    return corpus.decoder.decode(corpus.payloads(EtsiMessageType.CPM, 1, objects=3)[0])
+
+
+def frame(records: List[bytes]) -> bytes:
+    return FRAME_HEADER_STRUCT.pack(FRAME_MAGIC, SCHEMA_VERSION, len(records), 0, 0) + b"".join(
+        records
+    )
+
+
+def test_records_round_trip(cam: CAM, cpm: CPM):
+    records = encode_records(cam, 1) + encode_records(cpm, 2)
+    # Unknown record types and unknown trailing fields are skipped using the record size.
+    records.append(RECORD_HEADER_STRUCT.pack(99, 3) + b"abc")
+    records[0] = RECORD_HEADER_STRUCT.pack(RECORD_TYPE_CAM, records[0][1] + 2) + records[0][2:]
+    records[0] += b"\xff\xff"
+    decoded = list(decode_frame(frame(records)))
+
+    assert [record_type for record_type, _ in decoded] == [RECORD_TYPE_CAM] + [
+        RECORD_TYPE_CPM_OBJECT
+    ] * 3
+    parameters = cam.cam.cam_parameters
+    high_frequency = parameters.high_frequency_container.basic_vehicle_container_high_frequency
+    assert decoded[0][1] == (
+        1,
+        cam.header.station_id,
+        cam.cam.generation_delta_time,
+        parameters.basic_container.station_type,
+        high_frequency.drive_direction,
+        parameters.basic_container.reference_position.latitude,
+        parameters.basic_container.reference_position.longitude,
+        parameters.basic_container.reference_position.altitude.altitude_value,
+        high_frequency.heading.heading_value,
+        high_frequency.speed.speed_value,
+        high_frequency.longitudinal_acceleration.longitudinal_acceleration_value,
+        high_frequency.curvature.curvature_value,
+        high_frequency.yaw_rate.yaw_rate_value,
+        high_frequency.vehicle_length.vehicle_length_value,
+        high_frequency.vehicle_width,
+    )
+    for (_, fields), perceived_object in zip(
+        decoded[1:], cpm.cpmParameters.cpmPerceivedObjectContainer
+    ):
+        assert fields[:5] == (
+            2,
+            cpm.header.station_id,
+            cpm.generationDeltaTime,
+            perceived_object.objectId,
+            perceived_object.classification.classificationType,
+        )
+        assert fields[9] == perceived_object.xDistance.value
+
+
+def test_fields_outside_the_record_ranges_are_saturated(cam: CAM, cpm: CPM):
+    perceived_object = cpm.cpmParameters.cpmPerceivedObjectContainer[0]
+    perceived_object.classification.classificationType = "pedestrian"
+    perceived_object.classification.confidence = 300
+    perceived_object.objectId = -1
+    cpm.generationDeltaTime = 70000
+    high_frequency = cam.cam.cam_parameters.high_frequency_container
+    high_frequency.basic_vehicle_container_high_frequency.vehicle_width = 300
+    records = encode_records(cpm, 0) + encode_records(cam, 0)
+    decoded = [fields for _, fields in decode_frame(frame(records))]
+
+    assert decoded[0][2:6] == (65535, 0, 0, 255)
+    assert decoded[-1][-1] == 255
+
+
+def tcp_listener(backlog: int = 1) -> socket.socket:
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(backlog)
+    return listener
+
+
+def fill_backlog(listener: socket.socket) -> List[socket.socket]:
+    """
+    Connect to a listener that never accepts until its backlog is full, so that further
+    connection attempts hang.
+    """
+    clients = []
+    while True:
+        client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        client.settimeout(0.2)
+        try:
+            client.connect(listener.getsockname())
+        except OSError:
+            client.close()
+            return clients
+        clients.append(client)
+
+
+def receive_marker(sock: socket.socket, marker: int) -> float:
+    """
+    Wait for the frame containing the record with the timestamp `marker`.
+    """
+    while True:
+        data = sock.recv(65536)
+        if any(fields[0] == marker for _, fields in decode_frame(data)):
+            return time.monotonic()
+
+
+def test_tcp_consumer_receives_prefixed_frames(cam: CAM):
+    listener = tcp_listener()
+    with BinaryRepublisher([("tcp", *listener.getsockname())], tick=0.01) as republisher:
+        republisher.add(cam, 7)
+        listener.settimeout(2.0)
+        connection, _ = listener.accept()
+        connection.settimeout(2.0)
+        (size,) = TCP_PREFIX_STRUCT.unpack(connection.recv(TCP_PREFIX_STRUCT.size))
+        data = b""
+        while len(data) < size:
+            data += connection.recv(size - len(data))
+        assert [fields[0] for _, fields in decode_frame(data)] == [7]
+    connection.close()
+    listener.close()
+
+
+def test_slow_tcp_consumers_do_not_delay_udp_consumers(cam: CAM):
+    udp = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    udp.bind(("127.0.0.1", 0))
+    udp.settimeout(0.5)
+    # A consumer that never reads, and one whose connection attempts hang.
+    unread = tcp_listener()
+    hanging = tcp_listener(backlog=0)
+    clients = fill_backlog(hanging)
+    endpoints: List[Tuple[str, str, int]] = [
+        ("tcp", *unread.getsockname()),
+        ("tcp", *hanging.getsockname()),
+        ("udp", *udp.getsockname()),
+    ]
+    with BinaryRepublisher(endpoints, tick=0.01, max_pending_frames=4) as republisher:
+        # Longer than the reconnect interval, so that several connection attempts are made.
+        deadline = time.monotonic() + 1.5
+        marker = 0
+        while time.monotonic() < deadline:
+            marker += 1
+            sent = time.monotonic()
+            republisher.add(cam, marker)
+            assert receive_marker(udp, marker) - sent < 0.2
+        assert republisher.dropped_frames > 0
+    for sock in [udp, unread, hanging] + clients:
+        sock.close()
@@ -0,0 +1,161 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# Tests of the stationID sharding of the indication port.
+# ---------------------------------------------------------------------
+import errno
+import logging
+import socket
+import struct
+import sys
+import time
+
+from typing import Dict, List
+
+import pytest
+
+from cohda_driver.btp_indication import create_btp_indication_packet
+from cohda_driver.corpus import MessageCorpus
+from cohda_driver.decoder import EtsiDecoder
+from cohda_driver.driver import CohdaDriver
+from cohda_driver.etsi_message_type import EtsiMessageType
+from cohda_driver.logger import LOGGER_NAME
+from cohda_driver.sharded import (
+    STATION_ID_OFFSET,
+    ShardedDriver,
+    attach_station_sharding,
+    station_sharding_filter,
+)
+
+pytestmark = pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="Sharding by stationID requires Linux."
+)
+
+STATION_IDS = [1, 2, 3, 0x01020304, 0xFFFFFFFE, 0xFFFFFFFF]
+
+
+def cam_packets(corpus: MessageCorpus) -> Dict[int, bytes]:
+    """
+    Indication packet of a CAM of every station of STATION_IDS.
+    """
+    packets = {}
+    for station_id in STATION_IDS:
+        value = corpus.cam()
+        header = value["header"]
+        header["stationID" if "stationID" in header else "stationId"] = station_id
+        payload = corpus.encode(EtsiMessageType.CAM, value)
+        packets[station_id] = create_btp_indication_packet(EtsiMessageType.CAM, payload)
+    return packets
+
+
+def ignore(_message):
+    pass
+
+
+def wait_for(condition, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "Timed out."
+        time.sleep(0.01)
+
+
+def test_filter_loads_the_station_id_modulo_the_workers(corpus: MessageCorpus):
+    assert station_sharding_filter(3) == [
+        (0x20, 0, 0, CohdaDriver.HEADER_SIZE + 2),
+        (0x94, 0, 0, 3),
+        (0x16, 0, 0, 0),
+    ]
+    # The absolute load reads the big-endian stationID of the datagram.
+    for station_id, packet in cam_packets(corpus).items():
+        assert struct.unpack_from(">I", packet, STATION_ID_OFFSET)[0] == station_id
+
+
+def test_attach_falls_back_to_the_address_hash(caplog):
+    class UnsupportedSocket:
+        def setsockopt(self, *_args):
+            raise OSError(errno.ENOPROTOOPT, "Protocol not available")
+
+    with caplog.at_level(logging.WARNING, logger=LOGGER_NAME):
+        assert not attach_station_sharding(UnsupportedSocket(), 2)
+    assert "falling back to the address hash" in caplog.text
+
+
+def test_stations_always_land_on_the_same_shard(decoder: EtsiDecoder, corpus: MessageCorpus):
+    shards: List[CohdaDriver] = []
+    port = 0
+    for _ in range(2):
+        shard = CohdaDriver(
+            "127.0.0.1",
+            "127.0.0.1",
+            port,
+            0,
+            kernel_timestamps=False,
+            decoder=decoder,
+            reuse_port=True,
+        )
+        port = shard.sock.getsockname()[1]
+        shard.sock.settimeout(0.1)
+        shards.append(shard)
+    received: List[List[int]] = [[], []]
+    try:
+        if not attach_station_sharding(shards[0].sock, len(shards)):
+            pytest.skip("SO_ATTACH_REUSEPORT_CBPF is not available.")
+        for shard, station_ids in zip(shards, received):
+            shard.subscribe(
+                EtsiMessageType.CAM, lambda cam, ids=station_ids: ids.append(cam.header.station_id)
+            )
+            shard.start_loop()
+
+        packets = cam_packets(corpus)
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sender:
+            for _ in range(3):
+                for packet in packets.values():
+                    sender.sendto(packet, ("127.0.0.1", port))
+        wait_for(lambda: sum(len(station_ids) for station_ids in received) == 3 * len(packets))
+    finally:
+        for shard in shards:
+            shard.stop_loop()
+            shard.sock.close()
+
+    first, second = (set(station_ids) for station_ids in received)
+    assert first | second == set(STATION_IDS)
+    assert not first & second
+    # The stations are split by the parity of their stationID.
+    assert len({station_id % 2 for station_id in first}) == 1
+    assert len({station_id % 2 for station_id in second}) == 1
+
+
+def test_stats_of_the_workers_are_merged(decoder: EtsiDecoder, corpus: MessageCorpus):
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    # Forked workers inherit the compiled decoder.
+    driver = ShardedDriver(
+        "127.0.0.1",
+        "127.0.0.1",
+        port,
+        0,
+        workers=2,
+        start_method="fork",
+        enable_metrics=True,
+        kernel_timestamps=False,
+        decoder=decoder,
+    )
+    driver.setup_callback(ignore, EtsiMessageType.CAM)
+    driver.start_loop()
+    try:
+        packets = cam_packets(corpus)
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sender:
+            for packet in packets.values():
+                sender.sendto(packet, ("127.0.0.1", port))
+        wait_for(lambda: driver.stats()["packets_received"] == len(packets))
+        stats = driver.stats()
+        assert stats["message_types"]["CAM"]["received"] == len(packets)
+        assert stats["message_types"]["CAM"]["decoded"] == len(packets)
+    finally:
+        driver.stop_loop()
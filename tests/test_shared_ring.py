@@ -0,0 +1,42 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# Tests of the shared memory ring buffer.
+# ---------------------------------------------------------------------
+import logging
+
+from cohda_driver.etsi_message_type import EtsiMessageType
+from cohda_driver.logger import LOGGER_NAME
+from cohda_driver.shared_ring import SharedRingReader, SharedRingWriter
+
+
+def test_records_round_trip(corpus):
+    payloads = corpus.payloads(EtsiMessageType.CAM, 6)
+    with SharedRingWriter(slot_count=4) as writer:
+        with SharedRingReader(writer.name, decoder=corpus.decoder) as reader:
+            for i, payload in enumerate(payloads):
+                writer.write(payload, timestamp_ns=i)
+            records = reader.poll()
+
+            # The reader fell behind by two messages, which were overwritten.
+            assert [record.timestamp_ns for record in records] == [2, 3, 4, 5]
+            assert [reader.payload(record) for record in records] == payloads[2:]
+            assert reader.decode(records[0]) == corpus.decoder.decode(payloads[2])
+
+
+def test_oversize_messages_are_counted_and_warned_once(corpus, caplog):
+    payload = corpus.payloads(EtsiMessageType.CAM, 1)[0]
+    with caplog.at_level(logging.WARNING, logger=LOGGER_NAME):
+        with SharedRingWriter(slot_count=4, slot_size=len(payload)) as writer:
+            for _ in range(100):
+                writer.write(payload)
+            assert writer.oversize_drops == 100
+            assert len(caplog.records) == 1
+    # The repetitions are summarized when the writer is closed.
+    assert len(caplog.records) == 2
+    assert "99 x" in caplog.records[1].getMessage()
@@ -0,0 +1,159 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# Tests of the subscribers of the driver, their filters and
+# unsubscribing.
+# ---------------------------------------------------------------------
+import logging
+
+from typing import List
+
+import pytest
+
+from cohda_driver.btp_indication import create_btp_indication_packet
+from cohda_driver.corpus import MessageCorpus
+from cohda_driver.driver import CohdaDriver
+from cohda_driver.etsi_message_type import EtsiMessageType
+from cohda_driver.logger import LOGGER_NAME
+
+
+@pytest.fixture
+def packets(corpus: MessageCorpus) -> List[bytes]:
+    return [
+        create_btp_indication_packet(EtsiMessageType.CAM, payload)
+        for payload in corpus.payloads(EtsiMessageType.CAM, 3)
+    ]
+
+
+def station_id(cam) -> int:
+    return cam.header.station_id
+
+
+def test_subscribers_are_called_in_order(driver: CohdaDriver, packets: List[bytes]):
+    calls = []
+    driver.subscribe(EtsiMessageType.CAM, lambda cam: calls.append(("first", station_id(cam))))
+    driver.subscribe(EtsiMessageType.CAM, lambda cam: calls.append(("second", station_id(cam))))
+    driver.process_packet(packets[0])
+    assert [name for name, _ in calls] == ["first", "second"]
+    assert calls[0][1] == calls[1][1]
+    assert driver.stats()["message_types"]["CAM"]["decoded"] == 1
+
+
+def test_unsubscribe_during_dispatch(driver: CohdaDriver, packets: List[bytes]):
+    received = {"first": [], "second": [], "third": []}
+    subscriptions = {}
+
+    def first(cam):
+        received["first"].append(station_id(cam))
+        # Unsubscribes itself and a later subscriber of the message being dispatched.
+        subscriptions["first"].unsubscribe()
+        subscriptions["second"].unsubscribe()
+
+    subscriptions["first"] = driver.subscribe(EtsiMessageType.CAM, first)
+    for name in ["second", "third"]:
+        subscriptions[name] = driver.subscribe(
+            EtsiMessageType.CAM, lambda cam, name=name: received[name].append(station_id(cam))
+        )
+
+    for packet in packets[:2]:
+        driver.process_packet(packet)
+
+    # The message being dispatched is still delivered to all of its subscribers.
+    assert len(received["first"]) == 1
+    assert received["second"] == received["first"]
+    assert len(received["third"]) == 2
+    assert not subscriptions["first"].active
+    assert not subscriptions["second"].active
+    assert subscriptions["third"].active
+    # Unsubscribing again has no effect.
+    subscriptions["first"].unsubscribe()
+    subscriptions["third"].unsubscribe()
+    assert not driver.has_subscriptions
+
+
+def test_message_filters_select_messages_per_subscriber(
+    driver: CohdaDriver, corpus: MessageCorpus, packets: List[bytes]
+):
+    station_ids = [
+        corpus.decoder.decode_header(packet[CohdaDriver.HEADER_SIZE :]).station_id
+        for packet in packets
+    ]
+    selected, received = [], []
+    driver.subscribe(
+        EtsiMessageType.CAM,
+        lambda cam: selected.append(station_id(cam)),
+        message_filter=lambda cam: station_id(cam) == station_ids[1],
+    )
+    driver.subscribe(EtsiMessageType.CAM, lambda cam: received.append(station_id(cam)))
+
+    for packet in packets:
+        driver.process_packet(packet)
+
+    assert selected == [station_ids[1]]
+    assert received == station_ids
+    assert driver.stats()["message_types"]["CAM"]["decoded"] == len(packets)
+
+
+def test_payload_filters_skip_decoding(driver: CohdaDriver, packets: List[bytes]):
+    payloads = [packet[CohdaDriver.HEADER_SIZE :] for packet in packets]
+    seen, received = [], []
+
+    def payload_filter(data: bytes) -> bool:
+        seen.append(data)
+        return data == payloads[2]
+
+    subscription = driver.subscribe(
+        EtsiMessageType.CAM, received.append, payload_filter=payload_filter
+    )
+    for packet in packets:
+        driver.process_packet(packet)
+
+    assert seen == payloads
+    assert len(received) == 1
+    cam = driver.stats()["message_types"]["CAM"]
+    # Messages rejected by the payload filters of all subscribers are not decoded.
+    assert cam["decoded"] == 1
+    assert cam["filter_drops"] == 2
+
+    # A subscriber without payload filter receives every message.
+    others = []
+    driver.subscribe(EtsiMessageType.CAM, others.append)
+    for packet in packets:
+        driver.process_packet(packet)
+    assert len(others) == len(packets)
+    assert len(received) == 2
+    subscription.unsubscribe()
+
+
+def test_raising_subscribers_do_not_stop_later_subscribers(
+    driver: CohdaDriver, packets: List[bytes], caplog
+):
+    received = []
+
+    def failing(_cam):
+        raise RuntimeError("boom")
+
+    def failing_filter(_data: bytes) -> bool:
+        raise RuntimeError("filter boom")
+
+    driver.subscribe(EtsiMessageType.CAM, failing)
+    driver.subscribe(EtsiMessageType.CAM, received.append, message_filter=failing)
+    driver.subscribe(EtsiMessageType.CAM, received.append, payload_filter=failing_filter)
+    driver.subscribe(EtsiMessageType.CAM, received.append)
+
+    with caplog.at_level(logging.WARNING, logger=LOGGER_NAME):
+        for packet in packets:
+            driver.process_packet(packet)
+
+    assert len(received) == len(packets)
+    cam = driver.stats()["message_types"]["CAM"]
+    assert cam["decoded"] == len(packets)
+    assert cam["callback_errors"] == 3 * len(packets)
+    # Repeated errors are aggregated, the first of every cause is logged.
+    assert "Error in CAM callback: boom" in caplog.text
+    assert "Error in CAM payload filter: filter boom" in caplog.text
@@ -0,0 +1,63 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# Tests of the sampled packet tracing.
+# ---------------------------------------------------------------------
+import threading
+
+import pytest
+
+from cohda_driver.btp_indication import create_btp_indication_packet
+from cohda_driver.etsi_message_type import EtsiMessageType
+from cohda_driver.tracing import INDICATION, RingBufferTracer, Tracer
+
+
+def test_tracer_requires_finish():
+    with pytest.raises(TypeError):
+        Tracer()
+
+
+def test_packets_are_sampled_at_even_intervals():
+    tracer = RingBufferTracer(sample_rate=0.25)
+    sampled = [tracer.start_packet(INDICATION) is not None for _ in range(12)]
+    assert sampled == [False, False, False, True] * 3
+
+
+def test_sampling_is_exact_across_threads():
+    tracer = RingBufferTracer(sample_rate=0.5)
+    counts = []
+
+    def start_packets():
+        counts.append(sum(tracer.start_packet(INDICATION) is not None for _ in range(20000)))
+
+    threads = [threading.Thread(target=start_packets) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sum(counts) == 40000
+
+
+def test_driver_traces_the_stages_of_a_packet(driver, corpus):
+    tracer = RingBufferTracer()
+    driver.setup_tracer(tracer)
+    driver.subscribe(EtsiMessageType.CAM, lambda cam: None)
+    payload = corpus.payloads(EtsiMessageType.CAM, 1)[0]
+    driver.process_packet(create_btp_indication_packet(EtsiMessageType.CAM, payload))
+
+    (trace,) = tracer.traces()
+    assert trace.message_type == EtsiMessageType.CAM
+    assert [stage for stage, _ in trace.stages] == [
+        "receive",
+        "header",
+        "dispatch",
+        "decode",
+        "metrics",
+        "callback",
+    ]
+    assert "CAM" in tracer.dump()
@@ -0,0 +1,84 @@
+# -- BEGIN LICENSE BLOCK ----------------------------------------------
+# -- END LICENSE BLOCK ------------------------------------------------
+#
+# ---------------------------------------------------------------------
+# !\file
+#
+# \date    2026-10-19
+#
+# Conformance of the generated UPER codecs and of the decoder with
+# asn1tools, on random valid messages and on the message corpus.
+# ---------------------------------------------------------------------
+import importlib
+import random
+
+import pytest
+
+from cohda_driver import uper_codecs
+from cohda_driver.codegen import GENERATED_MESSAGES
+from cohda_driver.corpus import random_value
+from cohda_driver.decoder import EtsiDecoder
+from cohda_driver.etsi_message_type import EtsiMessageType
+
+CORPUS_VARIANTS = [
+    (EtsiMessageType.CAM, {"road_side_unit": False}),
+    (EtsiMessageType.CAM, {"road_side_unit": True}),
+    (EtsiMessageType.CPM, {"objects": 0}),
+    (EtsiMessageType.CPM, {"objects": 16}),
+    (EtsiMessageType.MAPEM, {"lanes": 4, "nodes": 8}),
+    (EtsiMessageType.SPATEM, {"intersections": 4}),
+]
+
+
+def specification(decoder):
+    return decoder.specifications[EtsiDecoder.DECODABLE_PROTOCOL_VERSION]
+
+
+@pytest.mark.parametrize("message", GENERATED_MESSAGES, ids=lambda message: message.type_name)
+def test_generated_codecs_match_asn1tools(decoder, message):
+    spec = specification(decoder)
+    root = spec.types[message.type_name]._type
+    message_class = getattr(
+        importlib.import_module(f"cohda_driver.etsi_messages.{message.module}"),
+        message.message_class,
+    )
+    decode_value = getattr(uper_codecs, f"decode_{message.name}_value")
+    encode_value = getattr(uper_codecs, f"encode_{message.name}_value")
+    decode = getattr(uper_codecs, f"decode_{message.name}")
+    rng = random.Random(0)
+    compared = 0
+    for index in range(200):
+        # Every other message has all optional members, as from_dict requires some of them.
+        value = random_value(root, rng, complete=index % 2 == 1)
+        data = bytes(spec.encode(message.type_name, value))
+        expected = spec.decode(message.type_name, data)
+
+        assert encode_value(value) == data, index
+        assert decode_value(data) == expected, index
+        try:
+            reference = message_class.from_dict(expected)
+        except (KeyError, IndexError, TypeError):
+            # from_dict rejects some valid messages, e.g. CPM objects without dimensions.
+            reference = None
+        if reference is not None:
+            compared += 1
+            assert decode(data) == reference, index
+        with pytest.raises(uper_codecs.UperDecodeError):
+            decode(data[: len(data) // 2])
+    assert compared >= 100
+
+
+@pytest.mark.parametrize(
+    "message_type, options",
+    CORPUS_VARIANTS,
+    ids=[f"{t.name}-{'-'.join(map(str, o.values()))}" for t, o in CORPUS_VARIANTS],
+)
+def test_decoder_matches_asn1tools_on_corpus(decoder, corpus, message_type, options):
+    _, type_name, message_class = EtsiDecoder.MESSAGE_SPECS[message_type]
+    spec = specification(decoder)
+    generated_decode = uper_codecs.DECODERS.get(type_name)
+    for data in corpus.payloads(message_type, 50, **options):
+        reference = message_class.from_dict(spec.decode(type_name, data))
+        assert decoder.decode(data) == reference
+        if generated_decode is not None:
+            assert generated_decode(data) == reference